@@ -0,0 +1,67 @@
+"""Add team_standings aggregate table
+
+Revision ID: a7b8c9d0e1f2
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-17
+
+Changes:
+- New team_standings table holding per-team wins/losses/points, maintained
+  incrementally on game result changes
+- Backfill from existing completed regular-season games
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'e1f2a3b4c5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'team_standings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('league_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('leagues.id'), nullable=False),
+        sa.Column('team_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('teams.id'), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('losses', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('points_for', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('points_against', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint('team_id', name='uq_team_standings_team'),
+    )
+    op.create_index('ix_team_standings_league_id', 'team_standings', ['league_id'])
+
+    # Backfill using the same filter as calculate_team_standings
+    op.execute("""
+        INSERT INTO team_standings (id, league_id, team_id, wins, losses, points_for, points_against)
+        SELECT gen_random_uuid(), league_id, team_id,
+               SUM(win), SUM(loss), SUM(pf), SUM(pa)
+        FROM (
+            SELECT league_id, team1_id AS team_id,
+                   CASE WHEN winner_id = team1_id THEN 1 ELSE 0 END AS win,
+                   CASE WHEN winner_id = team2_id THEN 1 ELSE 0 END AS loss,
+                   COALESCE(team1_score, 0) AS pf, COALESCE(team2_score, 0) AS pa
+            FROM games
+            WHERE phase = 'regular_season' AND status = 'completed'
+              AND is_active = true AND winner_id IS NOT NULL
+            UNION ALL
+            SELECT league_id, team2_id AS team_id,
+                   CASE WHEN winner_id = team2_id THEN 1 ELSE 0 END AS win,
+                   CASE WHEN winner_id = team1_id THEN 1 ELSE 0 END AS loss,
+                   COALESCE(team2_score, 0) AS pf, COALESCE(team1_score, 0) AS pa
+            FROM games
+            WHERE phase = 'regular_season' AND status = 'completed'
+              AND is_active = true AND winner_id IS NOT NULL
+        ) per_team
+        GROUP BY league_id, team_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_team_standings_league_id', table_name='team_standings')
+    op.drop_table('team_standings')
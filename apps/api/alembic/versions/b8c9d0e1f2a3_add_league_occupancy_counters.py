@@ -0,0 +1,46 @@
+"""Add denormalized occupancy counters to leagues
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17
+
+Changes:
+- leagues.confirmed_players_count: active confirmed league_players
+- leagues.pending_invites_count: group_invitations with status 'pending'
+- Backfill both from the source tables
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, Sequence[str], None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('leagues', sa.Column('confirmed_players_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('leagues', sa.Column('pending_invites_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Same definitions as league_service.recount_occupancy
+    op.execute("""
+        UPDATE leagues SET
+            confirmed_players_count = (
+                SELECT COUNT(*) FROM league_players lp
+                WHERE lp.league_id = leagues.id
+                  AND lp.registration_status = 'confirmed'
+                  AND lp.is_active = true
+            ),
+            pending_invites_count = (
+                SELECT COUNT(*) FROM group_invitations gi
+                WHERE gi.league_id = leagues.id
+                  AND gi.status = 'pending'
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('leagues', 'pending_invites_count')
+    op.drop_column('leagues', 'confirmed_players_count')
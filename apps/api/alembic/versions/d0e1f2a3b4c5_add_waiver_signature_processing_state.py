@@ -0,0 +1,50 @@
+"""Add post-signing processing state to waiver_signatures
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-17
+
+Changes:
+- waiver_signatures.processed_at / processing_attempts / next_processing_at /
+  processing_error: the signature row is the work item for the background
+  PDF + S3 + confirmation email stage
+- Partial index on next_processing_at for unprocessed signatures
+- Existing signatures are marked processed so they are not re-run
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'd0e1f2a3b4c5'
+down_revision: Union[str, Sequence[str], None] = 'c9d0e1f2a3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('waiver_signatures', sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        'waiver_signatures',
+        sa.Column('processing_attempts', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column(
+        'waiver_signatures',
+        sa.Column('next_processing_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.add_column('waiver_signatures', sa.Column('processing_error', sa.Text(), nullable=True))
+
+    op.execute("UPDATE waiver_signatures SET processed_at = COALESCE(email_sent_at, signed_at, now())")
+
+    op.create_index(
+        'ix_waiver_signatures_unprocessed', 'waiver_signatures', ['next_processing_at'],
+        postgresql_where=sa.text('processed_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_waiver_signatures_unprocessed', table_name='waiver_signatures')
+    op.drop_column('waiver_signatures', 'processing_error')
+    op.drop_column('waiver_signatures', 'next_processing_at')
+    op.drop_column('waiver_signatures', 'processing_attempts')
+    op.drop_column('waiver_signatures', 'processed_at')
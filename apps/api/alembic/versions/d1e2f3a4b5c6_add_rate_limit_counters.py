@@ -0,0 +1,41 @@
+"""Add rate_limit_counters table
+
+Revision ID: d1e2f3a4b5c6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-17
+
+Changes:
+- New rate_limit_counters table: shared sliding-window-counter state for the
+  API rate limiter when RATE_LIMIT_BACKEND=postgres, so the per-route limits
+  hold across all Lambda instances instead of per instance
+- Index on expires_at for purging dead keys
+- UNLOGGED: counters are short-lived and need not survive a crash, and
+  skipping WAL keeps the per-request upsert cheap
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'd1e2f3a4b5c6'
+down_revision: Union[str, Sequence[str], None] = 'd0e1f2a3b4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'rate_limit_counters',
+        sa.Column('key', sa.String(), primary_key=True),
+        sa.Column('window_index', sa.BigInteger(), nullable=False),
+        sa.Column('current_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('previous_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        prefixes=['UNLOGGED'],
+    )
+    op.create_index('ix_rate_limit_counters_expires_at', 'rate_limit_counters', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rate_limit_counters_expires_at', table_name='rate_limit_counters')
+    op.drop_table('rate_limit_counters')
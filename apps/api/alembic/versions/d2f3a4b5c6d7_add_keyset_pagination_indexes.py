@@ -0,0 +1,34 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: d2f3a4b5c6d7
+Revises: d1e2f3a4b5c6
+Create Date: 2026-10-17
+
+Changes:
+- players (created_at, id) WHERE is_active: the admin user listing pages
+  newest-first with WHERE (created_at, id) < cursor, which is one backward
+  range scan of this index at any depth instead of an OFFSET walk
+- leagues (created_at, id): same for the admin and public league listings
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'd2f3a4b5c6d7'
+down_revision: Union[str, Sequence[str], None] = 'd1e2f3a4b5c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_players_active_created_at_id', 'players', ['created_at', 'id'],
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index('ix_leagues_created_at_id', 'leagues', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leagues_created_at_id', table_name='leagues')
+    op.drop_index('ix_players_active_created_at_id', table_name='players')
@@ -0,0 +1,52 @@
+"""Add field_blackouts for the field free/busy calendar
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-17
+
+Changes:
+- field_blackouts: periods a field is closed regardless of its availability
+  (local starts_at/ends_at, like games.game_datetime), soft-deleted via
+  is_active
+- ck_field_blackouts_range: ends_at after starts_at
+- ix_field_blackouts_field_id_starts_at: serves the calendar's range lookup
+  and the per-field listing
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = 'e4f5a6b7c8d9'
+down_revision: Union[str, Sequence[str], None] = 'd3e4f5a6b7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'field_blackouts',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('field_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('starts_at', sa.DateTime(), nullable=False),
+        sa.Column('ends_at', sa.DateTime(), nullable=False),
+        sa.Column('reason', sa.String(), nullable=True),
+        sa.Column('created_by', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.CheckConstraint('ends_at > starts_at', name='ck_field_blackouts_range'),
+        sa.ForeignKeyConstraint(['field_id'], ['fields.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_field_blackouts_id'), 'field_blackouts', ['id'], unique=False)
+    op.create_index(
+        'ix_field_blackouts_field_id_starts_at', 'field_blackouts', ['field_id', 'starts_at'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_field_blackouts_field_id_starts_at', table_name='field_blackouts')
+    op.drop_index(op.f('ix_field_blackouts_id'), table_name='field_blackouts')
+    op.drop_table('field_blackouts')
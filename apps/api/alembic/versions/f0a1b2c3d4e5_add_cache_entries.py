@@ -0,0 +1,39 @@
+"""Add cache_entries table
+
+Revision ID: f0a1b2c3d4e5
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-17
+
+Changes:
+- New cache_entries table: shared key/value cache for PostgresBackend, the
+  default shared tier of the Clerk email lookup
+  (EMAIL_LOOKUP_SHARED_BACKEND=postgres), so a Lambda cold start finds the
+  email another instance already fetched without a Redis server
+- Index on expires_at for purging dead entries
+- UNLOGGED: entries are disposable and skipping WAL keeps writes cheap
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'f0a1b2c3d4e5'
+down_revision: Union[str, Sequence[str], None] = 'e4f5a6b7c8d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cache_entries',
+        sa.Column('key', sa.String(), primary_key=True),
+        sa.Column('value', sa.LargeBinary(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        prefixes=['UNLOGGED'],
+    )
+    op.create_index('ix_cache_entries_expires_at', 'cache_entries', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cache_entries_expires_at', table_name='cache_entries')
+    op.drop_table('cache_entries')
@@ -3,22 +3,26 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List
+from typing import List, Literal, Optional
+from uuid import UUID
 from math import ceil
 
 logger = logging.getLogger(__name__)
 from app.core.limiter import limiter
+from app.core.pagination import CountMode, InvalidCursorError, count_rows, keyset_page
 from app.db.db import get_db
 from app.models.admin_config import AdminConfig
 from app.models.player import Player
 from app.models.league_player import LeaguePlayer
 from app.api.schemas.admin import (
     AdminConfigResponse, AdminConfigCreateRequest, AdminConfigUpdateRequest,
-    UserResponse, PaginatedUserResponse
+    UserResponse, PaginatedUserResponse, PlayerSearchResult
 )
 from app.api.admin.dependencies import get_admin_user
 from app.utils.clerk_jwt import get_current_user
 from app.services.admin_service import AdminService
+from app.services.exceptions import ServiceError
+from app.services.player_search_service import search_players
 
 router = APIRouter()
 
@@ -120,66 +124,103 @@ async def remove_admin_email(
         logger.exception("Failed to remove admin: %s", e)
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
 
+def _leagues_counts(db: Session, player_ids: list) -> dict:
+    """Active league registrations per player, in a single query."""
+    counts_query = (
+        db.query(LeaguePlayer.player_id, func.count(LeaguePlayer.id))
+        .filter(LeaguePlayer.player_id.in_(player_ids), LeaguePlayer.is_active == True)
+        .group_by(LeaguePlayer.player_id)
+        .all()
+    )
+    return {player_id: count for player_id, count in counts_query}
+
+
+def _user_fields(player: Player, leagues_count: int) -> dict:
+    return dict(
+        clerk_user_id=player.clerk_user_id,
+        first_name=player.first_name,
+        last_name=player.last_name,
+        email=player.email,
+        phone=player.phone,
+        date_of_birth=player.date_of_birth,
+        gender=player.gender,
+        created_at=player.created_at,
+        leagues_count=leagues_count,
+    )
+
+
+def _user_responses(db: Session, players: list) -> List[UserResponse]:
+    leagues_counts = _leagues_counts(db, [p.id for p in players])
+    return [UserResponse(**_user_fields(p, leagues_counts.get(p.id, 0))) for p in players]
+
+
+@router.get("/users/search", response_model=List[PlayerSearchResult], summary="Search players by name, email or phone")
+@limiter.limit("120/minute")
+async def search_users(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=100, description="Name, email or phone; prefix and typo tolerant"),
+    league_id: Optional[UUID] = Query(None, description="Only players registered in this league"),
+    registration_status: Optional[Literal["confirmed", "pending", "declined", "expired"]] = Query(None),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user)
+):
+    """Ranked player search for the admin typeahead"""
+    try:
+        hits = search_players(db, q, league_id=league_id, registration_status=registration_status, limit=limit)
+    except ServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    leagues_counts = _leagues_counts(db, [hit.player.id for hit in hits])
+    return [
+        PlayerSearchResult(**_user_fields(hit.player, leagues_counts.get(hit.player.id, 0)), score=round(hit.score, 4))
+        for hit in hits
+    ]
+
+
 @router.get("/users", response_model=PaginatedUserResponse, summary="Get all users (paginated)")
 @limiter.limit("30/minute")
 async def get_all_users(
     request: Request,
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    page: Optional[int] = Query(None, ge=1, description="Legacy page number (1-indexed); prefer cursor"),
     page_size: int = Query(25, ge=1, le=100, description="Number of users per page"),
+    cursor: Optional[str] = Query(None, max_length=200, description="next_cursor from the previous page"),
+    count_mode: Optional[CountMode] = Query(
+        None, alias="count", description="Total: exact, estimated (planner statistics) or none. Default: exact with page, none with cursor",
+    ),
     db: Session = Depends(get_db),
     admin_user=Depends(get_admin_user)
 ):
-    """Get all users with their basic information (paginated)"""
+    """Get all users with their basic information, newest first (keyset-paginated)"""
+    if cursor is not None and page is not None:
+        raise HTTPException(status_code=400, detail="Use either page or cursor, not both")
+    if count_mode is None:
+        count_mode = "none" if cursor is not None else "exact"
     try:
-        # Get total count of active players
-        total_count = db.query(func.count(Player.id)).filter(Player.is_active == True).scalar() or 0
-        
-        # Calculate pagination
-        total_pages = ceil(total_count / page_size) if total_count > 0 else 0
-        
-        # Validate page number
-        if page > total_pages and total_pages > 0:
+        active_players = db.query(Player).filter(Player.is_active == True)
+        total_count = count_rows(db, active_players, count_mode)
+        total_pages = None
+        if total_count is not None:
+            total_pages = ceil(total_count / page_size) if total_count > 0 else 0
+
+        # Validate page number (an estimated total is not exact enough to reject on)
+        if page and count_mode == "exact" and page > total_pages and total_pages > 0:
             raise HTTPException(status_code=404, detail=f"Page {page} does not exist. Total pages: {total_pages}")
-        
-        # Get paginated players, ordered by creation date (newest first)
-        offset = (page - 1) * page_size
-        players = db.query(Player).filter(
-            Player.is_active == True
-        ).order_by(Player.created_at.desc()).offset(offset).limit(page_size).all()
-        
-        # Fetch league counts for all players on this page in a single query
-        player_ids = [p.id for p in players]
-        counts_query = (
-            db.query(LeaguePlayer.player_id, func.count(LeaguePlayer.id))
-            .filter(LeaguePlayer.player_id.in_(player_ids), LeaguePlayer.is_active == True)
-            .group_by(LeaguePlayer.player_id)
-            .all()
-        )
-        leagues_counts = {player_id: count for player_id, count in counts_query}
-
-        result = []
-        for player in players:
-            leagues_count = leagues_counts.get(player.id, 0)
-
-            result.append(UserResponse(
-                clerk_user_id=player.clerk_user_id,
-                first_name=player.first_name,
-                last_name=player.last_name,
-                email=player.email,
-                phone=player.phone,
-                date_of_birth=player.date_of_birth,
-                gender=player.gender,
-                created_at=player.created_at,
-                leagues_count=leagues_count
-            ))
-        
+
+        # Keyset paging on (created_at, id); legacy page numbers become an offset
+        offset = (page - 1) * page_size if page else 0
+        users_page = keyset_page(active_players, Player, cursor, page_size, offset=offset)
+
         return PaginatedUserResponse(
-            users=result,
+            users=_user_responses(db, users_page.items),
             total=total_count,
-            page=page,
+            total_is_estimate=count_mode == "estimated",
+            page=(page or 1) if cursor is None else None,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=users_page.next_cursor,
         )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except HTTPException:
         raise
     except Exception as e:
@@ -2,24 +2,65 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import select
+from datetime import date, datetime
 from typing import List, Dict, Optional
 from uuid import UUID
 from app.db.db import get_db
 from app.models.league import League
 from app.models.field import Field
 from app.models.field_availability import FieldAvailability
+from app.models.field_blackout import FieldBlackout
 from app.models.league_field import LeagueField
 from app.api.schemas.admin import (
     FieldResponse, FieldCreateRequest, FieldUpdateRequest,
     FieldAvailabilityResponse, FieldAvailabilityCreateRequest, FieldAvailabilityUpdateRequest,
+    FieldBlackoutResponse, FieldBlackoutCreateRequest,
+    FieldRiskWindow, FieldUtilizationResponse, FieldUtilizationReportResponse,
 )
 from app.api.admin.dependencies import get_admin_user
 from app.core.limiter import limiter
+from app.services.exceptions import ServiceError
+from app.services.field_calendar import SLOT_MINUTES
+from app.services.field_utilization_service import get_field_utilization
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# FieldAvailabilityResponse columns, in schema order, with the field's name
+# joined in so listings load in one query (no per-row Field lookup)
+_AVAILABILITY_COLUMNS = (
+    FieldAvailability.id,
+    FieldAvailability.field_id,
+    Field.name.label("field_name"),
+    FieldAvailability.is_recurring,
+    FieldAvailability.day_of_week,
+    FieldAvailability.recurrence_start_date,
+    FieldAvailability.recurrence_end_date,
+    FieldAvailability.custom_date,
+    FieldAvailability.start_time,
+    FieldAvailability.end_time,
+    FieldAvailability.notes,
+    FieldAvailability.is_active,
+    FieldAvailability.created_at,
+    FieldAvailability.updated_at,
+)
+
+
+def _availability_query(db: Session):
+    """Row-tuple query over field availability with the field name joined in."""
+    return db.query(*_AVAILABILITY_COLUMNS).outerjoin(Field, Field.id == FieldAvailability.field_id)
+
+
+def _availability_responses(rows) -> List[FieldAvailabilityResponse]:
+    """Build responses straight from _availability_query rows (values are already typed by the DB driver)."""
+    return [FieldAvailabilityResponse.model_construct(**row._mapping) for row in rows]
+
+
+def _availability_response(db: Session, availability_id: UUID) -> Optional[FieldAvailabilityResponse]:
+    row = _availability_query(db).filter(FieldAvailability.id == availability_id).first()
+    return _availability_responses([row])[0] if row else None
+
 
 # Global Field Management Endpoints (fields are independent, not tied to leagues)
 @router.post("/fields", response_model=FieldResponse, summary="Create a new field")
@@ -658,13 +699,11 @@ async def create_field_availability_global(
 
     try:
         db.add(field_availability)
+        db.flush()
+        availability_id = field_availability.id
         db.commit()
-        db.refresh(field_availability)
-
-        # Populate field_name in response
-        response = FieldAvailabilityResponse.model_validate(field_availability)
-        response.field_name = field.name
-        return response
+        # Re-read through the joined projection (replaces refresh + field lookup)
+        return _availability_response(db, availability_id)
     except Exception as e:
         db.rollback()
         logger.exception("Failed to create field availability: %s", e)
@@ -697,7 +736,7 @@ async def get_all_field_availability(
     """
     limit = min(limit, 500)
     # Query field availability records
-    query = db.query(FieldAvailability)
+    query = _availability_query(db)
 
     if field_id is not None:
         query = query.filter(FieldAvailability.field_id == field_id)
@@ -705,17 +744,8 @@ async def get_all_field_availability(
     if is_active is not None:
         query = query.filter(FieldAvailability.is_active == is_active)
 
-    availabilities = query.order_by(FieldAvailability.created_at.desc()).offset(skip).limit(limit).all()
-
-    # Populate field_name for each response
-    result = []
-    for avail in availabilities:
-        field = db.query(Field).filter(Field.id == avail.field_id).first()
-        response = FieldAvailabilityResponse.model_validate(avail)
-        response.field_name = field.name if field else None
-        result.append(response)
-
-    return result
+    rows = query.order_by(FieldAvailability.created_at.desc()).offset(skip).limit(limit).all()
+    return _availability_responses(rows)
 
 @router.get("/leagues/{league_id}/field-availability", response_model=List[FieldAvailabilityResponse], summary="Get field availability for fields in a league")
 @limiter.limit("30/minute")
@@ -752,24 +782,15 @@ async def get_field_availability_for_league(
     ).subquery()
 
     # Query field availability records for fields in this league
-    query = db.query(FieldAvailability).filter(
+    query = _availability_query(db).filter(
         FieldAvailability.field_id.in_(select(field_ids_subquery.c.field_id))
     )
 
     if is_active is not None:
         query = query.filter(FieldAvailability.is_active == is_active)
 
-    availabilities = query.order_by(FieldAvailability.created_at.desc()).all()
-
-    # Populate field_name for each response
-    result = []
-    for avail in availabilities:
-        field = db.query(Field).filter(Field.id == avail.field_id).first()
-        response = FieldAvailabilityResponse.model_validate(avail)
-        response.field_name = field.name if field else None
-        result.append(response)
-
-    return result
+    rows = query.order_by(FieldAvailability.created_at.desc()).all()
+    return _availability_responses(rows)
 
 @router.get("/field-availability/{availability_id}", response_model=FieldAvailabilityResponse, summary="Get a specific field availability record")
 @limiter.limit("30/minute")
@@ -793,18 +814,9 @@ async def get_field_availability_by_id(
     Raises:
         HTTPException 404: If the field availability record is not found.
     """
-    # Query field availability record
-    availability = db.query(FieldAvailability).filter(
-        FieldAvailability.id == availability_id
-    ).first()
-
-    if not availability:
+    response = _availability_response(db, availability_id)
+    if response is None:
         raise HTTPException(status_code=404, detail="Field availability record not found")
-
-    # Populate field_name in response
-    field = db.query(Field).filter(Field.id == availability.field_id).first()
-    response = FieldAvailabilityResponse.model_validate(availability)
-    response.field_name = field.name if field else None
     return response
 
 @router.put("/field-availability/{availability_id}", response_model=FieldAvailabilityResponse, summary="Update field availability record")
@@ -866,13 +878,7 @@ async def update_field_availability_global(
 
     try:
         db.commit()
-        db.refresh(availability)
-
-        # Populate field_name in response
-        field = db.query(Field).filter(Field.id == availability.field_id).first()
-        response = FieldAvailabilityResponse.model_validate(availability)
-        response.field_name = field.name if field else None
-        return response
+        return _availability_response(db, availability_id)
     except Exception as e:
         db.rollback()
         logger.exception("Failed to update field availability: %s", e)
@@ -956,17 +962,15 @@ async def create_field_availability_scoped(
     )
     db.add(availability)
     try:
+        db.flush()
+        availability_id = availability.id
         db.commit()
-        db.refresh(availability)
     except Exception as e:
         db.rollback()
         logger.exception("Failed to create availability: %s", e)
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
 
-    return FieldAvailabilityResponse(
-        **availability.__dict__,
-        field_name=field.name,
-    )
+    return _availability_response(db, availability_id)
 
 
 @router.get("/fields/{field_id}/availability", response_model=List[FieldAvailabilityResponse], summary="Get all availability windows for a field")
@@ -982,15 +986,11 @@ async def get_field_availability_scoped(
     if not field:
         raise HTTPException(status_code=404, detail="Field not found")
 
-    availabilities = db.query(FieldAvailability).filter(
+    rows = _availability_query(db).filter(
         FieldAvailability.field_id == field_id,
         FieldAvailability.is_active == True,
     ).order_by(FieldAvailability.created_at).all()
-
-    return [
-        FieldAvailabilityResponse(**a.__dict__, field_name=field.name)
-        for a in availabilities
-    ]
+    return _availability_responses(rows)
 
 
 @router.put("/fields/{field_id}/availability/{avail_id}", response_model=FieldAvailabilityResponse, summary="Update a field availability window")
@@ -1021,13 +1021,12 @@ async def update_field_availability_scoped(
 
     try:
         db.commit()
-        db.refresh(availability)
     except Exception as e:
         db.rollback()
         logger.exception("Failed to update availability: %s", e)
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
 
-    return FieldAvailabilityResponse(**availability.__dict__, field_name=field.name)
+    return _availability_response(db, avail_id)
 
 
 @router.delete("/fields/{field_id}/availability/{avail_id}", summary="Delete a field availability window")
@@ -1056,3 +1055,149 @@ async def delete_field_availability_scoped(
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
 
     return {"message": "Availability window deleted."}
+
+
+# ---------------------------------------------------------------------------
+# Field blackouts (closures that override availability)
+# ---------------------------------------------------------------------------
+
+@router.post("/fields/{field_id}/blackouts", response_model=FieldBlackoutResponse, summary="Black out a field for a period")
+@limiter.limit("30/minute")
+async def create_field_blackout(
+    request: Request,
+    field_id: UUID,
+    blackout_data: FieldBlackoutCreateRequest,
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user),
+):
+    """Close a field from starts_at to ends_at (local time); scheduling skips it even inside availability windows."""
+    field = db.query(Field).filter(Field.id == field_id, Field.is_active == True).first()
+    if not field:
+        raise HTTPException(status_code=404, detail="Field not found")
+
+    blackout = FieldBlackout(
+        field_id=field_id,
+        starts_at=blackout_data.starts_at,
+        ends_at=blackout_data.ends_at,
+        reason=blackout_data.reason,
+        created_by=admin_user["id"],
+        is_active=True,
+    )
+    db.add(blackout)
+    try:
+        db.commit()
+        db.refresh(blackout)
+    except Exception as e:
+        db.rollback()
+        logger.exception("Failed to create blackout: %s", e)
+        raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
+
+    return FieldBlackoutResponse.model_validate(blackout)
+
+
+@router.get("/fields/{field_id}/blackouts", response_model=List[FieldBlackoutResponse], summary="Get blackouts for a field")
+@limiter.limit("30/minute")
+async def get_field_blackouts(
+    request: Request,
+    field_id: UUID,
+    include_past: bool = False,
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user),
+):
+    """Return a field's active blackouts by start time; past ones only with include_past=true."""
+    field = db.query(Field).filter(Field.id == field_id).first()
+    if not field:
+        raise HTTPException(status_code=404, detail="Field not found")
+
+    query = db.query(FieldBlackout).filter(
+        FieldBlackout.field_id == field_id,
+        FieldBlackout.is_active == True,
+    )
+    if not include_past:
+        query = query.filter(FieldBlackout.ends_at > datetime.now())
+    return [FieldBlackoutResponse.model_validate(b) for b in query.order_by(FieldBlackout.starts_at).all()]
+
+
+@router.delete("/fields/{field_id}/blackouts/{blackout_id}", summary="Delete a field blackout")
+@limiter.limit("30/minute")
+async def delete_field_blackout(
+    request: Request,
+    field_id: UUID,
+    blackout_id: UUID,
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user),
+):
+    """Soft-delete a blackout (sets is_active=False)."""
+    blackout = db.query(FieldBlackout).filter(
+        FieldBlackout.id == blackout_id,
+        FieldBlackout.field_id == field_id,
+    ).first()
+    if not blackout:
+        raise HTTPException(status_code=404, detail="Blackout not found")
+
+    blackout.is_active = False
+    try:
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.exception("Failed to delete blackout: %s", e)
+        raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
+
+    return {"message": "Blackout deleted."}
+
+
+# ---------------------------------------------------------------------------
+# Field utilization analytics
+# ---------------------------------------------------------------------------
+
+@router.get("/field-utilization", response_model=FieldUtilizationReportResponse, summary="Field utilization heatmaps over a date range")
+@limiter.limit("10/minute")
+async def get_field_utilization_report(
+    request: Request,
+    start_date: date,
+    end_date: date,
+    league_id: Optional[UUID] = Query(None, description="Only this league's fields; games from every league still count"),
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user),
+):
+    """
+    Per-field available, booked and idle time, blackout losses and
+    double-booking risk from start_date to end_date inclusive, with
+    weekday x hour and per-day arrays ready for heatmaps.
+    """
+    try:
+        report = get_field_utilization(db, start_date, end_date, league_id=league_id)
+    except ServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    return FieldUtilizationReportResponse(
+        start_date=report.start_date,
+        end_date=report.end_date,
+        slot_minutes=SLOT_MINUTES,
+        fields=[
+            FieldUtilizationResponse(
+                field_id=f.field_id,
+                field_name=f.field_name,
+                available_minutes=f.available_minutes,
+                booked_minutes=f.booked_minutes,
+                idle_minutes=f.idle_minutes,
+                blocked_minutes=f.blocked_minutes,
+                conflict_minutes=f.conflict_minutes,
+                double_booked_minutes=f.double_booked_minutes,
+                utilization=round(f.utilization, 4),
+                hourly_available_minutes=f.hourly_available_minutes,
+                hourly_booked_minutes=f.hourly_booked_minutes,
+                hourly_utilization=[
+                    [None if u is None else round(u, 4) for u in row] for row in f.hourly_utilization
+                ],
+                daily_available_minutes=f.daily_available_minutes,
+                daily_booked_minutes=f.daily_booked_minutes,
+                risks=[
+                    FieldRiskWindow(date=r.day, start_time=r.start_time, end_time=r.end_time, kind=r.kind)
+                    for r in f.risks
+                ],
+                risks_truncated=f.risks_truncated,
+            )
+            for f in report.fields
+        ],
+    )
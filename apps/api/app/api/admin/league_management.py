@@ -1,14 +1,16 @@
 import logging
 
 from datetime import date, datetime, timedelta, timezone
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_league, invalidate_listing
 from app.core.limiter import limiter
+from app.core.pagination import CountMode, InvalidCursorError, count_rows, keyset_page, page_headers
 
 logger = logging.getLogger(__name__)
 from app.db.db import get_db
@@ -22,7 +24,8 @@ from app.api.schemas.admin import (
     LeagueCreateRequest, LeagueUpdateRequest, LeagueResponse, LeagueStatsResponse
 )
 from app.api.admin.dependencies import get_admin_user
-from app.services.league_service import get_player_cap, get_occupied_spots
+from app.services.league_service import get_player_cap, get_occupied_spots, recount_occupancy
+from app.services.standings_service import rebuild_team_standings
 from app.core.config import settings as app_settings
 from app.core.constants import INVITE_EXPIRED, INVITE_PENDING, REG_CONFIRMED
 
@@ -94,6 +97,7 @@ async def create_league(
         db.add(league)
         db.commit()
         db.refresh(league)
+        invalidate_listing()
 
         # Schedule deadline job if applicable
         try:
@@ -113,14 +117,24 @@ async def create_league(
 @limiter.limit("30/minute")
 async def get_all_leagues(
     request: Request,
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, le=100),
+    response: Response,
+    skip: int = Query(default=0, ge=0, description="Legacy offset; prefer cursor"),
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, max_length=200, description="X-Next-Cursor from the previous page"),
+    count: CountMode = Query(default="none", description="Return X-Total-Count: exact, estimated (planner statistics) or none"),
     db: Session = Depends(get_db),
     admin_user=Depends(get_admin_user)
 ):
-    """Get all leagues with registration statistics"""
+    """Get all leagues with registration statistics, newest first (keyset-paginated)"""
     limit = min(limit, 100)
-    leagues = db.query(League).order_by(League.created_at.desc()).offset(skip).limit(limit).all()
+    if cursor is not None and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor, not both")
+    try:
+        page = keyset_page(db.query(League), League, cursor, limit, offset=skip)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    response.headers.update(page_headers(page, count_rows(db, db.query(League), count), count))
+    leagues = page.items
     if not leagues:
         return []
 
@@ -218,6 +232,7 @@ async def update_league(
     try:
         db.commit()
         db.refresh(league)
+        invalidate_league(league_id)
 
         # Re-schedule deadline job with new deadline (if changed)
         try:
@@ -275,6 +290,7 @@ async def delete_league(
             Game.league_id == league_id,
             Game.is_active == True,
         ).update({"is_active": False}, synchronize_session="fetch")
+        rebuild_team_standings(db, league_id)
 
         db.query(Group).filter(
             Group.league_id == league_id,
@@ -285,8 +301,10 @@ async def delete_league(
             GroupInvitation.league_id == league_id,
             GroupInvitation.status == INVITE_PENDING,
         ).update({"status": INVITE_EXPIRED}, synchronize_session="fetch")
+        recount_occupancy(db, [league_id])
 
         db.commit()
+        invalidate_league(league_id)
         return {"message": f"League '{league.name}' has been deleted"}
     except Exception as e:
         db.rollback()
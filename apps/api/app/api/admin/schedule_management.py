@@ -1,8 +1,11 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime, date, timedelta, time as dt_time
-from typing import List, Tuple, Optional
+from typing import Dict, List, Literal, Tuple, Optional
 from uuid import UUID
 from app.db.db import get_db
 from app.models.league import League
@@ -13,13 +16,36 @@ from app.api.schemas.admin import (
     GameUpdateRequest
 )
 from app.api.admin.dependencies import get_admin_user
-from app.core.constants import GAME_COMPLETED
+from app.core.cache import invalidate_league
+from app.core.constants import GAME_COMPLETED, GAME_IN_PROGRESS, GAME_SCHEDULED
 from app.core.limiter import limiter
+from app.services.exceptions import ServiceError
+from app.services.league_export_service import iter_export, load_schedule_export
 from app.services.schedule_service import (
-    get_available_time_slots_for_date,
+    get_available_time_slots_for_range,
     generate_time_slots_from_availability,
     MAX_GAME_DURATION_MINUTES,
 )
+from app.services.schedule_optimizer import (
+    DEFAULT_ENGINE,
+    DEFAULT_TIME_BUDGET_MS,
+    ScheduleProblem,
+    ScheduleResult,
+    Slot,
+    optimize_schedule,
+    round_robin_matchups,
+)
+from app.services.swiss_service import (
+    DEFAULT_SWISS_TIEBREAK,
+    SWISS_TIEBREAKS,
+    compute_swiss_records,
+    pair_swiss_round,
+)
+from app.services.standings_service import (
+    GameResult,
+    apply_game_result_change,
+    rebuild_team_standings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,18 +53,15 @@ router = APIRouter()
 
 
 def _get_week_slots(
-    league_id: UUID,
     current_date: date,
-    db: Session,
+    windows_by_date: Dict[date, list],
     time_slots_provided: Optional[List[str]],
     game_duration: int,
 ) -> Optional[list]:
     """Return available time slots for a week-date, or None if no availability."""
     if time_slots_provided:
         return time_slots_provided
-    available_windows = get_available_time_slots_for_date(
-        league_id, current_date, db, field_id=None, max_duration_minutes=game_duration
-    )
+    available_windows = windows_by_date.get(current_date, [])
     available_time_slots: list = []
     for fid, window_start, window_end in available_windows:
         slots = generate_time_slots_from_availability(
@@ -49,6 +72,38 @@ def _get_week_slots(
     return available_time_slots if available_time_slots else None
 
 
+def _game_row(
+    league_id: UUID,
+    team1_id: UUID,
+    team2_id: UUID,
+    week: int,
+    game_date: date,
+    game_time: str,
+    game_datetime: datetime,
+    duration_minutes: int,
+    field_id: Optional[UUID],
+    admin_user_id: str,
+) -> dict:
+    return {
+        "league_id": league_id,
+        "team1_id": team1_id,
+        "team2_id": team2_id,
+        "week": week,
+        "game_date": game_date,
+        "game_time": game_time,
+        "game_datetime": game_datetime,
+        "duration_minutes": duration_minutes,
+        "field_id": field_id,
+        "created_by": admin_user_id,
+    }
+
+
+def _insert_games(rows: List[dict], db: Session) -> None:
+    """Insert Game rows in one executemany (batched multi-row VALUES on Postgres)."""
+    if rows:
+        db.execute(insert(Game), rows)
+
+
 def _create_games_for_pairings(
     pairings: List[Tuple],
     week: int,
@@ -59,13 +114,14 @@ def _create_games_for_pairings(
     admin_user_id: str,
     db: Session,
 ) -> Tuple[List[dict], int]:
-    """Create Game records for a list of (team1_id, team2_id) pairings. Returns (details, count)."""
+    """
+    Create Game records for a list of (team1_id, team2_id) pairings. Returns (details, count).
+
+    Pairing i gets slot i; callers check there is a slot for every pairing.
+    """
+    rows: List[dict] = []
     details: List[dict] = []
-    count = 0
-    for idx, (t1, t2) in enumerate(pairings):
-        if idx >= len(available_time_slots):
-            break
-        slot = available_time_slots[idx]
+    for (t1, t2), slot in zip(pairings, available_time_slots):
         field_id_for_game = None
         if isinstance(slot, tuple):
             field_id_for_game, game_time = slot
@@ -73,19 +129,10 @@ def _create_games_for_pairings(
             game_time = slot
         game_datetime = datetime.combine(current_date, datetime.strptime(game_time, "%H:%M").time())
 
-        game = Game(
-            league_id=league_id,
-            team1_id=t1,
-            team2_id=t2,
-            week=week,
-            game_date=current_date,
-            game_time=game_time,
-            game_datetime=game_datetime,
-            duration_minutes=game_duration,
-            field_id=field_id_for_game,
-            created_by=admin_user_id,
-        )
-        db.add(game)
+        rows.append(_game_row(
+            league_id, t1, t2, week, current_date, game_time, game_datetime,
+            game_duration, field_id_for_game, admin_user_id,
+        ))
         details.append({
             "week": week,
             "date": current_date,
@@ -95,8 +142,110 @@ def _create_games_for_pairings(
             "game_datetime": game_datetime.isoformat(),
             "duration_minutes": game_duration,
         })
-        count += 1
-    return details, count
+    _insert_games(rows, db)
+    return details, len(rows)
+
+
+def _create_scheduled_games(
+    result: ScheduleResult,
+    game_duration: int,
+    league_id: UUID,
+    admin_user_id: str,
+    db: Session,
+) -> List[dict]:
+    """Create Game records for an optimizer result. Returns schedule details."""
+    rows: List[dict] = []
+    details: List[dict] = []
+    for scheduled in result.games:
+        slot = scheduled.slot
+        game_datetime = datetime.combine(slot.date, datetime.strptime(slot.time, "%H:%M").time())
+        rows.append(_game_row(
+            league_id, scheduled.matchup.team1_id, scheduled.matchup.team2_id, slot.week,
+            slot.date, slot.time, game_datetime, game_duration, slot.field_id, admin_user_id,
+        ))
+        details.append({
+            "week": slot.week,
+            "date": slot.date,
+            "time": slot.time,
+            "team1_id": scheduled.matchup.team1_id,
+            "team2_id": scheduled.matchup.team2_id,
+            "game_datetime": game_datetime.isoformat(),
+            "duration_minutes": game_duration,
+        })
+    _insert_games(rows, db)
+    return details
+
+
+def _generate_swiss_round(
+    league: League,
+    teams: List[Team],
+    start_date: date,
+    game_duration: int,
+    time_slots_provided: Optional[List[str]],
+    admin_user_id: str,
+    db: Session,
+) -> Tuple[List[dict], int]:
+    """
+    Pair and create the next Swiss round from the results so far.
+
+    Rounds are generated one at a time because each depends on the previous
+    round's results. Calling again before any game of the pending round has
+    been played re-pairs that round; a partially played round blocks.
+    """
+    total_rounds = league.swiss_rounds or league.num_weeks
+    games = db.query(Game).filter(
+        Game.league_id == league.id,
+        Game.is_active == True
+    ).all()
+
+    current_round = max((g.week for g in games if g.status != GAME_SCHEDULED), default=0)
+    if current_round and any(
+        g.week == current_round and g.status in (GAME_SCHEDULED, GAME_IN_PROGRESS) for g in games
+    ):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Round {current_round} is still in progress; record its results first",
+        )
+    next_round = current_round + 1
+    if next_round > total_rounds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"All {total_rounds} Swiss rounds have already been scheduled",
+        )
+
+    # Replace any unplayed (pending) round
+    db.query(Game).filter(
+        Game.league_id == league.id,
+        Game.is_active == True,
+        Game.status == GAME_SCHEDULED,
+    ).update({Game.is_active: False})
+
+    tiebreak = league.swiss_pairing_method if league.swiss_pairing_method in SWISS_TIEBREAKS else DEFAULT_SWISS_TIEBREAK
+    records = compute_swiss_records([t.id for t in teams], [g for g in games if g.status != GAME_SCHEDULED])
+    pairing = pair_swiss_round(records, tiebreak)
+
+    round_date = start_date + timedelta(weeks=next_round - 1)
+    windows_by_date: dict = {}
+    if not time_slots_provided:
+        windows_by_date = get_available_time_slots_for_range(
+            league.id, round_date, round_date, db, max_duration_minutes=game_duration,
+        )
+    round_slots = _get_week_slots(round_date, windows_by_date, time_slots_provided, game_duration)
+    if round_slots is None:
+        raise HTTPException(status_code=400, detail=f"No field availability on {round_date} for round {next_round}")
+    if len(round_slots) < len(pairing.pairings):
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Round {next_round} needs {len(pairing.pairings)} time slots on {round_date} "
+                f"but only {len(round_slots)} are available"
+            ),
+        )
+
+    return _create_games_for_pairings(
+        pairing.pairings, next_round, round_date, round_slots,
+        game_duration, league.id, admin_user_id, db,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -112,7 +261,12 @@ async def generate_schedule(
     db: Session = Depends(get_db),
     admin_user=Depends(get_admin_user)
 ):
-    """Generate a complete schedule for a league based on its tournament format."""
+    """
+    Generate a complete schedule for a league based on its tournament format.
+
+    Round robin schedules the whole season; Swiss schedules the next round
+    from current results on each call.
+    """
     league = db.query(League).filter(League.id == league_id).first()
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
@@ -128,55 +282,72 @@ async def generate_schedule(
     game_duration = min(schedule_data.game_duration or league.game_duration, MAX_GAME_DURATION_MINUTES)
     time_slots_provided = schedule_data.time_slots
 
+    if league.tournament_format == 'swiss':
+        schedule_details, games_created = _generate_swiss_round(
+            league, teams, start_date, game_duration, time_slots_provided, admin_user["id"], db,
+        )
+        db.commit()
+        invalidate_league(league_id)
+        return ScheduleGenerationResponse(
+            games_created=games_created,
+            weeks_scheduled=1,
+            schedule_details=schedule_details,
+        )
+
     # Clear existing games
-    for game in db.query(Game).filter(Game.league_id == league_id).all():
-        game.is_active = False
-
-    schedule_details: List[dict] = []
-    games_created = 0
-    current_date = start_date
-
-    if league.tournament_format == 'round_robin':
-        team_ids: list = [team.id for team in teams]
-        num_teams = len(team_ids)
-        if num_teams % 2 == 1:
-            team_ids.append(None)
-            num_teams += 1
-
-        for week in range(league.num_weeks):
-            if week > 0:
-                team_ids = [team_ids[0]] + team_ids[2:] + [team_ids[1]]
-
-            week_slots = _get_week_slots(league_id, current_date, db, time_slots_provided, game_duration)
-            if week_slots is None:
-                current_date += timedelta(days=7)
-                continue
-
-            pairings = [
-                (team_ids[i], team_ids[i + 1])
-                for i in range(0, num_teams, 2)
-                if team_ids[i] is not None and team_ids[i + 1] is not None
-            ]
-            details, cnt = _create_games_for_pairings(
-                pairings, week + 1, current_date, week_slots,
-                game_duration, league_id, admin_user["id"], db,
-            )
-            schedule_details.extend(details)
-            games_created += cnt
-            current_date += timedelta(days=7)
-
-    else:
-        raise HTTPException(
-            status_code=501,
-            detail="Swiss tournament scheduling is not yet implemented",
+    db.query(Game).filter(
+        Game.league_id == league_id,
+        Game.is_active == True,
+    ).update({Game.is_active: False})
+    rebuild_team_standings(db, league_id)
+
+    # Load availability and existing bookings for the whole season up front
+    # (a constant number of queries) rather than once per week.
+    windows_by_date: dict = {}
+    if not time_slots_provided:
+        season_end = start_date + timedelta(weeks=max(league.num_weeks - 1, 0))
+        windows_by_date = get_available_time_slots_for_range(
+            league_id, start_date, season_end, db, max_duration_minutes=game_duration,
         )
 
+    slots_by_week: dict = {}
+    for week in range(1, league.num_weeks + 1):
+        week_date = start_date + timedelta(weeks=week - 1)
+        week_slots = _get_week_slots(week_date, windows_by_date, time_slots_provided, game_duration)
+        if week_slots is None:
+            continue
+        slots_by_week[week] = [
+            Slot(week, week_date, slot[1], slot[0]) if isinstance(slot, tuple) else Slot(week, week_date, slot)
+            for slot in week_slots
+        ]
+
+    games_per_week = schedule_data.games_per_week or league.games_per_week or 1
+    problem = ScheduleProblem(
+        matchups=round_robin_matchups([team.id for team in teams], league.num_weeks, games_per_week),
+        slots_by_week=slots_by_week,
+        num_weeks=league.num_weeks,
+        games_per_week=games_per_week,
+        game_duration=game_duration,
+    )
+    # CPU-bound for up to the time budget; keep it off the event loop
+    result = await run_in_threadpool(
+        optimize_schedule,
+        problem,
+        engine=schedule_data.engine or DEFAULT_ENGINE,
+        time_budget_ms=schedule_data.time_budget_ms or DEFAULT_TIME_BUDGET_MS,
+    )
+    schedule_details = _create_scheduled_games(result, game_duration, league_id, admin_user["id"], db)
+
     db.commit()
+    invalidate_league(league_id)
 
     return ScheduleGenerationResponse(
-        games_created=games_created,
+        games_created=len(schedule_details),
         weeks_scheduled=league.num_weeks,
         schedule_details=schedule_details,
+        engine=result.engine,
+        objective_score=result.objective,
+        unscheduled_games=len(result.unscheduled),
     )
 
 
@@ -243,6 +414,27 @@ async def get_league_schedule(
         "schedule_by_week": schedule_by_week
     }
 
+@router.get("/leagues/{league_id}/schedule/export", summary="Download the league schedule as CSV or NDJSON")
+@limiter.limit("10/minute")
+async def export_league_schedule(
+    request: Request,
+    league_id: UUID,
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user)
+):
+    """Stream every active game of a league, one row per game; see league_export_service."""
+    try:
+        export = load_schedule_export(db, league_id, format)
+    except ServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    return StreamingResponse(
+        iter_export(db, export),
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
+
 @router.put("/leagues/{league_id}/games/{game_id}", summary="Update a game's score or details")
 @limiter.limit("30/minute")
 async def update_game(
@@ -254,14 +446,18 @@ async def update_game(
     admin_user=Depends(get_admin_user)
 ):
     """Update a game's score, status, or scheduling details (date/time/field)."""
+    # Lock the row before snapshotting: concurrent score updates would otherwise
+    # share one `before` and both add their delta to team_standings.
     game = db.query(Game).filter(
         Game.id == game_id,
         Game.league_id == league_id,
         Game.is_active == True
-    ).first()
+    ).with_for_update().first()
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
+    before = GameResult.from_game(game)
+
     # Validate winner_id against game participants
     if game_data.winner_id is not None and game_data.winner_id not in (game.team1_id, game.team2_id):
         raise HTTPException(status_code=400, detail="Winner must be one of the teams in this game")
@@ -300,7 +496,9 @@ async def update_game(
         game.field_id = game_data.field_id
 
     try:
+        apply_game_result_change(db, before, GameResult.from_game(game))
         db.commit()
+        invalidate_league(game.league_id)
         db.refresh(game)
         return {
             "message": "Game updated successfully",
@@ -314,3 +512,28 @@ async def update_game(
         db.rollback()
         logger.exception("Failed to update game: %s", e)
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
+
+
+@router.post("/leagues/{league_id}/standings/rebuild", summary="Rebuild league standings from games")
+@limiter.limit("30/minute")
+async def rebuild_league_standings(
+    request: Request,
+    league_id: UUID,
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user)
+):
+    """Recompute the stored standings aggregate for a league from its games (drift repair)."""
+    league = db.query(League).filter(League.id == league_id).first()
+    if not league:
+        raise HTTPException(status_code=404, detail="League not found")
+
+    try:
+        teams_ranked = rebuild_team_standings(db, league_id)
+        db.commit()
+        invalidate_league(league_id)
+    except Exception as e:
+        db.rollback()
+        logger.exception("Failed to rebuild standings: %s", e)
+        raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
+
+    return {"message": "Standings rebuilt", "league_id": str(league_id), "teams_ranked": teams_ranked}
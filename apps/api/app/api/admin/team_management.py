@@ -1,9 +1,11 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal
 from uuid import UUID
+from app.core.cache import invalidate_league
 from app.core.limiter import limiter
 from app.db.db import get_db
 from app.models.league import League
@@ -15,6 +17,8 @@ from app.api.schemas.admin import (
     LeagueMemberResponse, TeamResponse, TeamGenerationRequest, TeamGenerationResponse
 )
 from app.api.admin.dependencies import get_admin_user
+from app.services.exceptions import ServiceError
+from app.services.league_export_service import iter_export, load_roster_export
 from app.services.team_generation_service import generate_teams as run_team_generation
 
 logger = logging.getLogger(__name__)
@@ -78,6 +82,27 @@ async def get_league_members(
 
     return result
 
+@router.get("/leagues/{league_id}/members/export", summary="Download the league roster as CSV or NDJSON")
+@limiter.limit("10/minute")
+async def export_league_members(
+    request: Request,
+    league_id: UUID,
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user)
+):
+    """Stream every active member of a league; rows are read in batches, see league_export_service."""
+    try:
+        export = load_roster_export(db, league_id, format)
+    except ServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    return StreamingResponse(
+        iter_export(db, export),
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
+
 @router.get("/leagues/{league_id}/teams", response_model=List[TeamResponse], summary="Get all teams for a league")
 @limiter.limit("30/minute")
 async def get_league_teams(
@@ -124,8 +149,18 @@ async def generate_teams(
         raise HTTPException(status_code=400, detail="No confirmed players found for this league")
 
     try:
-        result = run_team_generation(league, db, teams_count=team_data.teams_count)
+        result = run_team_generation(
+            league,
+            db,
+            teams_count=team_data.teams_count,
+            balance_by=team_data.balance_by,
+            seed=team_data.seed,
+        )
         db.commit()
+        invalidate_league(league_id)
+    except ServiceError as e:
+        db.rollback()
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         db.rollback()
         logger.exception("Team generation failed for league %s: %s", league_id, e)
@@ -4,6 +4,7 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.limiter import limiter
@@ -11,10 +12,12 @@ from app.db.db import get_db
 from app.api.admin.dependencies import get_admin_user
 from app.services.exceptions import ServiceError
 import app.services.waiver_service as waiver_svc
+from app.services.waiver_archive_service import get_waiver_export, start_waiver_export
 from app.services.s3_service import generate_presigned_url
 from app.api.schemas.waiver import (
     AdminCreateWaiverRequest,
     AdminWaiverSignatureResponse,
+    WaiverExportResponse,
     WaiverResponse,
 )
 
@@ -45,6 +48,51 @@ async def list_waiver_signatures(
     ]
 
 
+@router.post(
+    "/waivers/export",
+    response_model=WaiverExportResponse,
+    status_code=202,
+    summary="Start a ZIP export of every signed waiver PDF for a league",
+)
+@limiter.limit("5/minute")
+async def export_waiver_archive(
+    request: Request,
+    league_id: UUID = Query(...),
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user),
+):
+    """
+    Builds a ZIP of the league's signed PDFs plus manifest.csv in S3; poll
+    GET /waivers/export/{export_id} for the download URL. PDFs missing from S3
+    are regenerated into the archive; see waiver_archive_service.
+    """
+    try:
+        # Without an export Lambda (local dev) this builds the whole archive
+        export_id = await run_in_threadpool(start_waiver_export, db, league_id)
+        return get_waiver_export(db, league_id, export_id)
+    except ServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+@router.get(
+    "/waivers/export/{export_id}",
+    response_model=WaiverExportResponse,
+    summary="Get a waiver export's status and download URL",
+)
+@limiter.limit("30/minute")
+async def get_waiver_archive_export(
+    request: Request,
+    export_id: UUID,
+    league_id: UUID = Query(...),
+    db: Session = Depends(get_db),
+    admin_user=Depends(get_admin_user),
+):
+    try:
+        return get_waiver_export(db, league_id, export_id)
+    except ServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
 @router.post("/waivers", response_model=WaiverResponse, status_code=201, summary="Create a new waiver version")
 @limiter.limit("5/minute")
 async def create_waiver_version(
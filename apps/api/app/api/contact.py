@@ -1,13 +1,15 @@
-import asyncio
-import functools
 import html
 import logging
 import httpx
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Depends, Request, HTTPException
 from pydantic import BaseModel, EmailStr, Field, field_validator
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.core.http_client import CircuitOpenError, http_client
 from app.core.limiter import limiter
-from app.services.email_service import send_contact_message
+from app.db.db import get_db
+from app.services.email_outbox_service import enqueue_email
+from app.services.email_service import build_contact_message
 
 logger = logging.getLogger(__name__)
 
@@ -54,19 +56,18 @@ class ContactRequest(BaseModel):
 
 async def verify_recaptcha(token: str) -> bool:
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.post(
-                "https://www.google.com/recaptcha/api/siteverify",
-                data={
-                    "secret": settings.RECAPTCHA_SECRET_KEY,
-                    "response": token,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("success", False) and data.get("score", 1.0) >= 0.5
-    except httpx.TimeoutException:
-        logger.error("reCAPTCHA verification timed out")
+        resp = await http_client.post(
+            "https://www.google.com/recaptcha/api/siteverify",
+            data={
+                "secret": settings.RECAPTCHA_SECRET_KEY,
+                "response": token,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return data.get("success", False) and data.get("score", 1.0) >= 0.5
+    except (httpx.TimeoutException, CircuitOpenError) as e:
+        logger.error("reCAPTCHA verification unavailable: %s", e)
         raise HTTPException(status_code=503, detail="Service temporarily unavailable.")
     except Exception as e:
         logger.error("reCAPTCHA verification failed: %s", e)
@@ -75,7 +76,7 @@ async def verify_recaptcha(token: str) -> bool:
 
 @router.post("")
 @limiter.limit("5/hour")
-async def contact(request: Request, body: ContactRequest):
+async def contact(request: Request, body: ContactRequest, db: Session = Depends(get_db)):
     if not settings.RECAPTCHA_SECRET_KEY:
         raise HTTPException(status_code=503, detail="Contact form is temporarily unavailable.")
     valid = await verify_recaptcha(body.recaptcha_token)
@@ -85,20 +86,17 @@ async def contact(request: Request, body: ContactRequest):
     if not settings.CONTACT_EMAIL:
         raise HTTPException(status_code=500, detail="Contact email not configured")
 
-    loop = asyncio.get_running_loop()
     try:
-        await loop.run_in_executor(
-            None,
-            functools.partial(
-                send_contact_message,
-                sender_name=body.name,
-                sender_email=body.email,
-                subject=body.subject,
-                message=body.message,
-            ),
-        )
+        enqueue_email(db, "contact_message", build_contact_message(
+            sender_name=body.name,
+            sender_email=body.email,
+            subject=body.subject,
+            message=body.message,
+        ))
+        db.commit()
     except Exception as e:
-        logger.exception("Failed to send contact email: %s", e)
+        db.rollback()
+        logger.exception("Failed to queue contact email: %s", e)
         raise HTTPException(status_code=500, detail="Failed to send message. Please try again later.")
 
     return {"success": True, "message": "Your message has been sent."}
@@ -1,13 +1,16 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import LISTING_SCOPE, WithHeaders, cached_json_response, public_cache
 from app.core.limiter import limiter
-from app.db.db import get_db
+from app.core.pagination import CountMode, InvalidCursorError, KeysetPage, count_rows, decode_cursor, keyset_page, page_headers
+from app.db.db import get_async_db
 from app.models.group_invitation import GroupInvitation
 from app.models.league import League
 from app.models.league_player import LeaguePlayer
@@ -22,6 +25,12 @@ from app.utils.clerk_jwt import get_optional_user
 router = APIRouter()
 
 
+def _league_cache_key(resource: str, league_id: UUID) -> str | None:
+    if not public_cache.enabled:
+        return None
+    return f"public:{resource}:{league_id}:{public_cache.version(str(league_id))}"
+
+
 def _compute_league_response(
     league: League,
     confirmed_counts: dict,
@@ -69,18 +78,29 @@ def _compute_league_response(
     )
 
 
-@router.get("/public/leagues", response_model=List[PublicLeagueResponse], summary="Get all leagues (public view)")
-@limiter.limit("60/minute")
-async def get_public_leagues(
-    request: Request,
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, le=100),
-    db: Session = Depends(get_db),
-    user: dict | None = Depends(get_optional_user),
-):
-    """Get all leagues with registration statistics for public viewing"""
-    limit = min(limit, 100)
-    leagues = db.query(League).order_by(League.created_at.desc()).offset(skip).limit(limit).all()
+def list_public_leagues(
+    db: Session,
+    skip: int = 0,
+    limit: int = 50,
+    clerk_user_id: str | None = None,
+    cursor: str | None = None,
+) -> KeysetPage:
+    """
+    Build one page of the public league listing, newest first.
+
+    Pages by `cursor` (keyset on created_at, id); `skip` is the legacy offset.
+    Sync so it runs under Session or AsyncSession.run_sync.
+    """
+    page = keyset_page(db.query(League), League, cursor, limit, offset=skip)
+    page.items = _public_league_responses(db, page.items, clerk_user_id)
+    return page
+
+
+def _public_league_responses(
+    db: Session,
+    leagues: List[League],
+    clerk_user_id: str | None,
+) -> List[PublicLeagueResponse]:
     if not leagues:
         return []
 
@@ -117,8 +137,8 @@ async def get_public_leagues(
 
     # Optionally fold per-user registration state into the response
     registered_league_ids: set | None = None
-    if user:
-        player = db.query(Player).filter(Player.clerk_user_id == user["id"]).first()
+    if clerk_user_id:
+        player = db.query(Player).filter(Player.clerk_user_id == clerk_user_id).first()
         if player:
             registered_league_ids = set(
                 row[0] for row in db.query(LeaguePlayer.league_id)
@@ -138,17 +158,55 @@ async def get_public_leagues(
     ]
 
 
-@router.get("/{league_id}/standings", summary="Get standings for a specific league")
+@router.get("/public/leagues", response_model=List[PublicLeagueResponse], summary="Get all leagues (public view)")
 @limiter.limit("60/minute")
-async def get_league_standings(request: Request, league_id: UUID, db: Session = Depends(get_db)):
-    """Return real standings computed from completed game results for a league."""
-    from app.services.schedule_service import calculate_team_standings
+async def get_public_leagues(
+    request: Request,
+    skip: int = Query(default=0, ge=0, description="Legacy offset; prefer cursor"),
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, max_length=200, description="X-Next-Cursor from the previous page"),
+    count: CountMode = Query(default="none", description="Return X-Total-Count: exact, estimated (planner statistics) or none"),
+    db: AsyncSession = Depends(get_async_db),
+    user: dict | None = Depends(get_optional_user),
+):
+    """Get all leagues with registration statistics for public viewing"""
+    limit = min(limit, 100)
+    if cursor is not None:
+        if skip:
+            raise HTTPException(status_code=400, detail="Use either skip or cursor, not both")
+        try:
+            decode_cursor(cursor)
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    clerk_user_id = user["id"] if user else None
+    # Signed-in responses carry is_registered, so only anonymous ones are shared
+    key = None
+    if clerk_user_id is None and public_cache.enabled:
+        position = cursor if cursor is not None else f"skip={skip}"
+        key = f"public:leagues:{public_cache.version(LISTING_SCOPE)}:{position}:{limit}:{count}"
+
+    def load(sync_db: Session) -> WithHeaders:
+        page = list_public_leagues(sync_db, skip, limit, clerk_user_id, cursor)
+        total = count_rows(sync_db, sync_db.query(League), count)
+        return WithHeaders(page.items, page_headers(page, total, count))
+
+    async def build():
+        return await db.run_sync(load)
+
+    return await cached_json_response(
+        request, public_cache, key, build, shared=clerk_user_id is None,
+    )
+
+
+def get_standings_rows(db: Session, league_id: UUID) -> list[dict] | None:
+    """Return ranked standings rows for a league, or None if the league does not exist."""
+    from app.services.standings_service import get_team_standings
 
     league = db.query(League).filter(League.id == league_id).first()
     if not league:
-        raise HTTPException(status_code=404, detail="League not found")
+        return None
 
-    standings = calculate_team_standings(league_id, db)
+    standings = get_team_standings(db, league_id)
 
     team_ids = [team_id for team_id, _ in standings]
     teams_by_id = {t.id: t for t in db.query(Team).filter(Team.id.in_(team_ids)).all()}
@@ -170,13 +228,24 @@ async def get_league_standings(request: Request, league_id: UUID, db: Session =
     return result
 
 
-@router.get("/{league_id}/schedule", summary="Get schedule for a specific league")
+@router.get("/{league_id}/standings", summary="Get standings for a specific league")
 @limiter.limit("60/minute")
-async def get_public_league_schedule(request: Request, league_id: UUID, db: Session = Depends(get_db)):
-    """Return the full schedule for a league, grouped by week."""
+async def get_league_standings(request: Request, league_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """Return real standings computed from completed game results for a league."""
+    response = await cached_json_response(
+        request, public_cache, _league_cache_key("standings", league_id),
+        lambda: db.run_sync(get_standings_rows, league_id),
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="League not found")
+    return response
+
+
+def get_public_schedule(db: Session, league_id: UUID) -> dict | None:
+    """Return the week-grouped public schedule, or None if the league does not exist."""
     league = db.query(League).filter(League.id == league_id).first()
     if not league:
-        raise HTTPException(status_code=404, detail="League not found")
+        return None
 
     games = db.query(Game).filter(
         Game.league_id == league_id,
@@ -218,18 +287,28 @@ async def get_public_league_schedule(request: Request, league_id: UUID, db: Sess
     }
 
 
-@router.get("/{league_id}", response_model=PublicLeagueResponse, summary="Get a single league (public view)")
+@router.get("/{league_id}/schedule", summary="Get schedule for a specific league")
 @limiter.limit("60/minute")
-async def get_league_by_id(
-    request: Request,
+async def get_public_league_schedule(request: Request, league_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """Return the full schedule for a league, grouped by week."""
+    response = await cached_json_response(
+        request, public_cache, _league_cache_key("schedule", league_id),
+        lambda: db.run_sync(get_public_schedule, league_id),
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="League not found")
+    return response
+
+
+def get_public_league(
+    db: Session,
     league_id: UUID,
-    db: Session = Depends(get_db),
-    user: dict | None = Depends(get_optional_user),
-):
-    """Get a single league by ID. Does not filter by is_active — past leagues remain viewable."""
+    clerk_user_id: str | None = None,
+) -> PublicLeagueResponse | None:
+    """Build a single public league response, or None if the league does not exist."""
     league = db.query(League).filter(League.id == league_id).first()
     if not league:
-        raise HTTPException(status_code=404, detail="League not found")
+        return None
 
     now = datetime.now(timezone.utc)
 
@@ -254,8 +333,8 @@ async def get_league_by_id(
     pending_invite_counts = {league_id: pending_invite_count}
 
     registered_league_ids: set | None = None
-    if user:
-        player = db.query(Player).filter(Player.clerk_user_id == user["id"]).first()
+    if clerk_user_id:
+        player = db.query(Player).filter(Player.clerk_user_id == clerk_user_id).first()
         if player:
             lp = db.query(LeaguePlayer).filter(
                 LeaguePlayer.player_id == player.id,
@@ -268,3 +347,18 @@ async def get_league_by_id(
             registered_league_ids = set()
 
     return _compute_league_response(league, confirmed_counts, team_counts, pending_invite_counts, registered_league_ids)
+
+
+@router.get("/{league_id}", response_model=PublicLeagueResponse, summary="Get a single league (public view)")
+@limiter.limit("60/minute")
+async def get_league_by_id(
+    request: Request,
+    league_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    user: dict | None = Depends(get_optional_user),
+):
+    """Get a single league by ID. Does not filter by is_active — past leagues remain viewable."""
+    result = await db.run_sync(get_public_league, league_id, user["id"] if user else None)
+    if result is None:
+        raise HTTPException(status_code=404, detail="League not found")
+    return result
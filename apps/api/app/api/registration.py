@@ -4,14 +4,13 @@ Each endpoint handles: rate limiting, auth, request parsing, response building.
 Domain logic lives in services/registration_service.py and services/invitation_service.py.
 """
 
-import asyncio
-import functools
 import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_league, invalidate_listing
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.db.db import get_db
@@ -19,7 +18,8 @@ from app.models.league import League
 from app.models.player import Player
 from app.utils.clerk_jwt import get_current_user
 from app.services.exceptions import ServiceError
-from app.services.email_service import send_group_invitation, send_waiver_prompt
+from app.services.email_outbox_service import enqueue_email
+from app.services.email_service import build_group_invitation, build_waiver_prompt
 from app.services.team_generation_service import trigger_team_generation_if_ready
 import app.services.registration_service as registration_svc
 import app.services.invitation_service as invitation_svc
@@ -49,6 +49,16 @@ def _get_clerk_id(user: dict) -> str:
     return cid
 
 
+def _enqueue_waiver_prompt(db: Session, player: Player, league_name: str, league_id: UUID) -> None:
+    enqueue_email(db, "waiver_prompt", build_waiver_prompt(
+        to_email=player.email,
+        to_name=f"{player.first_name} {player.last_name}",
+        league_name=league_name,
+        league_id=str(league_id),
+        expiry_days=settings.WAIVER_EXPIRY_DAYS,
+    ))
+
+
 # ---------------------------------------------------------------------------
 # Solo registration
 # ---------------------------------------------------------------------------
@@ -77,8 +87,10 @@ async def register_player(
             communications_accepted=registration_data.communicationsAccepted,
             group_name=registration_data.groupName if registration_data.groupName else None,
         )
+        _enqueue_waiver_prompt(db, result.player, result.league_name, registration_data.league_id)
         db.commit()
         db.refresh(result.league_player)
+        invalidate_league(registration_data.league_id)
     except ServiceError as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
@@ -89,26 +101,10 @@ async def register_player(
     try:
         if trigger_team_generation_if_ready(registration_data.league_id, db):
             db.commit()
+            invalidate_league(registration_data.league_id)
     except Exception as e:
         logger.exception("Team generation trigger failed after solo registration: %s", e)
 
-    # Send waiver prompt email (best-effort)
-    try:
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(
-            None,
-            functools.partial(
-                send_waiver_prompt,
-                to_email=result.player.email,
-                to_name=f"{result.player.first_name} {result.player.last_name}",
-                league_name=result.league_name,
-                league_id=str(registration_data.league_id),
-                expiry_days=settings.WAIVER_EXPIRY_DAYS,
-            ),
-        )
-    except Exception as e:
-        logger.exception("Waiver prompt email failed after solo registration: %s", e)
-
     lp = result.league_player
     return RegistrationResponse(
         success=True,
@@ -154,7 +150,23 @@ async def register_group(
             players=[p.model_dump() for p in registration_data.players],
             invitation_expiry_days=settings.INVITATION_EXPIRY_DAYS,
         )
+        # Emails are queued in the same transaction and delivered by the outbox drainer
+        for ed in result.invitation_emails:
+            enqueue_email(db, "group_invitation", build_group_invitation(
+                to_email=ed.to_email,
+                to_name=ed.to_name,
+                inviter_name=result.organizer_name,
+                group_name=result.group_name,
+                league_name=result.league_name,
+                token=ed.token,
+                app_url=settings.APP_URL,
+                expiry_days=settings.INVITATION_EXPIRY_DAYS,
+            ))
+        organizer = db.query(Player).filter(Player.id == result.organizer_player_id).first()
+        if organizer:
+            _enqueue_waiver_prompt(db, organizer, result.league_name, registration_data.league_id)
         db.commit()
+        invalidate_league(registration_data.league_id)
     except ServiceError as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
@@ -162,53 +174,6 @@ async def register_group(
         logger.exception("Group registration failed: %s", e)
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
 
-    # Send invitation emails concurrently (best-effort — don't roll back if email fails)
-    if settings.RESEND_API_KEY and result.invitation_emails:
-        loop = asyncio.get_running_loop()
-
-        async def _send(ed):
-            try:
-                await loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        send_group_invitation,
-                        to_email=ed.to_email,
-                        to_name=ed.to_name,
-                        inviter_name=result.organizer_name,
-                        group_name=result.group_name,
-                        league_name=result.league_name,
-                        token=ed.token,
-                        app_url=settings.APP_URL,
-                        expiry_days=settings.INVITATION_EXPIRY_DAYS,
-                    ),
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to send invitation email for group %s: %s",
-                    result.group_id, e,
-                )
-
-        await asyncio.gather(*[_send(ed) for ed in result.invitation_emails])
-
-    # Send waiver prompt email to organizer (best-effort)
-    try:
-        organizer = db.query(Player).filter(Player.id == result.organizer_player_id).first()
-        if organizer:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None,
-                functools.partial(
-                    send_waiver_prompt,
-                    to_email=organizer.email,
-                    to_name=result.organizer_name,
-                    league_name=result.league_name,
-                    league_id=str(registration_data.league_id),
-                    expiry_days=settings.WAIVER_EXPIRY_DAYS,
-                ),
-            )
-    except Exception as e:
-        logger.exception("Waiver prompt email failed after group registration: %s", e)
-
     return RegistrationResponse(
         success=True,
         message=(
@@ -257,7 +222,12 @@ async def accept_invitation(
 
     try:
         result = invitation_svc.accept_invitation(db, clerk_user_id, jwt_email, token)
+        player = db.query(Player).filter(Player.clerk_user_id == clerk_user_id).first()
+        league = db.query(League).filter(League.id == result.league_id).first()
+        if player and league:
+            _enqueue_waiver_prompt(db, player, league.name, result.league_id)
         db.commit()
+        invalidate_league(result.league_id)
     except ServiceError as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
@@ -268,29 +238,10 @@ async def accept_invitation(
     try:
         if trigger_team_generation_if_ready(result.league_id, db):
             db.commit()
+            invalidate_league(result.league_id)
     except Exception as e:
         logger.exception("Team generation trigger failed after invitation acceptance: %s", e)
 
-    # Send waiver prompt email to the invitee who just accepted (best-effort)
-    try:
-        player = db.query(Player).filter(Player.clerk_user_id == clerk_user_id).first()
-        league = db.query(League).filter(League.id == result.league_id).first()
-        if player and league:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None,
-                functools.partial(
-                    send_waiver_prompt,
-                    to_email=player.email,
-                    to_name=f"{player.first_name} {player.last_name}",
-                    league_name=league.name,
-                    league_id=str(result.league_id),
-                    expiry_days=settings.WAIVER_EXPIRY_DAYS,
-                ),
-            )
-    except Exception as e:
-        logger.exception("Waiver prompt email failed after invitation acceptance: %s", e)
-
     return SuccessResponse(success=True, message="Invitation accepted. You are now registered for the league.")
 
 
@@ -307,6 +258,7 @@ async def decline_invitation(
     try:
         invitation_svc.decline_invitation(db, jwt_email, token)
         db.commit()
+        invalidate_listing()
     except ServiceError as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
@@ -404,6 +356,7 @@ async def revoke_invitation(
     try:
         invitation_svc.revoke_invitation(db, clerk_user_id, invitation_id)
         db.commit()
+        invalidate_listing()
     except ServiceError as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
@@ -431,6 +384,7 @@ async def unregister_from_league(
     try:
         registration_svc.unregister(db, clerk_user_id, league_id)
         db.commit()
+        invalidate_league(league_id)
     except ServiceError as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
@@ -23,6 +23,7 @@ from app.api.schemas.admin import (
     # User Management
     UserResponse,
     PaginatedUserResponse,
+    PlayerSearchResult,
     # Field Management
     FieldResponse,
     FieldCreateRequest,
@@ -31,6 +32,12 @@ from app.api.schemas.admin import (
     FieldAvailabilityResponse,
     FieldAvailabilityCreateRequest,
     FieldAvailabilityUpdateRequest,
+    # Field Blackouts
+    FieldBlackoutResponse,
+    FieldBlackoutCreateRequest,
+    FieldRiskWindow,
+    FieldUtilizationResponse,
+    FieldUtilizationReportResponse,
 )
 
 # User schemas
@@ -68,12 +75,18 @@ __all__ = [
     "AdminConfigUpdateRequest",
     "UserResponse",
     "PaginatedUserResponse",
+    "PlayerSearchResult",
     "FieldResponse",
     "FieldCreateRequest",
     "FieldUpdateRequest",
     "FieldAvailabilityResponse",
     "FieldAvailabilityCreateRequest",
     "FieldAvailabilityUpdateRequest",
+    "FieldBlackoutResponse",
+    "FieldBlackoutCreateRequest",
+    "FieldRiskWindow",
+    "FieldUtilizationResponse",
+    "FieldUtilizationReportResponse",
     # User schemas
     "UserProfile",
     "UserBase",
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, ValidationInfo, field_validator
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime, date, time, timezone
 from decimal import Decimal
 from uuid import UUID
@@ -42,6 +42,14 @@ class LeagueCreateRequest(BaseModel):
             raise ValueError(f'tournament_format must be one of {valid_formats}')
         return v
 
+    @field_validator('swiss_pairing_method')
+    @classmethod
+    def validate_swiss_pairing_method(cls, v):
+        valid_methods = ['buchholz', 'sonneborn_berger']
+        if v is not None and v not in valid_methods:
+            raise ValueError(f'swiss_pairing_method must be one of {valid_methods}')
+        return v
+
     @field_validator('format')
     @classmethod
     def validate_format(cls, v):
@@ -111,6 +119,15 @@ class LeagueUpdateRequest(BaseModel):
                 raise ValueError(f'tournament_format must be one of {valid_formats}')
         return v
 
+    @field_validator('swiss_pairing_method')
+    @classmethod
+    def validate_swiss_pairing_method(cls, v):
+        if v is not None:
+            valid_methods = ['buchholz', 'sonneborn_berger']
+            if v not in valid_methods:
+                raise ValueError(f'swiss_pairing_method must be one of {valid_methods}')
+        return v
+
     @field_validator('max_teams')
     @classmethod
     def validate_max_teams(cls, v):
@@ -188,6 +205,17 @@ class TeamGenerationRequest(BaseModel):
     min_players_per_team: Optional[int] = Field(None, ge=1, le=20)
     team_names: Optional[List[str]] = None
     team_colors: Optional[List[str]] = None
+    balance_by: Optional[str] = Field(None, max_length=30)  # 'gender'
+    seed: int = Field(0, ge=0)
+
+    @field_validator('balance_by')
+    @classmethod
+    def validate_balance_by(cls, v):
+        if v is not None:
+            valid_attributes = ['gender']
+            if v not in valid_attributes:
+                raise ValueError(f'balance_by must be one of {valid_attributes}')
+        return v
 
 class TeamGenerationResponse(BaseModel):
     teams_created: int
@@ -202,11 +230,25 @@ class ScheduleGenerationRequest(BaseModel):
     game_duration: Optional[int] = Field(None, gt=0, le=300)
     games_per_week: Optional[int] = Field(None, gt=0, le=10)
     time_slots: Optional[List[str]] = None
+    engine: Optional[str] = Field(None, max_length=30)  # 'optimized' (default), 'greedy'
+    time_budget_ms: Optional[int] = Field(None, gt=0, le=30000)
+
+    @field_validator('engine')
+    @classmethod
+    def validate_engine(cls, v):
+        if v is not None:
+            valid_engines = ['optimized', 'greedy']
+            if v not in valid_engines:
+                raise ValueError(f'engine must be one of {valid_engines}')
+        return v
 
 class ScheduleGenerationResponse(BaseModel):
     games_created: int
     weeks_scheduled: int
     schedule_details: List[dict]
+    engine: Optional[str] = None
+    objective_score: Optional[float] = None
+    unscheduled_games: int = 0
 
 # Admin Management Schemas
 class AdminConfigResponse(BaseModel):
@@ -240,12 +282,17 @@ class UserResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+class PlayerSearchResult(UserResponse):
+    score: float  # higher is a better match; only comparable within one search
+
 class PaginatedUserResponse(BaseModel):
     users: List[UserResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # None when count=none
+    total_is_estimate: bool = False  # planner estimate (count=estimated)
+    page: Optional[int] = None  # None when paging by cursor
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page; None on the last page
 
 # Field Management Schemas
 class FieldResponse(BaseModel):
@@ -408,6 +455,70 @@ class FieldAvailabilityUpdateRequest(BaseModel):
             raise ValueError('day_of_week must be between 0 (Monday) and 6 (Sunday)')
         return v
 
+# Field Blackout Schemas
+class FieldBlackoutResponse(BaseModel):
+    id: UUID
+    field_id: UUID
+    starts_at: datetime
+    ends_at: datetime
+    reason: Optional[str] = None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class FieldBlackoutCreateRequest(BaseModel):
+    starts_at: datetime
+    ends_at: datetime
+    reason: Optional[str] = Field(None, max_length=500)
+
+    @field_validator('starts_at', 'ends_at')
+    @classmethod
+    def validate_local_time(cls, v):
+        """Blackouts are local wall-clock times, like game times; drop any offset."""
+        return v.replace(tzinfo=None)
+
+    @field_validator('ends_at')
+    @classmethod
+    def validate_ends_at(cls, v, info: ValidationInfo):
+        """Validate ends_at is after starts_at."""
+        starts_at = info.data.get('starts_at')
+        if starts_at and v <= starts_at:
+            raise ValueError('ends_at must be after starts_at')
+        return v
+
+class FieldRiskWindow(BaseModel):
+    date: date
+    start_time: time
+    end_time: time
+    kind: Literal["double_booked", "outside_availability"]
+
+class FieldUtilizationResponse(BaseModel):
+    """Minutes per field; hourly_* grids are [weekday][hour] (Monday first), daily_* arrays start at start_date."""
+    field_id: UUID
+    field_name: str
+    available_minutes: int  # availability windows minus blackouts
+    booked_minutes: int  # games inside available time, all leagues
+    idle_minutes: int
+    blocked_minutes: int  # availability lost to blackouts
+    conflict_minutes: int  # game time outside availability or during blackouts
+    double_booked_minutes: int
+    utilization: float
+    hourly_available_minutes: List[List[int]]
+    hourly_booked_minutes: List[List[int]]
+    hourly_utilization: List[List[Optional[float]]]  # None where never available
+    daily_available_minutes: List[int]
+    daily_booked_minutes: List[int]
+    risks: List[FieldRiskWindow]
+    risks_truncated: bool = False
+
+class FieldUtilizationReportResponse(BaseModel):
+    start_date: date
+    end_date: date
+    slot_minutes: int
+    fields: List[FieldUtilizationResponse]
+
 # Game Management Schemas
 class GameUpdateRequest(BaseModel):
     team1_score: Optional[int] = Field(None, ge=0, le=999)
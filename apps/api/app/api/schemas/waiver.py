@@ -65,6 +65,15 @@ class AdminWaiverSignatureResponse(BaseModel):
     pdf_url: Optional[str] = None
 
 
+class WaiverExportResponse(BaseModel):
+    export_id: UUID
+    status: str  # "pending", "ready" or "failed"
+    download_url: Optional[str] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class AdminCreateWaiverRequest(BaseModel):
     version: str = Field(..., min_length=1, max_length=50)
     content: str = Field(..., min_length=1, max_length=50000)
@@ -1,9 +1,6 @@
 """Waiver API — public endpoints for waiver display and signing."""
 
-import asyncio
-import functools
 import logging
-from datetime import datetime, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
@@ -11,14 +8,11 @@ from sqlalchemy.orm import Session
 
 from app.core.limiter import limiter
 from app.db.db import get_db
-from app.models.league import League
 from app.models.player import Player
 from app.utils.clerk_jwt import get_current_user, get_optional_user
 from app.services.exceptions import ServiceError
 import app.services.waiver_service as waiver_svc
-from app.services.pdf_service import generate_waiver_pdf
-from app.services.s3_service import upload_waiver_pdf, generate_presigned_url
-from app.services.email_service import send_waiver_confirmation
+from app.services.s3_service import generate_presigned_url
 from app.services.team_generation_service import trigger_team_generation_if_ready
 from app.api.schemas.waiver import (
     PresignedUrlResponse,
@@ -98,43 +92,10 @@ async def sign_waiver(
         logger.exception("Waiver signing failed: %s", e)
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
 
-    # Get waiver and league for PDF/email
+    # The signed PDF, S3 upload and confirmation email run in the background
+    # document stage (services/waiver_document_service.py), keyed off this row
     waiver = db.query(waiver_svc.Waiver).filter(waiver_svc.Waiver.id == body.waiver_id).first()
-    league = db.query(League).filter(League.id == body.league_id).first()
     waiver_version = waiver.version if waiver else "unknown"
-    league_name = league.name if league else "Unknown League"
-
-    # Generate PDF, upload to S3, send email (best-effort, don't roll back signature)
-    try:
-        pdf_bytes = generate_waiver_pdf(
-            waiver_content=waiver.content if waiver else "",
-            waiver_version=waiver_version,
-            league_name=league_name,
-            player_name=body.full_name_typed,
-            signed_at=signature.signed_at,
-        )
-
-        s3_key = upload_waiver_pdf(pdf_bytes, body.league_id, player.id, signature.id)
-        if s3_key:
-            signature.pdf_path = s3_key
-
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(
-            None,
-            functools.partial(
-                send_waiver_confirmation,
-                to_email=player.email,
-                to_name=f"{player.first_name} {player.last_name}",
-                league_name=league_name,
-                waiver_version=waiver_version,
-                signed_at=signature.signed_at,
-                pdf_bytes=pdf_bytes,
-            ),
-        )
-        signature.email_sent_at = datetime.now(timezone.utc)
-        db.commit()  # Single commit for pdf_path + email_sent_at
-    except Exception as e:
-        logger.exception("Post-sign PDF/email failed for signature %s: %s", signature.id, e)
 
     # Try to trigger team generation (all waivers might now be complete)
     try:
@@ -0,0 +1,331 @@
+"""
+Response cache for the anonymous public read endpoints.
+
+Cached entries are the serialized JSON body plus its ETag (and any extra
+response headers, such as a listing's next-page cursor), stored under keys
+that embed a per-league version token:
+
+    public:schedule:<league_id>:<version>
+    public:leagues:<listing version>:<cursor>:<limit>:<count>
+
+Writers never delete entries. After committing a change that affects a
+league, they call invalidate_league(league_id), which replaces that league's
+version token and the listing's token; readers then compute new keys and the
+old entries age out through TTL/LRU. Version tokens are random rather than
+counters so an evicted token can never resurrect an older entry.
+
+Backends (settings.PUBLIC_CACHE_BACKEND):
+- "memory" — per-process LRU with TTL (the default; suits Lambda, where each
+  instance keeps its own cache and TTL bounds cross-instance staleness)
+- "redis"  — any Redis-compatible server at PUBLIC_CACHE_URL, shared by all
+  instances so invalidation is global (requires the `redis` package)
+- "none"   — caching disabled
+
+PostgresBackend (the cache_entries table) is not offered for the public
+read cache, where a database round trip would defeat the point; it backs
+the shared tier of the Clerk email lookup in utils/clerk_jwt.py.
+
+Public API:
+- public_cache — the process-wide ResponseCache
+- invalidate_league(league_id) — call after commit on every write path
+- invalidate_listing() — for writes that only change listing counts
+- cached_json_response(request, cache, key, build) — ETag/304-aware responder
+- WithHeaders(payload, headers) — build() result that carries extra headers
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Protocol, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LISTING_SCOPE = "leagues"
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = self._clock() + ttl_seconds if ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Adapter over a Redis-compatible client (get / set(px=) / delete / scan_iter)."""
+
+    def __init__(self, client, prefix: str = "ffl:"):
+        self._client = client
+        self._prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, setting: str = "PUBLIC_CACHE_BACKEND") -> "RedisBackend":
+        """Connect to url; setting names the config option in the missing-package error."""
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError(f"{setting}=redis requires the 'redis' package") from exc
+        return cls(redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        px = int(ttl_seconds * 1000) if ttl_seconds else None
+        self._client.set(self._prefix + key, value, px=px)
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=self._prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+class PostgresBackend:
+    """
+    Shared store in the cache_entries table, for deployments without Redis.
+
+    Every call is a database round trip, so this suits lookups that replace
+    something slower (an external API call), not the public read cache.
+    """
+
+    PURGE_EVERY = 256  # writes between opportunistic purges of expired rows
+    DEFAULT_TTL = 24 * 60 * 60  # rows need an expiry; used when set() is given none
+
+    _GET_SQL = text("SELECT value FROM cache_entries WHERE key = :key AND expires_at > now()")
+    _SET_SQL = text("""
+        INSERT INTO cache_entries (key, value, expires_at) VALUES (:key, :value, :expires_at)
+        ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, expires_at = EXCLUDED.expires_at
+    """)
+    _PURGE_SQL = text("""
+        DELETE FROM cache_entries
+        WHERE key IN (SELECT key FROM cache_entries WHERE expires_at < now() LIMIT 500)
+    """)
+
+    def __init__(self, engine=None, prefix: str = "ffl:"):
+        if engine is None:
+            from app.db.db import engine
+        self._engine = engine
+        self._prefix = prefix
+        self._writes = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._engine.connect() as conn:
+            value = conn.execute(self._GET_SQL, {"key": self._prefix + key}).scalar()
+        return bytes(value) if value is not None else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds or self.DEFAULT_TTL)
+        with self._engine.begin() as conn:
+            conn.execute(self._SET_SQL, {"key": self._prefix + key, "value": value, "expires_at": expires_at})
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                conn.execute(self._PURGE_SQL)
+
+    def clear(self) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                text("DELETE FROM cache_entries WHERE starts_with(key, :prefix)"),
+                {"prefix": self._prefix},
+            )
+
+
+class ResponseCache:
+    """
+    Versioned response cache over a backend.
+
+    Backend errors are logged and treated as misses, so a cache outage
+    degrades to uncached reads rather than failed requests.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl_seconds: float = 30.0):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def version(self, scope: str) -> str:
+        """Current version token for a scope (a league ID or LISTING_SCOPE)."""
+        key = f"version:{scope}"
+        try:
+            token = self.backend.get(key)
+            if token is None:
+                token = uuid.uuid4().hex.encode()
+                self.backend.set(key, token)
+            return token.decode()
+        except Exception:
+            logger.warning("Response cache version lookup failed for %s", scope, exc_info=True)
+            return uuid.uuid4().hex
+
+    def bump(self, scope: str) -> None:
+        try:
+            self.backend.set(f"version:{scope}", uuid.uuid4().hex.encode())
+        except Exception:
+            logger.warning("Response cache invalidation failed for %s", scope, exc_info=True)
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, bytes, Dict[str, str]]]:
+        """(etag, body, extra headers) for a key, or None."""
+        try:
+            raw = self.backend.get(key)
+        except Exception:
+            logger.warning("Response cache read failed for %s", key, exc_info=True)
+            return None
+        if raw is None:
+            return None
+        # First line: the ETag, optionally followed by a tab and the headers as JSON
+        meta, _, body = raw.partition(b"\n")
+        etag, _, headers = meta.partition(b"\t")
+        return etag.decode(), body, json.loads(headers) if headers else {}
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """(etag, body) for a key, or None."""
+        entry = self.get_entry(key)
+        return entry[:2] if entry is not None else None
+
+    def put(self, key: str, etag: str, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        meta = etag.encode()
+        if headers:
+            meta += b"\t" + json.dumps(headers, separators=(",", ":")).encode()
+        try:
+            self.backend.set(key, meta + b"\n" + body, self.ttl_seconds)
+        except Exception:
+            logger.warning("Response cache write failed for %s", key, exc_info=True)
+
+    def clear(self) -> None:
+        if self.enabled:
+            self.backend.clear()
+
+
+def _build_backend() -> Optional[CacheBackend]:
+    kind = settings.PUBLIC_CACHE_BACKEND
+    if kind == "none":
+        return None
+    if kind == "redis":
+        return RedisBackend.from_url(settings.PUBLIC_CACHE_URL)
+    return MemoryBackend(max_entries=settings.PUBLIC_CACHE_MAX_ENTRIES)
+
+
+public_cache = ResponseCache(_build_backend(), ttl_seconds=settings.PUBLIC_CACHE_TTL_SECONDS)
+
+
+def invalidate_listing() -> None:
+    """Drop the cached public league listing. Call after commit."""
+    if public_cache.enabled:
+        public_cache.bump(LISTING_SCOPE)
+
+
+def invalidate_league(league_id) -> None:
+    """Drop cached public reads for a league and the league listing. Call after commit."""
+    if public_cache.enabled:
+        public_cache.bump(str(league_id))
+        public_cache.bump(LISTING_SCOPE)
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+class WithHeaders(NamedTuple):
+    """A build() result with response headers to cache and replay alongside the body."""
+    payload: Any
+    headers: Dict[str, str]
+
+
+async def cached_json_response(
+    request: Request,
+    cache: ResponseCache,
+    key: Optional[str],
+    build: Callable[[], Awaitable[Any]],
+    shared: bool = True,
+) -> Optional[Response]:
+    """
+    Serve a JSON body from cache, or build, serialize and store it.
+
+    build() returns the payload, or None for "not found" (returned as None,
+    not cached), or WithHeaders(payload, headers) to add response headers.
+    key=None bypasses the cache; pass shared=False as well for personalized
+    responses so intermediaries do not store them. Emits ETag and
+    Cache-Control, and answers If-None-Match with 304.
+    """
+    cached = cache.get_entry(key) if key and cache.enabled else None
+    if cached is not None:
+        etag, body, extra_headers = cached
+    else:
+        payload = await build()
+        if payload is None:
+            return None
+        extra_headers = {}
+        if isinstance(payload, WithHeaders):
+            payload, extra_headers = payload
+        body = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+        etag = _etag(body)
+        if key and cache.enabled:
+            cache.put(key, etag, body, extra_headers)
+
+    headers = {
+        **extra_headers,
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={int(cache.ttl_seconds)}" if shared else "private, no-cache",
+    }
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -38,7 +38,56 @@ class Settings:
     # Waiver settings
     WAIVER_EXPIRY_DAYS: int = int(os.getenv("WAIVER_EXPIRY_DAYS", "7"))
     WAIVER_S3_BUCKET: str = os.getenv("WAIVER_S3_BUCKET", "")
+    WAIVER_S3_ENDPOINT_URL: str = os.getenv("WAIVER_S3_ENDPOINT_URL", "")  # Optional: MinIO / local S3 stand-in
     AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
+    # Lambda that builds waiver ZIP exports (app/handlers/waiver_export_handler.py); unset runs them in-process
+    WAIVER_EXPORT_FUNCTION_NAME: str = os.getenv("WAIVER_EXPORT_FUNCTION_NAME", "")
+    # Signed waiver PDFs (see app/services/pdf_service.py); fonts from the fonts-dejavu-core package
+    WAIVER_PDF_FONT_DIR: str = os.getenv("WAIVER_PDF_FONT_DIR", "/usr/share/fonts/truetype/dejavu")
+    WAIVER_PDF_TEMPLATE_CACHE_SIZE: int = int(os.getenv("WAIVER_PDF_TEMPLATE_CACHE_SIZE", "32"))
+
+    # Public read cache (see app/core/cache.py): "memory", "redis" or "none"
+    PUBLIC_CACHE_BACKEND: str = os.getenv("PUBLIC_CACHE_BACKEND", "memory").lower()
+    PUBLIC_CACHE_URL: str = os.getenv("PUBLIC_CACHE_URL", "redis://localhost:6379/0")
+    PUBLIC_CACHE_TTL_SECONDS: int = int(os.getenv("PUBLIC_CACHE_TTL_SECONDS", "30"))
+    PUBLIC_CACHE_MAX_ENTRIES: int = int(os.getenv("PUBLIC_CACHE_MAX_ENTRIES", "1024"))
+
+    # Clerk email lookups for tokens without an email claim (see app/utils/clerk_jwt.py)
+    EMAIL_LOOKUP_CACHE_MAX_ENTRIES: int = int(os.getenv("EMAIL_LOOKUP_CACHE_MAX_ENTRIES", "10000"))
+    EMAIL_LOOKUP_SHARED_BACKEND: str = os.getenv("EMAIL_LOOKUP_SHARED_BACKEND", "postgres").lower()  # "postgres", "redis" or "none"
+    EMAIL_LOOKUP_SHARED_URL: str = os.getenv("EMAIL_LOOKUP_SHARED_URL", os.getenv("PUBLIC_CACHE_URL", "redis://localhost:6379/0"))
+    EMAIL_LOOKUP_SHARED_TTL_SECONDS: int = int(os.getenv("EMAIL_LOOKUP_SHARED_TTL_SECONDS", "3600"))
+
+    # API rate limiter storage (see app/core/rate_limit.py): "memory", "postgres" or "redis"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+    RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", os.getenv("PUBLIC_CACHE_URL", "redis://localhost:6379/0"))
+    # Share of each limit an instance may admit locally between shared-store syncs (0 disables)
+    RATE_LIMIT_LOCAL_SHARE: float = float(os.getenv("RATE_LIMIT_LOCAL_SHARE", "0.1"))
+
+    # Shared outbound HTTP client (see app/core/http_client.py)
+    CLERK_API_URL: str = os.getenv("CLERK_API_URL", "https://api.clerk.com").rstrip("/")
+    HTTP_CLIENT_HTTP2: bool = os.getenv("HTTP_CLIENT_HTTP2", "true").lower() == "true"
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_CLIENT_TIMEOUT_SECONDS", "5"))
+    HTTP_CLIENT_MAX_CONNECTIONS: int = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "50"))
+    HTTP_CLIENT_MAX_PER_HOST: int = int(os.getenv("HTTP_CLIENT_MAX_PER_HOST", "10"))
+    HTTP_CLIENT_KEEPALIVE_SECONDS: float = float(os.getenv("HTTP_CLIENT_KEEPALIVE_SECONDS", "60"))
+    HTTP_CLIENT_BREAKER_FAILURES: int = int(os.getenv("HTTP_CLIENT_BREAKER_FAILURES", "5"))
+    HTTP_CLIENT_BREAKER_RESET_SECONDS: float = float(os.getenv("HTTP_CLIENT_BREAKER_RESET_SECONDS", "30"))
+
+    # Per-request SQL profiling (see app/core/query_profiler.py)
+    QUERY_PROFILER_ENABLED: bool = os.getenv("QUERY_PROFILER_ENABLED", "false").lower() == "true"
+    # Also send the DB time and query count to clients in Server-Timing (exposed via CORS)
+    QUERY_PROFILER_SERVER_TIMING: bool = os.getenv("QUERY_PROFILER_SERVER_TIMING", "false").lower() == "true"
+    # A statement fingerprint repeated this often in one request is logged as a likely N+1
+    QUERY_PROFILER_REPEAT_THRESHOLD: int = int(os.getenv("QUERY_PROFILER_REPEAT_THRESHOLD", "5"))
+
+    # Email outbox drainer (see app/services/email_outbox_service.py)
+    EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "8"))
+    EMAIL_OUTBOX_BACKOFF_BASE_SECONDS: int = int(os.getenv("EMAIL_OUTBOX_BACKOFF_BASE_SECONDS", "30"))
+    EMAIL_OUTBOX_BACKOFF_MAX_SECONDS: int = int(os.getenv("EMAIL_OUTBOX_BACKOFF_MAX_SECONDS", "3600"))
+    EMAIL_OUTBOX_LEASE_SECONDS: int = int(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", "300"))
+    EMAIL_OUTBOX_RETENTION_DAYS: int = int(os.getenv("EMAIL_OUTBOX_RETENTION_DAYS", "30"))
 
 
 settings = Settings()
@@ -54,3 +103,39 @@ if settings.INVITATION_EXPIRY_DAYS <= 0:
 
 if settings.WAIVER_EXPIRY_DAYS <= 0:
     raise RuntimeError("WAIVER_EXPIRY_DAYS must be a positive integer")
+
+if settings.WAIVER_PDF_TEMPLATE_CACHE_SIZE <= 0:
+    raise RuntimeError("WAIVER_PDF_TEMPLATE_CACHE_SIZE must be a positive integer")
+
+if settings.PUBLIC_CACHE_BACKEND not in ("memory", "redis", "none"):
+    raise RuntimeError("PUBLIC_CACHE_BACKEND must be one of: memory, redis, none")
+
+if settings.PUBLIC_CACHE_TTL_SECONDS <= 0 or settings.PUBLIC_CACHE_MAX_ENTRIES <= 0:
+    raise RuntimeError("PUBLIC_CACHE_TTL_SECONDS and PUBLIC_CACHE_MAX_ENTRIES must be positive integers")
+
+if settings.EMAIL_LOOKUP_SHARED_BACKEND not in ("postgres", "redis", "none"):
+    raise RuntimeError("EMAIL_LOOKUP_SHARED_BACKEND must be one of: postgres, redis, none")
+
+if settings.EMAIL_LOOKUP_CACHE_MAX_ENTRIES <= 0 or settings.EMAIL_LOOKUP_SHARED_TTL_SECONDS <= 0:
+    raise RuntimeError("EMAIL_LOOKUP_CACHE_MAX_ENTRIES and EMAIL_LOOKUP_SHARED_TTL_SECONDS must be positive integers")
+
+if settings.RATE_LIMIT_BACKEND not in ("memory", "postgres", "redis"):
+    raise RuntimeError("RATE_LIMIT_BACKEND must be one of: memory, postgres, redis")
+
+if not 0 <= settings.RATE_LIMIT_LOCAL_SHARE < 0.5:
+    raise RuntimeError("RATE_LIMIT_LOCAL_SHARE must be at least 0 and below 0.5")
+
+if settings.HTTP_CLIENT_MAX_PER_HOST <= 0 or settings.HTTP_CLIENT_MAX_CONNECTIONS < settings.HTTP_CLIENT_MAX_PER_HOST:
+    raise RuntimeError("HTTP_CLIENT_MAX_PER_HOST must be positive and no larger than HTTP_CLIENT_MAX_CONNECTIONS")
+
+if settings.HTTP_CLIENT_BREAKER_FAILURES <= 0 or settings.HTTP_CLIENT_BREAKER_RESET_SECONDS <= 0:
+    raise RuntimeError("HTTP_CLIENT_BREAKER_FAILURES and HTTP_CLIENT_BREAKER_RESET_SECONDS must be positive")
+
+if settings.QUERY_PROFILER_REPEAT_THRESHOLD < 2:
+    raise RuntimeError("QUERY_PROFILER_REPEAT_THRESHOLD must be at least 2")
+
+if not 1 <= settings.EMAIL_OUTBOX_BATCH_SIZE <= 100:
+    raise RuntimeError("EMAIL_OUTBOX_BATCH_SIZE must be between 1 and 100 (Resend batch limit)")
+
+if settings.EMAIL_OUTBOX_MAX_ATTEMPTS <= 0 or settings.EMAIL_OUTBOX_LEASE_SECONDS <= 0:
+    raise RuntimeError("EMAIL_OUTBOX_MAX_ATTEMPTS and EMAIL_OUTBOX_LEASE_SECONDS must be positive integers")
@@ -34,6 +34,11 @@ GAME_IN_PROGRESS = "in_progress"
 GAME_COMPLETED = "completed"
 GAME_CANCELLED = "cancelled"
 
+# EmailOutbox.status
+EMAIL_PENDING = "pending"
+EMAIL_SENT = "sent"
+EMAIL_DEAD = "dead"
+
 # League.format
 FORMAT_7V7 = "7v7"
 FORMAT_5V5 = "5v5"
@@ -0,0 +1,223 @@
+"""
+Shared outbound HTTP client for upstream APIs (Clerk, reCAPTCHA).
+
+One pooled httpx.AsyncClient per process, so JWKS fetches, Clerk user
+lookups and reCAPTCHA checks reuse warm keep-alive connections instead of
+paying a TCP + TLS handshake on every call. The client is opened by
+main.lifespan under uvicorn; on Lambda (Mangum runs with lifespan="off") it
+is created on first use and then reused by every warm invocation, since
+Mangum drives all invocations on the same event loop. If the running loop
+changes (a new loop per test, or asyncio.run in a script), the client is
+rebuilt for that loop.
+
+On top of the pool:
+- HTTP/2 when settings.HTTP_CLIENT_HTTP2 is on and the `h2` package is
+  installed (httpx[http2]); otherwise HTTP/1.1 keep-alive
+- at most HTTP_CLIENT_MAX_PER_HOST requests in flight per host, so one slow
+  upstream cannot take every connection in the pool
+- a circuit breaker per host: after HTTP_CLIENT_BREAKER_FAILURES consecutive
+  failures (transport errors, timeouts or 5xx responses) requests to that
+  host fail fast with CircuitOpenError for HTTP_CLIENT_BREAKER_RESET_SECONDS,
+  then a single probe request decides whether it closes again
+
+Responses are returned as-is; callers still call raise_for_status().
+
+Public API:
+- http_client — the process-wide SharedHTTPClient
+- SharedHTTPClient.get(url, **kw) / .post(url, **kw) — pooled, guarded requests
+- SharedHTTPClient.start() / .aclose() — lifespan hooks
+- CircuitOpenError — raised instead of sending while a host's breaker is open
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """The upstream host's circuit breaker is open; the request was not sent."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: closed -> open -> half-open (one probe) -> closed."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self._clock() - self.opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_abandoned(self) -> None:
+        """The request ended without a verdict on the upstream; let the next one probe."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+        self._probing = False
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class _LoopState:
+    """The pooled client and per-host semaphores bound to one event loop."""
+    loop: asyncio.AbstractEventLoop
+    client: httpx.AsyncClient
+    host_slots: Dict[str, asyncio.Semaphore]
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+class SharedHTTPClient:
+    def __init__(
+        self,
+        *,
+        http2: bool = settings.HTTP_CLIENT_HTTP2,
+        timeout: float = settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+        max_connections: int = settings.HTTP_CLIENT_MAX_CONNECTIONS,
+        max_per_host: int = settings.HTTP_CLIENT_MAX_PER_HOST,
+        keepalive_seconds: float = settings.HTTP_CLIENT_KEEPALIVE_SECONDS,
+        breaker_failures: int = settings.HTTP_CLIENT_BREAKER_FAILURES,
+        breaker_reset_seconds: float = settings.HTTP_CLIENT_BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        **client_kwargs,
+    ):
+        self.http2 = http2
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.keepalive_seconds = keepalive_seconds
+        self.breaker_failures = breaker_failures
+        self.breaker_reset_seconds = breaker_reset_seconds
+        self._clock = clock
+        self._client_kwargs = client_kwargs
+        self._state: Optional[_LoopState] = None
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _new_client(self) -> httpx.AsyncClient:
+        http2 = self.http2 and _http2_available()
+        if self.http2 and not http2:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1 keep-alive")
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_seconds,
+            ),
+            **self._client_kwargs,
+        )
+
+    def _loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        if self._state is None or self._state.loop is not loop:
+            if self._state is not None:
+                # The old loop is gone or idle; its connections cannot be closed from here
+                logger.debug("Event loop changed; opening a new upstream HTTP pool")
+            self._state = _LoopState(loop=loop, client=self._new_client(), host_slots={})
+        return self._state
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(self.breaker_failures, self.breaker_reset_seconds, self._clock)
+            self._breakers[host] = breaker
+        return breaker
+
+    async def _send(
+        self, url: str, send: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        host = httpx.URL(url).host
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {host}; not sending request")
+        state = self._loop_state()
+        slots = state.host_slots.get(host)
+        if slots is None:
+            slots = state.host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        try:
+            async with slots:
+                response = await send(state.client)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled or a non-network error: no verdict on the upstream
+            breaker.record_abandoned()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self._send(url, lambda client: client.get(url, **kwargs))
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self._send(url, lambda client: client.post(url, **kwargs))
+
+    async def start(self) -> None:
+        """Open the pool on the running loop (startup hook; optional — get/post open it lazily)."""
+        self._loop_state()
+
+    async def aclose(self) -> None:
+        state, self._state = self._state, None
+        if state is not None and state.loop is asyncio.get_running_loop():
+            await state.client.aclose()
+
+    def reset(self) -> None:
+        """Forget the pool and all breaker state without closing (tests)."""
+        self._state = None
+        self._breakers.clear()
+
+
+http_client = SharedHTTPClient()
@@ -1,5 +1,7 @@
 from slowapi import Limiter
 
+from app.core.rate_limit import limiter_storage_config
+
 # Prefer request.client.host (set correctly by API Gateway / uvicorn).
 # Fall back to the leftmost X-Forwarded-For entry only when client.host
 # is unavailable (e.g. behind a non-standard proxy that strips it).
@@ -8,5 +10,7 @@ limiter = Limiter(
         (request.client.host if request.client else None)
         or request.headers.get("X-Forwarded-For", "").split(",")[0].strip()
         or "unknown"
-    )
+    ),
+    # Sliding window counters; shared across instances when RATE_LIMIT_BACKEND is postgres/redis
+    **limiter_storage_config(),
 )
@@ -0,0 +1,160 @@
+"""
+Keyset (cursor) pagination for newest-first listings.
+
+Listings ordered by `created_at DESC, id DESC` page by remembering the last
+row's (created_at, id) and asking for rows strictly before it:
+
+    WHERE (created_at, id) < (:created_at, :id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit + 1
+
+With a composite index on (created_at, id) every page is one index range
+scan of `limit + 1` rows, however deep the page, where OFFSET has to walk
+and discard every earlier row. `id` breaks ties between rows created in the
+same transaction, so no row is skipped or repeated across pages. The extra
+row only tells us whether there is a next page.
+
+Cursors are opaque to clients: URL-safe base64 of "<created_at iso>|<id>".
+They carry no secrets, but clients must not build or parse them.
+
+Totals are optional. estimated_count() asks the planner for its row estimate
+of the listing query (EXPLAIN, nothing is scanned), which is accurate to
+within the table statistics and constant-time at any table size; an exact
+COUNT(*) scans every matching row.
+
+Rows with a NULL created_at never match the keyset predicate; the columns
+this is used on are filled by server_default=now().
+
+List endpoints that return a bare JSON array put the next cursor and the
+optional total in headers (X-Next-Cursor, X-Total-Count, and
+X-Total-Count-Estimated: true when the total is the planner's estimate).
+
+Public API:
+- encode_cursor(created_at, id) / decode_cursor(cursor) -> Cursor
+- keyset_page(query, model, cursor, limit) -> KeysetPage
+- count_rows(db, query, mode) — "exact", "estimated" or "none" (-> None)
+- estimated_count(db, query) -> int
+- page_headers(page, total, mode) — the listing headers above
+- InvalidCursorError — raised by decode_cursor for malformed cursors
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Literal, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+CountMode = Literal["exact", "estimated", "none"]
+
+
+class InvalidCursorError(ValueError):
+    """The cursor was not produced by encode_cursor."""
+
+
+class Cursor(NamedTuple):
+    created_at: datetime
+    id: UUID
+
+
+@dataclass
+class KeysetPage:
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>, with the statement's bind parameters kept."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, _, row_id = raw.partition("|")
+        decoded = Cursor(datetime.fromisoformat(created_at), UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+    if decoded.created_at.tzinfo is None:
+        raise InvalidCursorError("Invalid cursor")
+    return decoded
+
+
+def keyset_page(query: Query, model, cursor: Optional[str], limit: int, offset: int = 0) -> KeysetPage:
+    """
+    One page of `query` (already filtered) in created_at DESC, id DESC order.
+
+    `model` must have `created_at` and `id` columns. `offset` serves the
+    legacy skip/page parameters; those pages still return a next_cursor so
+    clients can switch to keyset paging. Raises InvalidCursorError for a
+    malformed cursor.
+    """
+    if cursor:
+        after = decode_cursor(cursor)
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(after.created_at, after.id))
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if offset:
+        query = query.offset(offset)
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return KeysetPage(items=rows, next_cursor=None)
+    rows = rows[:limit]
+    last = rows[-1]
+    return KeysetPage(items=rows, next_cursor=encode_cursor(last.created_at, last.id))
+
+
+def estimated_count(db: Session, query: Query) -> int:
+    """The planner's estimate of how many rows `query` returns (no rows are scanned)."""
+    plan = db.execute(_Explain(query.order_by(None).statement)).scalar()
+    if isinstance(plan, str):  # asyncpg returns json columns undecoded
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(db: Session, query: Query, mode: CountMode) -> Optional[int]:
+    """Total rows matching `query`: exact COUNT(*), the planner's estimate, or None."""
+    if mode == "exact":
+        return query.order_by(None).count()
+    if mode == "estimated":
+        return estimated_count(db, query)
+    return None
+
+
+def page_headers(page: KeysetPage, total: Optional[int], mode: CountMode) -> Dict[str, str]:
+    headers = {}
+    if page.next_cursor:
+        headers["X-Next-Cursor"] = page.next_cursor
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+        if mode == "estimated":
+            headers["X-Total-Count-Estimated"] = "true"
+    return headers
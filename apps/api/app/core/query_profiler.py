@@ -0,0 +1,200 @@
+"""
+Per-request SQL profiling and N+1 detection.
+
+Engine-wide before/after_cursor_execute listeners time every statement and
+add it to the QueryProfile of the request being served, if any. The profile
+lives in a contextvar set by QueryProfilerMiddleware; it reaches sync
+endpoints and dependencies (run in the threadpool with a copy of the
+context) and AsyncSession.run_sync calls alike, so every engine — sync,
+asyncpg, the tests' engine — is covered without wiring.
+
+Statements are grouped by fingerprint: whitespace collapsed, literals and
+bind parameters replaced by `?`, IN-lists collapsed. The same fingerprint
+running QUERY_PROFILER_REPEAT_THRESHOLD or more times in one request is the
+signature of a query-per-row loop (N+1).
+
+After each request the middleware:
+- sets `Server-Timing: db;dur=<ms>;desc="<n> queries", app;dur=<ms>` when
+  QUERY_PROFILER_SERVER_TIMING=true (off by default, so clients are not told
+  how much DB work a request did)
+- logs one JSON line (event "request_queries") with the route, status,
+  query count, DB time and the most repeated fingerprints; the log filter
+  adds the request's correlation_id from CorrelationIDMiddleware
+- logs a WARNING (event "n_plus_one") per fingerprint over the threshold
+
+For streamed responses the numbers cover the work done before the first
+byte. Off unless QUERY_PROFILER_ENABLED=true; the test suite turns it on for
+the query budget plugin.
+
+Public API:
+- QueryProfilerMiddleware — install inside CorrelationIDMiddleware
+- QueryProfile — count, total_ms, fingerprints, repeated(threshold)
+- profile_queries() — context manager that profiles a block outside a request
+- add_request_observer(fn) / remove_request_observer(fn) — fn(request, profile)
+  after each profiled request (used by the tests' query budget plugin)
+- fingerprint(statement) -> str
+"""
+
+import contextvars
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_FINGERPRINT_MAX_LEN = 300
+_LOGGED_FINGERPRINTS = 5
+_START_ATTR = "_query_profiler_start"
+
+
+@dataclass
+class QueryProfile:
+    count: int = 0
+    total_ms: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.fingerprints[key] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Fingerprints that ran at least `threshold` times, most frequent first."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= threshold]
+
+    def summary(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_ms, 2),
+            "distinct": len(self.fingerprints),
+            "top": [
+                {"count": n, "sql": fp} for fp, n in self.fingerprints.most_common(_LOGGED_FINGERPRINTS) if n > 1
+            ],
+        }
+
+
+_current_profile: contextvars.ContextVar[Optional[QueryProfile]] = contextvars.ContextVar(
+    "query_profile", default=None,
+)
+_observers: List[Callable[[Request, QueryProfile], None]] = []
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_LIST = re.compile(r"\(\?(?:, \?)+\)")
+
+
+# The start time lives on the statement's execution context, which is dropped
+# with the statement; a statement that raises leaves nothing behind on the
+# pooled connection.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_profile.get() is not None:
+        setattr(context, _START_ATTR, time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    start = getattr(context, _START_ATTR, None)
+    if profile is None or start is None:
+        return
+    profile.record(statement, (time.perf_counter() - start) * 1000)
+
+
+def _route_path(request: Request) -> str:
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or request.url.path
+
+
+def server_timing(profile: QueryProfile, app_ms: float) -> str:
+    return f'db;dur={profile.total_ms:.1f};desc="{profile.count} queries", app;dur={app_ms:.1f}'
+
+
+def _report(request: Request, status_code: int, profile: QueryProfile, app_ms: float) -> None:
+    path = _route_path(request)
+    summary = profile.summary()
+    summary.update(method=request.method, path=path, status=status_code, app_ms=round(app_ms, 2))
+    logger.info(
+        "%s %s -> %s: %d queries, %.1f ms in DB",
+        request.method, path, status_code, profile.count, profile.total_ms,
+        extra={"event": "request_queries", "db": summary},
+    )
+    for sql, n in profile.repeated(settings.QUERY_PROFILER_REPEAT_THRESHOLD):
+        logger.warning(
+            "Possible N+1 in %s %s: statement ran %d times: %s", request.method, path, n, sql,
+            extra={"event": "n_plus_one", "db": {"method": request.method, "path": path, "count": n, "sql": sql}},
+        )
+    for observer in list(_observers):
+        observer(request, profile)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so executions that differ only in values group together."""
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING.sub("?", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _LIST.sub("(...)", sql)
+    return sql[:_FINGERPRINT_MAX_LEN]
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """Profile the statements run in this block (and threads started with its context)."""
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def add_request_observer(fn: Callable[[Request, QueryProfile], None]) -> None:
+    _observers.append(fn)
+
+
+def remove_request_observer(fn: Callable[[Request, QueryProfile], None]) -> None:
+    if fn in _observers:
+        _observers.remove(fn)
+
+
+class QueryProfilerMiddleware(BaseHTTPMiddleware):
+    """Profile each request's SQL; emit Server-Timing and a structured log line."""
+
+    async def dispatch(self, request, call_next):
+        if not settings.QUERY_PROFILER_ENABLED:
+            return await call_next(request)
+        start = time.perf_counter()
+        with profile_queries() as profile:
+            response = await call_next(request)
+        app_ms = (time.perf_counter() - start) * 1000
+        if settings.QUERY_PROFILER_SERVER_TIMING:
+            response.headers["Server-Timing"] = server_timing(profile, app_ms)
+        _report(request, response.status_code, profile, app_ms)
+        return response
@@ -0,0 +1,343 @@
+"""
+Storage backends for the API rate limiter (slowapi on top of `limits`).
+
+slowapi's default memory:// storage keeps counters in the process, so on
+Lambda every concurrent instance enforces its own copy of each limit and a
+cold start forgets them. The limiter uses the sliding-window-counter
+strategy (the previous fixed window's count, weighted by how much of it
+still overlaps the sliding window, plus the current window's count) on the
+storage selected by settings.RATE_LIMIT_BACKEND:
+
+- "memory"   — limits' MemoryStorage: per instance (local dev and tests)
+- "postgres" — PostgresSlidingWindowStorage: one rate_limit_counters row per
+  key, checked and incremented by a single atomic upsert
+- "redis"    — limits' RedisStorage at RATE_LIMIT_REDIS_URL (atomic Lua
+  scripts; requires the `redis` package)
+
+Shared backends sit behind LocalFastPathStorage. For a key that was clearly
+under its limit at the last sync, an instance admits up to
+floor(limit × RATE_LIMIT_LOCAL_SHARE) hits without a round trip and sends
+them to the shared store with the next hit that does need one. Each
+instance can therefore overshoot a limit by at most that budget; with the
+default share of 0.1, limits below 10 per window (waiver signing, contact
+form) always go to the shared store.
+
+If the shared store fails, slowapi falls back to per-instance memory
+counters until storage.check() succeeds again.
+
+Public API:
+- PostgresSlidingWindowStorage — scheme "ratelimit+postgresql://"
+- LocalFastPathStorage — scheme "ratelimit+local://", wraps shared_uri
+- limiter_storage_config() — strategy, storage URI and options for app.core.limiter
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from math import floor
+from typing import Callable, Optional, Tuple
+
+from limits.errors import ConfigurationError
+from limits.storage import SlidingWindowCounterSupport, Storage, storage_from_string
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+STRATEGY = "sliding-window-counter"
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _window(now: float, expiry: int) -> Tuple[int, float]:
+    """(current window index, weight of the previous window still in the sliding window)."""
+    return int(now // expiry), 1 - (now % expiry) / expiry
+
+
+def _utc(epoch_seconds: float) -> datetime:
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc)
+
+
+def _weighted(previous_count: int, previous_weight: float, current_count: int) -> float:
+    return previous_count * previous_weight + current_count
+
+
+# Rows whose window is ahead of ours (another instance's clock is slightly
+# ahead) are treated as current rather than rolled back.
+_PREVIOUS = """
+    CASE WHEN c.window_index >= :window THEN c.previous_count
+         WHEN c.window_index = :window - 1 THEN c.current_count
+         ELSE 0 END"""
+_CURRENT = "CASE WHEN c.window_index >= :window THEN c.current_count ELSE 0 END"
+
+_ACQUIRE_SQL = text(f"""
+    INSERT INTO rate_limit_counters AS c (key, window_index, current_count, previous_count, expires_at)
+    VALUES (:key, :window, :amount, 0, :expires_at)
+    ON CONFLICT (key) DO UPDATE SET
+        previous_count = {_PREVIOUS},
+        current_count = {_CURRENT} + :amount,
+        window_index = GREATEST(c.window_index, :window),
+        expires_at = GREATEST(c.expires_at, EXCLUDED.expires_at)
+    WHERE floor({_PREVIOUS} * :previous_weight + {_CURRENT}) + :amount <= :limit
+    RETURNING current_count, previous_count
+""")
+
+_PURGE_SQL = text("""
+    DELETE FROM rate_limit_counters
+    WHERE key IN (SELECT key FROM rate_limit_counters WHERE expires_at < now() LIMIT 500)
+""")
+
+
+@dataclass
+class _LocalKey:
+    usage: float  # weighted count reported by the shared store at the last sync
+    synced_at: float
+    pending: int = 0  # hits admitted locally, not yet sent to the shared store
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+class PostgresSlidingWindowStorage(Storage, SlidingWindowCounterSupport):
+    """Sliding window counters in the rate_limit_counters table (sliding-window-counter strategy only)."""
+
+    STORAGE_SCHEME = ["ratelimit+postgresql"]
+    PURGE_EVERY = 1024  # acquisitions between opportunistic purges of dead keys
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        engine=None,
+        clock: Callable[[], float] = time.time,
+        **options,
+    ):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+        if engine is None:
+            from app.db.db import engine
+        self._engine = engine
+        self._clock = clock
+        self._acquisitions = 0
+
+    @property
+    def base_exceptions(self):
+        return SQLAlchemyError
+
+    def acquire_with_usage(self, key: str, limit: int, expiry: int, amount: int = 1) -> Tuple[bool, float]:
+        """acquire_sliding_window_entry that also returns the weighted count afterwards."""
+        if amount > limit:
+            return False, float(limit)
+        now = self._clock()
+        window, previous_weight = _window(now, expiry)
+        with self._engine.begin() as conn:
+            row = conn.execute(_ACQUIRE_SQL, {
+                "key": key,
+                "window": window,
+                "amount": amount,
+                "limit": limit,
+                "previous_weight": previous_weight,
+                "expires_at": _utc(now + 2 * expiry),
+            }).first()
+            self._acquisitions += 1
+            if self._acquisitions % self.PURGE_EVERY == 0:
+                conn.execute(_PURGE_SQL)
+        if row is None:
+            return False, float(limit)
+        return True, _weighted(row.previous_count, previous_weight, row.current_count)
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        return self.acquire_with_usage(key, limit, expiry, amount)[0]
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        now = self._clock()
+        window, previous_weight = _window(now, expiry)
+        with self._engine.connect() as conn:
+            row = conn.execute(
+                text("SELECT window_index, current_count, previous_count FROM rate_limit_counters WHERE key = :key"),
+                {"key": key},
+            ).first()
+        previous_count = current_count = 0
+        if row is not None:
+            if row.window_index >= window:
+                previous_count, current_count = row.previous_count, row.current_count
+            elif row.window_index == window - 1:
+                previous_count = row.current_count
+        previous_ttl = previous_weight * expiry if previous_count else 0.0
+        current_ttl = 2 * expiry - (now % expiry)
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        self.clear(key)
+
+    def clear(self, key: str) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(text("DELETE FROM rate_limit_counters WHERE key = :key"), {"key": key})
+
+    def reset(self) -> Optional[int]:
+        with self._engine.begin() as conn:
+            return conn.execute(text("DELETE FROM rate_limit_counters")).rowcount
+
+    def check(self) -> bool:
+        try:
+            with self._engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except SQLAlchemyError:
+            return False
+
+    # limits' Storage ABC declares incr/get/get_expiry abstract, so the class
+    # cannot be instantiated without them. Only the fixed-window strategy calls
+    # them, and limiter_storage_config() always selects STRATEGY; a Limiter
+    # configured otherwise fails on its first hit with a ConfigurationError.
+    def _wrong_strategy(self) -> ConfigurationError:
+        return ConfigurationError(f"{type(self).__name__} only supports the {STRATEGY} strategy")
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        raise self._wrong_strategy()
+
+    def get(self, key: str) -> int:
+        raise self._wrong_strategy()
+
+    def get_expiry(self, key: str) -> float:
+        raise self._wrong_strategy()
+
+
+class LocalFastPathStorage(Storage, SlidingWindowCounterSupport):
+    """Admit clearly-under-limit hits locally; batch them into the next shared-store round trip."""
+
+    STORAGE_SCHEME = ["ratelimit+local"]
+    MAX_KEYS = 10_000
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        shared: Optional[Storage] = None,
+        shared_uri: Optional[str] = None,
+        local_share: float = 0.1,
+        clock: Callable[[], float] = time.time,
+        **options,
+    ):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+        self.shared = shared if shared is not None else storage_from_string(shared_uri, **options)
+        self.local_share = float(local_share)
+        self._clock = clock
+        self._keys: "OrderedDict[str, _LocalKey]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.shared_calls = 0
+
+    @property
+    def base_exceptions(self):
+        return self.shared.base_exceptions
+
+    def _budget(self, limit: int) -> int:
+        return floor(limit * self.local_share)
+
+    def _acquire_shared(self, key: str, limit: int, expiry: int, amount: int) -> Tuple[bool, float]:
+        self.shared_calls += 1
+        if hasattr(self.shared, "acquire_with_usage"):
+            return self.shared.acquire_with_usage(key, limit, expiry, amount)
+        allowed = self.shared.acquire_sliding_window_entry(key, limit, expiry, amount)
+        previous_count, previous_ttl, current_count, _ = self.shared.get_sliding_window(key, expiry)
+        return allowed, _weighted(previous_count, previous_ttl / expiry, current_count)
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        budget = self._budget(limit)
+        if budget < amount:
+            self.shared_calls += 1
+            return self.shared.acquire_sliding_window_entry(key, limit, expiry, amount)
+
+        now = self._clock()
+        with self._lock:
+            state = self._keys.get(key)
+            if (
+                state is not None
+                and state.pending + amount <= budget
+                and now - state.synced_at <= expiry * self.local_share
+                and state.usage + state.pending + amount <= limit / 2
+            ):
+                state.pending += amount
+                self.local_hits += 1
+                return True
+            pending = state.pending if state is not None else 0
+            if state is not None:
+                state.pending = 0
+
+        try:
+            allowed, usage = self._acquire_shared(key, limit, expiry, pending + amount)
+            if not allowed and pending:
+                # Those hits were already served; record them so other instances see them
+                allowed_pending, usage = self._acquire_shared(key, limit, expiry, pending)
+                if not allowed_pending:
+                    logger.debug("Rate limit %s: %d locally admitted hits not recorded (at limit)", key, pending)
+        except Exception:
+            with self._lock:
+                if key in self._keys:
+                    self._keys[key].pending += pending
+            raise
+
+        with self._lock:
+            # Keep hits other threads admitted locally while this call was in flight
+            previous = self._keys.get(key)
+            self._keys[key] = _LocalKey(usage=usage, synced_at=now, pending=previous.pending if previous else 0)
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.MAX_KEYS:
+                self._keys.popitem(last=False)
+        return allowed
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        previous_count, previous_ttl, current_count, current_ttl = self.shared.get_sliding_window(key, expiry)
+        with self._lock:
+            state = self._keys.get(key)
+            pending = state.pending if state is not None else 0
+        return previous_count, previous_ttl, current_count + pending, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        with self._lock:
+            self._keys.pop(key, None)
+        self.shared.clear_sliding_window(key, expiry)
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        return self.shared.incr(key, expiry, amount)
+
+    def get(self, key: str) -> int:
+        return self.shared.get(key)
+
+    def get_expiry(self, key: str) -> float:
+        return self.shared.get_expiry(key)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._keys.pop(key, None)
+        self.shared.clear(key)
+
+    def reset(self) -> Optional[int]:
+        with self._lock:
+            self._keys.clear()
+        return self.shared.reset()
+
+    def check(self) -> bool:
+        return self.shared.check()
+
+
+def limiter_storage_config() -> dict:
+    """Keyword arguments for slowapi.Limiter selecting the configured storage."""
+    backend = settings.RATE_LIMIT_BACKEND
+    if backend == "memory":
+        return {"strategy": STRATEGY, "storage_uri": "memory://"}
+    shared_uri = "ratelimit+postgresql://" if backend == "postgres" else settings.RATE_LIMIT_REDIS_URL
+    return {
+        "strategy": STRATEGY,
+        "storage_uri": "ratelimit+local://",
+        "storage_options": {"shared_uri": shared_uri, "local_share": settings.RATE_LIMIT_LOCAL_SHARE},
+        "in_memory_fallback_enabled": True,
+    }
@@ -1,5 +1,6 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import NullPool, QueuePool
 from dotenv import load_dotenv
@@ -27,6 +28,25 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+
+def _async_url(url: str) -> str:
+    """Rewrite a sync Postgres URL to use the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Async engine for `async def` routers. Same pooling rules as the sync engine;
+# asyncpg does not block the event loop while a query is in flight.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_url(DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=os.getenv("DEBUG_SQL", "").lower() in ("1", "true"),
+    poolclass=NullPool if _is_lambda else None,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # TODO: Implement periodic archival of is_active=False records older than 12 months.
 # Soft-deleted records grow tables unbounded. Consider a nightly Lambda/cron that
 # moves old inactive records to an archive table or cold storage (S3/Glacier).
@@ -38,4 +58,13 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+
+# Async database dependency for FastAPI. Services stay synchronous and take a
+# plain Session; call them through `await db.run_sync(service_fn, ...)` so the
+# same code serves both Lambda handlers (SessionLocal) and async routers.
+# So far only the public reads in api/league.py use it; other routers take get_db.
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -47,10 +47,12 @@ def handler(event, context):
 
     logger.info("Deadline handler fired for league %s", league_id)
 
+    from app.core.cache import invalidate_league
     from app.db.db import SessionLocal
     from app.models.group_invitation import GroupInvitation
     from app.models.league import League
     from app.models.team import Team
+    from app.services.league_service import recount_occupancy
     from app.services.team_generation_service import generate_teams
     from app.services.waiver_service import expire_unsigned_for_league, has_pending_waivers
 
@@ -80,6 +82,7 @@ def handler(event, context):
             .update({"status": INVITE_EXPIRED, "updated_at": datetime.now(timezone.utc)})
         )
         if expired_count:
+            recount_occupancy(db, [league_id])
             logger.info("Expired %d pending invitations for league %s", expired_count, league_id)
 
         # Step 2: expire unsigned waivers so those spots are freed
@@ -101,6 +104,7 @@ def handler(event, context):
 
         # Single atomic commit for all work
         db.commit()
+        invalidate_league(league_id)
 
         return {"statusCode": 200, "league_id": str(league_id), "teams_generated": triggered}
     except Exception as exc:
@@ -0,0 +1,94 @@
+"""
+Email Outbox Handler — invoked every minute by EventBridge to deliver queued email.
+
+Triggered by a recurring EventBridge rule (rate(1 minute)). Drains due rows
+from the email_outbox table (see services/email_outbox_service.py) until the
+queue is empty or the invocation is close to its timeout, then deletes
+delivered rows older than EMAIL_OUTBOX_RETENTION_DAYS.
+
+Outside Lambda, run it as a polling worker:
+
+    python -m app.handlers.email_outbox_handler
+"""
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+_EXPECTED_SOURCES = {"aws.events", "aws.scheduler"}
+
+# Leave this much of the Lambda timeout for the final record/commit
+_TIMEOUT_MARGIN_SECONDS = 5.0
+_DEFAULT_TIME_BUDGET_SECONDS = 25.0
+
+
+def _drain_once(time_budget_seconds: float) -> dict:
+    from app.core.config import settings
+    from app.db.db import SessionLocal
+    from app.services.email_outbox_service import drain_outbox, purge_sent
+
+    db = SessionLocal()
+    try:
+        result = drain_outbox(db, time_budget_seconds=time_budget_seconds)
+        purged = 0
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+            purged = purge_sent(db, cutoff)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.exception("Email outbox purge failed: %s", e)
+        return {
+            "claimed": result.claimed,
+            "sent": result.sent,
+            "retried": result.retried,
+            "dead": result.dead,
+            "purged": purged,
+        }
+    finally:
+        db.close()
+
+
+def handler(event, context):
+    source = event.get("source", "")
+    if source not in _EXPECTED_SOURCES:
+        logger.error(
+            "Email outbox handler rejected event with unexpected source %r",
+            source,
+        )
+        return {"statusCode": 403, "error": "Forbidden: unexpected invocation source"}
+
+    time_budget = _DEFAULT_TIME_BUDGET_SECONDS
+    if context is not None and hasattr(context, "get_remaining_time_in_millis"):
+        time_budget = context.get_remaining_time_in_millis() / 1000 - _TIMEOUT_MARGIN_SECONDS
+
+    try:
+        stats = _drain_once(max(time_budget, 1.0))
+    except Exception as exc:
+        logger.exception("Email outbox handler failed: %s", exc)
+        raise
+
+    if stats["claimed"]:
+        logger.info("Email outbox drained: %s", stats)
+    return {"statusCode": 200, **stats}
+
+
+def run_worker(poll_seconds: float = 5.0) -> None:
+    """Drain the outbox forever, sleeping poll_seconds whenever it is empty."""
+    logger.info("Email outbox worker started (poll every %.1fs)", poll_seconds)
+    while True:
+        try:
+            stats = _drain_once(_DEFAULT_TIME_BUDGET_SECONDS)
+        except Exception as exc:
+            logger.exception("Email outbox drain failed: %s", exc)
+            stats = {"claimed": 0}
+        if stats["claimed"]:
+            logger.info("Email outbox drained: %s", stats)
+        else:
+            time.sleep(poll_seconds)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_worker()
@@ -0,0 +1,117 @@
+"""
+Waiver Document Handler — invoked every minute by EventBridge to finish signed waivers.
+
+Triggered by a recurring EventBridge rule (rate(1 minute)). For each newly
+signed waiver it renders the PDF, uploads it to S3 and queues the
+confirmation email (see services/waiver_document_service.py), then drains
+the email outbox so the confirmation goes out in the same invocation.
+
+Outside Lambda, run it as a local worker:
+
+    python -m app.handlers.waiver_document_handler                  # poll forever
+    python -m app.handlers.waiver_document_handler --once           # one pass
+    python -m app.handlers.waiver_document_handler --signature-id <uuid>
+"""
+import argparse
+import logging
+import time
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+_EXPECTED_SOURCES = {"aws.events", "aws.scheduler"}
+
+# Leave this much of the Lambda timeout for the outbox drain
+_OUTBOX_RESERVE_SECONDS = 15.0
+_DEFAULT_TIME_BUDGET_SECONDS = 40.0
+
+
+def _run_once(time_budget_seconds: float) -> dict:
+    from app.db.db import SessionLocal
+    from app.services.email_outbox_service import drain_outbox
+    from app.services.waiver_document_service import process_pending_signatures
+
+    db = SessionLocal()
+    try:
+        result = process_pending_signatures(db, time_budget_seconds=time_budget_seconds)
+        emails_sent = 0
+        if result.processed:
+            try:
+                emails_sent = drain_outbox(db, max_batches=1).sent
+            except Exception as e:
+                db.rollback()
+                logger.exception("Email outbox drain after waiver processing failed: %s", e)
+        return {
+            "claimed": result.claimed,
+            "processed": result.processed,
+            "failed": result.failed,
+            "emails_sent": emails_sent,
+        }
+    finally:
+        db.close()
+
+
+def handler(event, context):
+    source = event.get("source", "")
+    if source not in _EXPECTED_SOURCES:
+        logger.error(
+            "Waiver document handler rejected event with unexpected source %r",
+            source,
+        )
+        return {"statusCode": 403, "error": "Forbidden: unexpected invocation source"}
+
+    time_budget = _DEFAULT_TIME_BUDGET_SECONDS
+    if context is not None and hasattr(context, "get_remaining_time_in_millis"):
+        time_budget = context.get_remaining_time_in_millis() / 1000 - _OUTBOX_RESERVE_SECONDS
+
+    try:
+        stats = _run_once(max(time_budget, 1.0))
+    except Exception as exc:
+        logger.exception("Waiver document handler failed: %s", exc)
+        raise
+
+    if stats["claimed"]:
+        logger.info("Waiver documents processed: %s", stats)
+    return {"statusCode": 200, **stats}
+
+
+def _process_one(signature_id: UUID) -> bool:
+    from app.db.db import SessionLocal
+    from app.services.waiver_document_service import process_signature
+
+    db = SessionLocal()
+    try:
+        return process_signature(db, signature_id)
+    finally:
+        db.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Process signed waivers (PDF, S3, confirmation email)")
+    parser.add_argument("--signature-id", type=UUID, help="process this signature only, even if already claimed")
+    parser.add_argument("--once", action="store_true", help="process due signatures once and exit")
+    parser.add_argument("--poll-seconds", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    if args.signature_id:
+        done = _process_one(args.signature_id)
+        logger.info("Signature %s %s", args.signature_id, "processed" if done else "not found or already processed")
+        return
+
+    while True:
+        try:
+            stats = _run_once(_DEFAULT_TIME_BUDGET_SECONDS)
+        except Exception as exc:
+            logger.exception("Waiver document pass failed: %s", exc)
+            stats = {"claimed": 0}
+        if stats["claimed"]:
+            logger.info("Waiver documents processed: %s", stats)
+        if args.once:
+            return
+        if not stats["claimed"]:
+            time.sleep(args.poll_seconds)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,69 @@
+"""
+Waiver Export Handler — builds one league's signed-waiver ZIP into S3.
+
+Event payload:
+  {"league_id": "<uuid-string>", "export_id": "<uuid-string>"}
+
+Invoked asynchronously (InvocationType=Event) by POST /admin/waivers/export
+through services/waiver_archive_service.start_waiver_export, so the archive
+is built outside the API's 30-second request limit and is never carried in a
+Lambda response. The admin polls GET /admin/waivers/export/{export_id} for
+the presigned download URL.
+
+SECURITY: only the API function's role is granted lambda:InvokeFunction on
+this function (see the SAM template); it has no event source.
+
+Outside Lambda, run one export by hand:
+
+    python -m app.handlers.waiver_export_handler <league_id> [<export_id>]
+"""
+import argparse
+import logging
+from uuid import UUID, uuid4
+
+logger = logging.getLogger(__name__)
+
+
+def _run(league_id: UUID, export_id: UUID) -> str:
+    from app.db.db import SessionLocal
+    from app.services.waiver_archive_service import run_waiver_export
+
+    db = SessionLocal()
+    try:
+        return run_waiver_export(db, league_id, export_id)
+    finally:
+        db.close()
+
+
+def handler(event, context):
+    try:
+        league_id = UUID(event["league_id"])
+        export_id = UUID(event["export_id"])
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error("Waiver export handler received malformed event %s: %s", event, e)
+        return {"statusCode": 400, "error": "Invalid event payload"}
+
+    # Failures are recorded for the status endpoint by run_waiver_export; do
+    # not raise, or Lambda's async retries would rebuild the same export
+    try:
+        key = _run(league_id, export_id)
+    except Exception as exc:
+        logger.exception("Waiver export %s failed: %s", export_id, exc)
+        return {"statusCode": 500, "error": "Export failed"}
+
+    logger.info("Waiver export %s for league %s written to %s", export_id, league_id, key)
+    return {"statusCode": 200, "key": key}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build a league's signed-waiver ZIP export in S3")
+    parser.add_argument("league_id", type=UUID)
+    parser.add_argument("export_id", type=UUID, nargs="?", default=None)
+    args = parser.parse_args(argv)
+    export_id = args.export_id or uuid4()
+    logger.info("Export %s written to %s", export_id, _run(args.league_id, export_id))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
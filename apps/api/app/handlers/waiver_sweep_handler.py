@@ -3,6 +3,7 @@ Waiver Sweep Handler — invoked daily by EventBridge to expire overdue unsigned
 
 Triggered by a recurring EventBridge rule (rate(1 day)).
 For each league with expired waivers, attempts to trigger team generation.
+Also reconciles the leagues' denormalized occupancy counters.
 """
 import logging
 
@@ -23,6 +24,7 @@ def handler(event, context):
     logger.info("Waiver sweep handler started")
 
     from app.db.db import SessionLocal
+    from app.services.league_service import reconcile_occupancy_counters
     from app.services.waiver_service import expire_overdue_waivers
     from app.services.team_generation_service import trigger_team_generation_if_ready
 
@@ -44,7 +46,15 @@ def handler(event, context):
         else:
             logger.info("No overdue waivers found")
 
-        return {"statusCode": 200, "leagues_affected": len(affected)}
+        drifted = []
+        try:
+            drifted = reconcile_occupancy_counters(db)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.exception("Occupancy counter reconciliation failed: %s", e)
+
+        return {"statusCode": 200, "leagues_affected": len(affected), "counters_repaired": len(drifted)}
     except Exception as exc:
         logger.exception("Waiver sweep handler failed: %s", exc)
         raise
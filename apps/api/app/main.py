@@ -9,6 +9,8 @@ from sqlalchemy.orm import Session
 from starlette.middleware.base import BaseHTTPMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from app.core.config import settings
+from app.core.http_client import http_client
 from app.core.limiter import limiter
 from app.api import user, registration, team, league, contact, waiver
 from app.api.admin.main import router as admin_router
@@ -17,8 +19,11 @@ from app.services.admin_service import AdminService
 
 # Import all models so Base.metadata is fully populated before create_all
 import app.models.admin_config  # noqa: F401
+import app.models.cache_entry  # noqa: F401
+import app.models.email_outbox  # noqa: F401
 import app.models.field  # noqa: F401
 import app.models.field_availability  # noqa: F401
+import app.models.field_blackout  # noqa: F401
 import app.models.game  # noqa: F401
 import app.models.group  # noqa: F401
 import app.models.group_invitation  # noqa: F401
@@ -26,7 +31,9 @@ import app.models.league  # noqa: F401
 import app.models.league_field  # noqa: F401
 import app.models.league_player  # noqa: F401
 import app.models.player  # noqa: F401
+import app.models.rate_limit_counter  # noqa: F401
 import app.models.team  # noqa: F401
+import app.models.team_standing  # noqa: F401
 import app.models.user  # noqa: F401
 import app.models.waiver  # noqa: F401
 
@@ -53,6 +60,8 @@ class _JSONFormatter(logging.Formatter):
             entry["correlation_id"] = record.correlation_id
         if getattr(record, "event", None):
             entry["event"] = record.event
+        if getattr(record, "db", None):
+            entry["db"] = record.db
         if record.exc_info:
             entry["exception"] = self.formatException(record.exc_info)
         return _json.dumps(entry)
@@ -73,7 +82,7 @@ _cors_origins = [o.strip() for o in os.getenv("CORS_ORIGINS", _default_origins).
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Bootstrap DB and first admin on startup."""
+    """Bootstrap DB and first admin on startup; open and close the upstream HTTP pool."""
     # Log Clerk config so issuer mismatches surface immediately in server logs
     from app.core.config import settings
     logger.info("Clerk config — JWKS_URL=%s  ISSUER=%s", settings.CLERK_JWKS_URL, settings.CLERK_ISSUER)
@@ -97,7 +106,11 @@ async def lifespan(app: FastAPI):
         finally:
             db.close()
 
-    yield
+    await http_client.start()
+    try:
+        yield
+    finally:
+        await http_client.aclose()
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -126,10 +139,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Total-Count-Estimated"]
+    + (["Server-Timing"] if settings.QUERY_PROFILER_SERVER_TIMING else []),
 )
 
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Runs inside CorrelationIDMiddleware so its log lines carry the request's correlation ID
+from app.core.query_profiler import QueryProfilerMiddleware
+app.add_middleware(QueryProfilerMiddleware)
+
 from app.core.middleware import CorrelationIDMiddleware
 app.add_middleware(CorrelationIDMiddleware)
 
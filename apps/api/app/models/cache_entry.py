@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, Index, LargeBinary, String
+from app.db.db import Base
+
+
+class CacheEntry(Base):
+    """
+    Shared key/value cache entries for instances without a Redis server.
+
+    Read and written by core/cache.py's PostgresBackend (the shared tier of
+    the Clerk email lookup in utils/clerk_jwt.py). A row past expires_at is
+    treated as a miss and purged opportunistically.
+    """
+    __tablename__ = "cache_entries"
+    __table_args__ = (
+        Index("ix_cache_entries_expires_at", "expires_at"),
+        {"prefixes": ["UNLOGGED"]},  # a cache; losing it on crash only costs misses
+    )
+
+    key = Column(String, primary_key=True)
+    value = Column(LargeBinary, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
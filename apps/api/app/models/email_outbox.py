@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, CheckConstraint, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.db.db import Base
+
+
+class EmailOutbox(Base):
+    """
+    Transactional outbox for outgoing email.
+
+    Request handlers insert a row in the same transaction as the change that
+    triggers the email; services/email_outbox_service.py drains pending rows to
+    Resend. A claimed row stays 'pending' with next_attempt_at pushed out by
+    the claim lease, so a worker that dies mid-send just lets the row come
+    due again.
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        CheckConstraint("status IN ('pending', 'sent', 'dead')", name="ck_email_outbox_status"),
+        Index(
+            "ix_email_outbox_due", "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String, nullable=False)  # e.g. "waiver_prompt", for logs and filtering
+    to_email = Column(String, nullable=False)
+    message = Column(JSON, nullable=False)  # Resend send params (from/to/subject/html/attachments)
+    status = Column(String, nullable=False, default="pending", server_default="pending")
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_error = Column(Text, nullable=True)
+    provider_message_id = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
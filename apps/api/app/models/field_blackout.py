@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, CheckConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.db.db import Base
+
+
+class FieldBlackout(Base):
+    """
+    A period when a field is closed regardless of its availability windows
+    (maintenance, holidays, permit gaps).
+
+    Blackouts override FieldAvailability: the field calendar
+    (app/services/field_calendar.py) subtracts them from the open windows.
+    Times are local wall-clock times, like Game.game_datetime, and may span
+    several days.
+    """
+    __tablename__ = "field_blackouts"
+    __table_args__ = (
+        CheckConstraint("ends_at > starts_at", name="ck_field_blackouts_range"),
+        Index("ix_field_blackouts_field_id_starts_at", "field_id", "starts_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    field_id = Column(UUID(as_uuid=True), ForeignKey("fields.id"), nullable=False)
+    starts_at = Column(DateTime, nullable=False)
+    ends_at = Column(DateTime, nullable=False)
+    reason = Column(String, nullable=True)  # e.g., "Turf replacement"
+
+    # Metadata
+    created_by = Column(String, nullable=False)  # Clerk user id
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
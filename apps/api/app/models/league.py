@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Text, JSON, Numeric, CheckConstraint
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Text, JSON, Numeric, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -9,6 +9,8 @@ class League(Base):
     __table_args__ = (
         CheckConstraint("format IN ('7v7', '5v5')", name="ck_leagues_format"),
         CheckConstraint("max_teams IS NULL OR (max_teams >= 2 AND max_teams <= 10)", name="ck_leagues_max_teams"),
+        # Keyset pagination of the league listings (app/core/pagination.py)
+        Index("ix_leagues_created_at_id", "created_at", "id"),
     )
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
@@ -34,6 +36,11 @@ class League(Base):
     # Registration settings
     registration_deadline = Column(Date, nullable=True)  # When registration closes
     registration_fee = Column(Numeric(10, 2), nullable=False, default=0)  # Registration fee in dollars
+
+    # Denormalized occupancy counters, maintained by the registration/invitation
+    # flows and repaired by league_service.reconcile_occupancy_counters
+    confirmed_players_count = Column(Integer, nullable=False, default=0, server_default='0')  # active confirmed league_players
+    pending_invites_count = Column(Integer, nullable=False, default=0, server_default='0')  # invitations with status 'pending'
     
     # Advanced settings stored as JSON
     settings = Column(JSON, nullable=True)  # Flexible settings for future features
@@ -1,11 +1,27 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Date
+from sqlalchemy import Column, String, DateTime, Boolean, Date, Text, Computed, DDL, Index, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
 from app.db.db import Base
 
+# Lower-cased "first last email phone-digits", kept by Postgres on every write.
+# Must match the expression in migration d3e4f5a6b7c8.
+PLAYER_SEARCH_TEXT_SQL = (
+    "lower(first_name || ' ' || last_name || ' ' || email)"
+    " || ' ' || coalesce(regexp_replace(phone, '[^0-9]', '', 'g'), '')"
+)
+
 class Player(Base):
     __tablename__ = "players"
+    __table_args__ = (
+        # Keyset pagination of the admin user listing (app/core/pagination.py)
+        Index("ix_players_active_created_at_id", "created_at", "id", postgresql_where=text("is_active")),
+        # Admin player search: LIKE/regex and word_similarity lookups (services/player_search_service.py)
+        Index(
+            "ix_players_search_text_trgm", "search_text",
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     clerk_user_id = Column(String(200), unique=True, index=True, nullable=False)
     first_name = Column(String(100), nullable=False)
@@ -19,4 +35,9 @@ class Player(Base):
     created_by = Column(String(200), nullable=False)  # Clerk user id
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now()) 
+    search_text = Column(Text, Computed(PLAYER_SEARCH_TEXT_SQL, persisted=True))
+
+
+# gin_trgm_ops needs pg_trgm; create it first when the schema is built with create_all (tests)
+event.listen(Player.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from app.db.db import Base
+
+
+class RateLimitCounter(Base):
+    """
+    Shared sliding-window-counter state for the API rate limiter.
+
+    One row per limit key (limit + client + route) holding the counts for the
+    current and previous fixed windows; the limiter weights the previous
+    count by how much of it still overlaps the sliding window. Rows are
+    written by core/rate_limit.py with a single upsert so concurrent Lambda
+    instances share one count. Rows past expires_at are dead and purged
+    opportunistically.
+    """
+    __tablename__ = "rate_limit_counters"
+    __table_args__ = (
+        Index("ix_rate_limit_counters_expires_at", "expires_at"),
+        {"prefixes": ["UNLOGGED"]},  # short-lived counters; no WAL needed
+    )
+
+    key = Column(String, primary_key=True)
+    window_index = Column(BigInteger, nullable=False)  # floor(epoch seconds / window length)
+    current_count = Column(Integer, nullable=False, default=0)
+    previous_count = Column(Integer, nullable=False, default=0)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.db.db import Base
+
+
+class TeamStanding(Base):
+    """
+    Persisted per-team standings aggregate.
+
+    Maintained by delta whenever a game result changes (see
+    services/standings_service.py) so standings reads are a single indexed
+    lookup instead of a scan over every completed game. Rebuildable from the
+    games table for drift repair.
+    """
+    __tablename__ = "team_standings"
+    __table_args__ = (
+        UniqueConstraint("team_id", name="uq_team_standings_team"),
+        Index("ix_team_standings_league_id", "league_id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    league_id = Column(UUID(as_uuid=True), ForeignKey("leagues.id"), nullable=False)
+    team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=False)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    points_for = Column(Integer, nullable=False, default=0)
+    points_against = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, UniqueConstraint, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, UniqueConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -25,6 +25,10 @@ class WaiverSignature(Base):
         Index("ix_waiver_signatures_waiver_id", "waiver_id"),
         Index("ix_waiver_signatures_player_id", "player_id"),
         Index("ix_waiver_signatures_league_id", "league_id"),
+        Index(
+            "ix_waiver_signatures_unprocessed", "next_processing_at",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
@@ -37,3 +41,10 @@ class WaiverSignature(Base):
     signed_at = Column(DateTime(timezone=True), server_default=func.now())
     email_sent_at = Column(DateTime(timezone=True), nullable=True)
     pdf_path = Column(String, nullable=True)
+
+    # Post-signing pipeline state (services/waiver_document_service.py):
+    # processed_at IS NULL means the PDF/email stage is still due
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+    processing_attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_processing_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    processing_error = Column(Text, nullable=True)
@@ -0,0 +1,257 @@
+"""
+Transactional email outbox.
+
+enqueue_email() adds a row to email_outbox inside the caller's transaction,
+so an email exists exactly when the change that triggered it commits, and
+the request never waits on Resend. drain_outbox() delivers due rows:
+
+1. Claim — SELECT ... FOR UPDATE SKIP LOCKED up to batch_size due rows,
+   bump attempts and push next_attempt_at out by the lease, commit.
+   Concurrent drainers never claim the same row, and rows claimed by a
+   drainer that died come due again once the lease runs out.
+2. Send — messages without attachments go to Resend's batch endpoint (one
+   call per claim, permissive validation so one bad address does not sink
+   the rest); messages with attachments, which the batch endpoint does not
+   accept, are sent one at a time. Every call carries an Idempotency-Key
+   derived from the outbox IDs so Resend drops a repeat of a send that
+   succeeded but was never recorded.
+3. Record — sent rows keep the provider message ID; retryable failures
+   (network errors, 429, 5xx) are rescheduled with capped exponential
+   backoff plus jitter; other failures, and rows out of attempts, are
+   dead-lettered with their last error. One executemany UPDATE per claim.
+
+Delivery is at-least-once.
+
+Public API:
+- enqueue_email(db, kind, message) — add to the outbox; does NOT commit
+- drain_outbox(db, ...) — deliver due rows; commits after each claim
+- purge_sent(db, older_than) — delete delivered rows; does NOT commit
+"""
+
+import hashlib
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import resend
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.constants import EMAIL_DEAD, EMAIL_PENDING, EMAIL_SENT
+from app.models.email_outbox import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+# Resend's batch endpoint accepts at most 100 messages per call
+RESEND_BATCH_LIMIT = 100
+_MAX_ERROR_LENGTH = 1000
+
+if settings.RESEND_API_KEY:
+    resend.api_key = settings.RESEND_API_KEY
+
+
+@dataclass
+class _Outcome:
+    provider_id: Optional[str] = None
+    error: Optional[str] = None
+    retryable: bool = False
+
+
+@dataclass
+class DrainResult:
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _failure(exc: Exception) -> _Outcome:
+    """Classify a send exception: network errors, 429 and 5xx are retryable."""
+    try:
+        code = int(getattr(exc, "code", None))
+    except (TypeError, ValueError):
+        code = None
+    retryable = code is None or code == 429 or code >= 500
+    error = f"{type(exc).__name__}: {exc}"[:_MAX_ERROR_LENGTH]
+    return _Outcome(error=error, retryable=retryable)
+
+
+def _idempotency_key(ids: List[UUID]) -> str:
+    if len(ids) == 1:
+        return f"outbox-{ids[0]}"
+    digest = hashlib.sha256(",".join(sorted(str(i) for i in ids)).encode()).hexdigest()
+    return f"outbox-batch-{digest}"
+
+
+def _send_batch(items: List[Tuple[UUID, dict]]) -> Dict[UUID, _Outcome]:
+    ids = [outbox_id for outbox_id, _ in items]
+    try:
+        resp = resend.Batch.send(
+            [message for _, message in items],
+            {"idempotency_key": _idempotency_key(ids), "batch_validation": "permissive"},
+        )
+    except Exception as exc:
+        outcome = _failure(exc)
+        return {outbox_id: outcome for outbox_id in ids}
+
+    # Permissive mode: errors name rejected indices; data lists the accepted
+    # messages in request order
+    rejected = {e["index"]: e.get("message", "rejected") for e in (resp.get("errors") or [])}
+    accepted = iter(resp.get("data") or [])
+    outcomes: Dict[UUID, _Outcome] = {}
+    for index, outbox_id in enumerate(ids):
+        if index in rejected:
+            outcomes[outbox_id] = _Outcome(error=f"Rejected: {rejected[index]}"[:_MAX_ERROR_LENGTH])
+        else:
+            sent = next(accepted, None)
+            outcomes[outbox_id] = _Outcome(provider_id=sent["id"] if sent else None)
+    return outcomes
+
+
+def _send_one(outbox_id: UUID, message: dict) -> _Outcome:
+    try:
+        resp = resend.Emails.send(message, {"idempotency_key": _idempotency_key([outbox_id])})
+    except Exception as exc:
+        return _failure(exc)
+    return _Outcome(provider_id=resp.get("id"))
+
+
+def _deliver(items: List[Tuple[UUID, dict]]) -> Dict[UUID, _Outcome]:
+    """Send claimed messages; returns an outcome per outbox ID. Never raises."""
+    outcomes: Dict[UUID, _Outcome] = {}
+    batchable = [(i, m) for i, m in items if not m.get("attachments")]
+    for start in range(0, len(batchable), RESEND_BATCH_LIMIT):
+        outcomes.update(_send_batch(batchable[start:start + RESEND_BATCH_LIMIT]))
+    for outbox_id, message in items:
+        if message.get("attachments"):
+            outcomes[outbox_id] = _send_one(outbox_id, message)
+    return outcomes
+
+
+def _backoff_seconds(attempts: int, rng: random.Random) -> float:
+    """Capped exponential backoff with jitter in [50%, 100%] of the step."""
+    step = settings.EMAIL_OUTBOX_BACKOFF_BASE_SECONDS * 2 ** min(attempts - 1, 30)
+    return min(step, settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS) * rng.uniform(0.5, 1.0)
+
+
+def _claim(db: Session, batch_size: int) -> List[Tuple[UUID, dict, int]]:
+    """Lease up to batch_size due rows and commit. Returns (id, message, attempts)."""
+    now = _now()
+    rows = db.execute(
+        select(EmailOutbox.id, EmailOutbox.message, EmailOutbox.attempts)
+        .where(EmailOutbox.status == EMAIL_PENDING, EmailOutbox.next_attempt_at <= now)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if rows:
+        db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_([r.id for r in rows]))
+            .values(
+                attempts=EmailOutbox.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+    db.commit()
+    return [(r.id, r.message, r.attempts + 1) for r in rows]
+
+
+def _record(
+    db: Session,
+    claimed: List[Tuple[UUID, dict, int]],
+    outcomes: Dict[UUID, _Outcome],
+    rng: random.Random,
+    result: DrainResult,
+) -> None:
+    now = _now()
+    params = []
+    for outbox_id, _, attempts in claimed:
+        outcome = outcomes[outbox_id]
+        if outcome.error is None:
+            result.sent += 1
+            params.append({
+                "id": outbox_id, "status": EMAIL_SENT, "sent_at": now,
+                "provider_message_id": outcome.provider_id, "last_error": None,
+            })
+        elif outcome.retryable and attempts < settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            result.retried += 1
+            retry_at = now + timedelta(seconds=_backoff_seconds(attempts, rng))
+            params.append({"id": outbox_id, "next_attempt_at": retry_at, "last_error": outcome.error})
+            logger.warning("Email %s failed (attempt %d), retrying at %s: %s", outbox_id, attempts, retry_at, outcome.error)
+        else:
+            result.dead += 1
+            params.append({"id": outbox_id, "status": EMAIL_DEAD, "last_error": outcome.error})
+            logger.error("Email %s dead-lettered after %d attempt(s): %s", outbox_id, attempts, outcome.error)
+    db.execute(update(EmailOutbox), params)
+    db.commit()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def enqueue_email(db: Session, kind: str, message: dict) -> EmailOutbox:
+    """
+    Add a message (Resend send params, see email_service.build_*) to the
+    outbox. Does NOT commit — commit it with the change that triggered it.
+    """
+    row = EmailOutbox(kind=kind, to_email=message["to"], message=message)
+    db.add(row)
+    return row
+
+
+def drain_outbox(
+    db: Session,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None,
+    time_budget_seconds: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> DrainResult:
+    """
+    Deliver due outbox rows, one claim of batch_size at a time, until none
+    are due or max_batches / time_budget_seconds runs out. Commits.
+    """
+    result = DrainResult()
+    if not resend.api_key:
+        logger.warning("RESEND_API_KEY is not set; leaving outbox undelivered")
+        return result
+
+    batch_size = min(batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE, RESEND_BATCH_LIMIT)
+    deadline = time.monotonic() + time_budget_seconds if time_budget_seconds else None
+    rng = random.Random(seed)
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        claimed = _claim(db, batch_size)
+        if not claimed:
+            break
+        batches += 1
+        result.claimed += len(claimed)
+        outcomes = _deliver([(outbox_id, message) for outbox_id, message, _ in claimed])
+        _record(db, claimed, outcomes, rng, result)
+    return result
+
+
+def purge_sent(db: Session, older_than: datetime) -> int:
+    """Delete delivered rows sent before older_than. Dead letters are kept. Does NOT commit."""
+    res = db.execute(
+        delete(EmailOutbox).where(EmailOutbox.status == EMAIL_SENT, EmailOutbox.sent_at < older_than),
+        execution_options={"synchronize_session": False},
+    )
+    return res.rowcount or 0
@@ -9,10 +9,10 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# TODO: Replace fire-and-forget email sends with an SQS queue + DLQ for
-# reliable delivery. Critical emails like waiver prompts directly affect
-# registration lifecycle — a silent failure means the player's registration
-# may expire without notification. See REVIEW_REPORT.md item 6.
+# Request paths do not call the send_* functions directly: they enqueue the
+# build_* message in the transactional outbox (services/email_outbox_service.py)
+# in the same commit as the change that triggered it, and the outbox drainer
+# delivers with batching, retries and dead-lettering.
 
 # Set API key once at module load, not on every call
 if settings.RESEND_API_KEY:
@@ -26,7 +26,7 @@ _jinja_env = Environment(
 )
 
 
-def send_group_invitation(
+def build_group_invitation(
     to_email: str,
     to_name: str,
     inviter_name: str,
@@ -35,7 +35,7 @@ def send_group_invitation(
     token: str,
     app_url: str,
     expiry_days: int = 7,
-):
+) -> dict:
     invite_url = f"{app_url}/invite/{token}"
     expiry_label = f"{expiry_days} day{'s' if expiry_days != 1 else ''}"
     html = _jinja_env.get_template("group_invitation.html").render(
@@ -46,21 +46,26 @@ def send_group_invitation(
         invite_url=invite_url,
         expiry_label=expiry_label,
     )
-    resend.Emails.send({
+    return {
         "from": settings.EMAIL_FROM,
         "to": to_email,
         "subject": f"You're invited to join {group_name} \u2013 {league_name}",
         "html": html,
-    })
-    logger.info("Email sent: type=group_invitation to=%s", to_email)
+    }
 
 
-def send_contact_message(
+def send_group_invitation(**kwargs):
+    """Send immediately, bypassing the outbox. Takes build_group_invitation's arguments."""
+    resend.Emails.send(build_group_invitation(**kwargs))
+    logger.info("Email sent: type=group_invitation to=%s", kwargs["to_email"])
+
+
+def build_contact_message(
     sender_name: str,
     sender_email: str,
     subject: str,
     message: str,
-):
+) -> dict:
     from markupsafe import Markup, escape
     message_html = escape(message).replace("\n", Markup("<br />"))
     html = _jinja_env.get_template("contact_message.html").render(
@@ -69,23 +74,28 @@ def send_contact_message(
         subject=subject,
         message_html=message_html,
     )
-    resend.Emails.send({
+    return {
         "from": settings.EMAIL_FROM,
         "to": settings.CONTACT_EMAIL,
         "subject": f"[Contact] {subject}",
         "html": html,
-    })
-    logger.info("Email sent: type=contact_message from=%s", sender_email)
+    }
+
+
+def send_contact_message(**kwargs):
+    """Send immediately, bypassing the outbox. Takes build_contact_message's arguments."""
+    resend.Emails.send(build_contact_message(**kwargs))
+    logger.info("Email sent: type=contact_message from=%s", kwargs["sender_email"])
 
 
-def send_waiver_prompt(
+def build_waiver_prompt(
     to_email: str,
     to_name: str,
     league_name: str,
     league_id: str,
     expiry_days: int,
-):
-    """Send an email prompting the player to sign their waiver after registration."""
+) -> dict:
+    """Email prompting the player to sign their waiver after registration."""
     waiver_url = f"{settings.APP_URL}/waiver/{league_id}"
     expiry_label = f"{expiry_days} day{'s' if expiry_days != 1 else ''}"
     html = _jinja_env.get_template("waiver_prompt.html").render(
@@ -94,23 +104,28 @@ def send_waiver_prompt(
         waiver_url=waiver_url,
         expiry_label=expiry_label,
     )
-    resend.Emails.send({
+    return {
         "from": settings.EMAIL_FROM,
         "to": to_email,
         "subject": f"Action Required: Sign Your Waiver \u2014 {league_name}",
         "html": html,
-    })
-    logger.info("Email sent: type=waiver_prompt to=%s", to_email)
+    }
 
 
-def send_waiver_confirmation(
+def send_waiver_prompt(**kwargs):
+    """Send immediately, bypassing the outbox. Takes build_waiver_prompt's arguments."""
+    resend.Emails.send(build_waiver_prompt(**kwargs))
+    logger.info("Email sent: type=waiver_prompt to=%s", kwargs["to_email"])
+
+
+def build_waiver_confirmation(
     to_email: str,
     to_name: str,
     league_name: str,
     waiver_version: str,
     signed_at: datetime,
     pdf_bytes: bytes,
-):
+) -> dict:
     signed_at_str = signed_at.strftime("%B %d, %Y at %I:%M %p UTC")
     html = _jinja_env.get_template("waiver_confirmation.html").render(
         to_name=to_name,
@@ -118,7 +133,7 @@ def send_waiver_confirmation(
         signed_at_str=signed_at_str,
         waiver_version=waiver_version,
     )
-    resend.Emails.send({
+    return {
         "from": settings.EMAIL_FROM,
         "to": to_email,
         "subject": f"Waiver Signed \u2014 {league_name}",
@@ -129,5 +144,10 @@ def send_waiver_confirmation(
                 "content": base64.b64encode(pdf_bytes).decode(),
             }
         ],
-    })
-    logger.info("Email sent: type=waiver_confirmation to=%s", to_email)
+    }
+
+
+def send_waiver_confirmation(**kwargs):
+    """Send immediately, bypassing the outbox. Takes build_waiver_confirmation's arguments."""
+    resend.Emails.send(build_waiver_confirmation(**kwargs))
+    logger.info("Email sent: type=waiver_confirmation to=%s", kwargs["to_email"])
@@ -0,0 +1,434 @@
+"""
+Materialized field free/busy calendar.
+
+FieldAvailability stores rules — weekly windows bounded by
+recurrence_start_date/recurrence_end_date, and one-off custom_date windows.
+FieldCalendar expands them once for a date range into per-field, per-day
+bitmaps at SLOT_MINUTES resolution: one Python int of SLOTS_PER_DAY bits per
+field-day, bit i covering minutes [5i, 5i + 5). Three layers are kept per
+field, each a list indexed by day offset:
+
+- open     — union of the availability windows that apply that day
+- blocked  — FieldBlackout periods
+- busy     — scheduled / in-progress games
+
+free = open & ~(blocked | busy). "Is this slot free", "free windows of at
+least N minutes" and "game start times that fit" are then shifts, ANDs and
+bit scans over a few machine words instead of re-expanding rules and
+re-checking bookings per query.
+
+Rounding is conservative: availability windows shrink to whole slots
+(start rounded up, end down), bookings and blackouts grow to whole slots.
+Bookings and blackouts that cross midnight are split across days.
+
+A calendar is built per request by build_field_calendar() from the rows in
+the database and is not kept between requests, so the availability,
+blackout and game write paths have nothing to update. It is loaded through
+add_availability(), add_blackout() and book() / book_games() (the bulk form
+used for a season of games), which build_field_calendar() calls and tests
+and benchmarks use to assemble calendars without a database.
+day_masks() walks a field's non-empty days with the raw layers (plus the
+double-booked overlap) for season-wide analytics.
+
+Public API:
+- SLOT_MINUTES, SLOTS_PER_DAY
+- FieldCalendar(field_ids, start_date, end_date)
+- build_field_calendar(db, field_ids, start_date, end_date) -> FieldCalendar
+  (three queries: availability, blackouts, bookings)
+- window_mask(start_time, end_time) -> int, mask_runs(mask) -> [(start_slot, end_slot)],
+  slot_time(slot) -> time
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, time as dt_time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core.constants import GAME_IN_PROGRESS, GAME_SCHEDULED
+from app.models.field_availability import FieldAvailability
+from app.models.field_blackout import FieldBlackout
+from app.models.game import Game
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+_SLOT = timedelta(minutes=SLOT_MINUTES)
+
+Span = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """One availability window, reduced to its slot mask and the days it applies to."""
+    mask: int
+    weekday: Optional[int] = None
+    first: Optional[date] = None
+    last: Optional[date] = None
+    on: Optional[date] = None
+
+    def applies(self, day: date) -> bool:
+        if self.on is not None:
+            return day == self.on
+        return (
+            day.weekday() == self.weekday
+            and (self.first is None or day >= self.first)
+            and (self.last is None or day <= self.last)
+        )
+
+    def days(self, start: date, end: date) -> Iterator[date]:
+        """Days in [start, end] the rule applies to."""
+        if self.on is not None:
+            if start <= self.on <= end:
+                yield self.on
+            return
+        first = max(start, self.first) if self.first else start
+        last = min(end, self.last) if self.last else end
+        day = first + timedelta(days=(self.weekday - first.weekday()) % 7)
+        while day <= last:
+            yield day
+            day += timedelta(weeks=1)
+
+
+class _FieldDays:
+    __slots__ = ("open", "blocked", "busy", "bookings")
+
+    def __init__(self, n_days: int) -> None:
+        self.open = [0] * n_days
+        self.blocked = [0] * n_days
+        self.busy = [0] * n_days
+        self.bookings: Dict[int, List[Span]] = defaultdict(list)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _span(start_slot: int, end_slot: int) -> int:
+    """Mask with bits [start_slot, end_slot) set."""
+    if end_slot <= start_slot:
+        return 0
+    return ((1 << (end_slot - start_slot)) - 1) << start_slot
+
+
+def _minutes(t: dt_time) -> int:
+    return t.hour * 60 + t.minute + (1 if t.second or t.microsecond else 0)
+
+
+def _slots_for(minutes: int) -> int:
+    return max(1, -(-minutes // SLOT_MINUTES))
+
+
+def _fit_starts(mask: int, n_slots: int) -> int:
+    """Bits i of `mask` where all of [i, i + n_slots) are set."""
+    fits, width = mask, 1
+    while width < n_slots and fits:
+        step = min(width, n_slots - width)
+        fits &= fits >> step
+        width += step
+    return fits
+
+
+def _rule_for(avail) -> Optional[_Rule]:
+    mask = window_mask(avail.start_time, avail.end_time)
+    if not mask or avail.is_active is False:
+        return None
+    if avail.is_recurring:
+        if avail.day_of_week is None:
+            return None
+        return _Rule(mask, weekday=avail.day_of_week, first=avail.recurrence_start_date, last=avail.recurrence_end_date)
+    if avail.custom_date is None:
+        return None
+    return _Rule(mask, on=avail.custom_date)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def window_mask(start: dt_time, end: dt_time) -> int:
+    """Slots fully inside [start, end) on one day (start rounded up, end down)."""
+    return _span(-(-_minutes(start) // SLOT_MINUTES), (end.hour * 60 + end.minute) // SLOT_MINUTES)
+
+
+def slot_time(slot: int) -> dt_time:
+    """Wall-clock start of a slot; SLOTS_PER_DAY (end of day) maps to time.max."""
+    if slot >= SLOTS_PER_DAY:
+        return dt_time.max
+    minutes = slot * SLOT_MINUTES
+    return dt_time(minutes // 60, minutes % 60)
+
+
+def mask_runs(mask: int) -> List[Span]:
+    """Maximal runs of set bits as (start_slot, end_slot) pairs, ascending."""
+    runs: List[Span] = []
+    while mask:
+        start = (mask & -mask).bit_length() - 1
+        shifted = mask >> start
+        length = (~shifted & (shifted + 1)).bit_length() - 1
+        runs.append((start, start + length))
+        mask &= ~_span(start, start + length)
+    return runs
+
+
+class FieldCalendar:
+    """
+    Free/busy bitmaps for fields over start_date..end_date inclusive.
+
+    Fields not passed to the constructor are added on first update; queries
+    on unknown fields or days outside the range see a closed field.
+    """
+
+    def __init__(self, field_ids: Iterable[UUID], start_date: date, end_date: date) -> None:
+        self.start_date = start_date
+        self.end_date = end_date
+        self.n_days = max((end_date - start_date).days + 1, 0)
+        self._origin = datetime.combine(start_date, dt_time())
+        self._n_slots = self.n_days * SLOTS_PER_DAY
+        self._fields: Dict[UUID, _FieldDays] = {}
+        for field_id in field_ids:
+            self._field(field_id)
+
+    @property
+    def field_ids(self) -> List[UUID]:
+        return sorted(self._fields)
+
+    def _field(self, field_id: UUID) -> _FieldDays:
+        days = self._fields.get(field_id)
+        if days is None:
+            days = self._fields[field_id] = _FieldDays(self.n_days)
+        return days
+
+    def _day_index(self, day: date) -> Optional[int]:
+        i = (day - self.start_date).days
+        return i if 0 <= i < self.n_days else None
+
+    def _slot_range(self, start: datetime, end: datetime) -> Span:
+        """[start, end) as slot numbers counted from the range's first midnight, rounded outward."""
+        return (start - self._origin) // _SLOT, -((self._origin - end) // _SLOT)
+
+    def _split(self, start: datetime, end: datetime) -> List[Tuple[int, Span]]:
+        """(day index, slot span) pieces of [start, end) inside the range, rounded outward."""
+        first, last = self._slot_range(start, end)
+        first, last = max(first, 0), min(last, self._n_slots)
+        i, offset = divmod(first, SLOTS_PER_DAY)
+        day_end = (i + 1) * SLOTS_PER_DAY
+        if last <= day_end:
+            # Most bookings fall within one day
+            return [(i, (offset, last - i * SLOTS_PER_DAY))] if first < last else []
+        pieces = [(i, (offset, SLOTS_PER_DAY))]
+        while day_end < last:
+            i += 1
+            pieces.append((i, (0, min(last - day_end, SLOTS_PER_DAY))))
+            day_end += SLOTS_PER_DAY
+        return pieces
+
+    # -- availability -------------------------------------------------------
+
+    def add_availability(self, avail) -> None:
+        """Open the field for a FieldAvailability rule's windows; inactive or empty rules are ignored."""
+        days = self._field(avail.field_id)
+        rule = _rule_for(avail)
+        if rule is not None:
+            for day in rule.days(self.start_date, self.end_date):
+                days.open[(day - self.start_date).days] |= rule.mask
+
+    # -- blackouts and bookings ---------------------------------------------
+
+    def add_blackout(self, field_id: UUID, start: datetime, end: datetime) -> None:
+        days = self._field(field_id)
+        for i, (first, last) in self._split(start, end):
+            days.blocked[i] |= _span(first, last)
+
+    def book(self, field_id: UUID, start: datetime, end: datetime) -> None:
+        days = self._field(field_id)
+        for i, (first, last) in self._split(start, end):
+            days.bookings[i].append((first, last))
+            days.busy[i] |= _span(first, last)
+
+    def book_games(self, rows: Iterable[Tuple[UUID, datetime, int]]) -> None:
+        """
+        Bulk book() for (field_id, game_datetime, duration_minutes) rows, as
+        loaded by build_field_calendar. Same result as booking each row; slot
+        numbers come from integer arithmetic instead of timedelta division.
+        """
+        origin = self._origin.toordinal()
+        slot_seconds = SLOT_MINUTES * 60
+        n_slots = self._n_slots
+        fields = self._fields
+        for field_id, start, duration_minutes in rows:
+            seconds = (start.toordinal() - origin) * 86400 + start.hour * 3600 + start.minute * 60 + start.second
+            first = seconds // slot_seconds
+            last = -(-(seconds + duration_minutes * 60) // slot_seconds)
+            i, offset = divmod(first, SLOTS_PER_DAY)
+            stop = last - i * SLOTS_PER_DAY
+            days = fields.get(field_id)
+            if days is None or first < 0 or last > n_slots or stop > SLOTS_PER_DAY or start.microsecond:
+                # New field, crosses midnight or the range edge
+                self.book(field_id, start, start + timedelta(minutes=duration_minutes))
+                continue
+            days.bookings[i].append((offset, stop))
+            days.busy[i] |= ((1 << (stop - offset)) - 1) << offset
+
+    # -- queries ------------------------------------------------------------
+
+    def masks(self, field_id: UUID, day: date) -> Tuple[int, int, int]:
+        """(open, blocked, busy) bitmaps for one field-day; zeros when unknown."""
+        days = self._fields.get(field_id)
+        i = self._day_index(day)
+        if days is None or i is None:
+            return 0, 0, 0
+        return days.open[i], days.blocked[i], days.busy[i]
+
+    def overlap_mask(self, field_id: UUID, day: date) -> int:
+        """Slots on `day` covered by two or more bookings (double-booked)."""
+        days = self._fields.get(field_id)
+        i = self._day_index(day)
+        if days is None or i is None:
+            return 0
+        return self._overlap(days.bookings.get(i, ()))
+
+    @staticmethod
+    def _overlap(spans: Iterable[Span]) -> int:
+        seen = twice = 0
+        for first, last in spans:
+            mask = _span(first, last)
+            twice |= seen & mask
+            seen |= mask
+        return twice
+
+    def day_masks(self, field_id: UUID) -> Iterator[Tuple[int, int, int, int, int]]:
+        """
+        (day offset, open, blocked, busy, overlap) for every day of the range
+        on which the field has availability, a blackout or a booking, in order.
+        """
+        days = self._fields.get(field_id)
+        if days is None:
+            return
+        for i, (open_, blocked, busy) in enumerate(zip(days.open, days.blocked, days.busy)):
+            if open_ or blocked or busy:
+                yield i, open_, blocked, busy, self._overlap(days.bookings[i]) if busy else 0
+
+    def free_mask(self, field_id: UUID, day: date) -> int:
+        open_, blocked, busy = self.masks(field_id, day)
+        return open_ & ~(blocked | busy)
+
+    def is_free(self, field_id: UUID, start: datetime, end: datetime) -> bool:
+        """True if every slot of [start, end) is open, not blacked out and not booked."""
+        days = self._fields.get(field_id)
+        first, last = self._slot_range(start, end)
+        if days is None or first >= last or first < 0 or last > self._n_slots:
+            return False
+        while first < last:
+            i, offset = divmod(first, SLOTS_PER_DAY)
+            stop = min(last - i * SLOTS_PER_DAY, SLOTS_PER_DAY)
+            wanted = _span(offset, stop)
+            if (days.open[i] & ~(days.blocked[i] | days.busy[i]) & wanted) != wanted:
+                return False
+            first = (i + 1) * SLOTS_PER_DAY
+        return True
+
+    def free_windows(self, field_id: UUID, day: date, min_minutes: int = SLOT_MINUTES) -> List[Tuple[dt_time, dt_time]]:
+        """Maximal free (start, end) windows on `day` lasting at least min_minutes."""
+        min_slots = _slots_for(min_minutes)
+        return [
+            (slot_time(first), slot_time(last))
+            for first, last in mask_runs(self.free_mask(field_id, day))
+            if last - first >= min_slots
+        ]
+
+    def start_times(
+        self, field_id: UUID, day: date, duration_minutes: int, step_minutes: Optional[int] = None,
+    ) -> List[dt_time]:
+        """
+        Non-overlapping start times for `duration_minutes` games on `day`,
+        earliest first; consecutive starts are at least step_minutes apart
+        (default: the duration).
+        """
+        fits = _fit_starts(self.free_mask(field_id, day), _slots_for(duration_minutes))
+        step = _slots_for(step_minutes or duration_minutes)
+        starts: List[dt_time] = []
+        while fits:
+            slot = (fits & -fits).bit_length() - 1
+            starts.append(slot_time(slot))
+            fits &= ~((1 << (slot + step)) - 1)
+        return starts
+
+    def windows_by_date(
+        self, min_minutes: int = SLOT_MINUTES, field_ids: Optional[Iterable[UUID]] = None,
+    ) -> Dict[date, List[Tuple[UUID, dt_time, dt_time]]]:
+        """{date: [(field_id, start, end), ...]} of free windows, ordered by (field_id, start); empty dates omitted."""
+        fields = sorted(field_ids) if field_ids is not None else self.field_ids
+        result: Dict[date, List[Tuple[UUID, dt_time, dt_time]]] = {}
+        for i in range(self.n_days):
+            day = self.start_date + timedelta(days=i)
+            windows = [
+                (field_id, start, end)
+                for field_id in fields
+                for start, end in self.free_windows(field_id, day, min_minutes)
+            ]
+            if windows:
+                result[day] = windows
+        return result
+
+
+def build_field_calendar(
+    db: Session,
+    field_ids: List[UUID],
+    start_date: date,
+    end_date: date,
+) -> FieldCalendar:
+    """
+    Materialize the calendar for `field_ids` over start_date..end_date inclusive
+    from active availability, active blackouts and scheduled / in-progress
+    games (any league). Three queries regardless of range length.
+    """
+    calendar = FieldCalendar(field_ids, start_date, end_date)
+    if not field_ids or end_date < start_date:
+        return calendar
+
+    availabilities = db.query(FieldAvailability).filter(
+        FieldAvailability.field_id.in_(field_ids),
+        FieldAvailability.is_active == True,
+        or_(
+            and_(
+                FieldAvailability.is_recurring == True,
+                or_(FieldAvailability.recurrence_start_date.is_(None),
+                    FieldAvailability.recurrence_start_date <= end_date),
+                or_(FieldAvailability.recurrence_end_date.is_(None),
+                    FieldAvailability.recurrence_end_date >= start_date),
+            ),
+            and_(
+                FieldAvailability.is_recurring == False,
+                FieldAvailability.custom_date >= start_date,
+                FieldAvailability.custom_date <= end_date,
+            ),
+        ),
+    ).all()
+    for avail in availabilities:
+        calendar.add_availability(avail)
+
+    range_start = datetime.combine(start_date, dt_time())
+    range_end = datetime.combine(end_date + timedelta(days=1), dt_time())
+    blackouts = db.query(FieldBlackout.field_id, FieldBlackout.starts_at, FieldBlackout.ends_at).filter(
+        FieldBlackout.field_id.in_(field_ids),
+        FieldBlackout.is_active == True,
+        FieldBlackout.starts_at < range_end,
+        FieldBlackout.ends_at > range_start,
+    ).all()
+    for field_id, starts_at, ends_at in blackouts:
+        calendar.add_blackout(field_id, starts_at, ends_at)
+
+    # A game late the evening before can run past midnight into the range
+    games = db.query(Game.field_id, Game.game_datetime, Game.duration_minutes).filter(
+        Game.game_date >= start_date - timedelta(days=1),
+        Game.game_date <= end_date,
+        Game.field_id.in_(field_ids),
+        Game.is_active == True,
+        Game.status.in_([GAME_SCHEDULED, GAME_IN_PROGRESS]),
+    ).all()
+    calendar.book_games(games)
+
+    return calendar
@@ -0,0 +1,219 @@
+"""
+Season-wide field utilization analytics across all leagues.
+
+Reads a FieldCalendar (app/services/field_calendar.py) for the range and
+reduces its per-field-day bitmaps to heatmap-ready arrays. Per field:
+
+- available — open (availability windows) minus blackouts
+- booked    — scheduled / in-progress games inside available time, any league
+- idle      — available and not booked
+- blocked   — availability lost to blackouts
+- conflict  — game time outside availability or during a blackout
+- double    — time covered by two or more games
+
+Hourly figures are summed into a weekday x hour grid without looping over
+hours: each day's 288-bit mask is folded into 24 twelve-bit lanes holding
+that hour's popcount (SWAR: pairwise bit counts, then nibble sums), and the
+lane words are added per weekday. A lane holds up to 4095 slots, i.e. 341
+days of a weekday; MAX_RANGE_DAYS keeps well inside that. The grid is
+unpacked once per field at the end, so the cost is a few big-int operations
+per non-empty field-day.
+
+Public API:
+- MAX_RANGE_DAYS, MAX_RISK_WINDOWS
+- summarize_calendar(calendar, fields) -> List[FieldUtilization]
+- get_field_utilization(db, start_date, end_date, league_id=None) -> FieldUtilizationReport
+  (four queries: fields, then the calendar's three; one more to check
+  league_id); raises ServiceError for an invalid range, NotFoundError for
+  an unknown league
+"""
+
+from dataclasses import dataclass, field as dataclass_field
+from datetime import date, time as dt_time, timedelta
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.field import Field
+from app.models.league import League
+from app.models.league_field import LeagueField
+from app.services.exceptions import NotFoundError, ServiceError
+from app.services.field_calendar import (
+    SLOT_MINUTES,
+    SLOTS_PER_DAY,
+    FieldCalendar,
+    build_field_calendar,
+    mask_runs,
+    slot_time,
+)
+
+MAX_RANGE_DAYS = 731
+MAX_RISK_WINDOWS = 200
+
+RISK_DOUBLE_BOOKED = "double_booked"
+RISK_UNAVAILABLE = "outside_availability"
+
+_HOURS = 24
+_LANE = 60 // SLOT_MINUTES
+_LANE_MASK = (1 << _LANE) - 1
+_ALL = (1 << SLOTS_PER_DAY) - 1
+_PAIRS = _ALL // 3  # 0b0101...
+_QUADS = _ALL // 5  # 0b0011...
+_LANE_LOW = sum(0xF << (_LANE * hour) for hour in range(_HOURS))
+
+
+@dataclass(frozen=True)
+class RiskWindow:
+    day: date
+    start_time: dt_time
+    end_time: dt_time
+    kind: str  # RISK_DOUBLE_BOOKED | RISK_UNAVAILABLE
+
+
+@dataclass
+class FieldUtilization:
+    """Totals in minutes; hourly grids are [weekday][hour], Monday first; daily arrays start at start_date."""
+    field_id: UUID
+    field_name: str
+    available_minutes: int = 0
+    booked_minutes: int = 0
+    blocked_minutes: int = 0
+    conflict_minutes: int = 0
+    double_booked_minutes: int = 0
+    hourly_available_minutes: List[List[int]] = dataclass_field(default_factory=list)
+    hourly_booked_minutes: List[List[int]] = dataclass_field(default_factory=list)
+    daily_available_minutes: List[int] = dataclass_field(default_factory=list)
+    daily_booked_minutes: List[int] = dataclass_field(default_factory=list)
+    risks: List[RiskWindow] = dataclass_field(default_factory=list)
+    risks_truncated: bool = False
+
+    @property
+    def idle_minutes(self) -> int:
+        return self.available_minutes - self.booked_minutes
+
+    @property
+    def utilization(self) -> float:
+        return self.booked_minutes / self.available_minutes if self.available_minutes else 0.0
+
+    @property
+    def hourly_utilization(self) -> List[List[Optional[float]]]:
+        """booked / available per weekday-hour; None where the field is never available."""
+        return [
+            [booked / available if available else None for available, booked in zip(avail_row, booked_row)]
+            for avail_row, booked_row in zip(self.hourly_available_minutes, self.hourly_booked_minutes)
+        ]
+
+
+@dataclass
+class FieldUtilizationReport:
+    start_date: date
+    end_date: date
+    fields: List[FieldUtilization]
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _hour_lanes(mask: int) -> int:
+    """Fold a day mask into 24 twelve-bit lanes, each holding its hour's set-bit count."""
+    x = mask - ((mask >> 1) & _PAIRS)
+    x = (x & _QUADS) + ((x >> 2) & _QUADS)
+    return (x + (x >> 4) + (x >> 8)) & _LANE_LOW
+
+
+def _unpack_lanes(word: int) -> List[int]:
+    return [((word >> (_LANE * hour)) & _LANE_MASK) * SLOT_MINUTES for hour in range(_HOURS)]
+
+
+def _add_risks(result: FieldUtilization, day: date, mask: int, kind: str) -> None:
+    for first, last in mask_runs(mask):
+        if len(result.risks) >= MAX_RISK_WINDOWS:
+            result.risks_truncated = True
+            return
+        result.risks.append(RiskWindow(day, slot_time(first), slot_time(last), kind))
+
+
+def _summarize_field(calendar: FieldCalendar, field_id: UUID, field_name: str) -> FieldUtilization:
+    result = FieldUtilization(field_id, field_name)
+    first_weekday = calendar.start_date.weekday()
+    available_lanes = [0] * 7
+    booked_lanes = [0] * 7
+    daily_available = [0] * calendar.n_days
+    daily_booked = [0] * calendar.n_days
+    blocked_slots = conflict_slots = double_slots = 0
+
+    for i, open_, blocked, busy, overlap in calendar.day_masks(field_id):
+        available = open_ & ~blocked
+        if available:
+            weekday = (first_weekday + i) % 7
+            available_lanes[weekday] += _hour_lanes(available)
+            daily_available[i] = available.bit_count() * SLOT_MINUTES
+            booked = busy & available
+            if booked:
+                booked_lanes[weekday] += _hour_lanes(booked)
+                daily_booked[i] = booked.bit_count() * SLOT_MINUTES
+        if blocked and open_:
+            blocked_slots += (open_ & blocked).bit_count()
+        conflict = busy & ~available
+        if conflict or overlap:
+            day = calendar.start_date + timedelta(days=i)
+            conflict_slots += conflict.bit_count()
+            double_slots += overlap.bit_count()
+            _add_risks(result, day, overlap, RISK_DOUBLE_BOOKED)
+            _add_risks(result, day, conflict, RISK_UNAVAILABLE)
+
+    result.available_minutes = sum(daily_available)
+    result.booked_minutes = sum(daily_booked)
+    result.blocked_minutes = blocked_slots * SLOT_MINUTES
+    result.conflict_minutes = conflict_slots * SLOT_MINUTES
+    result.double_booked_minutes = double_slots * SLOT_MINUTES
+    result.hourly_available_minutes = [_unpack_lanes(word) for word in available_lanes]
+    result.hourly_booked_minutes = [_unpack_lanes(word) for word in booked_lanes]
+    result.daily_available_minutes = daily_available
+    result.daily_booked_minutes = daily_booked
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def summarize_calendar(
+    calendar: FieldCalendar,
+    fields: Iterable[Tuple[UUID, str]],
+) -> List[FieldUtilization]:
+    """Utilization of each (field_id, name) in `fields` over the calendar's range, in the given order."""
+    if calendar.n_days > MAX_RANGE_DAYS:
+        raise ServiceError(f"Date range cannot exceed {MAX_RANGE_DAYS} days")
+    return [_summarize_field(calendar, field_id, name) for field_id, name in fields]
+
+
+def get_field_utilization(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    league_id: Optional[UUID] = None,
+) -> FieldUtilizationReport:
+    """
+    Utilization of every active field (or the fields of `league_id`) over
+    start_date..end_date inclusive, counting games from all leagues.
+    """
+    if end_date < start_date:
+        raise ServiceError("end_date must be on or after start_date")
+    if (end_date - start_date).days + 1 > MAX_RANGE_DAYS:
+        raise ServiceError(f"Date range cannot exceed {MAX_RANGE_DAYS} days")
+
+    query = db.query(Field.id, Field.name).filter(Field.is_active == True)
+    if league_id is not None:
+        if db.query(League.id).filter(League.id == league_id).first() is None:
+            raise NotFoundError("League not found")
+        query = query.filter(
+            Field.id.in_(select(LeagueField.field_id).where(LeagueField.league_id == league_id))
+        )
+    fields = query.order_by(Field.name, Field.id).all()
+
+    calendar = build_field_calendar(db, [field_id for field_id, _ in fields], start_date, end_date)
+    return FieldUtilizationReport(start_date, end_date, summarize_calendar(calendar, fields))
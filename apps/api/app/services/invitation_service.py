@@ -25,7 +25,7 @@ from app.core.constants import (
     INVITE_REVOKED,
 )
 from app.services.exceptions import ForbiddenError, NotFoundError, ServiceError
-from app.services.league_service import get_occupied_spots, get_player_cap
+from app.services.league_service import adjust_occupancy, remaining_spots
 
 logger = logging.getLogger(__name__)
 
@@ -166,11 +166,9 @@ def accept_invitation(
     league = db.query(League).filter(League.id == inv.league_id).with_for_update().first()
     if not league or not league.is_active:
         raise NotFoundError("League not found or inactive")
-    player_cap = get_player_cap(league.format, league.max_teams)
-    if player_cap is not None:
-        occupied = get_occupied_spots(league.id, db)
-        if occupied >= player_cap:
-            raise ServiceError("This league is full")
+    remaining = remaining_spots(league, db)
+    if remaining is not None and remaining < 1:
+        raise ServiceError("This league is full")
 
     from app.services.registration_service import _create_confirmed_league_player
     _create_confirmed_league_player(db, inv.league_id, player.id, inv.group_id, clerk_user_id)
@@ -178,6 +176,7 @@ def accept_invitation(
     inv.status = INVITE_ACCEPTED
     inv.player_id = player.id
     _invalidate_token(inv)
+    adjust_occupancy(db, inv.league_id, pending_invites=-1)
 
     return AcceptResult(league_id=inv.league_id)
 
@@ -196,6 +195,7 @@ def decline_invitation(db: Session, user_email: str, token: str) -> None:
 
     inv.status = INVITE_DECLINED
     _invalidate_token(inv)
+    adjust_occupancy(db, inv.league_id, pending_invites=-1)
 
 
 def revoke_invitation(db: Session, clerk_user_id: str, invitation_id: UUID) -> None:
@@ -215,6 +215,7 @@ def revoke_invitation(db: Session, clerk_user_id: str, invitation_id: UUID) -> N
 
     inv.status = INVITE_REVOKED
     _invalidate_token(inv)
+    adjust_occupancy(db, inv.league_id, pending_invites=-1)
 
 
 def get_invitation_token_for_user(db: Session, clerk_user_id: str, invitation_id: UUID) -> str:
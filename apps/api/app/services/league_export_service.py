@@ -0,0 +1,203 @@
+"""
+Streaming exports of a league's roster and schedule as CSV or NDJSON.
+
+Rows go straight from the database to the response. The export query selects
+plain columns (no ORM objects, so nothing accumulates in the session's
+identity map) and runs with yield_per, which on Postgres/psycopg2 opens a
+server-side cursor and fetches BATCH_SIZE rows at a time. Each batch is
+encoded and yielded as one chunk, so memory stays flat however large the
+roster is. The CSV header goes out before the query runs.
+
+The iterators use the request's Session while the response is streaming.
+FastAPI keeps yield dependencies (get_db) open until the response has been
+sent, so the session closes once the last chunk is out. The league check
+happens in load_*_export() before any bytes are sent, which lets a missing
+league still produce a 404.
+
+On Lambda, Mangum collects the streamed chunks into one response body before
+returning it. The cursor and the per-batch encoding still keep ORM and row
+memory flat there, but the first byte only arrives when uvicorn (or another
+streaming server) runs the app.
+
+CSV cells starting with =, +, -, @, tab or CR get a leading apostrophe so
+names typed at registration cannot run as spreadsheet formulas. NDJSON
+values are left as they are.
+
+Public API:
+- EXPORT_FORMATS, BATCH_SIZE, ROSTER_COLUMNS, SCHEDULE_COLUMNS
+- load_roster_export(db, league_id, fmt) -> LeagueExport
+- load_schedule_export(db, league_id, fmt) -> LeagueExport
+  (both raise NotFoundError for an unknown league, ServiceError for an
+  unknown format)
+- iter_export(db, export) -> Iterator[bytes]
+"""
+
+import csv
+import io
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterator, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, aliased
+
+from app.models.field import Field
+from app.models.game import Game
+from app.models.group import Group
+from app.models.league import League
+from app.models.league_player import LeaguePlayer
+from app.models.player import Player
+from app.models.team import Team
+from app.services.exceptions import NotFoundError, ServiceError
+
+BATCH_SIZE = 500
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+EXPORT_FORMATS = (FORMAT_CSV, FORMAT_NDJSON)
+
+_MEDIA_TYPES = {
+    FORMAT_CSV: "text/csv; charset=utf-8",
+    FORMAT_NDJSON: "application/x-ndjson",
+}
+
+ROSTER_COLUMNS = [
+    "id", "player_id", "first_name", "last_name", "email", "phone", "group_name", "team_name",
+    "registration_status", "payment_status", "waiver_status", "registered_at",
+]
+SCHEDULE_COLUMNS = [
+    "game_id", "week", "phase", "date", "time", "datetime", "duration_minutes", "field_name",
+    "team1_name", "team2_name", "status", "team1_score", "team2_score", "winner_id",
+]
+
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+@dataclass
+class LeagueExport:
+    statement: Select
+    columns: List[str]
+    fmt: str
+    filename: str
+
+    @property
+    def media_type(self) -> str:
+        return _MEDIA_TYPES[self.fmt]
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _check_format(fmt: str) -> None:
+    if fmt not in EXPORT_FORMATS:
+        raise ServiceError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+
+def _league_name(db: Session, league_id: UUID) -> str:
+    name = db.query(League.name).filter(League.id == league_id).scalar()
+    if name is None:
+        raise NotFoundError("League not found")
+    return name
+
+
+def _filename(league_name: str, kind: str, fmt: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", league_name).strip("-").lower() or "league"
+    return f"{kind}-{slug}-{datetime.now(timezone.utc):%Y%m%d}.{fmt}"
+
+
+def _roster_statement(league_id: UUID) -> Select:
+    return (
+        select(
+            LeaguePlayer.id, Player.id, Player.first_name, Player.last_name, Player.email, Player.phone,
+            Group.name, Team.name, LeaguePlayer.registration_status, LeaguePlayer.payment_status,
+            LeaguePlayer.waiver_status, LeaguePlayer.created_at,
+        )
+        .join(Player, Player.id == LeaguePlayer.player_id)
+        .outerjoin(Group, Group.id == LeaguePlayer.group_id)
+        .outerjoin(Team, Team.id == LeaguePlayer.team_id)
+        .where(LeaguePlayer.league_id == league_id, LeaguePlayer.is_active == True)
+        .order_by(Player.last_name, Player.first_name, LeaguePlayer.id)
+    )
+
+
+def _schedule_statement(league_id: UUID) -> Select:
+    team1, team2 = aliased(Team), aliased(Team)
+    return (
+        select(
+            Game.id, Game.week, Game.phase, Game.game_date, Game.game_time, Game.game_datetime,
+            Game.duration_minutes, Field.name, team1.name, team2.name, Game.status,
+            Game.team1_score, Game.team2_score, Game.winner_id,
+        )
+        .outerjoin(Field, Field.id == Game.field_id)
+        .outerjoin(team1, team1.id == Game.team1_id)
+        .outerjoin(team2, team2.id == Game.team2_id)
+        .where(Game.league_id == league_id, Game.is_active == True)
+        .order_by(Game.week, Game.game_datetime, Game.id)
+    )
+
+
+def _csv_cell(value):
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _json_value(value):
+    if isinstance(value, UUID):
+        return str(value)
+    return value.isoformat()  # date, datetime
+
+
+def _encode_csv(rows: Sequence[Sequence], buffer: io.StringIO, writer) -> bytes:
+    buffer.seek(0)
+    buffer.truncate()
+    writer.writerows([_csv_cell(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _encode_ndjson(rows: Sequence[Sequence], columns: List[str]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(columns, row)), default=_json_value, separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def load_roster_export(db: Session, league_id: UUID, fmt: str) -> LeagueExport:
+    """Active league members with player, group and team names, by last then first name."""
+    _check_format(fmt)
+    name = _league_name(db, league_id)
+    return LeagueExport(_roster_statement(league_id), ROSTER_COLUMNS, fmt, _filename(name, "roster", fmt))
+
+
+def load_schedule_export(db: Session, league_id: UUID, fmt: str) -> LeagueExport:
+    """Active games with field and team names, by week then kickoff."""
+    _check_format(fmt)
+    name = _league_name(db, league_id)
+    return LeagueExport(_schedule_statement(league_id), SCHEDULE_COLUMNS, fmt, _filename(name, "schedule", fmt))
+
+
+def iter_export(db: Session, export: LeagueExport, batch_size: int = BATCH_SIZE) -> Iterator[bytes]:
+    """Yield the export one encoded batch at a time from a server-side cursor."""
+    if export.fmt == FORMAT_CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(export.columns)
+        yield buffer.getvalue().encode("utf-8")
+
+    result = db.execute(export.statement.execution_options(yield_per=batch_size))
+    try:
+        for rows in result.partitions():
+            if export.fmt == FORMAT_CSV:
+                yield _encode_csv(rows, buffer, writer)
+            else:
+                yield _encode_ndjson(rows, export.columns)
+    finally:
+        result.close()
@@ -1,11 +1,16 @@
+import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import Session
+from app.models.league import League
 from app.models.league_player import LeaguePlayer
 from app.models.group_invitation import GroupInvitation
 from app.core.constants import INVITE_PENDING, PLAYERS_PER_TEAM, REG_CONFIRMED
 
+logger = logging.getLogger(__name__)
+
 
 def get_player_cap(league_format: str, max_teams: Optional[int]) -> Optional[int]:
     """Return the total player cap, or None if uncapped. Raises ValueError for unknown formats."""
@@ -32,3 +37,94 @@ def get_occupied_spots(league_id: UUID, db: Session) -> int:
         GroupInvitation.expires_at > now,
     ).count()
     return confirmed + pending_invites
+
+
+# ---------------------------------------------------------------------------
+# Occupancy counters
+#
+# leagues.confirmed_players_count and leagues.pending_invites_count mirror
+# the two COUNTs above so capacity checks can read the (already locked)
+# league row instead of scanning. The pending counter counts every
+# invitation still in 'pending' status, including ones past expires_at that
+# nothing has marked expired yet, so counters can only overstate occupancy;
+# remaining_spots() falls back to the exact count when they say the league
+# is (nearly) full.
+# ---------------------------------------------------------------------------
+
+def adjust_occupancy(
+    db: Session,
+    league_id: UUID,
+    confirmed: int = 0,
+    pending_invites: int = 0,
+) -> None:
+    """Add deltas to a league's occupancy counters (atomic UPDATE). Does NOT commit."""
+    values = {}
+    if confirmed:
+        values[League.confirmed_players_count] = League.confirmed_players_count + confirmed
+    if pending_invites:
+        values[League.pending_invites_count] = League.pending_invites_count + pending_invites
+    if values:
+        db.query(League).filter(League.id == league_id).update(values, synchronize_session="fetch")
+
+
+def remaining_spots(league: League, db: Session, spots_needed: int = 1) -> Optional[int]:
+    """
+    Spots left in a league, or None if uncapped.
+
+    Answers from the counters when they show at least spots_needed free;
+    otherwise recounts exactly, so an answer below spots_needed is exact.
+    """
+    player_cap = get_player_cap(league.format, league.max_teams)
+    if player_cap is None:
+        return None
+    remaining = player_cap - (league.confirmed_players_count or 0) - (league.pending_invites_count or 0)
+    if remaining >= spots_needed:
+        return remaining
+    return player_cap - get_occupied_spots(league.id, db)
+
+
+def recount_occupancy(db: Session, league_ids: Optional[Iterable[UUID]] = None) -> List[UUID]:
+    """
+    Recompute occupancy counters from source rows with one set-based UPDATE.
+
+    Limited to league_ids when given, otherwise all leagues. Returns the IDs
+    of leagues whose counters changed. Does NOT commit.
+    """
+    confirmed = (
+        select(func.count(LeaguePlayer.id))
+        .where(
+            LeaguePlayer.league_id == League.id,
+            LeaguePlayer.registration_status == REG_CONFIRMED,
+            LeaguePlayer.is_active == True,
+        )
+        .scalar_subquery()
+    )
+    pending = (
+        select(func.count(GroupInvitation.id))
+        .where(
+            GroupInvitation.league_id == League.id,
+            GroupInvitation.status == INVITE_PENDING,
+        )
+        .scalar_subquery()
+    )
+    stmt = (
+        update(League)
+        .where(or_(League.confirmed_players_count != confirmed, League.pending_invites_count != pending))
+        .values(confirmed_players_count=confirmed, pending_invites_count=pending)
+        .returning(League.id)
+    )
+    if league_ids is not None:
+        league_ids = list(league_ids)
+        if not league_ids:
+            return []
+        stmt = stmt.where(League.id.in_(league_ids))
+    changed = list(db.execute(stmt, execution_options={"synchronize_session": "fetch"}).scalars())
+    return changed
+
+
+def reconcile_occupancy_counters(db: Session) -> List[UUID]:
+    """Drift-repair job: recount every league and log any that had drifted. Does NOT commit."""
+    drifted = recount_occupancy(db)
+    if drifted:
+        logger.warning("Repaired occupancy counter drift in %d leagues: %s", len(drifted), drifted)
+    return drifted
@@ -1,54 +1,259 @@
+"""
+Signed waiver PDF rendering.
+
+A signed waiver is the waiver body — identical for everyone who signs a given
+waiver in a given league — plus a short signer block. Line-breaking the body
+is most of fpdf2's render time, so it is done once per (waiver_id,
+league_name) and the broken lines are kept in a process-wide LRU as a
+WaiverTemplate (Waiver rows are immutable; a new version is a new row). Each
+signature then re-emits the pre-broken lines and stamps only the signer block
+and date.
+
+Text is set in DejaVu Sans from settings.WAIVER_PDF_FONT_DIR, so any Unicode
+in the waiver, league or signer name is rendered as-is. Parsing the full TTFs
+costs more than the rest of a render, so documents whose characters all fall
+in _COMPACT_RANGES (Latin, Greek, Cyrillic, punctuation) use a subset of the
+fonts built once per process; anything else loads the full fonts. If the
+fonts are not installed, rendering falls back to Helvetica, which is Latin-1
+only: other characters print as "?".
+
+Public API:
+- get_waiver_template(waiver_id, league_name, waiver_content, waiver_version) — cached layout
+- build_waiver_template(league_name, waiver_content, waiver_version) — uncached layout
+- render_signed_waiver(template, player_name, signed_at) — stamp the signer block, PDF bytes
+- generate_waiver_pdf(...) — one-off render without the cache
+- clear_waiver_templates() — drop cached layouts
+"""
+
+import atexit
 import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Dict, FrozenSet, Hashable, Optional, Tuple
 
+from fontTools import subset as ftsubset
+from fontTools.ttLib import TTFont
 from fpdf import FPDF
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
-# Helvetica is Latin-1 only. Replace common Unicode chars with ASCII equivalents.
-_UNICODE_REPLACEMENTS = {
-    "\u2014": "--",   # em dash
-    "\u2013": "-",    # en dash
-    "\u2018": "'",    # left single quote
-    "\u2019": "'",    # right single quote
-    "\u201c": '"',    # left double quote
-    "\u201d": '"',    # right double quote
-    "\u2026": "...",  # ellipsis
-    "\u00a0": " ",    # non-breaking space
-}
-
-
-def _sanitize_for_latin1(text: str) -> str:
-    for char, replacement in _UNICODE_REPLACEMENTS.items():
-        text = text.replace(char, replacement)
-    return text
+_FONT_FAMILY = "DejaVu"
+_FONT_FILES = {"": "DejaVuSans.ttf", "B": "DejaVuSans-Bold.ttf"}
+_CORE_FAMILY = "Helvetica"
 
+# Code points covered by the per-process font subset
+_COMPACT_RANGES = (
+    (0x0020, 0x007E),  # Basic Latin
+    (0x00A0, 0x024F),  # Latin-1 Supplement, Latin Extended-A/B
+    (0x0370, 0x052F),  # Greek, Cyrillic
+    (0x1E00, 0x1EFF),  # Latin Extended Additional
+    (0x2000, 0x206F),  # General Punctuation
+    (0x20A0, 0x20CF),  # Currency Symbols
+    (0x2100, 0x214F),  # Letterlike Symbols
+)
+_LAYOUT_WHITESPACE = frozenset(map(ord, "\n\r\t"))
 
-def generate_waiver_pdf(
-    waiver_content: str,
-    waiver_version: str,
-    league_name: str,
-    player_name: str,
-    signed_at: datetime,
-) -> bytes:
-    """Generate a signed waiver PDF and return the raw bytes."""
-    waiver_content = _sanitize_for_latin1(waiver_content)
-    league_name = _sanitize_for_latin1(league_name)
-    player_name = _sanitize_for_latin1(player_name)
+_BODY_LINE_HEIGHT = 5
+_FOOTER_TEXT = (
+    "This document was signed electronically in accordance with the "
+    "Electronic Signatures in Global and National Commerce Act (ESIGN Act)."
+)
+
+
+@dataclass(frozen=True)
+class WaiverTemplate:
+    """The laid-out part of a signed waiver: everything except the signer block."""
+    league_name: str
+    waiver_version: str
+    body_lines: Tuple[str, ...]
+    code_points: FrozenSet[int]
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _FontSet:
+    family: str
+    files: Dict[str, str]  # style -> TTF path; empty for the core font
+    code_points: Optional[FrozenSet[int]] = None  # None = everything the font has
 
+    @property
+    def is_core(self) -> bool:
+        return not self.files
+
+    def covers(self, code_points: FrozenSet[int]) -> bool:
+        return self.code_points is None or code_points <= self.code_points
+
+
+_fonts_lock = threading.Lock()
+_font_sets: Optional[Tuple[_FontSet, _FontSet]] = None  # (compact, full)
+
+
+def _subset_fonts(paths: Dict[str, str]) -> _FontSet:
+    """Write DejaVu subsets covering _COMPACT_RANGES to a temp dir removed at exit."""
+    unicodes = [cp for start, end in _COMPACT_RANGES for cp in range(start, end + 1)]
+    options = ftsubset.Options(notdef_outline=True, hinting=False, layout_features=[], name_IDs=["*"])
+    options.drop_tables += ["FFTM"]  # FontForge timestamps; fontTools warns it cannot subset them
+    out_dir = tempfile.mkdtemp(prefix="waiver-fonts-")
+    atexit.register(shutil.rmtree, out_dir, ignore_errors=True)
+    subset_paths = {}
+    covered = None
+    for style, path in paths.items():
+        font = ftsubset.load_font(path, options)
+        subsetter = ftsubset.Subsetter(options)
+        subsetter.populate(unicodes=unicodes)
+        subsetter.subset(font)
+        subset_paths[style] = os.path.join(out_dir, os.path.basename(path))
+        ftsubset.save_font(font, subset_paths[style], options)
+        cmap = frozenset(TTFont(subset_paths[style], lazy=True).getBestCmap())
+        covered = cmap if covered is None else covered & cmap
+    return _FontSet(_FONT_FAMILY, subset_paths, covered | _LAYOUT_WHITESPACE)
+
+
+def _load_font_sets() -> Tuple[_FontSet, _FontSet]:
+    global _font_sets
+    with _fonts_lock:
+        if _font_sets is None:
+            font_dir = settings.WAIVER_PDF_FONT_DIR
+            paths = {style: os.path.join(font_dir, name) for style, name in _FONT_FILES.items()}
+            if not all(os.path.isfile(p) for p in paths.values()):
+                logger.warning("Waiver PDF fonts not found in %r; falling back to Helvetica (Latin-1 only)", font_dir)
+                core = _FontSet(_CORE_FAMILY, {})
+                _font_sets = (core, core)
+            else:
+                full = _FontSet(_FONT_FAMILY, paths)
+                try:
+                    compact = _subset_fonts(paths)
+                except Exception as e:
+                    logger.warning("Could not subset waiver PDF fonts, using full fonts: %s", e)
+                    compact = full
+                _font_sets = (compact, full)
+        return _font_sets
+
+
+def _fonts_for(code_points: FrozenSet[int]) -> _FontSet:
+    compact, full = _load_font_sets()
+    return compact if compact.covers(code_points) else full
+
+
+def _code_points(*texts: str) -> FrozenSet[int]:
+    return frozenset(ord(c) for text in texts for c in text)
+
+
+def _encodable(fonts: _FontSet, text: str) -> str:
+    if fonts.is_core:
+        return text.encode("latin-1", "replace").decode("latin-1")
+    return text
+
+
+def _new_document(fonts: _FontSet) -> FPDF:
     pdf = FPDF()
+    for style, path in fonts.files.items():
+        pdf.add_font(fonts.family, style, path)
     pdf.add_page()
     pdf.set_auto_page_break(auto=True, margin=20)
+    return pdf
+
+
+class _TemplateCache:
+    """Thread-safe LRU of WaiverTemplates."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, WaiverTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[WaiverTemplate]:
+        with self._lock:
+            template = self._entries.get(key)
+            if template is not None:
+                self._entries.move_to_end(key)
+            return template
+
+    def put(self, key: Hashable, template: WaiverTemplate) -> None:
+        with self._lock:
+            self._entries[key] = template
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_templates = _TemplateCache(settings.WAIVER_PDF_TEMPLATE_CACHE_SIZE)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def build_waiver_template(league_name: str, waiver_content: str, waiver_version: str) -> WaiverTemplate:
+    """Line-break the waiver body once; the result can be stamped for any signer."""
+    code_points = _code_points(league_name, waiver_content, waiver_version)
+    fonts = _fonts_for(code_points)
+    pdf = _new_document(fonts)
+    pdf.set_font(fonts.family, "", 9)
+    lines = pdf.multi_cell(
+        0, _BODY_LINE_HEIGHT, _encodable(fonts, waiver_content),
+        align="L", dry_run=True, output="LINES",
+    )
+    return WaiverTemplate(
+        league_name=league_name,
+        waiver_version=waiver_version,
+        body_lines=tuple(lines),
+        code_points=code_points,
+    )
+
+
+def get_waiver_template(
+    waiver_id: Hashable,
+    league_name: str,
+    waiver_content: str,
+    waiver_version: str,
+) -> WaiverTemplate:
+    """Cached build_waiver_template, keyed by (waiver_id, league_name)."""
+    key = (waiver_id, league_name)
+    template = _templates.get(key)
+    if template is None:
+        template = build_waiver_template(league_name, waiver_content, waiver_version)
+        _templates.put(key, template)
+    return template
+
+
+def clear_waiver_templates() -> None:
+    _templates.clear()
+
+
+def render_signed_waiver(template: WaiverTemplate, player_name: str, signed_at: datetime) -> bytes:
+    """Emit the template's pre-broken body and stamp the signer block and date."""
+    signed_at_str = signed_at.strftime("%B %d, %Y at %I:%M %p UTC")
+    fonts = _fonts_for(template.code_points | _code_points(player_name))
+    family = fonts.family
+    pdf = _new_document(fonts)
 
     # Title
-    pdf.set_font("Helvetica", "B", 16)
+    pdf.set_font(family, "B", 16)
     pdf.cell(0, 10, "Liability Waiver", new_x="LMARGIN", new_y="NEXT", align="C")
     pdf.ln(4)
 
     # Metadata
-    pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 6, f"League: {league_name}", new_x="LMARGIN", new_y="NEXT")
-    pdf.cell(0, 6, f"Waiver Version: {waiver_version}", new_x="LMARGIN", new_y="NEXT")
+    pdf.set_font(family, "", 10)
+    pdf.cell(0, 6, _encodable(fonts, f"League: {template.league_name}"), new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 6, _encodable(fonts, f"Waiver Version: {template.waiver_version}"), new_x="LMARGIN", new_y="NEXT")
     pdf.ln(4)
 
     # Divider
@@ -56,9 +261,10 @@ def generate_waiver_pdf(
     pdf.line(10, pdf.get_y(), 200, pdf.get_y())
     pdf.ln(6)
 
-    # Waiver body
-    pdf.set_font("Helvetica", "", 9)
-    pdf.multi_cell(0, 5, waiver_content)
+    # Waiver body — already line-broken, so each line is a plain cell
+    pdf.set_font(family, "", 9)
+    for line in template.body_lines:
+        pdf.cell(0, _BODY_LINE_HEIGHT, line, new_x="LMARGIN", new_y="NEXT")
     pdf.ln(8)
 
     # Divider
@@ -66,22 +272,28 @@ def generate_waiver_pdf(
     pdf.ln(6)
 
     # Signature block
-    pdf.set_font("Helvetica", "B", 11)
+    pdf.set_font(family, "B", 11)
     pdf.cell(0, 7, "Electronic Signature", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 6, f"Signed by: {player_name}", new_x="LMARGIN", new_y="NEXT")
-
-    signed_at_str = signed_at.strftime("%B %d, %Y at %I:%M %p UTC")
+    pdf.set_font(family, "", 10)
+    pdf.cell(0, 6, _encodable(fonts, f"Signed by: {player_name}"), new_x="LMARGIN", new_y="NEXT")
     pdf.cell(0, 6, f"Date: {signed_at_str}", new_x="LMARGIN", new_y="NEXT")
-
     pdf.ln(8)
 
     # Footer
-    pdf.set_font("Helvetica", "I", 8)
-    pdf.multi_cell(
-        0, 4,
-        "This document was signed electronically in accordance with the "
-        "Electronic Signatures in Global and National Commerce Act (ESIGN Act).",
-    )
+    pdf.set_font(family, "", 8)
+    pdf.set_text_color(90, 90, 90)
+    pdf.multi_cell(0, 4, _FOOTER_TEXT)
 
     return bytes(pdf.output())
+
+
+def generate_waiver_pdf(
+    waiver_content: str,
+    waiver_version: str,
+    league_name: str,
+    player_name: str,
+    signed_at: datetime,
+) -> bytes:
+    """Generate a signed waiver PDF and return the raw bytes (no template caching)."""
+    template = build_waiver_template(league_name, waiver_content, waiver_version)
+    return render_signed_waiver(template, player_name, signed_at)
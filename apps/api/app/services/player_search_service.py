@@ -0,0 +1,156 @@
+"""
+Admin player search over name, email and phone.
+
+Matches against players.search_text, a stored generated column holding the
+lower-cased "first last email" plus the phone's digits, with a pg_trgm GIN
+index (migration d3e4f5a6b7c8). A query is split into tokens; phone-looking
+tokens ("(555) 123-4567", "+1.555") are reduced to their digits. A player
+matches when either:
+
+- every token is a substring of search_text (typeahead: "jo smi" finds
+  "John Smith"), or
+- the whole query is a fuzzy word match (pg_trgm `<%`, word_similarity above
+  pg_trgm.word_similarity_threshold, default 0.6), which tolerates typos
+  ("jonh smtih")
+
+Both are served by the trigram index once a token is 3+ characters, and every
+match is ranked. Queries shorter than MIN_FUZZY_LENGTH cannot be narrowed by
+trigrams and match most of the table, so only the MAX_CANDIDATES best by
+prefix hits, then name, are ranked.
+
+Ranking, highest first:
+- exact email match (+2)
+- share of tokens that start a word (prefix match, +0..1)
+- word_similarity of the query to search_text (+0..1)
+then last name, first name and id for a stable order.
+
+Optional filters keep players with an active registration in `league_id`
+and/or with `registration_status`.
+
+Public API:
+- search_players(db, query, league_id=None, registration_status=None, limit=20)
+  -> List[PlayerSearchHit]; raises ServiceError for a query with no tokens
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import Float, Text, and_, case, cast, func, literal, or_
+from sqlalchemy.orm import Session
+
+from app.models.league_player import LeaguePlayer
+from app.models.player import Player
+from app.services.exceptions import ServiceError
+
+MAX_TOKENS = 5
+MAX_CANDIDATES = 2000
+MIN_FUZZY_LENGTH = 3
+
+_PHONE_TOKEN = re.compile(r"[\d()+\-.]+")
+
+
+@dataclass
+class PlayerSearchHit:
+    player: Player
+    score: float
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _tokens(query: str) -> List[str]:
+    tokens = []
+    for token in query.lower().split():
+        if _PHONE_TOKEN.fullmatch(token) and any(ch.isdigit() for ch in token):
+            token = re.sub(r"\D", "", token)
+        # Punctuation-only tokens ("!!!", "--") would be an unselective LIKE
+        if any(ch.isalnum() for ch in token):
+            tokens.append(token)
+    return tokens[:MAX_TOKENS]
+
+
+def _like_escape(token: str) -> str:
+    return token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _regex_escape(token: str) -> str:
+    # Backslash before a non-word character is a literal in Postgres AREs;
+    # before a letter it would start an escape, so word characters are left alone
+    return re.sub(r"(\W)", r"\\\1", token)
+
+
+def _prefix_hits(tokens: List[str]):
+    """Number of tokens that start a word of search_text."""
+    return sum(
+        case((Player.search_text.op("~")(r"\m" + _regex_escape(token)), 1), else_=0) for token in tokens
+    )
+
+
+def _candidate_ids(
+    db: Session,
+    tokens: List[str],
+    league_id: Optional[UUID],
+    registration_status: Optional[str],
+):
+    """Subquery of matching player ids, capped for short phrases (see module docstring)."""
+    phrase = " ".join(tokens)
+    search_text = Player.search_text
+
+    matches = and_(*(search_text.like(f"%{_like_escape(token)}%") for token in tokens))
+    if len(phrase) >= MIN_FUZZY_LENGTH:
+        matches = or_(matches, literal(phrase, Text).op("<%")(search_text))
+
+    candidates = db.query(Player.id).filter(Player.is_active == True, matches)
+    if league_id is not None or registration_status is not None:
+        registrations = db.query(LeaguePlayer.id).filter(
+            LeaguePlayer.player_id == Player.id,
+            LeaguePlayer.is_active == True,
+        )
+        if league_id is not None:
+            registrations = registrations.filter(LeaguePlayer.league_id == league_id)
+        if registration_status is not None:
+            registrations = registrations.filter(LeaguePlayer.registration_status == registration_status)
+        candidates = candidates.filter(registrations.exists())
+    if len(phrase) < MIN_FUZZY_LENGTH:
+        candidates = candidates.order_by(
+            _prefix_hits(tokens).desc(), Player.last_name, Player.first_name, Player.id,
+        ).limit(MAX_CANDIDATES)
+    return candidates.subquery()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def search_players(
+    db: Session,
+    query: str,
+    league_id: Optional[UUID] = None,
+    registration_status: Optional[str] = None,
+    limit: int = 20,
+) -> List[PlayerSearchHit]:
+    """Ranked active players matching `query`. Does not commit."""
+    tokens = _tokens(query)
+    if not tokens:
+        raise ServiceError("Search query must contain at least one letter or digit")
+    phrase = " ".join(tokens)
+    search_text = Player.search_text
+    candidate_ids = _candidate_ids(db, tokens, league_id, registration_status)
+
+    score = (
+        case((Player.email == phrase, 2.0), else_=0.0)
+        + cast(_prefix_hits(tokens), Float) * (1.0 / len(tokens))
+        + func.word_similarity(phrase, search_text)
+    ).label("score")
+
+    rows = (
+        db.query(Player, score)
+        .join(candidate_ids, candidate_ids.c.id == Player.id)
+        .order_by(score.desc(), Player.last_name, Player.first_name, Player.id)
+        .limit(limit)
+        .all()
+    )
+    return [PlayerSearchHit(player=player, score=float(rank)) for player, rank in rows]
@@ -20,7 +20,7 @@ from app.models.league_player import LeaguePlayer
 from app.models.player import Player
 from app.models.team import Team
 from app.services.exceptions import ConflictError, NotFoundError, ServiceError
-from app.services.league_service import get_occupied_spots, get_player_cap
+from app.services.league_service import adjust_occupancy, remaining_spots
 from app.core.config import settings
 from app.core.constants import (
     INVITE_PENDING,
@@ -108,16 +108,14 @@ def _validate_and_lock_league(
         raise ServiceError("League is not currently active")
     if league.registration_deadline and league.registration_deadline < datetime.now(timezone.utc).date():
         raise ServiceError("Registration deadline has passed")
-    player_cap = get_player_cap(league.format, league.max_teams)
-    if player_cap is not None:
-        occupied = get_occupied_spots(league.id, db)
-        if occupied + spots_needed > player_cap:
-            if spots_needed == 1:
-                raise ServiceError("This league is full — no spots remaining")
-            else:
-                raise ServiceError(
-                    f"Not enough spots remaining for this group. Available: {player_cap - occupied}"
-                )
+    remaining = remaining_spots(league, db, spots_needed)
+    if remaining is not None and remaining < spots_needed:
+        if spots_needed == 1:
+            raise ServiceError("This league is full — no spots remaining")
+        else:
+            raise ServiceError(
+                f"Not enough spots remaining for this group. Available: {remaining}"
+            )
     return league
 
 
@@ -139,7 +137,7 @@ def _create_confirmed_league_player(
     group_id: Optional[UUID],
     clerk_user_id: str,
 ) -> LeaguePlayer:
-    """Create a confirmed LeaguePlayer with standard defaults. Does NOT commit."""
+    """Create a confirmed LeaguePlayer with standard defaults and count it. Does NOT commit."""
     lp = LeaguePlayer(
         league_id=league_id,
         player_id=player_id,
@@ -151,6 +149,7 @@ def _create_confirmed_league_player(
         created_by=clerk_user_id,
     )
     db.add(lp)
+    adjust_occupancy(db, league_id, confirmed=1)
     return lp
 
 
@@ -288,6 +287,7 @@ def register_group(
             to_name=f"{inv_first} {inv_last}",
             token=token,
         ))
+    adjust_occupancy(db, league_id, pending_invites=len(invitation_emails))
 
     return GroupRegistrationResult(
         organizer_player_id=organizer.id,
@@ -320,6 +320,8 @@ def unregister(db: Session, clerk_user_id: str, league_id: UUID) -> None:
         )
 
     league_player.is_active = False
+    if league_player.registration_status == REG_CONFIRMED:
+        adjust_occupancy(db, league_id, confirmed=-1)
 
 
 def get_my_team_roster(
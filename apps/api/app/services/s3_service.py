@@ -1,7 +1,9 @@
 import logging
+from typing import Iterable
 from uuid import UUID
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
@@ -10,14 +12,30 @@ logger = logging.getLogger(__name__)
 
 _s3_client = None
 
+# S3 multipart parts must be at least 5 MiB, except the last
+ARCHIVE_PART_SIZE = 8 * 1024 * 1024
+
 
 def _get_client():
     global _s3_client
     if _s3_client is None:
-        _s3_client = boto3.client("s3", region_name=settings.AWS_REGION)
+        if settings.WAIVER_S3_ENDPOINT_URL:
+            # S3-compatible stand-in (MinIO, tests/fake_s3.py): path-style addressing
+            _s3_client = boto3.client(
+                "s3",
+                region_name=settings.AWS_REGION,
+                endpoint_url=settings.WAIVER_S3_ENDPOINT_URL,
+                config=Config(s3={"addressing_style": "path"}),
+            )
+        else:
+            _s3_client = boto3.client("s3", region_name=settings.AWS_REGION)
     return _s3_client
 
 
+def waiver_pdf_key(league_id: UUID, player_id: UUID, signature_id: UUID) -> str:
+    return f"waivers/{league_id}/{player_id}/{signature_id}.pdf"
+
+
 def upload_waiver_pdf(
     pdf_bytes: bytes,
     league_id: UUID,
@@ -26,39 +44,155 @@ def upload_waiver_pdf(
 ) -> str | None:
     """Upload a signed waiver PDF to S3.
 
-    Returns the S3 key on success, or None if no bucket is configured.
+    Returns the S3 key on success, or None if no bucket is configured. The key
+    is derived from the signature, so re-uploading overwrites the same object.
+    Raises botocore ClientError on failure so callers can retry.
     """
     if not settings.WAIVER_S3_BUCKET:
         logger.debug("WAIVER_S3_BUCKET not set, skipping S3 upload")
         return None
 
-    key = f"waivers/{league_id}/{player_id}/{signature_id}.pdf"
+    key = waiver_pdf_key(league_id, player_id, signature_id)
+    _get_client().put_object(
+        Bucket=settings.WAIVER_S3_BUCKET,
+        Key=key,
+        Body=pdf_bytes,
+        ContentType="application/pdf",
+    )
+    logger.info("Uploaded waiver PDF: s3://%s/%s", settings.WAIVER_S3_BUCKET, key)
+    return key
+
+
+def download_waiver_pdf(s3_key: str) -> bytes | None:
+    """Fetch a stored waiver PDF.
+
+    Returns None if the bucket is not configured or the object does not
+    exist. Raises botocore ClientError on other failures.
+    """
+    if not settings.WAIVER_S3_BUCKET or not s3_key:
+        return None
+
     try:
-        _get_client().put_object(
+        resp = _get_client().get_object(Bucket=settings.WAIVER_S3_BUCKET, Key=s3_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+            return None
+        raise
+    return resp["Body"].read()
+
+
+def get_waiver_pdf_range(s3_key: str, start: int, length: int) -> tuple[bytes, int] | None:
+    """Fetch up to `length` bytes of a stored waiver PDF starting at `start`.
+
+    Returns (data, total object size), or None if the bucket is not configured
+    or the object does not exist. Raises botocore ClientError on other failures.
+    """
+    if not settings.WAIVER_S3_BUCKET or not s3_key:
+        return None
+
+    try:
+        resp = _get_client().get_object(
             Bucket=settings.WAIVER_S3_BUCKET,
-            Key=key,
-            Body=pdf_bytes,
-            ContentType="application/pdf",
+            Key=s3_key,
+            Range=f"bytes={start}-{start + length - 1}",
         )
-        logger.info("Uploaded waiver PDF: s3://%s/%s", settings.WAIVER_S3_BUCKET, key)
-        return key
-    except ClientError:
-        logger.exception("Failed to upload waiver PDF to S3")
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code")
+        if code in ("NoSuchKey", "404"):
+            return None
+        if code == "InvalidRange":  # zero-length object
+            return b"", 0
+        raise
+    total = int(resp["ContentRange"].rsplit("/", 1)[1]) if resp.get("ContentRange") else resp["ContentLength"]
+    return resp["Body"].read(), total
+
+
+def waiver_export_key(league_id: UUID, export_id: UUID) -> str:
+    return f"exports/waivers/{league_id}/{export_id}.zip"
+
+
+def upload_waiver_archive(chunks: Iterable[bytes], s3_key: str, part_size: int = ARCHIVE_PART_SIZE) -> str | None:
+    """Stream a waiver archive into S3 with a multipart upload.
+
+    chunks is consumed as it is uploaded, so memory holds about one part.
+    Returns the S3 key, or None if no bucket is configured. On any failure
+    (including one raised by chunks) the upload is aborted and the error
+    re-raised, so no partial object or orphaned parts are left behind.
+    """
+    if not settings.WAIVER_S3_BUCKET:
+        logger.debug("WAIVER_S3_BUCKET not set, skipping archive upload")
         return None
 
+    client = _get_client()
+    bucket = settings.WAIVER_S3_BUCKET
+    upload_id = client.create_multipart_upload(Bucket=bucket, Key=s3_key, ContentType="application/zip")["UploadId"]
+    parts = []
+
+    def upload_part(body: bytes) -> None:
+        number = len(parts) + 1
+        resp = client.upload_part(Bucket=bucket, Key=s3_key, UploadId=upload_id, PartNumber=number, Body=body)
+        parts.append({"ETag": resp["ETag"], "PartNumber": number})
+
+    try:
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= part_size:
+                upload_part(bytes(buffer))
+                buffer.clear()
+        if buffer or not parts:
+            upload_part(bytes(buffer))
+        client.complete_multipart_upload(
+            Bucket=bucket, Key=s3_key, UploadId=upload_id, MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        try:
+            client.abort_multipart_upload(Bucket=bucket, Key=s3_key, UploadId=upload_id)
+        except ClientError:
+            logger.exception("Failed to abort multipart upload of %s", s3_key)
+        raise
+    logger.info("Uploaded waiver archive: s3://%s/%s (%d parts)", bucket, s3_key, len(parts))
+    return s3_key
+
+
+def put_text_object(s3_key: str, text: str) -> None:
+    """Store a small text object (e.g. an export's failure note). No-op without a bucket."""
+    if not settings.WAIVER_S3_BUCKET:
+        return
+    _get_client().put_object(
+        Bucket=settings.WAIVER_S3_BUCKET, Key=s3_key, Body=text.encode(), ContentType="text/plain; charset=utf-8",
+    )
+
+
+def object_exists(s3_key: str) -> bool:
+    """True if the object exists. Raises botocore ClientError on failures other than not-found."""
+    if not settings.WAIVER_S3_BUCKET or not s3_key:
+        return False
+    try:
+        _get_client().head_object(Bucket=settings.WAIVER_S3_BUCKET, Key=s3_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+            return False
+        raise
+    return True
+
 
-def generate_presigned_url(s3_key: str, expiry: int = 3600) -> str | None:
-    """Generate a presigned download URL for a waiver PDF.
+def generate_presigned_url(s3_key: str, expiry: int = 3600, filename: str | None = None) -> str | None:
+    """Generate a presigned download URL for a waiver PDF or archive.
 
+    filename, if given, is sent back as the attachment name on download.
     Returns the URL string, or None if the bucket is not configured.
     """
     if not settings.WAIVER_S3_BUCKET or not s3_key:
         return None
 
+    params = {"Bucket": settings.WAIVER_S3_BUCKET, "Key": s3_key}
+    if filename:
+        params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
     try:
         url = _get_client().generate_presigned_url(
             "get_object",
-            Params={"Bucket": settings.WAIVER_S3_BUCKET, "Key": s3_key},
+            Params=params,
             ExpiresIn=expiry,
         )
         return url
@@ -0,0 +1,435 @@
+"""
+Season schedule optimizer.
+
+Turns a list of matchups (who should play whom, and in which week) plus the
+bookable slots for each week into slot assignments. Hard constraints:
+
+- at most one game per slot (a field at a start time, or a bare time slot
+  when the admin supplied times without fields)
+- no team in two games whose times overlap
+- a game is never played before its target week
+
+Soft constraints make up the objective score (lower is better):
+
+- unscheduled games (very expensive — overflow is carried into later weeks
+  before a game is ever given up)
+- weeks of delay for carried-over games
+- games beyond games_per_week for a team in a week
+- early/late imbalance: each slot has a lateness in [0, 1] by its start time
+  within the week; a team's total lateness should stay near half its games
+
+Engines are pluggable via SCHEDULING_ENGINES:
+
+- "greedy": one pass, week by week, placing carried-over games first and
+  picking the feasible slot that best balances the two teams
+- "optimized": greedy, then local search (swap two games, move a game to a
+  free slot, pull a delayed or unscheduled game earlier) until the time
+  budget runs out or no improving move is found for a while
+
+Pure functions; no DB access. Deterministic for a given seed.
+
+Public API:
+- round_robin_matchups(team_ids, num_weeks, games_per_week)
+- optimize_schedule(problem, engine="optimized", time_budget_ms=..., seed=0)
+"""
+
+import logging
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGINE = 'optimized'
+DEFAULT_TIME_BUDGET_MS = 500
+MAX_TIME_BUDGET_MS = 30_000
+
+# Objective weights
+_W_UNSCHEDULED = 1000.0
+_W_DELAY_WEEK = 10.0
+_W_OVERLOAD = 20.0
+_W_BALANCE = 1.0
+
+# Local search stops after this many consecutive non-improving moves per game
+# (with a floor), so small leagues finish well inside the time budget
+_STALL_PER_GAME = 50
+_STALL_FLOOR = 2_000
+
+
+@dataclass(frozen=True)
+class Matchup:
+    team1_id: UUID
+    team2_id: UUID
+    week: int  # target week (1-based)
+
+
+@dataclass(frozen=True)
+class Slot:
+    week: int
+    date: date
+    time: str  # "HH:MM"
+    field_id: Optional[UUID] = None
+
+    @property
+    def start_minutes(self) -> int:
+        hour, minute = map(int, self.time.split(':'))
+        return hour * 60 + minute
+
+
+@dataclass
+class ScheduleProblem:
+    matchups: List[Matchup]
+    slots_by_week: Dict[int, List[Slot]]
+    num_weeks: int
+    games_per_week: int = 1
+    game_duration: int = 60
+
+
+@dataclass
+class ScheduledGame:
+    matchup: Matchup
+    slot: Slot
+
+
+@dataclass
+class ScheduleResult:
+    games: List[ScheduledGame]
+    unscheduled: List[Matchup]
+    objective: float
+    engine: str
+    iterations: int = 0
+    elapsed_ms: float = 0.0
+    breakdown: Dict[str, float] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Internal state
+# ---------------------------------------------------------------------------
+
+class _State:
+    """
+    Mutable assignment of matchups to slots with incrementally maintained
+    objective terms, so each local-search move is evaluated in O(1)-ish time
+    instead of rescoring the season.
+    """
+
+    def __init__(self, problem: ScheduleProblem):
+        self.problem = problem
+        self.slots: List[Slot] = [
+            s for week in sorted(problem.slots_by_week) for s in problem.slots_by_week[week]
+        ]
+        self.slots_of_week: Dict[int, List[int]] = defaultdict(list)
+        for i, slot in enumerate(self.slots):
+            self.slots_of_week[slot.week].append(i)
+        # Lateness: rank of the slot's start time among the week's distinct start times
+        self.slot_lateness: List[float] = [0.5] * len(self.slots)
+        for idxs in self.slots_of_week.values():
+            starts = sorted({self.slots[i].start_minutes for i in idxs})
+            span = len(starts) - 1
+            position = {m: (k / span if span else 0.5) for k, m in enumerate(starts)}
+            for i in idxs:
+                self.slot_lateness[i] = position[self.slots[i].start_minutes]
+
+        self.matchups = list(problem.matchups)
+        self.slot_of: List[Optional[int]] = [None] * len(self.matchups)
+        self.game_in: List[Optional[int]] = [None] * len(self.slots)
+        # (team, week) -> list of (start_minutes, matchup index)
+        self.busy: Dict[Tuple[UUID, int], List[Tuple[int, int]]] = defaultdict(list)
+        self.team_games: Dict[UUID, int] = defaultdict(int)
+        self.team_lateness: Dict[UUID, float] = defaultdict(float)
+
+    # -- feasibility --------------------------------------------------------
+
+    def team_free(self, team: UUID, slot_idx: int, ignore: Sequence[int] = ()) -> bool:
+        slot = self.slots[slot_idx]
+        start = slot.start_minutes
+        duration = self.problem.game_duration
+        for other_start, m in self.busy.get((team, slot.week), ()):
+            if m in ignore:
+                continue
+            if abs(other_start - start) < duration:
+                return False
+        return True
+
+    def fits(self, m: int, slot_idx: int, ignore: Sequence[int] = ()) -> bool:
+        matchup = self.matchups[m]
+        if self.slots[slot_idx].week < matchup.week:
+            return False
+        return self.team_free(matchup.team1_id, slot_idx, ignore) and self.team_free(matchup.team2_id, slot_idx, ignore)
+
+    # -- mutation -----------------------------------------------------------
+
+    def place(self, m: int, slot_idx: int) -> None:
+        matchup = self.matchups[m]
+        slot = self.slots[slot_idx]
+        self.slot_of[m] = slot_idx
+        self.game_in[slot_idx] = m
+        for team in (matchup.team1_id, matchup.team2_id):
+            self.busy[(team, slot.week)].append((slot.start_minutes, m))
+            self.team_games[team] += 1
+            self.team_lateness[team] += self.slot_lateness[slot_idx]
+
+    def remove(self, m: int) -> int:
+        slot_idx = self.slot_of[m]
+        matchup = self.matchups[m]
+        slot = self.slots[slot_idx]
+        self.slot_of[m] = None
+        self.game_in[slot_idx] = None
+        for team in (matchup.team1_id, matchup.team2_id):
+            self.busy[(team, slot.week)].remove((slot.start_minutes, m))
+            self.team_games[team] -= 1
+            self.team_lateness[team] -= self.slot_lateness[slot_idx]
+        return slot_idx
+
+    # -- objective ----------------------------------------------------------
+
+    def _team_terms(self, teams, weeks) -> float:
+        """Balance terms for teams plus their overload terms in the given weeks."""
+        gpw = self.problem.games_per_week
+        total = 0.0
+        for team in teams:
+            total += _W_BALANCE * (self.team_lateness[team] - 0.5 * self.team_games[team]) ** 2
+            for week in weeks:
+                load = len(self.busy.get((team, week), ()))
+                if load > gpw:
+                    total += _W_OVERLOAD * (load - gpw)
+        return total
+
+    def _matchup_terms(self, ms) -> float:
+        total = 0.0
+        for m in ms:
+            slot_idx = self.slot_of[m]
+            if slot_idx is None:
+                total += _W_UNSCHEDULED
+            else:
+                total += _W_DELAY_WEEK * (self.slots[slot_idx].week - self.matchups[m].week)
+        return total
+
+    def local_cost(self, ms, weeks) -> float:
+        """
+        Objective terms touched by ms. Only the weeks a move touches can change
+        overload, so comparing local_cost before and after a move over the
+        same weeks gives the exact objective delta.
+        """
+        teams = set()
+        for m in ms:
+            teams.add(self.matchups[m].team1_id)
+            teams.add(self.matchups[m].team2_id)
+        return self._team_terms(teams, weeks) + self._matchup_terms(ms)
+
+    def breakdown(self) -> Dict[str, float]:
+        unscheduled = sum(1 for s in self.slot_of if s is None)
+        delay = sum(
+            self.slots[s].week - self.matchups[m].week for m, s in enumerate(self.slot_of) if s is not None
+        )
+        gpw = self.problem.games_per_week
+        overload = sum(max(0, len(v) - gpw) for v in self.busy.values())
+        teams = set(self.team_games)
+        balance = sum((self.team_lateness[t] - 0.5 * self.team_games[t]) ** 2 for t in teams)
+        return {
+            'unscheduled': unscheduled,
+            'delay_weeks': delay,
+            'overload': overload,
+            'balance': round(balance, 4),
+        }
+
+    def objective(self) -> float:
+        b = self.breakdown()
+        return (
+            _W_UNSCHEDULED * b['unscheduled']
+            + _W_DELAY_WEEK * b['delay_weeks']
+            + _W_OVERLOAD * b['overload']
+            + _W_BALANCE * b['balance']
+        )
+
+
+# ---------------------------------------------------------------------------
+# Engines
+# ---------------------------------------------------------------------------
+
+def _greedy(state: _State) -> None:
+    """Week by week; carried-over games first, each into its best feasible free slot."""
+    by_week: Dict[int, List[int]] = defaultdict(list)
+    for m, matchup in enumerate(state.matchups):
+        by_week[matchup.week].append(m)
+
+    carried: List[int] = []
+    for week in range(1, state.problem.num_weeks + 1):
+        queue = carried + by_week.get(week, [])
+        carried = []
+        free = [i for i in state.slots_of_week.get(week, []) if state.game_in[i] is None]
+        for m in queue:
+            best, best_cost = None, None
+            for slot_idx in free:
+                if state.game_in[slot_idx] is not None or not state.fits(m, slot_idx):
+                    continue
+                state.place(m, slot_idx)
+                cost = state.local_cost([m], (week,))
+                state.remove(m)
+                if best_cost is None or cost < best_cost:
+                    best, best_cost = slot_idx, cost
+            if best is None:
+                carried.append(m)
+            else:
+                state.place(m, best)
+
+
+def _local_search(state: _State, rng: random.Random, deadline: float) -> int:
+    """Hill-climb with sideways moves until the deadline or a long stall."""
+    n_slots = len(state.slots)
+    n_matchups = len(state.matchups)
+    if not n_slots or not n_matchups:
+        return 0
+
+    stall_limit = max(_STALL_FLOOR, _STALL_PER_GAME * n_matchups)
+    iterations = 0
+    stall = 0
+    while stall < stall_limit and time.perf_counter() < deadline:
+        iterations += 1
+        m = rng.randrange(n_matchups)
+        target = rng.randrange(n_slots)
+        other = state.game_in[target]
+        current = state.slot_of[m]
+        if current == target:
+            stall += 1
+            continue
+        weeks = {state.slots[target].week}
+        if current is not None:
+            weeks.add(state.slots[current].week)
+
+        if other is None:
+            # Move m (placed or not) into a free slot
+            if current is None and not state.fits(m, target):
+                stall += 1
+                continue
+            before = state.local_cost([m], weeks)
+            if current is not None:
+                state.remove(m)
+            if not state.fits(m, target):
+                if current is not None:
+                    state.place(m, current)
+                stall += 1
+                continue
+            state.place(m, target)
+            delta = state.local_cost([m], weeks) - before
+            if delta > 0:
+                state.remove(m)
+                if current is not None:
+                    state.place(m, current)
+                stall += 1
+                continue
+        else:
+            # Swap m with the game in target (or bump it out if m was unplaced)
+            before = state.local_cost([m, other], weeks)
+            if current is not None:
+                state.remove(m)
+            state.remove(other)
+            if state.fits(m, target):
+                state.place(m, target)
+                if current is None or state.fits(other, current):
+                    if current is not None:
+                        state.place(other, current)
+                    delta = state.local_cost([m, other], weeks) - before
+                    if delta <= 0:
+                        stall = 0 if delta < 0 else stall + 1
+                        continue
+                    if current is not None:
+                        state.remove(other)
+                state.remove(m)
+            # Revert
+            state.place(other, target)
+            if current is not None:
+                state.place(m, current)
+            stall += 1
+            continue
+
+        stall = 0 if delta < 0 else stall + 1
+    return iterations
+
+
+def _run_greedy(state: _State, rng: random.Random, deadline: float) -> int:
+    _greedy(state)
+    return 0
+
+
+def _run_optimized(state: _State, rng: random.Random, deadline: float) -> int:
+    _greedy(state)
+    return _local_search(state, rng, deadline)
+
+
+SCHEDULING_ENGINES: Dict[str, Callable[[_State, random.Random, float], int]] = {
+    'greedy': _run_greedy,
+    'optimized': _run_optimized,
+}
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def round_robin_matchups(
+    team_ids: Sequence[UUID],
+    num_weeks: int,
+    games_per_week: int = 1,
+) -> List[Matchup]:
+    """
+    Circle-method round robin: games_per_week rounds per week, cycling
+    through the rotation again once every pairing has been played.
+    """
+    ids: List[Optional[UUID]] = list(team_ids)
+    if len(ids) % 2 == 1:
+        ids.append(None)
+    n = len(ids)
+
+    matchups: List[Matchup] = []
+    for round_idx in range(num_weeks * games_per_week):
+        if round_idx > 0:
+            # Keep the first team fixed and rotate the rest one position
+            ids = [ids[0], ids[-1]] + ids[1:-1]
+        week = round_idx // games_per_week + 1
+        for i in range(n // 2):
+            home, away = ids[i], ids[n - 1 - i]
+            if home is not None and away is not None:
+                matchups.append(Matchup(home, away, week))
+    return matchups
+
+
+def optimize_schedule(
+    problem: ScheduleProblem,
+    engine: str = DEFAULT_ENGINE,
+    time_budget_ms: int = DEFAULT_TIME_BUDGET_MS,
+    seed: int = 0,
+) -> ScheduleResult:
+    """Assign matchups to slots with the named engine within the time budget."""
+    if engine not in SCHEDULING_ENGINES:
+        raise ValueError(f"engine must be one of {sorted(SCHEDULING_ENGINES)}")
+
+    started = time.perf_counter()
+    deadline = started + min(time_budget_ms, MAX_TIME_BUDGET_MS) / 1000
+    state = _State(problem)
+    iterations = SCHEDULING_ENGINES[engine](state, random.Random(seed), deadline)
+
+    games = [
+        ScheduledGame(matchup=state.matchups[m], slot=state.slots[s])
+        for m, s in enumerate(state.slot_of) if s is not None
+    ]
+    games.sort(key=lambda g: (g.slot.week, g.slot.start_minutes, str(g.slot.field_id)))
+    unscheduled = [state.matchups[m] for m, s in enumerate(state.slot_of) if s is None]
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if unscheduled:
+        logger.warning("Schedule optimizer left %d game(s) unscheduled: not enough slots", len(unscheduled))
+
+    return ScheduleResult(
+        games=games,
+        unscheduled=unscheduled,
+        objective=round(state.objective(), 4),
+        engine=engine,
+        iterations=iterations,
+        elapsed_ms=round(elapsed_ms, 2),
+        breakdown=state.breakdown(),
+    )
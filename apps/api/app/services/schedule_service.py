@@ -3,14 +3,16 @@ Schedule-related domain logic extracted from admin/schedule_management.py.
 
 Public functions:
 - calculate_team_standings(league_id, db) — standings from completed games
-- get_available_time_slots_for_date(...) — merged non-conflicting windows
+- rank_standings(team_stats) — shared standings sort order
+- get_available_time_slots_for_range(...) — {date: windows} for a season in 4 queries,
+  via app.services.field_calendar
+- get_available_time_slots_for_date(...) — free windows on one date
 - generate_time_slots_from_availability(...) — discrete "HH:MM" slots
 """
 
 import logging
 from collections import defaultdict
-from datetime import date, datetime, timedelta, time as dt_time
-from itertools import groupby
+from datetime import date, time as dt_time
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
@@ -18,9 +20,9 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.field import Field
-from app.models.field_availability import FieldAvailability
 from app.models.game import Game
 from app.models.league_field import LeagueField
+from app.services.field_calendar import FieldCalendar, build_field_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -28,63 +30,6 @@ logger = logging.getLogger(__name__)
 MAX_GAME_DURATION_MINUTES = 60
 
 
-# ---------------------------------------------------------------------------
-# Private helpers
-# ---------------------------------------------------------------------------
-
-def _has_conflict(
-    field_id: UUID,
-    slot_start: dt_time,
-    slot_end: dt_time,
-    booked_by_field: Dict[UUID, List[Tuple[dt_time, dt_time]]],
-) -> bool:
-    """Return True if the proposed slot overlaps any existing booking for the field."""
-    for booked_start, booked_end in booked_by_field.get(field_id, []):
-        if not (slot_end <= booked_start or slot_start >= booked_end):
-            return True
-    return False
-
-
-def _merge_field_slots(
-    field_id: UUID,
-    field_slots: List[Tuple[dt_time, dt_time]],
-    merged: List[Tuple[UUID, dt_time, dt_time]],
-) -> None:
-    """Merge overlapping (start, end) tuples for one field into the merged list."""
-    field_slots.sort(key=lambda x: x[0])
-    for slot_start, slot_end in field_slots:
-        if not merged or merged[-1][0] != field_id:
-            merged.append((field_id, slot_start, slot_end))
-        else:
-            _, last_start, last_end = merged[-1]
-            if slot_start <= last_end:
-                merged[-1] = (field_id, last_start, max(slot_end, last_end))
-            else:
-                merged.append((field_id, slot_start, slot_end))
-
-
-def _collect_non_conflicting(
-    availabilities,
-    target_date: date,
-    max_duration_minutes: int,
-    booked_by_field: Dict[UUID, List[Tuple[dt_time, dt_time]]],
-) -> List[Tuple[UUID, dt_time, dt_time]]:
-    """Filter availability windows to those that fit a game and have no booking conflicts."""
-    result: List[Tuple[UUID, dt_time, dt_time]] = []
-    for avail in availabilities:
-        if avail.is_recurring:
-            if avail.recurrence_start_date and target_date < avail.recurrence_start_date:
-                continue
-            if avail.recurrence_end_date and target_date > avail.recurrence_end_date:
-                continue
-        start_dt = datetime.combine(target_date, avail.start_time)
-        end_dt = datetime.combine(target_date, avail.end_time)
-        if (end_dt - start_dt).total_seconds() / 60 >= max_duration_minutes:
-            if not _has_conflict(avail.field_id, avail.start_time, avail.end_time, booked_by_field):
-                result.append((avail.field_id, avail.start_time, avail.end_time))
-    return result
-
-
 # ---------------------------------------------------------------------------
 # Standings
 # ---------------------------------------------------------------------------
@@ -124,6 +69,14 @@ def calculate_team_standings(league_id: UUID, db: Session) -> List[Tuple[UUID, D
             team_stats[game.team2_id]['wins'] += 1
             team_stats[game.team1_id]['losses'] += 1
 
+    return rank_standings(team_stats)
+
+
+def rank_standings(team_stats: Dict[UUID, Dict]) -> List[Tuple[UUID, Dict]]:
+    """
+    Add win_percentage to each team's stats and return them ranked by
+    win percentage, wins, points for, and points against.
+    """
     standings = []
     for team_id, stats in team_stats.items():
         total_games = stats['wins'] + stats['losses']
@@ -144,21 +97,8 @@ def calculate_team_standings(league_id: UUID, db: Session) -> List[Tuple[UUID, D
 # Field availability
 # ---------------------------------------------------------------------------
 
-def get_available_time_slots_for_date(
-    league_id: UUID,
-    target_date: date,
-    db: Session,
-    field_id: Optional[UUID] = None,
-    max_duration_minutes: int = MAX_GAME_DURATION_MINUTES,
-) -> List[Tuple[UUID, dt_time, dt_time]]:
-    """
-    Get available time slots for a specific date based on field availability.
-
-    Queries field availability for fields associated with the league and checks
-    existing game bookings across ALL active leagues to avoid conflicts. Returns
-    merged, non-conflicting time windows as (field_id, start_time, end_time) tuples.
-    """
-    # Get fields associated with this league
+def _league_field_ids(db: Session, league_id: UUID, field_id: Optional[UUID] = None) -> List[UUID]:
+    """Active field IDs associated with the league (optionally narrowed to one field)."""
     league_field_ids_subquery = db.query(LeagueField.field_id).filter(
         LeagueField.league_id == league_id
     ).subquery()
@@ -170,58 +110,66 @@ def get_available_time_slots_for_date(
     if field_id is not None:
         fields_query = fields_query.filter(Field.id == field_id)
 
-    associated_field_ids = [fid[0] for fid in fields_query.all()]
+    return [fid[0] for fid in fields_query.all()]
+
+
+def get_available_time_slots_for_range(
+    league_id: UUID,
+    start_date: date,
+    end_date: date,
+    db: Session,
+    field_id: Optional[UUID] = None,
+    max_duration_minutes: int = MAX_GAME_DURATION_MINUTES,
+    calendar: Optional[FieldCalendar] = None,
+) -> Dict[date, List[Tuple[UUID, dt_time, dt_time]]]:
+    """
+    Available time slots for every date from start_date to end_date inclusive.
+
+    Same rules as get_available_time_slots_for_date, read from a FieldCalendar
+    materialized for the league's fields over the whole range (four queries:
+    fields, availability, blackouts, bookings), or from `calendar` when the
+    caller already holds one covering the range. Windows are the free runs of
+    open & ~(blackouts | bookings) lasting at least max_duration_minutes, so a
+    partly booked window still offers its free remainder.
+    Returns {date: [(field_id, start_time, end_time), ...]} ordered by
+    (field_id, start); dates with no available windows are omitted.
+    """
+    if end_date < start_date:
+        return {}
+
+    associated_field_ids = _league_field_ids(db, league_id, field_id)
     if not associated_field_ids:
-        return []
+        return {}
 
-    day_of_week = target_date.weekday()
+    if calendar is None:
+        calendar = build_field_calendar(db, associated_field_ids, start_date, end_date)
 
-    # Build dict of booked time slots indexed by field_id
-    existing_games = db.query(Game).filter(
-        Game.game_date == target_date,
-        Game.field_id.in_(associated_field_ids),
-        Game.is_active == True,
-        Game.status.in_(['scheduled', 'in_progress']),
-    ).all()
+    by_date = calendar.windows_by_date(max_duration_minutes, field_ids=associated_field_ids)
+    return {day: windows for day, windows in by_date.items() if start_date <= day <= end_date}
 
-    booked_by_field: Dict[UUID, List[Tuple[dt_time, dt_time]]] = {}
-    for game in existing_games:
-        if game.field_id and game.game_datetime:
-            game_start = game.game_datetime.time()
-            game_end_dt = datetime.combine(target_date, game_start) + timedelta(minutes=game.duration_minutes)
-            booked_by_field.setdefault(game.field_id, []).append((game_start, game_end_dt.time()))
-
-    # Recurring availability
-    recurring_query = db.query(FieldAvailability).filter(
-        FieldAvailability.field_id.in_(associated_field_ids),
-        FieldAvailability.is_recurring == True,
-        FieldAvailability.is_active == True,
-        FieldAvailability.day_of_week == day_of_week,
-    )
-    if field_id is not None:
-        recurring_query = recurring_query.filter(FieldAvailability.field_id == field_id)
-
-    # Custom one-time availability
-    custom_query = db.query(FieldAvailability).filter(
-        FieldAvailability.field_id.in_(associated_field_ids),
-        FieldAvailability.is_recurring == False,
-        FieldAvailability.is_active == True,
-        FieldAvailability.custom_date == target_date,
-    )
-    if field_id is not None:
-        custom_query = custom_query.filter(FieldAvailability.field_id == field_id)
 
-    # Collect non-conflicting availability windows
-    available_slots = _collect_non_conflicting(recurring_query.all(), target_date, max_duration_minutes, booked_by_field)
-    available_slots += _collect_non_conflicting(custom_query.all(), target_date, max_duration_minutes, booked_by_field)
+def get_available_time_slots_for_date(
+    league_id: UUID,
+    target_date: date,
+    db: Session,
+    field_id: Optional[UUID] = None,
+    max_duration_minutes: int = MAX_GAME_DURATION_MINUTES,
+) -> List[Tuple[UUID, dt_time, dt_time]]:
+    """
+    Get available time slots for a specific date based on field availability.
 
-    # Merge overlapping slots per field
-    available_slots.sort(key=lambda x: (x[0], x[1]))
-    merged_slots: List[Tuple[UUID, dt_time, dt_time]] = []
-    for fid, group_iter in groupby(available_slots, key=lambda x: x[0]):
-        _merge_field_slots(fid, [(s, e) for _, s, e in group_iter], merged_slots)
+    Queries field availability for fields associated with the league and checks
+    existing game bookings across ALL active leagues to avoid conflicts. Returns
+    merged, non-conflicting time windows as (field_id, start_time, end_time) tuples.
 
-    return merged_slots
+    For more than one date use get_available_time_slots_for_range, which costs
+    the same number of queries for the whole range.
+    """
+    by_date = get_available_time_slots_for_range(
+        league_id, target_date, target_date, db,
+        field_id=field_id, max_duration_minutes=max_duration_minutes,
+    )
+    return by_date.get(target_date, [])
 
 
 def generate_time_slots_from_availability(
@@ -0,0 +1,192 @@
+"""
+Incrementally maintained team standings.
+
+The team_standings table holds one aggregate row per team. Every code path
+that changes a game's result snapshots the game before and after the change
+and calls apply_game_result_change(), which adds the difference to the
+affected rows with an atomic upsert. Reads are a single indexed query on
+league_id instead of a scan over every completed game.
+
+rebuild_team_standings() recomputes a league's rows from the games table
+(via schedule_service.calculate_team_standings) and is the drift-repair path.
+
+Public functions:
+- GameResult.from_game(game) — snapshot of the fields standings depend on
+- apply_game_result_change(db, before, after) — add the delta for one game
+- rebuild_team_standings(db, league_id) — recompute a league from games
+- get_team_standings(db, league_id) — ranked standings from the aggregate
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.constants import GAME_COMPLETED
+from app.models.game import Game
+from app.models.team_standing import TeamStanding
+from app.services.schedule_service import calculate_team_standings, rank_standings
+
+logger = logging.getLogger(__name__)
+
+# (wins, losses, points_for, points_against)
+_Line = Tuple[int, int, int, int]
+_ZERO: _Line = (0, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """The subset of a game's state that contributes to standings."""
+    league_id: UUID
+    team1_id: UUID
+    team2_id: UUID
+    phase: Optional[str]
+    status: Optional[str]
+    is_active: bool
+    team1_score: Optional[int]
+    team2_score: Optional[int]
+    winner_id: Optional[UUID]
+
+    @classmethod
+    def from_game(cls, game: Game) -> "GameResult":
+        return cls(
+            league_id=game.league_id,
+            team1_id=game.team1_id,
+            team2_id=game.team2_id,
+            phase=game.phase,
+            status=game.status,
+            is_active=bool(game.is_active),
+            team1_score=game.team1_score,
+            team2_score=game.team2_score,
+            winner_id=game.winner_id,
+        )
+
+    @property
+    def counts(self) -> bool:
+        """Mirror of the filter in calculate_team_standings."""
+        return (
+            self.phase == 'regular_season'
+            and self.status == GAME_COMPLETED
+            and self.is_active
+            and self.winner_id is not None
+        )
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _contribution(result: Optional[GameResult]) -> Dict[UUID, _Line]:
+    """Per-team standings lines a single game contributes."""
+    if result is None or not result.counts:
+        return {}
+    s1 = result.team1_score or 0
+    s2 = result.team2_score or 0
+    w1 = 1 if result.winner_id == result.team1_id else 0
+    w2 = 1 if result.winner_id == result.team2_id else 0
+    return {
+        result.team1_id: (w1, w2, s1, s2),
+        result.team2_id: (w2, w1, s2, s1),
+    }
+
+
+def _upsert_delta(db: Session, league_id: UUID, team_id: UUID, delta: _Line) -> None:
+    wins, losses, points_for, points_against = delta
+    stmt = pg_insert(TeamStanding).values(
+        league_id=league_id,
+        team_id=team_id,
+        wins=wins,
+        losses=losses,
+        points_for=points_for,
+        points_against=points_against,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TeamStanding.team_id],
+        set_={
+            'wins': TeamStanding.wins + stmt.excluded.wins,
+            'losses': TeamStanding.losses + stmt.excluded.losses,
+            'points_for': TeamStanding.points_for + stmt.excluded.points_for,
+            'points_against': TeamStanding.points_against + stmt.excluded.points_against,
+        },
+    )
+    db.execute(stmt)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def apply_game_result_change(
+    db: Session,
+    before: Optional[GameResult],
+    after: Optional[GameResult],
+) -> None:
+    """
+    Apply the standings difference between two snapshots of the same game.
+
+    Pass before=None for a newly created game and after=None for a deleted
+    one. Does not commit; the caller commits alongside the game change so
+    the aggregate and the game row stay in the same transaction.
+    """
+    old = _contribution(before)
+    new = _contribution(after)
+    if not old and not new:
+        return
+
+    league_id = (after or before).league_id
+    for team_id in old.keys() | new.keys():
+        o = old.get(team_id, _ZERO)
+        n = new.get(team_id, _ZERO)
+        delta = tuple(b - a for a, b in zip(o, n))
+        if delta != _ZERO:
+            _upsert_delta(db, league_id, team_id, delta)
+
+
+def rebuild_team_standings(db: Session, league_id: UUID) -> int:
+    """
+    Recompute a league's standings rows from its games. Does not commit.
+
+    Returns the number of team rows written.
+    """
+    db.query(TeamStanding).filter(
+        TeamStanding.league_id == league_id
+    ).delete(synchronize_session=False)
+
+    standings = calculate_team_standings(league_id, db)
+    for team_id, stats in standings:
+        db.add(TeamStanding(
+            league_id=league_id,
+            team_id=team_id,
+            wins=stats['wins'],
+            losses=stats['losses'],
+            points_for=stats['points_for'],
+            points_against=stats['points_against'],
+        ))
+    db.flush()
+    logger.info("Rebuilt standings for league %s (%d teams)", league_id, len(standings))
+    return len(standings)
+
+
+def get_team_standings(db: Session, league_id: UUID) -> List[Tuple[UUID, Dict]]:
+    """
+    Ranked standings for a league, read from the aggregate table.
+
+    Same shape and ordering as calculate_team_standings.
+    """
+    rows = db.query(TeamStanding).filter(
+        TeamStanding.league_id == league_id,
+        (TeamStanding.wins + TeamStanding.losses) > 0,
+    ).all()
+
+    return rank_standings({
+        row.team_id: {
+            'wins': row.wins,
+            'losses': row.losses,
+            'points_for': row.points_for,
+            'points_against': row.points_against,
+        }
+        for row in rows
+    })
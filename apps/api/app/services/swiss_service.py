@@ -0,0 +1,275 @@
+"""
+Swiss-system pairing.
+
+Each round is paired from the current standings: teams are ranked by points
+and the league's tiebreak (Buchholz or Sonneborn-Berger), then a
+backtracking pairer matches them top-down — top half against bottom half
+within a score group first, falling through to lower groups — while never
+repeating a previous matchup. With an odd team count the lowest-ranked team
+with the fewest byes sits out and is credited BYE_POINTS (a full win, as in
+standard Swiss scoring), so sitting out does not push the lowest-ranked team
+further down.
+
+The search works on bitmasks and prunes with a forward check (every
+unpaired team must still have an eligible opponent) plus a memo of
+remaining-team sets already proven unpairable, so a 64-team round pairs in
+milliseconds. If no rematch-free pairing exists (late rounds in small
+leagues), it falls back to the best pairing that allows rematches.
+
+Pure functions; no DB access. See schedule_management.generate_schedule for
+how rounds are persisted.
+
+Public functions:
+- compute_swiss_records(team_ids, games, bye_points=BYE_POINTS) — points, opponents,
+  byes, tiebreaks
+- rank_swiss(records, tiebreak) — ordered team IDs
+- pair_swiss_round(records, tiebreak) — SwissPairing for the next round
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.core.constants import GAME_CANCELLED, GAME_COMPLETED
+
+logger = logging.getLogger(__name__)
+
+SWISS_TIEBREAKS = ('buchholz', 'sonneborn_berger')
+DEFAULT_SWISS_TIEBREAK = 'buchholz'
+BYE_POINTS = 1.0  # a bye scores as a win
+
+# Search nodes (across all bye choices) before giving up on a rematch-free pairing
+_NODE_LIMIT = 200_000
+
+
+@dataclass
+class SwissRecord:
+    """One team's Swiss standing."""
+    team_id: UUID
+    seed: int
+    points: float = 0.0
+    byes: int = 0
+    opponents: set = field(default_factory=set)
+    # (opponent_id, score) for each completed game: 1 win, 0.5 tie, 0 loss
+    results: List[Tuple[UUID, float]] = field(default_factory=list)
+    buchholz: float = 0.0
+    sonneborn_berger: float = 0.0
+
+
+@dataclass
+class SwissPairing:
+    pairings: List[Tuple[UUID, UUID]]
+    bye_team_id: Optional[UUID]
+    rematches: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _game_scores(game) -> Optional[Tuple[float, float]]:
+    """(team1 score, team2 score) in Swiss points, or None if the game has no result."""
+    if game.winner_id is not None:
+        if game.winner_id == game.team1_id:
+            return 1.0, 0.0
+        if game.winner_id == game.team2_id:
+            return 0.0, 1.0
+        return None
+    if game.team1_score is not None and game.team1_score == game.team2_score:
+        return 0.5, 0.5
+    return None
+
+
+def _sort_key(record: SwissRecord, tiebreak: str):
+    primary, secondary = (
+        (record.sonneborn_berger, record.buchholz)
+        if tiebreak == 'sonneborn_berger'
+        else (record.buchholz, record.sonneborn_berger)
+    )
+    return (-record.points, -primary, -secondary, record.seed)
+
+
+def _candidate_order(remaining: List[int], points: List[float]) -> List[int]:
+    """
+    Preferred opponents for remaining[0] (the top unpaired team).
+
+    Within its score group the top team meets the team half-way down
+    (Dutch-style top half vs bottom half), then the rest of the group, then
+    lower score groups in rank order.
+    """
+    top = remaining[0]
+    group = [i for i in remaining[1:] if points[i] == points[top]]
+    rest = [i for i in remaining[1:] if points[i] != points[top]]
+    half = len(group) // 2
+    return group[half:] + group[:half] + rest
+
+
+def _pair(
+    points: List[float],
+    played: List[int],
+    allow_rematches: bool,
+    budget: List[int],
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Backtracking perfect matching over team indices 0..n-1, which are in
+    rank order. played[i] is a bitmask of indices i has already met.
+
+    Returns index pairs, or None if no pairing exists or budget[0] search
+    nodes ran out (the budget is shared across calls).
+    """
+    n = len(points)
+    failed: set = set()
+
+    def eligible(i: int, remaining_mask: int) -> int:
+        mask = remaining_mask & ~(1 << i)
+        if not allow_rematches:
+            mask &= ~played[i]
+        return mask
+
+    def solve(remaining_mask: int) -> Optional[List[Tuple[int, int]]]:
+        if remaining_mask == 0:
+            return []
+        if remaining_mask in failed or budget[0] <= 0:
+            return None
+        budget[0] -= 1
+
+        remaining = [i for i in range(n) if remaining_mask >> i & 1]
+        # Forward check: a team with no eligible opponent dooms this branch
+        for i in remaining:
+            if not eligible(i, remaining_mask):
+                failed.add(remaining_mask)
+                return None
+
+        top = remaining[0]
+        top_eligible = eligible(top, remaining_mask)
+        candidates = _candidate_order(remaining, points)
+        if allow_rematches:
+            # Still prefer fresh opponents when rematches are permitted
+            candidates.sort(key=lambda opp: played[top] >> opp & 1)
+        for opp in candidates:
+            if not (top_eligible >> opp & 1):
+                continue
+            sub = solve(remaining_mask & ~(1 << top) & ~(1 << opp))
+            if sub is not None:
+                return [(top, opp)] + sub
+            if budget[0] <= 0:
+                return None
+
+        failed.add(remaining_mask)
+        return None
+
+    return solve((1 << n) - 1)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def compute_swiss_records(
+    team_ids: Sequence[UUID],
+    games: Iterable,
+    bye_points: float = BYE_POINTS,
+) -> Dict[UUID, SwissRecord]:
+    """
+    Build Swiss records for team_ids from a league's games.
+
+    Completed games score points; every non-cancelled game counts as a prior
+    meeting for rematch avoidance. A team that did not appear in a week in
+    which games were played is credited with a bye worth bye_points. A bye
+    has no opponent, so it adds to the team's points (and through them to its
+    opponents' tiebreaks) but not to its own Buchholz or Sonneborn-Berger.
+    Games involving teams outside team_ids are ignored.
+    """
+    records = {team_id: SwissRecord(team_id=team_id, seed=i) for i, team_id in enumerate(team_ids)}
+    teams_by_week: Dict[int, set] = {}
+
+    for game in games:
+        if game.status == GAME_CANCELLED:
+            continue
+        if game.team1_id not in records or game.team2_id not in records:
+            continue
+        r1, r2 = records[game.team1_id], records[game.team2_id]
+        r1.opponents.add(r2.team_id)
+        r2.opponents.add(r1.team_id)
+        teams_by_week.setdefault(game.week, set()).update((r1.team_id, r2.team_id))
+
+        if game.status != GAME_COMPLETED:
+            continue
+        scores = _game_scores(game)
+        if scores is None:
+            continue
+        s1, s2 = scores
+        r1.points += s1
+        r2.points += s2
+        r1.results.append((r2.team_id, s1))
+        r2.results.append((r1.team_id, s2))
+
+    for week_teams in teams_by_week.values():
+        for team_id, record in records.items():
+            if team_id not in week_teams:
+                record.byes += 1
+                record.points += bye_points
+
+    for record in records.values():
+        record.buchholz = sum(records[opp].points for opp, _ in record.results)
+        record.sonneborn_berger = sum(records[opp].points * score for opp, score in record.results)
+
+    return records
+
+
+def rank_swiss(records: Dict[UUID, SwissRecord], tiebreak: str = DEFAULT_SWISS_TIEBREAK) -> List[UUID]:
+    """Team IDs ordered by points, the chosen tiebreak, the other tiebreak, then seed."""
+    return [r.team_id for r in sorted(records.values(), key=lambda r: _sort_key(r, tiebreak))]
+
+
+def pair_swiss_round(
+    records: Dict[UUID, SwissRecord],
+    tiebreak: str = DEFAULT_SWISS_TIEBREAK,
+) -> SwissPairing:
+    """
+    Pair the next Swiss round.
+
+    Returns pairings as (higher-ranked, lower-ranked) team IDs in rank order,
+    plus the bye team when the count is odd.
+    """
+    if tiebreak not in SWISS_TIEBREAKS:
+        raise ValueError(f"tiebreak must be one of {SWISS_TIEBREAKS}")
+
+    ranked = rank_swiss(records, tiebreak)
+    if len(ranked) < 2:
+        return SwissPairing(pairings=[], bye_team_id=ranked[0] if ranked else None)
+
+    # Bye candidates: fewest byes first, then lowest-ranked
+    if len(ranked) % 2:
+        rank_pos = {team_id: i for i, team_id in enumerate(ranked)}
+        bye_candidates: List[Optional[UUID]] = sorted(
+            ranked, key=lambda t: (records[t].byes, -rank_pos[t])
+        )
+    else:
+        bye_candidates = [None]
+
+    for allow_rematches in (False, True):
+        budget = [_NODE_LIMIT]
+        for bye in bye_candidates:
+            order = [t for t in ranked if t != bye]
+            index = {team_id: i for i, team_id in enumerate(order)}
+            points = [records[t].points for t in order]
+            played = [0] * len(order)
+            for i, team_id in enumerate(order):
+                for opp in records[team_id].opponents:
+                    if opp in index:
+                        played[i] |= 1 << index[opp]
+
+            matched = _pair(points, played, allow_rematches, budget)
+            if matched is None:
+                continue
+
+            pairings = [(order[a], order[b]) for a, b in matched]
+            rematches = sum(1 for a, b in matched if played[a] >> b & 1)
+            if rematches:
+                logger.warning("Swiss pairing needed %d rematch(es); no rematch-free pairing exists", rematches)
+            return SwissPairing(pairings=pairings, bye_team_id=bye, rematches=rematches)
+
+    # Unreachable: with rematches allowed any even set of teams can be paired
+    raise RuntimeError("Swiss pairing failed")
@@ -0,0 +1,238 @@
+"""
+Balanced team assignment via bin packing.
+
+Players are packed into teams as units — a registration group that fits on
+one team is a single unit, everyone else is a unit of one. Oversized groups
+are cut into as few near-equal chunks as possible rather than scattered.
+
+1. Largest-unit-first: units are placed in descending size order, each into
+   the currently smallest team that can still take it (a min-heap keyed on
+   team size). A group that no longer fits anywhere is split into single
+   players, which then fill the smallest teams.
+2. Local search: random unit moves and swaps between two teams are kept when
+   they lower the objective — squared deviation of team sizes from the mean
+   plus, when balance_key is given, squared deviation of each attribute
+   value's per-team count from its mean (e.g. gender balance).
+
+Pure functions; no DB access. Deterministic for a given seed.
+
+Public API:
+- balance_teams(players_by_group, ungrouped, teams_count, capacity, ...)
+"""
+
+import heapq
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+# Local search stops after this many consecutive non-improving moves per
+# player (with a floor) or at max_iterations
+_STALL_PER_PLAYER = 5
+_STALL_FLOOR = 2_000
+DEFAULT_MAX_ITERATIONS = 200_000
+
+
+@dataclass
+class _Unit:
+    players: list
+    keys: list  # balance attribute per player (None = not balanced)
+    group_id: Optional[Hashable] = None
+    attrs: Counter = field(init=False)
+
+    def __post_init__(self):
+        self.attrs = Counter(k for k in self.keys if k is not None)
+
+    @property
+    def size(self) -> int:
+        return len(self.players)
+
+    def singles(self) -> List["_Unit"]:
+        return [_Unit([p], [k], self.group_id) for p, k in zip(self.players, self.keys)]
+
+
+@dataclass
+class BalanceResult:
+    teams: List[list]  # players per team, in team order
+    groups_kept_together: int
+    groups_split: int
+    objective: float
+    iterations: int = 0
+    attribute_counts: List[Dict[Hashable, int]] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _chunks(unit: _Unit, capacity: int) -> List[_Unit]:
+    """Cut a unit into the fewest chunks of at most capacity, sized as evenly as possible."""
+    n_chunks = -(-unit.size // capacity)
+    base, extra = divmod(unit.size, n_chunks)
+    out, start = [], 0
+    for i in range(n_chunks):
+        end = start + base + (1 if i < extra else 0)
+        out.append(_Unit(unit.players[start:end], unit.keys[start:end], unit.group_id))
+        start = end
+    return out
+
+
+class _Packing:
+    """Team contents plus incrementally maintained objective terms."""
+
+    def __init__(self, teams_count: int, capacity: int, total_players: int, attr_totals: Counter):
+        self.capacity = capacity
+        self.units: List[List[_Unit]] = [[] for _ in range(teams_count)]
+        self.sizes = [0] * teams_count
+        self.attrs: List[Counter] = [Counter() for _ in range(teams_count)]
+        self.mean_size = total_players / teams_count
+        self.mean_attr = {v: n / teams_count for v, n in attr_totals.items()}
+
+    def add(self, t: int, unit: _Unit) -> None:
+        self.units[t].append(unit)
+        self.sizes[t] += unit.size
+        self.attrs[t].update(unit.attrs)
+
+    def remove(self, t: int, unit: _Unit) -> None:
+        self.units[t].remove(unit)
+        self.sizes[t] -= unit.size
+        self.attrs[t].subtract(unit.attrs)
+
+    def team_cost(self, t: int) -> float:
+        cost = (self.sizes[t] - self.mean_size) ** 2
+        attrs = self.attrs[t]
+        for value, mean in self.mean_attr.items():
+            cost += (attrs[value] - mean) ** 2
+        return cost
+
+    def objective(self) -> float:
+        return sum(self.team_cost(t) for t in range(len(self.sizes)))
+
+
+def _greedy(packing: _Packing, units: List[_Unit]) -> List[_Unit]:
+    """Largest-unit-first into the smallest team. Returns groups that had to be split."""
+    heap = [(0, t) for t in range(len(packing.sizes))]
+    heapq.heapify(heap)
+    split: List[_Unit] = []
+    singles: List[_Unit] = []
+
+    for unit in units:
+        if unit.size == 1:
+            singles.append(unit)
+            continue
+        size, t = heap[0]
+        if size + unit.size > packing.capacity:
+            split.append(unit)
+            continue
+        heapq.heapreplace(heap, (size + unit.size, t))
+        packing.add(t, unit)
+
+    for unit in split:
+        singles.extend(unit.singles())
+    for unit in singles:
+        size, t = heap[0]
+        heapq.heapreplace(heap, (size + 1, t))
+        packing.add(t, unit)
+    return split
+
+
+def _local_search(packing: _Packing, rng: random.Random, total_players: int, max_iterations: int) -> int:
+    teams_count = len(packing.sizes)
+    if teams_count < 2:
+        return 0
+    stall_limit = max(_STALL_FLOOR, _STALL_PER_PLAYER * total_players)
+    stall = 0
+    iterations = 0
+    while stall < stall_limit and iterations < max_iterations:
+        iterations += 1
+        a, b = rng.sample(range(teams_count), 2)
+        if not packing.units[a]:
+            stall += 1
+            continue
+        u = rng.choice(packing.units[a])
+        w = rng.choice(packing.units[b]) if packing.units[b] and rng.random() < 0.5 else None
+
+        new_a = packing.sizes[a] - u.size + (w.size if w else 0)
+        new_b = packing.sizes[b] + u.size - (w.size if w else 0)
+        if new_a > packing.capacity or new_b > packing.capacity:
+            stall += 1
+            continue
+
+        before = packing.team_cost(a) + packing.team_cost(b)
+        packing.remove(a, u)
+        packing.add(b, u)
+        if w:
+            packing.remove(b, w)
+            packing.add(a, w)
+        delta = packing.team_cost(a) + packing.team_cost(b) - before
+        if delta < -1e-9:
+            stall = 0
+            continue
+        # Revert
+        if w:
+            packing.remove(a, w)
+            packing.add(b, w)
+        packing.remove(b, u)
+        packing.add(a, u)
+        stall += 1
+    return iterations
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def balance_teams(
+    players_by_group: Dict[Hashable, list],
+    ungrouped: Sequence,
+    teams_count: int,
+    capacity: int,
+    balance_key: Optional[Callable[[object], Optional[Hashable]]] = None,
+    seed: int = 0,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> BalanceResult:
+    """
+    Pack players into teams_count teams of at most capacity players.
+
+    players_by_group maps a group ID to its players; groups that fit are kept
+    on one team. balance_key(player) returns the attribute to balance on
+    (None values are ignored). Players may be any objects; they are returned
+    unchanged, grouped per team.
+    """
+    def keys_of(players) -> list:
+        return [balance_key(p) if balance_key else None for p in players]
+
+    rng = random.Random(seed)
+    units: List[_Unit] = []
+    split_group_ids = set()
+    for group_id in sorted(players_by_group, key=str):
+        unit = _Unit(list(players_by_group[group_id]), keys_of(players_by_group[group_id]), group_id)
+        if unit.size > capacity:
+            split_group_ids.add(group_id)
+            units.extend(_chunks(unit, capacity))
+        else:
+            units.append(unit)
+    units.extend(_Unit([p], keys_of([p])) for p in ungrouped)
+
+    # Seeded shuffle, then stable sort: equal-size units are placed in a
+    # seed-dependent but reproducible order
+    rng.shuffle(units)
+    units.sort(key=lambda u: -u.size)
+
+    total_players = sum(u.size for u in units)
+    attr_totals: Counter = Counter()
+    for unit in units:
+        attr_totals.update(unit.attrs)
+
+    packing = _Packing(teams_count, capacity, total_players, attr_totals)
+    split_group_ids.update(u.group_id for u in _greedy(packing, units))
+    iterations = _local_search(packing, rng, total_players, max_iterations)
+
+    return BalanceResult(
+        teams=[[p for unit in team_units for p in unit.players] for team_units in packing.units],
+        groups_kept_together=len(players_by_group) - len(split_group_ids),
+        groups_split=len(split_group_ids),
+        objective=round(packing.objective(), 4),
+        iterations=iterations,
+        attribute_counts=[dict(+c) for c in packing.attrs],
+    )
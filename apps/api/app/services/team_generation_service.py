@@ -9,52 +9,62 @@ transaction boundary.
 """
 import logging
 from datetime import datetime, timezone
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List
 from uuid import UUID
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.models.game import Game
 from app.models.league import League
 from app.models.league_player import LeaguePlayer
+from app.models.player import Player
 from app.models.team import Team
 from app.core.constants import GAME_SCHEDULED, REG_CONFIRMED, WAIVER_SIGNED
 from app.services.exceptions import ServiceError
-from app.services.league_service import get_player_cap, get_occupied_spots
+from app.services.league_service import remaining_spots
+from app.services.team_balancer import balance_teams
 from app.services.waiver_service import has_pending_waivers
 
 logger = logging.getLogger(__name__)
 
+# Player columns team generation can balance on
+TEAM_BALANCE_ATTRIBUTES = ('gender',)
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _guard_regeneration(league, db: Session) -> list:
-    """Check for non-scheduled games and return existing teams.
+def _guard_regeneration(league, db: Session) -> None:
+    """Raise ServiceError(409) if the league has games in progress or completed."""
+    has_active_teams = db.query(Team.id).filter(
+        Team.league_id == league.id,
+        Team.is_active == True,
+    ).first() is not None
+    if has_active_teams:
+        games_played = db.query(Game).filter(
+            Game.league_id == league.id,
+            Game.is_active == True,
+            Game.status.notin_([GAME_SCHEDULED]),
+        ).count()
+        if games_played > 0:
+            raise ServiceError(
+                "Cannot regenerate teams: league has games in progress or completed",
+                status_code=409,
+            )
 
-    Raises ServiceError(409) if games are in progress or completed.
-    Returns the list of existing Team objects (may be empty).
-    """
-    existing_teams = db.query(Team).filter(Team.league_id == league.id).all()
-    if existing_teams:
-        active_team_ids = [t.id for t in existing_teams if t.is_active]
-        if active_team_ids:
-            games_played = db.query(Game).filter(
-                Game.league_id == league.id,
-                Game.is_active == True,
-                Game.status.notin_([GAME_SCHEDULED]),
-            ).count()
-            if games_played > 0:
-                raise ServiceError(
-                    "Cannot regenerate teams: league has games in progress or completed",
-                    status_code=409,
-                )
-    return existing_teams
+
+def _deactivate_teams(league, db: Session) -> int:
+    """Deactivate the league's current teams with one UPDATE. Returns the row count."""
+    return db.query(Team).filter(
+        Team.league_id == league.id,
+        Team.is_active == True,
+    ).update({Team.is_active: False})
 
 
 def _create_teams(league, db: Session, teams_count: int) -> list:
-    """Create Team records for the league and return them."""
+    """Insert the league's Team rows in one statement and return them in order."""
     team_names = settings.TEAM_NAMES
     team_colors = settings.TEAM_COLORS
 
@@ -64,20 +74,17 @@ def _create_teams(league, db: Session, teams_count: int) -> list:
             teams_count, len(team_names),
         )
 
-    teams = []
+    rows = []
     for i in range(teams_count):
         base_name = team_names[i % len(team_names)]
         name = base_name if i < len(team_names) else f"{base_name} {i // len(team_names) + 1}"
-        team = Team(
-            league_id=league.id,
-            name=name,
-            color=team_colors[i % len(team_colors)],
-            created_by="system",
-        )
-        db.add(team)
-        db.flush()
-        teams.append(team)
-    return teams
+        rows.append({
+            "league_id": league.id,
+            "name": name,
+            "color": team_colors[i % len(team_colors)],
+            "created_by": "system",
+        })
+    return list(db.scalars(insert(Team).returning(Team, sort_by_parameter_order=True), rows))
 
 
 def _partition_players(
@@ -99,58 +106,52 @@ def _assign_players_to_teams(
     players_by_group: Dict[UUID, List],
     ungrouped_players: list,
     players_per_team: int,
+    balance_key: Optional[Callable] = None,
+    seed: int = 0,
 ) -> tuple[Dict[UUID, List], int, int, int]:
     """Assign players to teams, keeping groups together when possible.
 
+    Packing is delegated to team_balancer.balance_teams; players_per_team is
+    the per-team capacity.
+
     Returns (team_assignments, players_assigned, groups_kept_together, groups_split).
     """
-    team_assignments: Dict[UUID, List] = {team.id: [] for team in teams}
-    groups_kept_together = 0
-    groups_split = 0
+    result = balance_teams(
+        players_by_group,
+        ungrouped_players,
+        teams_count=len(teams),
+        capacity=players_per_team,
+        balance_key=balance_key,
+        seed=seed,
+    )
+
+    team_assignments: Dict[UUID, List] = {}
     players_assigned = 0
+    for team, team_players in zip(teams, result.teams):
+        for lp in team_players:
+            lp.team_id = team.id
+        team_assignments[team.id] = team_players
+        players_assigned += len(team_players)
+
+    return team_assignments, players_assigned, result.groups_kept_together, result.groups_split
 
-    def _assign_to_smallest(lp):
-        """Assign a single league_player to the team with the fewest members."""
-        best = min(teams, key=lambda t: len(team_assignments[t.id]))
-        if len(team_assignments[best.id]) >= players_per_team:
-            logger.warning(
-                "Team generation overflow: assigning player %s to over-full team %s",
-                lp.player_id, best.id,
-            )
-        lp.team_id = best.id
-        team_assignments[best.id].append(lp)
-
-    for group_id, group_players in players_by_group.items():
-        if len(group_players) <= players_per_team:
-            best_team = None
-            min_count = float('inf')
-            for team in teams:
-                current = len(team_assignments[team.id])
-                if current + len(group_players) <= players_per_team and current < min_count:
-                    min_count = current
-                    best_team = team
-            if best_team:
-                for lp in group_players:
-                    lp.team_id = best_team.id
-                    team_assignments[best_team.id].append(lp)
-                    players_assigned += 1
-                groups_kept_together += 1
-            else:
-                for lp in group_players:
-                    _assign_to_smallest(lp)
-                    players_assigned += 1
-                groups_split += 1
-        else:
-            for lp in group_players:
-                _assign_to_smallest(lp)
-                players_assigned += 1
-            groups_split += 1
 
-    for lp in ungrouped_players:
-        _assign_to_smallest(lp)
-        players_assigned += 1
+def _balance_key_for(balance_by: Optional[str], registered_players: list, db: Session) -> Optional[Callable]:
+    """Attribute lookup for balance_teams, or None when not balancing."""
+    if balance_by is None:
+        return None
+    if balance_by not in TEAM_BALANCE_ATTRIBUTES:
+        raise ServiceError(f"balance_by must be one of {list(TEAM_BALANCE_ATTRIBUTES)}")
 
-    return team_assignments, players_assigned, groups_kept_together, groups_split
+    player_ids = [lp.player_id for lp in registered_players]
+    column = getattr(Player, balance_by)
+    values = dict(db.query(Player.id, column).filter(Player.id.in_(player_ids)).all())
+
+    def key(lp):
+        value = values.get(lp.player_id)
+        return value.strip().lower() if value else None
+
+    return key
 
 
 def _build_generation_result(
@@ -202,9 +203,19 @@ def _build_generation_result(
 # ---------------------------------------------------------------------------
 
 
-def generate_teams(league, db: Session, teams_count: Optional[int] = None) -> dict:
+def generate_teams(
+    league,
+    db: Session,
+    teams_count: Optional[int] = None,
+    balance_by: Optional[str] = None,
+    seed: int = 0,
+) -> dict:
     """Generate teams for a league, assigning confirmed+signed players.
 
+    Team sizes differ by at most one where groups allow. balance_by names a
+    player attribute (see TEAM_BALANCE_ATTRIBUTES) to spread evenly across
+    teams; seed makes the assignment reproducible.
+
     Guards against regeneration when games are in progress.
     Does NOT commit — caller owns the transaction.
     """
@@ -223,14 +234,14 @@ def generate_teams(league, db: Session, teams_count: Optional[int] = None) -> di
     if teams_count is None:
         teams_count = max(settings.TEAM_GENERATION_MIN_TEAMS, total_players // settings.TEAM_GENERATION_DIVISOR)
 
-    players_per_team = total_players // teams_count
+    players_per_team = -(-total_players // teams_count)
+    balance_key = _balance_key_for(balance_by, registered_players, db)
 
     # Guard: block regeneration if non-scheduled games exist
-    existing_teams = _guard_regeneration(league, db)
+    _guard_regeneration(league, db)
 
     # Clear existing teams
-    for team in existing_teams:
-        team.is_active = False
+    _deactivate_teams(league, db)
 
     # Create new teams
     teams = _create_teams(league, db, teams_count)
@@ -239,6 +250,7 @@ def generate_teams(league, db: Session, teams_count: Optional[int] = None) -> di
     players_by_group, ungrouped = _partition_players(registered_players)
     team_assignments, players_assigned, groups_kept, groups_split = _assign_players_to_teams(
         teams, players_by_group, ungrouped, players_per_team,
+        balance_key=balance_key, seed=seed,
     )
 
     return _build_generation_result(
@@ -266,16 +278,15 @@ def trigger_team_generation_if_ready(league_id: UUID, db: Session) -> bool:
         return False
 
     # Check if registration is now full
-    player_cap = get_player_cap(league.format, league.max_teams)
-    if player_cap is None:
+    remaining = remaining_spots(league, db)
+    if remaining is None:
         return False  # Uncapped — don't auto-generate
 
-    occupied = get_occupied_spots(league_id, db)
     deadline_passed = (
         league.registration_deadline is not None
         and league.registration_deadline < datetime.now(timezone.utc).date()
     )
-    is_full = occupied >= player_cap
+    is_full = remaining <= 0
 
     if is_full or deadline_passed:
         # Don't generate teams while waivers are still pending within their deadline
@@ -0,0 +1,396 @@
+"""
+Bulk export of a league's signed waivers as a ZIP archive in S3.
+
+The archive holds one PDF per signature plus manifest.csv, and is produced
+incrementally: iter_waiver_archive() yields ZIP bytes as each member is
+written, and run_waiver_export() feeds them straight into an S3 multipart
+upload, so memory holds a bounded window rather than the archive. The admin
+downloads the finished object through a presigned URL; an API response
+could not carry it (Lambda responses are buffered and capped at 6 MB, and
+API Gateway gives up after 30 s).
+
+Exports run as jobs. start_waiver_export() picks an export id and invokes
+the waiver export Lambda asynchronously (settings.WAIVER_EXPORT_FUNCTION_NAME),
+or, when none is configured (local dev), runs the export in-process before
+returning. get_waiver_export() reports the job from S3 alone: the archive
+object exists once the upload completes, and a failed run leaves a
+"<key>.failed" note instead.
+
+- PDFs are read from S3 in ranged GETs of chunk_size bytes. A thread pool
+  prefetches the first chunk of the next `concurrency` signatures while the
+  current one is being written, so S3 latency overlaps; any further chunks of
+  a large object are fetched as that member is written. Memory is bounded by
+  roughly concurrency × chunk_size.
+- A signature whose PDF is missing from S3 (not yet processed, deleted, or
+  the bucket is not configured) is rendered on the fly from its waiver with
+  the cached pdf_service template; the manifest marks it "regenerated".
+  Nothing is written back to S3 — that is the document stage's job.
+- A stored PDF that cannot be read to the end once its member has started
+  (S3 error, object replaced mid-export) cannot be taken back out of the
+  stream: the member is closed as-is and the manifest marks it "failed" with
+  the error, and the export carries on with the next signature.
+- PDFs are stored uncompressed (their streams are already deflated); the
+  manifest, written last so it can record each member's outcome, is deflated.
+
+load_archive_entries() reads everything the stream needs up front, so the
+DB session is not used while the archive is being built.
+
+Public API:
+- load_archive_entries(db, league_id) — WaiverArchive for a league; raises NotFoundError
+- iter_waiver_archive(archive, concurrency=8, chunk_size=1 MiB) — ZIP bytes
+- archive_filename(archive) — suggested download name
+- start_waiver_export(db, league_id) — export id; raises NotFoundError / ServiceError
+- run_waiver_export(db, league_id, export_id) — build and upload one export
+- get_waiver_export(db, league_id, export_id) — WaiverExportStatus; raises NotFoundError
+"""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import re
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.league import League
+from app.models.player import Player
+from app.models.waiver import Waiver, WaiverSignature
+from app.services.exceptions import NotFoundError, ServiceError
+from app.services.pdf_service import get_waiver_template, render_signed_waiver
+from app.services.s3_service import (
+    download_waiver_pdf,
+    generate_presigned_url,
+    get_waiver_pdf_range,
+    object_exists,
+    put_text_object,
+    upload_waiver_archive,
+    waiver_export_key,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MANIFEST_NAME = "manifest.csv"
+MANIFEST_COLUMNS = [
+    "file", "signature_id", "player_name", "player_email", "full_name_typed",
+    "waiver_version", "signed_at", "source", "bytes", "sha256", "error",
+]
+
+SOURCE_STORED = "stored"
+SOURCE_REGENERATED = "regenerated"
+SOURCE_FAILED = "failed"
+
+EXPORT_PENDING = "pending"
+EXPORT_READY = "ready"
+EXPORT_FAILED = "failed"
+DOWNLOAD_URL_EXPIRY = 3600
+
+
+@dataclass
+class ArchiveEntry:
+    signature_id: UUID
+    waiver_id: UUID
+    player_name: str
+    player_email: str
+    full_name_typed: str
+    waiver_version: str
+    signed_at: datetime
+    pdf_path: Optional[str]
+    filename: str = ""
+
+
+@dataclass
+class WaiverArchive:
+    league_id: UUID
+    league_name: str
+    entries: List[ArchiveEntry]
+    waivers: Dict[UUID, Tuple[str, str]] = field(default_factory=dict)  # waiver_id -> (content, version)
+
+
+@dataclass
+class WaiverExportStatus:
+    export_id: UUID
+    status: str  # EXPORT_PENDING / EXPORT_READY / EXPORT_FAILED
+    download_url: Optional[str] = None
+    error: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Prefetched:
+    source: str
+    head: bytes = b""
+    total: int = 0
+    error: Optional[str] = None
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable file that ZipFile writes into; drained after each write."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _safe_name(text: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", text, flags=re.UNICODE).strip("._") or "player"
+
+
+def _regenerate(archive: WaiverArchive, entry: ArchiveEntry) -> bytes:
+    content, version = archive.waivers[entry.waiver_id]
+    template = get_waiver_template(entry.waiver_id, archive.league_name, content, version)
+    return render_signed_waiver(template, entry.full_name_typed, entry.signed_at)
+
+
+def _prefetch(archive: WaiverArchive, entry: ArchiveEntry, chunk_size: int) -> _Prefetched:
+    """Runs in the pool: first chunk of the stored PDF, or a regenerated PDF."""
+    if entry.pdf_path:
+        try:
+            found = get_waiver_pdf_range(entry.pdf_path, 0, chunk_size)
+        except Exception as e:
+            logger.warning("Waiver export: fetching %s failed, regenerating: %s", entry.pdf_path, e)
+            found = None
+        if found is not None and found[1] > 0:
+            return _Prefetched(SOURCE_STORED, head=found[0], total=found[1])
+    try:
+        pdf_bytes = _regenerate(archive, entry)
+    except Exception as e:
+        logger.exception("Waiver export: could not regenerate PDF for signature %s", entry.signature_id)
+        return _Prefetched(SOURCE_FAILED, error=f"{type(e).__name__}: {e}")
+    return _Prefetched(SOURCE_REGENERATED, head=pdf_bytes, total=len(pdf_bytes))
+
+
+def _pdf_chunks(entry: ArchiveEntry, fetched: _Prefetched, chunk_size: int) -> Iterator[bytes]:
+    yield fetched.head
+    offset = len(fetched.head)
+    while offset < fetched.total:
+        found = get_waiver_pdf_range(entry.pdf_path, offset, chunk_size)
+        if found is None or not found[0]:
+            raise IOError(f"{entry.pdf_path} changed while being exported")
+        yield found[0]
+        offset += len(found[0])
+
+
+def _manifest_row(entry: ArchiveEntry, fetched: _Prefetched, size: int, digest: str, in_archive: bool = True) -> list:
+    return [
+        entry.filename if in_archive else "",
+        str(entry.signature_id),
+        entry.player_name,
+        entry.player_email,
+        entry.full_name_typed,
+        entry.waiver_version,
+        entry.signed_at.isoformat(),
+        fetched.source,
+        size,
+        digest,
+        fetched.error or "",
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def load_archive_entries(db: Session, league_id: UUID) -> WaiverArchive:
+    league = db.query(League.id, League.name).filter(League.id == league_id).first()
+    if not league:
+        raise NotFoundError("League not found")
+
+    rows = (
+        db.query(
+            WaiverSignature.id,
+            WaiverSignature.waiver_id,
+            WaiverSignature.full_name_typed,
+            WaiverSignature.signed_at,
+            WaiverSignature.pdf_path,
+            Player.first_name,
+            Player.last_name,
+            Player.email,
+            Waiver.version,
+        )
+        .join(Player, WaiverSignature.player_id == Player.id)
+        .join(Waiver, WaiverSignature.waiver_id == Waiver.id)
+        .filter(WaiverSignature.league_id == league_id)
+        .order_by(Player.last_name, Player.first_name, WaiverSignature.signed_at)
+        .all()
+    )
+    entries = []
+    for row in rows:
+        player_name = f"{row.first_name} {row.last_name}"
+        entries.append(ArchiveEntry(
+            signature_id=row.id,
+            waiver_id=row.waiver_id,
+            player_name=player_name,
+            player_email=row.email,
+            full_name_typed=row.full_name_typed,
+            waiver_version=row.version,
+            signed_at=row.signed_at,
+            pdf_path=row.pdf_path,
+            filename=f"{_safe_name(player_name)}_{row.id.hex[:8]}.pdf",
+        ))
+
+    # Waiver text is only needed to regenerate missing PDFs; load each version once
+    waiver_ids = {e.waiver_id for e in entries}
+    waivers = {}
+    if waiver_ids:
+        waivers = {
+            w.id: (w.content, w.version)
+            for w in db.query(Waiver.id, Waiver.content, Waiver.version).filter(Waiver.id.in_(waiver_ids))
+        }
+    return WaiverArchive(league_id=league.id, league_name=league.name, entries=entries, waivers=waivers)
+
+
+def _filename(league_name: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", league_name).strip("-").lower() or "league"
+    return f"waivers-{slug}-{datetime.now(timezone.utc):%Y%m%d}.zip"
+
+
+def archive_filename(archive: WaiverArchive) -> str:
+    return _filename(archive.league_name)
+
+
+def iter_waiver_archive(
+    archive: WaiverArchive,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield the ZIP archive (PDFs, then manifest.csv) in pieces as it is built."""
+    sink = _ChunkSink()
+    manifest = io.StringIO()
+    writer = csv.writer(manifest)
+    writer.writerow(MANIFEST_COLUMNS)
+    pending: Deque[Tuple[ArchiveEntry, Future]] = deque()
+    upcoming = iter(archive.entries)
+    pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="waiver-export")
+
+    def refill():
+        while len(pending) < max(1, concurrency):
+            entry = next(upcoming, None)
+            if entry is None:
+                return
+            pending.append((entry, pool.submit(_prefetch, archive, entry, chunk_size)))
+
+    try:
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as zf:
+            refill()
+            while pending:
+                entry, future = pending.popleft()
+                fetched = future.result()
+                refill()
+                if fetched.source == SOURCE_FAILED:
+                    writer.writerow(_manifest_row(entry, fetched, 0, "", in_archive=False))
+                    continue
+
+                info = zipfile.ZipInfo(entry.filename, date_time=entry.signed_at.timetuple()[:6])
+                info.compress_type = zipfile.ZIP_STORED
+                digest = hashlib.sha256()
+                size = 0
+                with zf.open(info, mode="w", force_zip64=fetched.total >= zipfile.ZIP64_LIMIT) as member:
+                    try:
+                        for chunk in _pdf_chunks(entry, fetched, chunk_size):
+                            member.write(chunk)
+                            digest.update(chunk)
+                            size += len(chunk)
+                            if data := sink.drain():
+                                yield data
+                    except Exception as e:
+                        # Bytes already sent cannot be recalled: keep the truncated member, flag it
+                        logger.exception("Waiver export: reading %s failed after %d bytes", entry.pdf_path, size)
+                        fetched.source = SOURCE_FAILED
+                        fetched.error = f"{type(e).__name__}: {e} (file truncated at {size} of {fetched.total} bytes)"
+                writer.writerow(_manifest_row(entry, fetched, size, digest.hexdigest()))
+                if data := sink.drain():
+                    yield data
+
+            zf.writestr(MANIFEST_NAME, manifest.getvalue(), compress_type=zipfile.ZIP_DEFLATED)
+        yield sink.drain()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _failure_key(key: str) -> str:
+    return f"{key}.failed"
+
+
+def run_waiver_export(db: Session, league_id: UUID, export_id: UUID) -> str:
+    """Build a league's archive into S3 under the export's key and return the key.
+
+    On failure, leaves the export's failure note for get_waiver_export() and re-raises.
+    """
+    key = waiver_export_key(league_id, export_id)
+    try:
+        archive = load_archive_entries(db, league_id)
+        upload_waiver_archive(iter_waiver_archive(archive), key)
+    except Exception as e:
+        logger.exception("Waiver export %s for league %s failed", export_id, league_id)
+        put_text_object(_failure_key(key), f"{type(e).__name__}: {e}")
+        raise
+    return key
+
+
+def start_waiver_export(db: Session, league_id: UUID) -> UUID:
+    """Start an export of the league's signed waivers and return its id.
+
+    Raises NotFoundError for an unknown league and ServiceError (503) when no
+    waiver bucket is configured or the export Lambda cannot be invoked.
+    """
+    if not db.query(League.id).filter(League.id == league_id).first():
+        raise NotFoundError("League not found")
+    if not settings.WAIVER_S3_BUCKET:
+        raise ServiceError("Waiver storage is not configured", status_code=503)
+
+    export_id = uuid4()
+    if not settings.WAIVER_EXPORT_FUNCTION_NAME:
+        run_waiver_export(db, league_id, export_id)
+        return export_id
+
+    try:
+        import boto3
+        boto3.client("lambda", region_name=settings.AWS_REGION).invoke(
+            FunctionName=settings.WAIVER_EXPORT_FUNCTION_NAME,
+            InvocationType="Event",
+            Payload=json.dumps({"league_id": str(league_id), "export_id": str(export_id)}).encode(),
+        )
+    except Exception as e:
+        logger.exception("Could not start waiver export for league %s: %s", league_id, e)
+        raise ServiceError("Could not start the export. Please retry.", status_code=503)
+    return export_id
+
+
+def get_waiver_export(db: Session, league_id: UUID, export_id: UUID) -> WaiverExportStatus:
+    """Where an export stands; a ready export carries a presigned download URL. Raises NotFoundError."""
+    league_name = db.query(League.name).filter(League.id == league_id).scalar()
+    if league_name is None:
+        raise NotFoundError("League not found")
+    key = waiver_export_key(league_id, export_id)
+    if object_exists(key):
+        url = generate_presigned_url(key, expiry=DOWNLOAD_URL_EXPIRY, filename=_filename(league_name))
+        return WaiverExportStatus(export_id, EXPORT_READY, download_url=url)
+    note = download_waiver_pdf(_failure_key(key))
+    if note is not None:
+        return WaiverExportStatus(export_id, EXPORT_FAILED, error=note.decode(errors="replace"))
+    return WaiverExportStatus(export_id, EXPORT_PENDING)
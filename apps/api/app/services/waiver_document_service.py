@@ -0,0 +1,214 @@
+"""
+Post-signing document stage for waiver signatures.
+
+sign_waiver only records the signature; the committed row is the work item
+(processed_at IS NULL). This stage, run by handlers/waiver_document_handler.py,
+turns it into the signed PDF in S3 plus a queued confirmation email:
+
+1. PDF — reuse the stored object when pdf_path is set and it still exists,
+   otherwise render it and upload it under the signature's fixed S3 key (a
+   re-run overwrites the same object).
+2. Email — unless email_sent_at is already set, queue the confirmation with
+   the PDF attached in the email outbox and stamp email_sent_at.
+3. Commit pdf_path, email_sent_at and processed_at together with the outbox
+   row, so a crash before the commit re-runs the whole stage and a crash
+   after it leaves nothing to redo: the email is queued exactly once.
+
+process_pending_signatures() claims due rows with FOR UPDATE SKIP LOCKED and
+a lease, like the email outbox; a failed signature is retried with capped
+exponential backoff until MAX_ATTEMPTS, then left with processing_error set.
+
+Public API:
+- render_signature_pdf(signature, waiver, league_name) — PDF bytes for a signature
+- process_signature(db, signature_id) — run the stage for one signature; commits
+- process_pending_signatures(db, ...) — claim and process due signatures; commits
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.league import League
+from app.models.player import Player
+from app.models.waiver import Waiver, WaiverSignature
+from app.services.email_outbox_service import enqueue_email
+from app.services.email_service import build_waiver_confirmation
+from app.services.pdf_service import build_waiver_template, get_waiver_template, render_signed_waiver
+from app.services.s3_service import download_waiver_pdf, upload_waiver_pdf
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 6
+DEFAULT_BATCH_SIZE = 20
+_LEASE_SECONDS = 300
+_BACKOFF_BASE_SECONDS = 60
+_BACKOFF_MAX_SECONDS = 3600
+_MAX_ERROR_LENGTH = 1000
+
+
+@dataclass
+class ProcessingResult:
+    claimed: int = 0
+    processed: int = 0
+    failed: int = 0
+    failed_ids: List[UUID] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _claim(db: Session, batch_size: int) -> List[UUID]:
+    """Lease up to batch_size due signatures and commit."""
+    now = _now()
+    ids = list(db.execute(
+        select(WaiverSignature.id)
+        .where(
+            WaiverSignature.processed_at.is_(None),
+            WaiverSignature.next_processing_at <= now,
+            WaiverSignature.processing_attempts < MAX_ATTEMPTS,
+        )
+        .order_by(WaiverSignature.next_processing_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).scalars())
+    if ids:
+        db.execute(
+            update(WaiverSignature)
+            .where(WaiverSignature.id.in_(ids))
+            .values(
+                processing_attempts=WaiverSignature.processing_attempts + 1,
+                next_processing_at=now + timedelta(seconds=_LEASE_SECONDS),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+    db.commit()
+    return ids
+
+
+def _record_failure(db: Session, signature_id: UUID, exc: Exception, rng: random.Random) -> None:
+    db.rollback()
+    attempts = db.execute(
+        select(WaiverSignature.processing_attempts).where(WaiverSignature.id == signature_id)
+    ).scalar_one()
+    step = min(_BACKOFF_BASE_SECONDS * 2 ** min(attempts - 1, 30), _BACKOFF_MAX_SECONDS)
+    error = f"{type(exc).__name__}: {exc}"[:_MAX_ERROR_LENGTH]
+    db.execute(
+        update(WaiverSignature)
+        .where(WaiverSignature.id == signature_id)
+        .values(
+            processing_error=error,
+            next_processing_at=_now() + timedelta(seconds=step * rng.uniform(0.5, 1.0)),
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
+    if attempts >= MAX_ATTEMPTS:
+        logger.error("Waiver signature %s processing gave up after %d attempts: %s", signature_id, attempts, error)
+    else:
+        logger.warning("Waiver signature %s processing failed (attempt %d): %s", signature_id, attempts, error)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def render_signature_pdf(signature: WaiverSignature, waiver: Optional[Waiver], league_name: str) -> bytes:
+    if waiver is None:
+        template = build_waiver_template(league_name, "", "unknown")
+    else:
+        template = get_waiver_template(waiver.id, league_name, waiver.content, waiver.version)
+    return render_signed_waiver(template, signature.full_name_typed, signature.signed_at)
+
+
+def process_signature(db: Session, signature_id: UUID) -> bool:
+    """
+    Render/upload the signed PDF and queue the confirmation email for one
+    signature. Returns False if it does not exist or was already processed.
+    Commits; raises on failure (nothing is committed then).
+    """
+    signature = (
+        db.query(WaiverSignature)
+        .filter(WaiverSignature.id == signature_id)
+        .with_for_update()
+        .first()
+    )
+    if not signature or signature.processed_at is not None:
+        db.rollback()
+        return False
+
+    waiver = db.query(Waiver).filter(Waiver.id == signature.waiver_id).first()
+    league = db.query(League).filter(League.id == signature.league_id).first()
+    player = db.query(Player).filter(Player.id == signature.player_id).first()
+    league_name = league.name if league else "Unknown League"
+    needs_email = signature.email_sent_at is None and player is not None
+
+    pdf_bytes = None
+    if signature.pdf_path and needs_email:
+        pdf_bytes = download_waiver_pdf(signature.pdf_path)
+    if not signature.pdf_path or (needs_email and pdf_bytes is None):
+        pdf_bytes = render_signature_pdf(signature, waiver, league_name)
+        s3_key = upload_waiver_pdf(pdf_bytes, signature.league_id, signature.player_id, signature.id)
+        if s3_key:
+            signature.pdf_path = s3_key
+
+    now = _now()
+    if needs_email:
+        enqueue_email(db, "waiver_confirmation", build_waiver_confirmation(
+            to_email=player.email,
+            to_name=f"{player.first_name} {player.last_name}",
+            league_name=league_name,
+            waiver_version=waiver.version if waiver else "unknown",
+            signed_at=signature.signed_at,
+            pdf_bytes=pdf_bytes,
+        ))
+        signature.email_sent_at = now  # handed to the outbox in this commit
+    signature.processed_at = now
+    signature.processing_error = None
+    db.commit()
+    return True
+
+
+def process_pending_signatures(
+    db: Session,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    time_budget_seconds: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> ProcessingResult:
+    """
+    Process due signatures, one claim of batch_size at a time, until none are
+    due or max_batches / time_budget_seconds runs out. Commits per signature.
+    """
+    result = ProcessingResult()
+    deadline = time.monotonic() + time_budget_seconds if time_budget_seconds else None
+    rng = random.Random(seed)
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        ids = _claim(db, batch_size)
+        if not ids:
+            break
+        batches += 1
+        result.claimed += len(ids)
+        for signature_id in ids:
+            try:
+                if process_signature(db, signature_id):
+                    result.processed += 1
+            except Exception as exc:
+                result.failed += 1
+                result.failed_ids.append(signature_id)
+                _record_failure(db, signature_id, exc, rng)
+    return result
@@ -12,6 +12,7 @@ from app.models.player import Player
 from app.models.league import League
 from app.core.constants import REG_CONFIRMED, REG_EXPIRED, WAIVER_EXPIRED, WAIVER_PENDING, WAIVER_SIGNED
 from app.services.exceptions import ServiceError, ConflictError, NotFoundError
+from app.services.league_service import recount_occupancy
 
 logger = logging.getLogger(__name__)
 
@@ -305,6 +306,7 @@ def expire_overdue_waivers(db: Session) -> dict[UUID, int]:
             },
             synchronize_session="fetch",
         )
+        recount_occupancy(db, affected.keys())
         total = sum(affected.values())
         logger.info("Expired %d overdue waiver registrations across %d leagues", total, len(affected))
 
@@ -327,6 +329,7 @@ def expire_unsigned_for_league(db: Session, league_id: UUID) -> int:
         })
     )
     if count:
+        recount_occupancy(db, [league_id])
         logger.info("Expired %d unsigned waivers for league %s", count, league_id)
     return count
 
@@ -1,15 +1,20 @@
 import asyncio
+import hashlib
 import httpx
 import logging
 import os
 import time
 import urllib.parse
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 
 import jwt as pyjwt
 from jwt import algorithms as jwt_algorithms
 from jwt.exceptions import PyJWTError
 from fastapi import HTTPException, status, Request
+from app.core.cache import MemoryBackend, PostgresBackend, RedisBackend
 from app.core.config import settings
+from app.core.http_client import CircuitOpenError, http_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +23,70 @@ JWKS_CACHE_TTL = 60 * 60  # 1 hour
 _JWKS_NEGATIVE_TTL = 30  # seconds to wait before retrying after a failure
 _JWKS_LOCK = asyncio.Lock()
 
-# Per-user email cache — avoids hitting Clerk API on every authenticated request
-_EMAIL_CACHE: dict[str, tuple[str, float]] = {}  # {user_id: (email, fetched_at)}
+# Parsed RSA public keys by kid. Rebuilt (and _VERIFIED_TOKENS cleared) only
+# when get_jwks() hands back a different JWKS document, i.e. after a refresh.
+_SIGNING_KEYS: dict = {"source": None, "keys": {}}
+
+# Recently verified tokens: sha256(token) -> (claims, exp). An entry is only
+# served while now < exp, so a hit is exactly as valid as re-verifying the
+# signature and claims; the LRU bound caps memory.
+_VERIFIED_TOKENS: "OrderedDict[bytes, tuple[dict, float]]" = OrderedDict()
+_VERIFIED_TOKENS_MAX = 4096
+
+# Email lookup for tokens without an email claim, tiered to avoid hitting the
+# Clerk API on every authenticated request:
+#   1. _EMAIL_CACHE — bounded per-process LRU (5 minutes)
+#   2. _EMAIL_SHARED — store shared by all instances (the cache_entries table by
+#      default, or Redis), so a Lambda cold start does not mean a Clerk call
+#   3. Clerk backend API — concurrent misses for one user share a single call
+# Only Clerk is trusted for the email: when it is unavailable the lookup fails
+# with 503 rather than falling back to user-editable data such as players.email.
+_EMAIL_CACHE = MemoryBackend(max_entries=settings.EMAIL_LOOKUP_CACHE_MAX_ENTRIES)
 _EMAIL_CACHE_TTL = 300  # 5 minutes
+_EMAIL_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+def _build_shared_email_store():
+    kind = settings.EMAIL_LOOKUP_SHARED_BACKEND
+    if kind == "postgres":
+        return PostgresBackend()
+    if kind == "redis":
+        return RedisBackend.from_url(settings.EMAIL_LOOKUP_SHARED_URL, setting="EMAIL_LOOKUP_SHARED_BACKEND")
+    return None
+
+
+_EMAIL_SHARED = _build_shared_email_store()
+
+
+@dataclass
+class EmailLookupStats:
+    memory_hits: int = 0
+    shared_hits: int = 0
+    coalesced: int = 0
+    upstream_calls: int = 0
+    upstream_errors: int = 0
+    upstream_ms_total: float = 0.0
+    upstream_ms_max: float = 0.0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.shared_hits + self.coalesced + self.upstream_calls
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered without a Clerk call of their own."""
+        return 1 - self.upstream_calls / self.lookups if self.lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "lookups": self.lookups,
+            "hit_rate": round(self.hit_rate, 4),
+            "upstream_ms_mean": round(self.upstream_ms_total / self.upstream_calls, 1) if self.upstream_calls else 0.0,
+        }
+
+
+EMAIL_LOOKUP_STATS = EmailLookupStats()
 
 # Normalize issuer: strip trailing slash so both "…dev" and "…dev/" validate.
 _CLERK_ISSUER_NORMALIZED = settings.CLERK_ISSUER.rstrip("/")
@@ -51,12 +117,11 @@ async def get_jwks():
         if JWKS_CACHE["keys"] and now - JWKS_CACHE["fetched_at"] < JWKS_CACHE_TTL:
             return JWKS_CACHE["keys"]
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(settings.CLERK_JWKS_URL)
-                resp.raise_for_status()
-                JWKS_CACHE["keys"] = resp.json()
-                JWKS_CACHE["fetched_at"] = int(time.time())
-                JWKS_CACHE["failed_at"] = 0
+            resp = await http_client.get(settings.CLERK_JWKS_URL)
+            resp.raise_for_status()
+            JWKS_CACHE["keys"] = resp.json()
+            JWKS_CACHE["fetched_at"] = int(time.time())
+            JWKS_CACHE["failed_at"] = 0
         except Exception as exc:
             if JWKS_CACHE["keys"]:
                 logger.warning(
@@ -69,36 +134,106 @@ async def get_jwks():
         return JWKS_CACHE["keys"]
 
 
+def _signing_keys(jwks: dict) -> dict:
+    """Return {kid: public key} for this JWKS document, parsing each JWK only once."""
+    if _SIGNING_KEYS["source"] is not jwks:
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            kid = jwk.get("kid")
+            if kid in keys:
+                continue
+            try:
+                keys[kid] = jwt_algorithms.RSAAlgorithm.from_jwk(jwk)
+            except PyJWTError as exc:
+                logger.warning("Ignoring unusable JWKS key kid=%r: %s", kid, exc)
+        _SIGNING_KEYS["keys"] = keys
+        _SIGNING_KEYS["source"] = jwks
+        # Tokens verified against the previous key set must be re-checked
+        _VERIFIED_TOKENS.clear()
+    return _SIGNING_KEYS["keys"]
+
+
 def _get_signing_key(jwks: dict, token: str):
     """Extract the RSA signing key from JWKS that matches the token's kid header."""
     header = pyjwt.get_unverified_header(token)
-    kid = header.get("kid")
-    for jwk in jwks.get("keys", []):
-        if jwk.get("kid") == kid:
-            return jwt_algorithms.RSAAlgorithm.from_jwk(jwk)
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Unable to find signing key for token",
+    key = _signing_keys(jwks).get(header.get("kid"))
+    if key is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unable to find signing key for token",
+        )
+    return key
+
+
+def _decode_token(jwks: dict, token: str) -> dict:
+    """Verify the token (signature, exp, iss, aud) and return a copy of its claims.
+
+    Tokens already verified against the current JWKS are served from
+    _VERIFIED_TOKENS until their exp. Raises PyJWTError / HTTPException like
+    pyjwt.decode and _get_signing_key.
+    """
+    _signing_keys(jwks)
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = _VERIFIED_TOKENS.get(digest)
+    if cached is not None:
+        claims, exp = cached
+        if time.time() < exp:
+            _VERIFIED_TOKENS.move_to_end(digest)
+            return dict(claims)
+        del _VERIFIED_TOKENS[digest]
+
+    payload = pyjwt.decode(
+        token,
+        _get_signing_key(jwks, token),
+        algorithms=["RS256"],
+        options=_jwt_decode_options(),
+        issuer=_CLERK_ISSUER_NORMALIZED,
+        **_jwt_decode_kwargs(),
     )
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _VERIFIED_TOKENS[digest] = (dict(payload), float(exp))
+        while len(_VERIFIED_TOKENS) > _VERIFIED_TOKENS_MAX:
+            _VERIFIED_TOKENS.popitem(last=False)
+    return payload
 
 
-async def _fetch_clerk_email(user_id: str) -> str:
-    """Fetch primary email for a Clerk user via the backend API. Cached for 5 minutes."""
-    now = time.time()
-    cached = _EMAIL_CACHE.get(user_id)
-    if cached and now - cached[1] < _EMAIL_CACHE_TTL:
-        return cached[0]
+async def _shared_email_get(user_id: str) -> str | None:
+    if _EMAIL_SHARED is None:
+        return None
+    try:
+        raw = await asyncio.to_thread(_EMAIL_SHARED.get, f"clerk-email:{user_id}")
+    except Exception:
+        logger.warning("Shared email cache read failed for user %s", user_id, exc_info=True)
+        return None
+    return raw.decode() if raw else None
+
+
+async def _shared_email_set(user_id: str, email: str) -> None:
+    if _EMAIL_SHARED is None:
+        return
+    try:
+        await asyncio.to_thread(
+            _EMAIL_SHARED.set, f"clerk-email:{user_id}", email.encode(), settings.EMAIL_LOOKUP_SHARED_TTL_SECONDS,
+        )
+    except Exception:
+        logger.warning("Shared email cache write failed for user %s", user_id, exc_info=True)
 
-    url = f"https://api.clerk.com/v1/users/{urllib.parse.quote(user_id, safe='')}"
+
+async def _fetch_clerk_email_upstream(user_id: str) -> str:
+    """Fetch primary email for a Clerk user via the backend API (retries 5xx/timeouts)."""
+    url = f"{settings.CLERK_API_URL}/v1/users/{urllib.parse.quote(user_id, safe='')}"
     headers = {"Authorization": f"Bearer {settings.CLERK_SECRET_KEY}"}
     data = None
     for attempt in range(3):
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
-                break
+            resp = await http_client.get(url, headers=headers)
+            resp.raise_for_status()
+            data = resp.json()
+            break
+        except CircuitOpenError:
+            logger.error("Clerk API circuit open; not fetching email for user %s", user_id)
+            raise HTTPException(status_code=503, detail="Authentication service unavailable. Please retry.")
         except httpx.TimeoutException:
             if attempt < 2:
                 await asyncio.sleep(0.5 * (2 ** attempt))
@@ -125,9 +260,61 @@ async def _fetch_clerk_email(user_id: str) -> str:
         email = addresses[0]["email_address"]
     if not email:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="No email found for user")
-    _EMAIL_CACHE[user_id] = (email, now)
     return email
 
+
+
+async def _load_email(user_id: str) -> str:
+    """Shared store, then Clerk. Runs once per user however many callers wait."""
+    email = await _shared_email_get(user_id)
+    if email:
+        EMAIL_LOOKUP_STATS.shared_hits += 1
+        _EMAIL_CACHE.set(user_id, email.encode(), _EMAIL_CACHE_TTL)
+        return email
+
+    EMAIL_LOOKUP_STATS.upstream_calls += 1
+    start = time.perf_counter()
+    try:
+        email = await _fetch_clerk_email_upstream(user_id)
+    except HTTPException:
+        EMAIL_LOOKUP_STATS.upstream_errors += 1
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        EMAIL_LOOKUP_STATS.upstream_ms_total += elapsed_ms
+        EMAIL_LOOKUP_STATS.upstream_ms_max = max(EMAIL_LOOKUP_STATS.upstream_ms_max, elapsed_ms)
+
+    logger.info(
+        "Clerk email lookup for user %s took %.0fms (email lookup hit rate %.1f%%)",
+        user_id, elapsed_ms, EMAIL_LOOKUP_STATS.hit_rate * 100,
+    )
+    _EMAIL_CACHE.set(user_id, email.encode(), _EMAIL_CACHE_TTL)
+    await _shared_email_set(user_id, email)
+    return email
+
+
+async def _fetch_clerk_email(user_id: str) -> str:
+    """Primary email for a Clerk user, via the tiered cache described at the top of this module."""
+    cached = _EMAIL_CACHE.get(user_id)
+    if cached:
+        EMAIL_LOOKUP_STATS.memory_hits += 1
+        return cached.decode()
+
+    task = _EMAIL_INFLIGHT.get(user_id)
+    if task is not None and task.get_loop() is asyncio.get_running_loop():
+        EMAIL_LOOKUP_STATS.coalesced += 1
+    else:
+        task = asyncio.ensure_future(_load_email(user_id))
+        _EMAIL_INFLIGHT[user_id] = task
+        task.add_done_callback(lambda t: _EMAIL_INFLIGHT.pop(user_id, None) if _EMAIL_INFLIGHT.get(user_id) is t else None)
+    # shield: one waiter being cancelled (client disconnect) must not cancel the shared lookup
+    return await asyncio.shield(task)
+
+
+def email_lookup_stats() -> dict:
+    """Snapshot of email lookup counters for logs/diagnostics."""
+    return EMAIL_LOOKUP_STATS.as_dict()
+
 _TESTING = os.getenv("TESTING") == "true"
 _TEST_BYPASS_TOKEN = os.getenv("TEST_BYPASS_TOKEN", "")
 
@@ -162,15 +349,7 @@ async def get_optional_user(request: Request):
     token = auth_header.split(" ", 1)[1]
     try:
         jwks = await get_jwks()
-        key = _get_signing_key(jwks, token)
-        payload = pyjwt.decode(
-            token,
-            key,
-            algorithms=["RS256"],
-            options=_jwt_decode_options(),
-            issuer=_CLERK_ISSUER_NORMALIZED,
-            **_jwt_decode_kwargs(),
-        )
+        payload = _decode_token(jwks, token)
         user_id = payload.get("sub")
         if not user_id:
             return None
@@ -190,16 +369,8 @@ async def get_current_user(request: Request):
 
     try:
         jwks = await get_jwks()
-        key = _get_signing_key(jwks, token)
         try:
-            payload = pyjwt.decode(
-                token,
-                key,
-                algorithms=["RS256"],
-                options=_jwt_decode_options(),
-                issuer=_CLERK_ISSUER_NORMALIZED,
-                **_jwt_decode_kwargs(),
-            )
+            payload = _decode_token(jwks, token)
         except pyjwt.exceptions.InvalidIssuerError:
             # Diagnostic: decode without verification to log the mismatched issuer
             try:
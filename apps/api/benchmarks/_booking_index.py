@@ -0,0 +1,65 @@
+"""Sorted-interval booking index: the baseline bench_field_conflicts and bench_field_calendar compare against.
+
+Schedule generation used it for field conflict checks before FieldCalendar
+(app.services.field_calendar) replaced it; the app no longer imports it.
+Covered by tests/unit/test_booking_index.py.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import accumulate
+from typing import Dict, List
+from uuid import UUID
+
+
+class _FieldIntervals:
+    """
+    Bookings for one field as sorted boundary arrays.
+
+    starts is sorted ascending; max_end[i] is the latest end among the first
+    i + 1 bookings in start order. A query [qs, qe) overlaps some booking iff
+    the bookings starting before qe include one ending after qs, i.e.
+    max_end[bisect_left(starts, qe) - 1] > qs — one binary search per query.
+    """
+
+    __slots__ = ("starts", "ends", "max_end", "_dirty")
+
+    def __init__(self) -> None:
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+        self.max_end: List[datetime] = []
+        self._dirty = False
+
+    def add(self, start: datetime, end: datetime) -> None:
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self._dirty = True
+
+    def _rebuild(self) -> None:
+        self.max_end = list(accumulate(self.ends, max))
+        self._dirty = False
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        if self._dirty:
+            self._rebuild()
+        i = bisect_left(self.starts, end)
+        return i > 0 and self.max_end[i - 1] > start
+
+
+class FieldBookingIndex:
+    """Per-field interval index of bookings; O(log n) overlap checks per field."""
+
+    def __init__(self) -> None:
+        self._by_field: Dict[UUID, _FieldIntervals] = {}
+
+    def add(self, field_id: UUID, start: datetime, end: datetime) -> None:
+        intervals = self._by_field.get(field_id)
+        if intervals is None:
+            intervals = self._by_field[field_id] = _FieldIntervals()
+        intervals.add(start, end)
+
+    def overlaps(self, field_id: UUID, start: datetime, end: datetime) -> bool:
+        """Return True if [start, end) overlaps any booking on the field."""
+        intervals = self._by_field.get(field_id)
+        return intervals is not None and intervals.overlaps(start, end)
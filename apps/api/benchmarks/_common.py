@@ -0,0 +1,43 @@
+"""Small helpers shared by the benchmark scripts."""
+
+import os
+import statistics
+import time
+from contextlib import contextmanager
+
+
+def ensure_test_env() -> None:
+    """Set the env vars app.core.config requires so benchmarks can import the app."""
+    os.environ.setdefault("CLERK_JWKS_URL", "https://bench.clerk.dev/.well-known/jwks.json")
+    os.environ.setdefault("CLERK_ISSUER", "https://bench.clerk.dev/")
+    os.environ.setdefault("CLERK_SECRET_KEY", "sk_bench_placeholder")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples (pct in 0-100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    k = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[k]
+
+
+def summarize(label: str, samples_ms: list[float]) -> str:
+    """Format p50/p99/mean for a list of millisecond samples."""
+    return (
+        f"{label:<28} n={len(samples_ms):<6} "
+        f"p50={percentile(samples_ms, 50):8.2f}ms  "
+        f"p99={percentile(samples_ms, 99):8.2f}ms  "
+        f"mean={statistics.fmean(samples_ms) if samples_ms else 0.0:8.2f}ms"
+    )
+
+
+@contextmanager
+def timer():
+    """Yield a dict whose 'ms' key holds the elapsed wall time after the block exits."""
+    result = {"ms": 0.0}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["ms"] = (time.perf_counter() - start) * 1000
@@ -0,0 +1,100 @@
+"""Micro-benchmark: per-request overhead of the get_current_user dependency (no network).
+
+Preloads a JWKS and calls get_current_user with a locally signed RS256
+token three ways: the pre-cache path (parse the JWK and verify the signature
+on every call), a cold token cache (parsed keys reused, signature verified
+each call), and a warm token cache (same browser session repeating calls).
+
+    python -m benchmarks.bench_auth
+    python -m benchmarks.bench_auth --requests 5000 --keys 4
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+from benchmarks._common import ensure_test_env, summarize
+
+ensure_test_env()
+
+import jwt as pyjwt  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: E402
+from jwt import algorithms as jwt_algorithms  # noqa: E402
+
+from app.utils import clerk_jwt  # noqa: E402
+
+
+def _request(token: str) -> MagicMock:
+    request = MagicMock()
+    request.headers = {"Authorization": f"Bearer {token}"}
+    return request
+
+
+def _setup(keys: int):
+    jwks, private_key = {"keys": []}, None
+    for i in range(keys):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = jwt_algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        jwk.update(kid=f"kid-{i}", use="sig", alg="RS256")
+        jwks["keys"].append(jwk)
+    clerk_jwt.JWKS_CACHE.update(keys=jwks, fetched_at=int(time.time()), failed_at=0)
+    token = pyjwt.encode(
+        {"sub": "user_bench", "iss": clerk_jwt._CLERK_ISSUER_NORMALIZED,
+         "exp": int(time.time()) + 3600, "email": "bench@example.com"},
+        private_key, algorithm="RS256", headers={"kid": f"kid-{keys - 1}"},
+    )
+    return jwks, token
+
+
+def _legacy_decode(jwks: dict, token: str) -> dict:
+    """The pre-cache path: linear kid scan, JWK parse and RS256 verify per call."""
+    kid = pyjwt.get_unverified_header(token).get("kid")
+    jwk = next(k for k in jwks["keys"] if k.get("kid") == kid)
+    return pyjwt.decode(
+        token,
+        jwt_algorithms.RSAAlgorithm.from_jwk(jwk),
+        algorithms=["RS256"],
+        options=clerk_jwt._jwt_decode_options(),
+        issuer=clerk_jwt._CLERK_ISSUER_NORMALIZED,
+        **clerk_jwt._jwt_decode_kwargs(),
+    )
+
+
+async def _run(label: str, requests: int, token: str, before_each=None) -> None:
+    request = _request(token)
+    samples = []
+    start = time.perf_counter()
+    for _ in range(requests):
+        if before_each:
+            before_each()
+        t0 = time.perf_counter()
+        user = await clerk_jwt.get_current_user(request)
+        samples.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - start
+    assert user["id"] == "user_bench"
+    print(f"{summarize(label, samples)}  {requests / elapsed:9.0f} req/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--keys", type=int, default=2, help="keys in the JWKS (token uses the last)")
+    args = parser.parse_args()
+
+    jwks, token = _setup(args.keys)
+    print(f"{args.requests} calls to get_current_user, {args.keys} JWKS keys")
+
+    original = clerk_jwt._decode_token
+    clerk_jwt._decode_token = _legacy_decode
+    try:
+        await _run("parse + verify every call", args.requests, token)
+    finally:
+        clerk_jwt._decode_token = original
+
+    await _run("cached keys, cold tokens", args.requests, token, before_each=clerk_jwt._VERIFIED_TOKENS.clear)
+    await _run("cached keys, warm token", args.requests, token)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+"""Benchmark: admin field availability listing, per-row field lookup vs joined projection.
+
+Seeds --fields fields with --per-field availability windows each (default
+50 x 10 = 500 rows, the endpoint's max page) and times building the
+GET /admin/field-availability response both ways:
+
+- per-row — load FieldAvailability objects, then one Field query per row and
+            model_validate on the ORM object (the old endpoint, 1 + N queries)
+- joined  — one SELECT of the response columns with fields.name joined in,
+            serialized from row tuples (field_management._availability_query)
+
+Query counts come from app.core.query_profiler.
+
+    python -m benchmarks.bench_field_availability
+    python -m benchmarks.bench_field_availability --fields 10 --per-field 20 --samples 50
+"""
+
+import argparse
+import uuid
+from datetime import time
+
+from benchmarks._common import ensure_test_env, summarize, timer
+
+ensure_test_env()
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.api.admin.field_management import _availability_query, _availability_responses  # noqa: E402
+from app.api.schemas.admin import FieldAvailabilityResponse  # noqa: E402
+from app.core.query_profiler import profile_queries  # noqa: E402
+from app.db.db import SessionLocal  # noqa: E402
+from app.models.field import Field  # noqa: E402
+from app.models.field_availability import FieldAvailability  # noqa: E402
+
+_BENCH_CREATOR = "bench-field-availability"
+
+
+def _seed(n_fields: int, per_field: int) -> None:
+    db = SessionLocal()
+    try:
+        field_ids = [uuid.uuid4() for _ in range(n_fields)]
+        db.execute(insert(Field), [
+            {
+                "id": field_id, "name": f"Bench Field {i}", "street_address": "1 Bench St",
+                "city": "Salem", "state": "MA", "zip_code": "01970", "country": "USA",
+                "created_by": _BENCH_CREATOR, "is_active": True,
+            }
+            for i, field_id in enumerate(field_ids)
+        ])
+        db.execute(insert(FieldAvailability), [
+            {
+                "id": uuid.uuid4(), "field_id": field_id, "is_recurring": True, "day_of_week": i % 7,
+                "start_time": time(17 + i % 3, 0), "end_time": time(21, 0),
+                "created_by": _BENCH_CREATOR, "is_active": True,
+            }
+            for field_id in field_ids
+            for i in range(per_field)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _cleanup() -> None:
+    db = SessionLocal()
+    try:
+        db.query(FieldAvailability).filter(FieldAvailability.created_by == _BENCH_CREATOR).delete(
+            synchronize_session=False,
+        )
+        db.query(Field).filter(Field.created_by == _BENCH_CREATOR).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _per_row(db, limit: int):
+    availabilities = (
+        db.query(FieldAvailability).filter(FieldAvailability.created_by == _BENCH_CREATOR)
+        .order_by(FieldAvailability.created_at.desc()).limit(limit).all()
+    )
+    result = []
+    for avail in availabilities:
+        field = db.query(Field).filter(Field.id == avail.field_id).first()
+        response = FieldAvailabilityResponse.model_validate(avail)
+        response.field_name = field.name if field else None
+        result.append(response)
+    return result
+
+
+def _joined(db, limit: int):
+    rows = (
+        _availability_query(db).filter(FieldAvailability.created_by == _BENCH_CREATOR)
+        .order_by(FieldAvailability.created_at.desc()).limit(limit).all()
+    )
+    return _availability_responses(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=50)
+    parser.add_argument("--per-field", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+    limit = min(args.fields * args.per_field, 500)
+
+    _seed(args.fields, args.per_field)
+    db = SessionLocal()
+    try:
+        for label, build in (("per-row", _per_row), ("joined", _joined)):
+            samples = []
+            for _ in range(args.samples):
+                with profile_queries() as profile, timer() as t:
+                    responses = build(db, limit)
+                samples.append(t["ms"])
+                db.expunge_all()
+            assert len(responses) == limit
+            print(summarize(f"{label} rows={limit} queries={profile.count}", samples))
+    finally:
+        db.close()
+        _cleanup()
+
+
+if __name__ == "__main__":
+    main()
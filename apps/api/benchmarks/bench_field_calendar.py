@@ -0,0 +1,165 @@
+"""Micro-benchmark: slot queries, rule re-expansion + FieldBookingIndex vs FieldCalendar bitmaps.
+
+Generates a synthetic season (no database): F fields, each with a few
+recurring weekly windows and one-off dates, a handful of blackouts, and game
+bookings filling --fill of every window. Then answers two kinds of question
+both ways:
+
+- "is [start, start + 60min) free on this field?" for random 5-minute starts
+  — baseline re-expands the field's rules for that date (is the slot inside
+  an applicable window?) and checks blackouts and bookings with
+  FieldBookingIndex; the calendar ANDs one mask
+- "which windows of >= 60 min are free, per date, for the whole season?"
+  — baseline expands rules per date, merges windows and drops any window
+  touching a booking (the pre-calendar behaviour); the calendar scans runs
+  of free bits
+
+    python -m benchmarks.bench_field_calendar
+    python -m benchmarks.bench_field_calendar --fields 50 --weeks 52 --queries 200000
+"""
+
+import argparse
+import random
+import uuid
+from datetime import date, datetime, timedelta, time as dt_time
+from types import SimpleNamespace
+
+from benchmarks._booking_index import FieldBookingIndex
+from benchmarks._common import ensure_test_env, timer
+
+ensure_test_env()
+
+from app.services.field_calendar import FieldCalendar  # noqa: E402
+
+_SEASON_START = date(2026, 3, 2)
+
+
+def _season(fields: int, weeks: int, fill: float, seed: int):
+    rng = random.Random(seed)
+    rules, blackouts, bookings = [], [], []
+    season_end = _SEASON_START + timedelta(weeks=weeks)
+    for _ in range(fields):
+        field_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+        for weekday in rng.sample(range(7), 3):
+            start_hour = rng.choice([8, 9, 17, 18])
+            rules.append(SimpleNamespace(
+                id=uuid.uuid4(), field_id=field_id, is_recurring=True, day_of_week=weekday,
+                recurrence_start_date=_SEASON_START, recurrence_end_date=None, custom_date=None,
+                start_time=dt_time(start_hour), end_time=dt_time(start_hour + 4), is_active=True,
+            ))
+        for _ in range(4):
+            day = _SEASON_START + timedelta(days=rng.randrange(weeks * 7))
+            rules.append(SimpleNamespace(
+                id=uuid.uuid4(), field_id=field_id, is_recurring=False, day_of_week=None,
+                recurrence_start_date=None, recurrence_end_date=None, custom_date=day,
+                start_time=dt_time(10), end_time=dt_time(16), is_active=True,
+            ))
+        for _ in range(3):
+            start = datetime.combine(_SEASON_START + timedelta(days=rng.randrange(weeks * 7)), dt_time(0))
+            blackouts.append((field_id, start, start + timedelta(days=rng.randint(1, 3))))
+        day = _SEASON_START
+        while day < season_end:
+            for hour in range(8, 22):
+                if rng.random() < fill:
+                    start = datetime.combine(day, dt_time(hour))
+                    bookings.append((field_id, start, start + timedelta(minutes=60)))
+            day += timedelta(days=1)
+    return rules, blackouts, bookings, season_end - timedelta(days=1)
+
+
+def _applies(rule, day: date) -> bool:
+    if not rule.is_recurring:
+        return rule.custom_date == day
+    return day.weekday() == rule.day_of_week and day >= rule.recurrence_start_date
+
+
+def _baseline_is_free(rules_by_field, blocked: FieldBookingIndex, booked: FieldBookingIndex, field_id, start, end):
+    day = start.date()
+    inside = any(
+        _applies(rule, day)
+        and datetime.combine(day, rule.start_time) <= start and end <= datetime.combine(day, rule.end_time)
+        for rule in rules_by_field[field_id]
+    )
+    return inside and not blocked.overlaps(field_id, start, end) and not booked.overlaps(field_id, start, end)
+
+
+def _baseline_windows(rules_by_field, blocked, booked, start_date, end_date, min_minutes):
+    result = {}
+    day = start_date
+    while day <= end_date:
+        windows = []
+        for field_id, rules in rules_by_field.items():
+            for rule in rules:
+                if not _applies(rule, day):
+                    continue
+                s, e = datetime.combine(day, rule.start_time), datetime.combine(day, rule.end_time)
+                if (e - s) >= timedelta(minutes=min_minutes) and not blocked.overlaps(field_id, s, e) \
+                        and not booked.overlaps(field_id, s, e):
+                    windows.append((field_id, rule.start_time, rule.end_time))
+        if windows:
+            result[day] = sorted(windows)
+        day += timedelta(days=1)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=50)
+    parser.add_argument("--weeks", type=int, default=26)
+    parser.add_argument("--fill", type=float, default=0.3, help="share of hours booked")
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rules, blackouts, bookings, season_end = _season(args.fields, args.weeks, args.fill, args.seed)
+    field_ids = sorted({rule.field_id for rule in rules})
+    print(f"{args.fields} fields × {args.weeks} weeks: {len(rules)} rules, "
+          f"{len(blackouts)} blackouts, {len(bookings)} bookings")
+
+    with timer() as t_index:
+        rules_by_field = {field_id: [] for field_id in field_ids}
+        for rule in rules:
+            rules_by_field[rule.field_id].append(rule)
+        blocked, booked = FieldBookingIndex(), FieldBookingIndex()
+        for field_id, start, end in blackouts:
+            blocked.add(field_id, start, end)
+        for field_id, start, end in bookings:
+            booked.add(field_id, start, end)
+    with timer() as t_calendar:
+        calendar = FieldCalendar(field_ids, _SEASON_START, season_end)
+        for rule in rules:
+            calendar.add_availability(rule)
+        for field_id, start, end in blackouts:
+            calendar.add_blackout(field_id, start, end)
+        for field_id, start, end in bookings:
+            calendar.book(field_id, start, end)
+    print(f"{'build: rules + indexes':<28} {t_index['ms']:10.1f}ms")
+    print(f"{'build: FieldCalendar':<28} {t_calendar['ms']:10.1f}ms")
+
+    rng = random.Random(args.seed + 1)
+    queries = []
+    for _ in range(args.queries):
+        day = _SEASON_START + timedelta(days=rng.randrange(args.weeks * 7))
+        start = datetime.combine(day, dt_time(7)) + timedelta(minutes=5 * rng.randrange(0, 170))
+        queries.append((rng.choice(field_ids), start, start + timedelta(minutes=60)))
+
+    with timer() as t_base:
+        base_hits = sum(_baseline_is_free(rules_by_field, blocked, booked, *q) for q in queries)
+    with timer() as t_cal:
+        cal_hits = sum(calendar.is_free(*q) for q in queries)
+    per_q = lambda ms: ms * 1000 / len(queries)  # noqa: E731
+    print(f"{'is_free: re-expand + index':<28} {t_base['ms']:10.1f}ms  {per_q(t_base['ms']):8.2f}µs/query  ({base_hits} free)")
+    print(f"{'is_free: calendar':<28} {t_cal['ms']:10.1f}ms  {per_q(t_cal['ms']):8.2f}µs/query  ({cal_hits} free)")
+
+    with timer() as t_base:
+        base_windows = _baseline_windows(rules_by_field, blocked, booked, _SEASON_START, season_end, 60)
+    with timer() as t_cal:
+        cal_windows = calendar.windows_by_date(60)
+    print(f"{'season windows: re-expand':<28} {t_base['ms']:10.1f}ms  "
+          f"({sum(map(len, base_windows.values()))} whole windows free)")
+    print(f"{'season windows: calendar':<28} {t_cal['ms']:10.1f}ms  "
+          f"({sum(map(len, cal_windows.values()))} free runs, partly booked windows included)")
+
+
+if __name__ == "__main__":
+    main()
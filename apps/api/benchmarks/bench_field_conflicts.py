@@ -0,0 +1,107 @@
+"""Micro-benchmark: field booking conflict checks, linear scan vs FieldBookingIndex.
+
+Generates a dense synthetic season (no database): F fields × W weekly game
+days, each day packed with back-to-back bookings from 08:00 to 22:00. Then
+asks "does this window overlap a booking?" for every availability window a
+schedule-generation run would probe, once with the pre-index linear scan over
+the field's bookings and once with the sorted-boundary index.
+
+    python -m benchmarks.bench_field_conflicts
+    python -m benchmarks.bench_field_conflicts --fields 50 --weeks 52 --game-minutes 30
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from benchmarks._booking_index import FieldBookingIndex
+from benchmarks._common import ensure_test_env, timer
+
+ensure_test_env()
+
+
+def _season(fields: int, weeks: int, game_minutes: int, fill: float, seed: int):
+    """Return {field_id: [(start, end), ...]} for a dense season."""
+    rng = random.Random(seed)
+    season_start = datetime(2026, 1, 3)
+    bookings = {}
+    for _ in range(fields):
+        field_id = uuid4()
+        rows = []
+        for week in range(weeks):
+            day = season_start + timedelta(weeks=week)
+            t = day.replace(hour=8)
+            close = day.replace(hour=22)
+            while t + timedelta(minutes=game_minutes) <= close:
+                if rng.random() < fill:
+                    rows.append((t, t + timedelta(minutes=game_minutes)))
+                t += timedelta(minutes=game_minutes)
+        rng.shuffle(rows)
+        bookings[field_id] = rows
+    return bookings
+
+
+def _queries(bookings, weeks: int, per_day: int, seed: int):
+    rng = random.Random(seed + 1)
+    season_start = datetime(2026, 1, 3)
+    out = []
+    for field_id in bookings:
+        for week in range(weeks):
+            day = season_start + timedelta(weeks=week)
+            for _ in range(per_day):
+                start = day.replace(hour=8) + timedelta(minutes=5 * rng.randrange(0, 160))
+                out.append((field_id, start, start + timedelta(minutes=60)))
+    return out
+
+
+def _linear(bookings, queries) -> int:
+    hits = 0
+    for field_id, start, end in queries:
+        for b_start, b_end in bookings.get(field_id, []):
+            if not (end <= b_start or start >= b_end):
+                hits += 1
+                break
+    return hits
+
+
+def _indexed(index: FieldBookingIndex, queries) -> int:
+    return sum(1 for field_id, start, end in queries if index.overlaps(field_id, start, end))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=50)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--game-minutes", type=int, default=60)
+    parser.add_argument("--fill", type=float, default=0.9, help="fraction of slots booked")
+    parser.add_argument("--queries-per-day", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    bookings = _season(args.fields, args.weeks, args.game_minutes, args.fill, args.seed)
+    queries = _queries(bookings, args.weeks, args.queries_per_day, args.seed)
+    n_bookings = sum(len(v) for v in bookings.values())
+    print(f"{args.fields} fields × {args.weeks} weeks: {n_bookings} bookings, {len(queries)} overlap queries")
+
+    with timer() as t_build:
+        index = FieldBookingIndex()
+        for field_id, rows in bookings.items():
+            for start, end in rows:
+                index.add(field_id, start, end)
+        index.overlaps(next(iter(bookings)), datetime(2026, 1, 1), datetime(2026, 1, 1, 1))
+    with timer() as t_linear:
+        linear_hits = _linear(bookings, queries)
+    with timer() as t_index:
+        index_hits = _indexed(index, queries)
+
+    assert linear_hits == index_hits, (linear_hits, index_hits)
+    per_q = lambda ms: ms * 1000 / len(queries)  # noqa: E731
+    print(f"{'linear scan':<20} {t_linear['ms']:10.1f}ms  {per_q(t_linear['ms']):8.2f}µs/query")
+    print(f"{'FieldBookingIndex':<20} {t_index['ms']:10.1f}ms  {per_q(t_index['ms']):8.2f}µs/query"
+          f"  (+{t_build['ms']:.1f}ms build)")
+    print(f"speedup: {t_linear['ms'] / max(t_index['ms'], 1e-9):.1f}×  ({index_hits} conflicts found)")
+
+
+if __name__ == "__main__":
+    main()
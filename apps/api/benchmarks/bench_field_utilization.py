@@ -0,0 +1,146 @@
+"""Micro-benchmark: season-wide field utilization, per-hour loop vs SWAR hour lanes.
+
+Generates a synthetic year (no database): F fields, each open a few evenings
+a week plus weekend days, with games filling --fill of the open hours, some
+double bookings and a few blackouts. Then reduces the FieldCalendar to the
+analytics arrays two ways:
+
+- per-hour loop: for every non-empty field-day, 24 shift/mask/bit_count
+  steps per layer (what a straightforward per-day report would do)
+- summarize_calendar: one SWAR fold per layer per field-day, summed per
+  weekday, unpacked once per field
+
+and times the whole request path without the database — calendar build,
+summary, response model and JSON — against the 200 ms target.
+
+    python -m benchmarks.bench_field_utilization
+    python -m benchmarks.bench_field_utilization --fields 30 --days 365 --fill 0.6
+"""
+
+import argparse
+import random
+import uuid
+from datetime import date, datetime, timedelta, time as dt_time
+from types import SimpleNamespace
+
+from benchmarks._common import ensure_test_env, timer
+
+ensure_test_env()
+
+from app.api.schemas.admin import FieldUtilizationReportResponse, FieldUtilizationResponse  # noqa: E402
+from app.services.field_calendar import SLOT_MINUTES, FieldCalendar  # noqa: E402
+from app.services.field_utilization_service import summarize_calendar  # noqa: E402
+
+_START = date(2026, 1, 1)
+
+
+def _year(fields: int, days: int, fill: float, seed: int):
+    rng = random.Random(seed)
+    field_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(fields)]
+    rules, blackouts, games = [], [], []
+    for field_id in field_ids:
+        for weekday in range(7):
+            start, end = (9, 21) if weekday >= 5 else (17, 22)
+            rules.append(SimpleNamespace(
+                id=uuid.uuid4(), field_id=field_id, is_recurring=True, day_of_week=weekday,
+                recurrence_start_date=None, recurrence_end_date=None, custom_date=None,
+                start_time=dt_time(start), end_time=dt_time(end), is_active=True,
+            ))
+        for _ in range(3):
+            start = datetime.combine(_START + timedelta(days=rng.randrange(days)), dt_time())
+            blackouts.append((field_id, start, start + timedelta(days=rng.randint(1, 3))))
+        for offset in range(days):
+            day = _START + timedelta(days=offset)
+            first, last = (9, 21) if day.weekday() >= 5 else (17, 22)
+            for hour in range(first, last):
+                if rng.random() < fill:
+                    start = datetime.combine(day, dt_time(hour, rng.choice([0, 0, 0, 30])))
+                    games.append((field_id, start, 60))
+    return field_ids, rules, blackouts, games
+
+
+def _per_hour_loop(calendar: FieldCalendar, field_ids):
+    """Same grids, one bit_count per hour per layer per field-day."""
+    out = []
+    first_weekday = calendar.start_date.weekday()
+    for field_id in field_ids:
+        available_grid = [[0] * 24 for _ in range(7)]
+        booked_grid = [[0] * 24 for _ in range(7)]
+        for i, open_, blocked, busy, _overlap in calendar.day_masks(field_id):
+            available = open_ & ~blocked
+            booked = busy & available
+            row_a, row_b = available_grid[(first_weekday + i) % 7], booked_grid[(first_weekday + i) % 7]
+            for hour in range(24):
+                row_a[hour] += ((available >> (12 * hour)) & 0xFFF).bit_count() * SLOT_MINUTES
+                row_b[hour] += ((booked >> (12 * hour)) & 0xFFF).bit_count() * SLOT_MINUTES
+        out.append((available_grid, booked_grid))
+    return out
+
+
+def _response(start_date, end_date, results) -> str:
+    report = FieldUtilizationReportResponse(
+        start_date=start_date, end_date=end_date, slot_minutes=SLOT_MINUTES,
+        fields=[
+            FieldUtilizationResponse(
+                field_id=r.field_id, field_name=r.field_name,
+                available_minutes=r.available_minutes, booked_minutes=r.booked_minutes,
+                idle_minutes=r.idle_minutes, blocked_minutes=r.blocked_minutes,
+                conflict_minutes=r.conflict_minutes, double_booked_minutes=r.double_booked_minutes,
+                utilization=round(r.utilization, 4),
+                hourly_available_minutes=r.hourly_available_minutes,
+                hourly_booked_minutes=r.hourly_booked_minutes,
+                hourly_utilization=[[None if u is None else round(u, 4) for u in row] for row in r.hourly_utilization],
+                daily_available_minutes=r.daily_available_minutes,
+                daily_booked_minutes=r.daily_booked_minutes,
+                risks=[dict(date=k.day, start_time=k.start_time, end_time=k.end_time, kind=k.kind) for k in r.risks],
+                risks_truncated=r.risks_truncated,
+            )
+            for r in results
+        ],
+    )
+    return report.model_dump_json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=30)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--fill", type=float, default=0.5, help="share of open hours with a game")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    field_ids, rules, blackouts, games = _year(args.fields, args.days, args.fill, args.seed)
+    end_date = _START + timedelta(days=args.days - 1)
+    print(f"{args.fields} fields × {args.days} days: {len(rules)} rules, "
+          f"{len(blackouts)} blackouts, {len(games)} games")
+
+    best = {}
+    for _ in range(args.repeat):
+        with timer() as t_build:
+            calendar = FieldCalendar(field_ids, _START, end_date)
+            for rule in rules:
+                calendar.add_availability(rule)
+            for field_id, start, end in blackouts:
+                calendar.add_blackout(field_id, start, end)
+            calendar.book_games(games)
+        with timer() as t_loop:
+            grids = _per_hour_loop(calendar, field_ids)
+        with timer() as t_swar:
+            results = summarize_calendar(calendar, [(field_id, "Field") for field_id in field_ids])
+        with timer() as t_json:
+            body = _response(_START, end_date, results)
+        for key, t in (("build", t_build), ("loop", t_loop), ("swar", t_swar), ("json", t_json)):
+            best[key] = min(best.get(key, t["ms"]), t["ms"])
+
+    assert [r.hourly_available_minutes for r in results] == [a for a, _ in grids]
+    assert [r.hourly_booked_minutes for r in results] == [b for _, b in grids]
+    print(f"{'calendar build':<28} {best['build']:10.1f}ms")
+    print(f"{'grids: per-hour loop':<28} {best['loop']:10.1f}ms")
+    print(f"{'summary: SWAR lanes':<28} {best['swar']:10.1f}ms  (grids + daily arrays + risk windows)")
+    print(f"{'response model + JSON':<28} {best['json']:10.1f}ms  ({len(body) / 1024:.0f} KiB)")
+    print(f"{'total without DB':<28} {best['build'] + best['swar'] + best['json']:10.1f}ms  (target 200ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark: admin user listing at depth, OFFSET vs keyset, exact vs estimated totals.
+
+Seeds --players active players (default 100k) with spread-out created_at
+values, runs ANALYZE so the planner has statistics, then times fetching a
+25-row page at increasing depths:
+
+- offset  — ORDER BY created_at DESC OFFSET n (the old admin listing)
+- keyset  — WHERE (created_at, id) < cursor (app.core.pagination.keyset_page),
+            with the cursor for that depth taken up front
+
+and the per-page total both ways (COUNT(*) vs the planner's estimate).
+Needs the ix_players_active_created_at_id index (alembic upgrade head).
+
+    python -m benchmarks.bench_keyset_pagination
+    python -m benchmarks.bench_keyset_pagination --players 20000 --samples 50
+"""
+
+import argparse
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks._common import ensure_test_env, summarize, timer
+
+ensure_test_env()
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from app.core.pagination import count_rows, encode_cursor, keyset_page  # noqa: E402
+from app.db.db import SessionLocal  # noqa: E402
+from app.models.player import Player  # noqa: E402
+
+_BENCH_CREATOR = "bench-keyset-pagination"
+_PAGE_SIZE = 25
+
+
+def _seed(n_players: int) -> None:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    db = SessionLocal()
+    try:
+        for offset in range(0, n_players, 5000):
+            db.execute(insert(Player), [
+                {
+                    "id": uuid.uuid4(),
+                    "clerk_user_id": f"{_BENCH_CREATOR}-{i}",
+                    "first_name": "Bench",
+                    "last_name": f"Player{i}",
+                    "email": f"bench{i}@example.com",
+                    "created_by": _BENCH_CREATOR,
+                    "is_active": True,
+                    # Pairs share a timestamp so the id tie-breaker is exercised
+                    "created_at": start + timedelta(seconds=i // 2),
+                }
+                for i in range(offset, min(offset + 5000, n_players))
+            ])
+        db.commit()
+        db.execute(text("ANALYZE players"))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _cleanup() -> None:
+    db = SessionLocal()
+    try:
+        db.query(Player).filter(Player.created_by == _BENCH_CREATOR).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _active(db):
+    return db.query(Player).filter(Player.is_active == True)
+
+
+def _cursor_at(db, depth: int) -> str | None:
+    if depth == 0:
+        return None
+    row = (
+        _active(db).order_by(Player.created_at.desc(), Player.id.desc())
+        .offset(depth - 1).limit(1).one()
+    )
+    return encode_cursor(row.created_at, row.id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--samples", type=int, default=20, help="timed fetches per depth")
+    args = parser.parse_args()
+
+    _seed(args.players)
+    db = SessionLocal()
+    try:
+        depths = [d for d in (0, 1_000, 10_000, 50_000, args.players - _PAGE_SIZE) if 0 <= d < args.players]
+        for depth in depths:
+            cursor = _cursor_at(db, depth)
+            offset_ms, keyset_ms = [], []
+            for _ in range(args.samples):
+                with timer() as t:
+                    offset_rows = (
+                        _active(db).order_by(Player.created_at.desc(), Player.id.desc())
+                        .offset(depth).limit(_PAGE_SIZE).all()
+                    )
+                offset_ms.append(t["ms"])
+                with timer() as t:
+                    page = keyset_page(_active(db), Player, cursor, _PAGE_SIZE)
+                keyset_ms.append(t["ms"])
+                assert [p.id for p in page.items] == [p.id for p in offset_rows]
+                db.expunge_all()
+            print(summarize(f"offset  depth={depth}", offset_ms))
+            print(summarize(f"keyset  depth={depth}", keyset_ms))
+
+        for mode in ("exact", "estimated"):
+            samples = []
+            for _ in range(args.samples):
+                with timer() as t:
+                    total = count_rows(db, _active(db), mode)
+                samples.append(t["ms"])
+            print(summarize(f"total {mode}={total}", samples))
+    finally:
+        db.close()
+        _cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark: exporting a large league roster, in-memory list vs streamed CSV/NDJSON.
+
+Seeds benchmarks.player_dataset into a single league (default 50k members)
+and measures, for each way of producing the roster body:
+
+- list: what GET /admin/leagues/{id}/members does with limit lifted — load
+  LeaguePlayer rows, batch-load their players (the dataset has no groups or
+  teams), build LeagueMemberResponse objects, then serialize the whole list
+  to JSON
+- stream csv / stream ndjson: league_export_service.iter_export over a
+  server-side cursor (yield_per)
+
+time to first byte, total time and peak Python memory (tracemalloc, measured
+in a separate pass so it does not skew the timings). Streaming memory should
+stay flat as --players grows; the list grows with it.
+
+    python -m benchmarks.bench_league_export
+    python -m benchmarks.bench_league_export --players 200000 --keep
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from benchmarks._common import ensure_test_env, timer
+from benchmarks import player_dataset
+
+ensure_test_env()
+
+from app.api.schemas.admin import LeagueMemberResponse  # noqa: E402
+from app.db.db import SessionLocal  # noqa: E402
+from app.models.league_player import LeaguePlayer  # noqa: E402
+from app.models.player import Player  # noqa: E402
+from app.services.league_export_service import iter_export, load_roster_export  # noqa: E402
+
+
+def _list_body(db, league_id):
+    league_players = db.query(LeaguePlayer).filter(
+        LeaguePlayer.league_id == league_id, LeaguePlayer.is_active == True,
+    ).all()
+    players_by_id = {
+        p.id: p for p in db.query(Player).filter(Player.id.in_([lp.player_id for lp in league_players])).all()
+    }
+    members = [
+        LeagueMemberResponse(
+            id=lp.id, player_id=lp.player_id, first_name=players_by_id[lp.player_id].first_name,
+            last_name=players_by_id[lp.player_id].last_name, email=players_by_id[lp.player_id].email,
+            group_id=None, group_name=None, team_id=None, team_name=None,
+            registration_status=lp.registration_status, payment_status=lp.payment_status,
+            waiver_status=lp.waiver_status, created_at=lp.created_at,
+        )
+        for lp in league_players
+    ]
+    yield json.dumps([m.model_dump(mode="json") for m in members]).encode()
+
+
+def _stream_body(db, league_id, fmt):
+    yield from iter_export(db, load_roster_export(db, league_id, fmt))
+
+
+def _measure(body):
+    """(first byte ms, total ms, bytes) for draining a body iterator."""
+    size, first = 0, None
+    start = time.perf_counter()
+    for chunk in body:
+        if first is None:
+            first = (time.perf_counter() - start) * 1000
+        size += len(chunk)
+    return first or 0.0, (time.perf_counter() - start) * 1000, size
+
+
+def _peak_mib(body) -> float:
+    tracemalloc.start()
+    try:
+        for _ in body:
+            pass
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="leave the dataset in place afterwards")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        player_dataset.drop(db)
+        with timer() as t_seed:
+            dataset = player_dataset.seed(db, args.players, n_leagues=1, registrations_per_player=1.0, seed=args.seed)
+        league_id = dataset.league_ids[0]
+        members = db.query(LeaguePlayer).filter(LeaguePlayer.league_id == league_id).count()
+        print(f"{members} members in one league (seeded in {t_seed['ms'] / 1000:.1f}s)")
+
+        cases = {
+            "list (JSON array)": lambda: _list_body(db, league_id),
+            "stream csv": lambda: _stream_body(db, league_id, "csv"),
+            "stream ndjson": lambda: _stream_body(db, league_id, "ndjson"),
+        }
+        for label, body in cases.items():
+            first_ms, total_ms, size = _measure(body())
+            db.rollback()
+            db.expunge_all()
+            peak = _peak_mib(body())
+            db.rollback()
+            db.expunge_all()
+            print(f"{label:<20} first byte {first_ms:9.1f}ms  total {total_ms:9.1f}ms  "
+                  f"{size / 2**20:7.1f} MiB body  peak {peak:7.1f} MiB")
+    finally:
+        if not args.keep:
+            player_dataset.drop(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
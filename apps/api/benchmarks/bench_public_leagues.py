@@ -0,0 +1,121 @@
+"""Load benchmark: GET /league/public/leagues via sync Session vs AsyncSession.
+
+Both routes run the same `list_public_leagues` query builder. The sync route
+calls it with a blocking `SessionLocal()` inside `async def` (the pre-async
+behaviour), so every DB round trip stalls the event loop; the async route goes
+through `AsyncSession.run_sync` on the asyncpg engine.
+
+    python -m benchmarks.bench_public_leagues --concurrency 200 --rounds 5
+    python -m benchmarks.bench_public_leagues --slow-ms 20   # add pg_sleep per request
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from benchmarks._common import ensure_test_env, summarize, timer
+
+ensure_test_env()
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app.api.league import list_public_leagues  # noqa: E402
+from app.db.db import SessionLocal, get_async_db, async_engine  # noqa: E402
+from app.models.league import League  # noqa: E402
+
+_BENCH_PREFIX = "bench-public-leagues-"
+
+
+def _seed(n_leagues: int) -> None:
+    db = SessionLocal()
+    try:
+        for i in range(n_leagues):
+            db.add(League(
+                name=f"{_BENCH_PREFIX}{i}",
+                start_date=date(2026, 6, 1),
+                num_weeks=8,
+                format="7v7",
+                tournament_format="round_robin",
+                max_teams=8,
+                created_by="bench",
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _cleanup() -> None:
+    db = SessionLocal()
+    try:
+        db.query(League).filter(League.name.like(f"{_BENCH_PREFIX}%")).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _build_app(slow_ms: int) -> FastAPI:
+    bench_app = FastAPI()
+    sleep_sql = text("SELECT pg_sleep(:s)")
+
+    def _query(db, limit: int):
+        if slow_ms:
+            db.execute(sleep_sql, {"s": slow_ms / 1000})
+        return list_public_leagues(db, 0, limit).items
+
+    @bench_app.get("/sync")
+    async def sync_path(limit: int = 50):
+        db = SessionLocal()
+        try:
+            return _query(db, limit)
+        finally:
+            db.close()
+
+    @bench_app.get("/async")
+    async def async_path(limit: int = 50, db: AsyncSession = Depends(get_async_db)):
+        return await db.run_sync(_query, limit)
+
+    return bench_app
+
+
+async def _run(path: str, client: httpx.AsyncClient, concurrency: int, rounds: int) -> list[float]:
+    samples: list[float] = []
+
+    async def _one():
+        with timer() as t:
+            resp = await client.get(path)
+        resp.raise_for_status()
+        samples.append(t["ms"])
+
+    # Warm-up round so pool connections exist before measuring
+    await asyncio.gather(*[_one() for _ in range(min(concurrency, 10))])
+    samples.clear()
+    for _ in range(rounds):
+        await asyncio.gather(*[_one() for _ in range(concurrency)])
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--leagues", type=int, default=50, help="leagues to seed")
+    parser.add_argument("--slow-ms", type=int, default=0, help="extra pg_sleep per request")
+    args = parser.parse_args()
+
+    _seed(args.leagues)
+    try:
+        transport = httpx.ASGITransport(app=_build_app(args.slow_ms))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            for label, path in (("sync Session", "/sync"), ("AsyncSession (asyncpg)", "/async")):
+                samples = await _run(path, client, args.concurrency, args.rounds)
+                print(summarize(f"{label} c={args.concurrency}", samples))
+    finally:
+        await async_engine.dispose()
+        _cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""Micro-benchmark: Swiss round pairing latency (no database).
+
+Simulates a Swiss tournament with random results and times
+pair_swiss_round for every round, repeated over several seeds.
+
+    python -m benchmarks.bench_swiss_pairing
+    python -m benchmarks.bench_swiss_pairing --teams 64 --rounds 10 --tiebreak sonneborn_berger
+"""
+
+import argparse
+import random
+from types import SimpleNamespace
+from uuid import uuid4
+
+from benchmarks._common import ensure_test_env, summarize, timer
+
+ensure_test_env()
+
+from app.services.swiss_service import SWISS_TIEBREAKS, compute_swiss_records, pair_swiss_round  # noqa: E402
+
+
+def _run_tournament(teams: int, rounds: int, tiebreak: str, seed: int):
+    rng = random.Random(seed)
+    team_ids = [uuid4() for _ in range(teams)]
+    games = []
+    pair_ms, records_ms = [], []
+    rematches = 0
+    for week in range(1, rounds + 1):
+        with timer() as t_rec:
+            records = compute_swiss_records(team_ids, games)
+        with timer() as t_pair:
+            pairing = pair_swiss_round(records, tiebreak)
+        records_ms.append(t_rec["ms"])
+        pair_ms.append(t_pair["ms"])
+        rematches += pairing.rematches
+        for a, b in pairing.pairings:
+            s1, s2 = rng.randint(0, 35), rng.randint(0, 35)
+            winner = a if s1 > s2 else b if s2 > s1 else None
+            games.append(SimpleNamespace(
+                team1_id=a, team2_id=b, week=week, status="completed",
+                team1_score=s1, team2_score=s2, winner_id=winner,
+            ))
+    return pair_ms, records_ms, rematches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seeds", type=int, default=20, help="tournaments to simulate")
+    parser.add_argument("--tiebreak", choices=SWISS_TIEBREAKS, default="buchholz")
+    args = parser.parse_args()
+
+    pair_ms, records_ms = [], []
+    rematches = 0
+    for seed in range(args.seeds):
+        p, r, m = _run_tournament(args.teams, args.rounds, args.tiebreak, seed)
+        pair_ms += p
+        records_ms += r
+        rematches += m
+
+    print(f"{args.teams} teams × {args.rounds} rounds × {args.seeds} tournaments ({args.tiebreak})")
+    print(summarize("pair_swiss_round", pair_ms))
+    print(summarize("compute_swiss_records", records_ms))
+    print(f"rematches forced: {rematches}")
+
+
+if __name__ == "__main__":
+    main()
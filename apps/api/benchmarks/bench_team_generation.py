@@ -0,0 +1,116 @@
+"""Micro-benchmark: team generation on large leagues (no database).
+
+Builds a synthetic league of registration groups and solo players and packs
+it with the previous greedy assignment (groups first into the emptiest team,
+then solo players) and with team_balancer.balance_teams. Reports latency plus
+quality: team-size spread, groups split, and the worst per-team gender skew.
+
+    python -m benchmarks.bench_team_generation
+    python -m benchmarks.bench_team_generation --players 2000 --teams 140 --no-balance-gender
+"""
+
+import argparse
+import random
+from collections import Counter
+
+from benchmarks._common import ensure_test_env, summarize, timer
+
+ensure_test_env()
+
+from app.services.team_balancer import balance_teams  # noqa: E402
+
+
+def _league(players: int, group_share: float, seed: int):
+    """(players_by_group, ungrouped) with group sizes 2–6 and a 60/40 gender mix."""
+    rng = random.Random(seed)
+
+    def player(i):
+        return {"id": i, "gender": "male" if rng.random() < 0.6 else "female"}
+
+    groups, ungrouped = {}, []
+    i = 0
+    grouped_target = int(players * group_share)
+    while i < grouped_target:
+        size = min(rng.randint(2, 6), grouped_target - i)
+        groups[f"g{i}"] = [player(i + k) for k in range(size)]
+        i += size
+    ungrouped = [player(k) for k in range(i, players)]
+    return groups, ungrouped
+
+
+def _legacy_assign(players_by_group, ungrouped, teams_count):
+    """The pre-balancer algorithm from team_generation_service."""
+    total = sum(len(g) for g in players_by_group.values()) + len(ungrouped)
+    per_team = total // teams_count
+    teams = [[] for _ in range(teams_count)]
+    split = 0
+
+    def smallest():
+        return min(range(teams_count), key=lambda t: len(teams[t]))
+
+    for group in players_by_group.values():
+        best = None
+        if len(group) <= per_team:
+            fits = [t for t in range(teams_count) if len(teams[t]) + len(group) <= per_team]
+            best = min(fits, key=lambda t: len(teams[t])) if fits else None
+        if best is not None:
+            teams[best].extend(group)
+        else:
+            split += 1
+            for p in group:
+                teams[smallest()].append(p)
+    for p in ungrouped:
+        teams[smallest()].append(p)
+    return teams, split
+
+
+def _quality(teams):
+    sizes = [len(t) for t in teams]
+    total_female = sum(p["gender"] == "female" for t in teams for p in t)
+    mean_female = total_female / len(teams)
+    skew = max(abs(Counter(p["gender"] for p in t)["female"] - mean_female) for t in teams)
+    return max(sizes) - min(sizes), skew
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--teams", type=int, default=140)
+    parser.add_argument("--group-share", type=float, default=0.4, help="fraction of players in groups")
+    parser.add_argument("--seeds", type=int, default=10, help="leagues to generate")
+    parser.add_argument("--no-balance-gender", action="store_true")
+    args = parser.parse_args()
+
+    balance_key = None if args.no_balance_gender else (lambda p: p["gender"])
+    capacity = -(-args.players // args.teams)
+
+    legacy_ms, balanced_ms = [], []
+    legacy_q, balanced_q = [], []
+    for seed in range(args.seeds):
+        groups, ungrouped = _league(args.players, args.group_share, seed)
+
+        with timer() as t:
+            teams, split = _legacy_assign(groups, ungrouped, args.teams)
+        legacy_ms.append(t["ms"])
+        legacy_q.append((*_quality(teams), split))
+
+        with timer() as t:
+            result = balance_teams(groups, ungrouped, args.teams, capacity, balance_key=balance_key, seed=seed)
+        balanced_ms.append(t["ms"])
+        balanced_q.append((*_quality(result.teams), result.groups_split))
+
+    print(f"{args.players} players → {args.teams} teams (capacity {capacity}), "
+          f"{args.group_share:.0%} grouped, {args.seeds} leagues")
+    for label, samples, quality in (
+        ("legacy greedy", legacy_ms, legacy_q),
+        ("balance_teams", balanced_ms, balanced_q),
+    ):
+        print(summarize(label, samples))
+        spread = max(q[0] for q in quality)
+        skew = max(q[1] for q in quality)
+        split = sum(q[2] for q in quality) / len(quality)
+        print(f"    worst size spread {spread}, worst female skew {skew:.2f}, mean groups split {split:.1f}")
+
+
+if __name__ == "__main__":
+    main()
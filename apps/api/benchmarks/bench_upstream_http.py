@@ -0,0 +1,174 @@
+"""Micro-benchmark: JWKS and Clerk email lookup latency, client per call vs the shared pool.
+
+Serves a JWKS document and a Clerk-style /v1/users/<id> endpoint over TLS
+from a local thread (self-signed certificate, no network). --rtt-ms adds a
+simulated round trip to every request and two more to every new connection
+(TCP + TLS 1.3 handshakes), so the numbers approximate a real upstream.
+The local server speaks HTTP/1.1 only, so this measures keep-alive reuse,
+not HTTP/2 multiplexing.
+Each lookup is timed three ways:
+
+- new client per call — the old code: open httpx.AsyncClient, request, close
+- shared pool, cold — first call on a fresh SharedHTTPClient (cold start)
+- shared pool, warm — later calls reusing the keep-alive connection
+
+    python -m benchmarks.bench_upstream_http
+    python -m benchmarks.bench_upstream_http --requests 100 --rtt-ms 0
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import json
+import os
+import ssl
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks._common import ensure_test_env, summarize, timer
+
+_USER = {
+    "id": "user_bench",
+    "email_addresses": [{"id": "idn_1", "email_address": "bench@example.com"}],
+    "primary_email_address_id": "idn_1",
+}
+
+
+def _self_signed_cert(directory: str) -> tuple[str, str]:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption(),
+        ))
+    return cert_path, key_path
+
+
+def _start_server(cert_path: str, key_path: str, rtt: float, jwks: dict) -> ThreadingHTTPServer:
+    tls = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    tls.load_cert_chain(cert_path, key_path)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+        wbufsize = 64 * 1024  # headers and body in one write
+
+        def setup(self):
+            time.sleep(2 * rtt)  # TCP + TLS handshakes
+            super().setup()
+
+        def do_GET(self):
+            time.sleep(rtt)
+            payload = jwks if self.path.endswith("jwks.json") else _USER
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class TLSServer(ThreadingHTTPServer):
+        daemon_threads = True
+
+        def get_request(self):
+            sock, addr = self.socket.accept()
+            return tls.wrap_socket(sock, server_side=True, do_handshake_on_connect=False), addr
+
+    server = TLSServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(label: str, samples_wanted: int, call) -> None:
+    samples = []
+    for _ in range(samples_wanted):
+        with timer() as t:
+            await call()
+        samples.append(t["ms"])
+    print(summarize(label, samples))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=20.0, help="simulated round trip to the upstream")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-upstream-")
+    cert_path, key_path = _self_signed_cert(workdir)
+    server = _start_server(cert_path, key_path, args.rtt_ms / 1000, jwks={"keys": []})
+    base = f"https://127.0.0.1:{server.server_address[1]}"
+    os.environ["CLERK_JWKS_URL"] = f"{base}/.well-known/jwks.json"
+    os.environ["CLERK_API_URL"] = base
+    ensure_test_env()
+
+    import httpx
+    from app.core.http_client import SharedHTTPClient
+    from app.utils import clerk_jwt
+
+    trust = ssl.create_default_context(cafile=cert_path)
+
+    def use_pool(pool):
+        clerk_jwt.http_client = pool
+
+    async def jwks_lookup():
+        clerk_jwt.JWKS_CACHE.update(keys=None, fetched_at=0, failed_at=0)
+        await clerk_jwt.get_jwks()
+
+    async def email_lookup():
+        await clerk_jwt._fetch_clerk_email_upstream("user_bench")
+
+    print(f"{args.requests} lookups per case, simulated RTT {args.rtt_ms:.0f}ms, HTTP/1.1")
+    for name, lookup, url in (
+        ("JWKS", jwks_lookup, os.environ["CLERK_JWKS_URL"]),
+        ("email", email_lookup, f"{base}/v1/users/user_bench"),
+    ):
+        async def per_call():
+            async with httpx.AsyncClient(timeout=5.0, verify=trust) as client:
+                (await client.get(url)).raise_for_status()
+
+        async def cold():
+            pool = SharedHTTPClient(http2=False, verify=trust)
+            use_pool(pool)
+            await lookup()
+            await pool.aclose()
+
+        await _run(f"{name}: new client per call", args.requests, per_call)
+        await _run(f"{name}: shared pool, cold", args.requests, cold)
+        pool = SharedHTTPClient(http2=False, verify=trust)
+        use_pool(pool)
+        await lookup()
+        await _run(f"{name}: shared pool, warm", args.requests, lookup)
+        await pool.aclose()
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""Micro-benchmark: signed waiver PDF renders per second (no database).
+
+Renders a ~5-page waiver for a stream of signers three ways: laying the body
+out from scratch each time (generate_waiver_pdf), stamping a cached
+WaiverTemplate, and stamping with names that need the full Unicode fonts.
+
+    python -m benchmarks.bench_waiver_pdf
+    python -m benchmarks.bench_waiver_pdf --renders 200 --paragraphs 40
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from benchmarks._common import ensure_test_env, summarize, timer
+
+ensure_test_env()
+
+from app.services.pdf_service import (  # noqa: E402
+    clear_waiver_templates,
+    generate_waiver_pdf,
+    get_waiver_template,
+    render_signed_waiver,
+)
+
+_PARAGRAPH = (
+    "I acknowledge that flag football involves running, cutting and incidental "
+    "contact — including collisions, falls and “accidental” blocks — and that "
+    "injuries can occur despite the rules against tackling. I voluntarily assume "
+    "all such risks, release the league, its organisers, referees and volunteers "
+    "from liability for ordinary negligence, and agree to follow the league's "
+    "safety rules, equipment requirements and the instructions of officials. "
+)
+_NAMES = ["Alex Johnson", "Zoë Martínez", "Søren Ødegaard", "Дмитрий Петров", "Łukasz Wróbel"]
+_FULL_FONT_NAMES = ["Jane ✓ Doe", "Sam ☆ Lee"]
+
+
+def _waiver_text(paragraphs: int) -> str:
+    return "\n\n".join(f"{i}. {_PARAGRAPH * 2}" for i in range(1, paragraphs + 1))
+
+
+def _run(label: str, renders: int, render) -> list:
+    samples = []
+    start = time.perf_counter()
+    for i in range(renders):
+        with timer() as t:
+            render(i)
+        samples.append(t["ms"])
+    elapsed = time.perf_counter() - start
+    print(f"{summarize(label, samples)}  {renders / elapsed:7.1f} renders/s")
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=50)
+    parser.add_argument("--paragraphs", type=int, default=26, help="waiver length (26 ≈ 5 pages)")
+    args = parser.parse_args()
+
+    content = _waiver_text(args.paragraphs)
+    signed_at = datetime(2026, 9, 1, 18, 30, tzinfo=timezone.utc)
+    waiver_id = uuid4()
+
+    sample = generate_waiver_pdf(content, "2026-v1", "Fall League", _NAMES[0], signed_at)
+    pages = len(re.findall(rb"/Type /Page\b", sample))
+    print(f"{pages}-page waiver, {len(content):,} characters, {args.renders} renders per case")
+
+    _run("layout every render", args.renders, lambda i: generate_waiver_pdf(
+        content, "2026-v1", "Fall League", _NAMES[i % len(_NAMES)], signed_at,
+    ))
+
+    clear_waiver_templates()
+    with timer() as t:
+        get_waiver_template(waiver_id, "Fall League", content, "2026-v1")
+    print(f"{'template build (once)':<28} {t['ms']:8.2f}ms")
+
+    def stamp(names):
+        def render(i):
+            template = get_waiver_template(waiver_id, "Fall League", content, "2026-v1")
+            render_signed_waiver(template, names[i % len(names)], signed_at)
+        return render
+
+    _run("cached template", args.renders, stamp(_NAMES))
+    _run("cached, full fonts", args.renders, stamp(_FULL_FONT_NAMES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Deterministic synthetic players, leagues and registrations for search/listing benchmarks.
+
+Names are drawn from common first/last name lists with a long tail of
+generated surnames, so prefixes are realistically skewed (many "Jo...", few
+"Zb..."). Emails mix name-based and handle-style addresses across a few
+domains; phones use assorted formats ("(555) 123-4567", "555.123.4567",
+"+1 555 123 4567", or none). Every seeded row is tagged with
+created_by=DATASET_TAG so it can be removed again.
+
+Used by the benchmarks, or on its own to fill a dev database:
+
+    python -m benchmarks.player_dataset --players 100000 --leagues 40
+    python -m benchmarks.player_dataset --drop
+"""
+
+import argparse
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterator, List
+
+from benchmarks._common import ensure_test_env
+
+DATASET_TAG = "bench-player-dataset"
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William", "Elizabeth",
+    "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Christopher", "Lisa", "Daniel", "Nancy", "Matthew", "Betty", "Anthony", "Sandra", "Mark", "Margaret",
+    "Donald", "Ashley", "Steven", "Kimberly", "Andrew", "Emily", "Paul", "Donna", "Joshua", "Michelle",
+    "Kenneth", "Carol", "Kevin", "Amanda", "Brian", "Melissa", "George", "Deborah", "Timothy", "Stephanie",
+    "Jonathan", "Rebecca", "Jose", "Sharon", "Juan", "Laura", "Luis", "Cynthia", "Carlos", "Dorothy",
+    "Wei", "Amy", "Priya", "Angela", "Mohammed", "Shirley", "Aaliyah", "Anna", "Zoe", "Chloe",
+    "Noah", "Olivia", "Liam", "Emma", "Mateo", "Sofia", "Aiden", "Mia", "Lucas", "Isabella",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell", "Carter", "Roberts",
+    "O'Brien", "McDonald", "Van der Berg", "Kowalski", "Okafor", "Patel", "Kim", "Chen", "Singh", "Muller",
+]
+_SYLLABLES = ["ka", "lo", "ver", "shan", "mi", "tor", "bel", "ra", "quin", "zeb", "dal", "ost", "wen", "ix", "mar"]
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "icloud.com", "example.org"]
+STATUS_WEIGHTS = {"confirmed": 70, "pending": 20, "declined": 6, "expired": 4}
+
+
+@dataclass
+class Dataset:
+    player_ids: List[uuid.UUID]
+    league_ids: List[uuid.UUID]
+
+
+def _surname(rng: random.Random) -> str:
+    # 80% common surnames, 20% generated long tail
+    if rng.random() < 0.8:
+        return rng.choice(LAST_NAMES)
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+
+def _phone(rng: random.Random) -> str | None:
+    area, mid, last = rng.randint(200, 989), rng.randint(200, 999), rng.randint(0, 9999)
+    return rng.choice([
+        f"({area}) {mid}-{last:04d}",
+        f"{area}.{mid}.{last:04d}",
+        f"+1 {area} {mid} {last:04d}",
+        f"{area}{mid}{last:04d}",
+        None,
+    ])
+
+
+def generate_players(n: int, seed: int = 42) -> Iterator[Dict]:
+    """Yield `n` Player column dicts, identical for the same seed."""
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    for i in range(n):
+        first, last = rng.choice(FIRST_NAMES), _surname(rng)
+        local = rng.choice([
+            f"{first}.{last}", f"{first[0]}{last}", f"{first}{rng.randint(1, 99)}",
+            f"{last}.{first[0]}", f"player{i}",
+        ]).lower().replace(" ", "").replace("'", "")
+        yield {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "clerk_user_id": f"{DATASET_TAG}-{i}",
+            "first_name": first,
+            "last_name": last,
+            "email": f"{local}.{i}@{rng.choice(DOMAINS)}",
+            "phone": _phone(rng),
+            "gender": rng.choice(["male", "female", None]),
+            "created_by": DATASET_TAG,
+            "is_active": rng.random() > 0.03,
+            "created_at": start + timedelta(minutes=i * 5 + rng.randint(0, 4)),
+        }
+
+
+def seed(db, n_players: int, n_leagues: int = 40, registrations_per_player: float = 1.5, seed: int = 42) -> Dataset:
+    """Insert the dataset in batches and ANALYZE the touched tables. Commits."""
+    from sqlalchemy import insert, text
+
+    from app.models.league import League
+    from app.models.league_player import LeaguePlayer
+    from app.models.player import Player
+
+    rng = random.Random(seed + 1)
+    league_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(n_leagues)]
+    if league_ids:
+        db.execute(insert(League), [
+            {
+                "id": league_id,
+                "name": f"{DATASET_TAG} league {i}",
+                "start_date": date(2026, 3, 1) + timedelta(weeks=i % 30),
+                "num_weeks": 8,
+                "format": "7v7",
+                "tournament_format": "round_robin",
+                "max_teams": 10,
+                "created_by": DATASET_TAG,
+            }
+            for i, league_id in enumerate(league_ids)
+        ])
+
+    statuses, weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    player_ids: List[uuid.UUID] = []
+    batch: List[Dict] = []
+    registrations: List[Dict] = []
+
+    def flush():
+        if batch:
+            db.execute(insert(Player), batch)
+        if registrations:
+            db.execute(insert(LeaguePlayer), registrations)
+        batch.clear()
+        registrations.clear()
+
+    for row in generate_players(n_players, seed):
+        batch.append(row)
+        player_ids.append(row["id"])
+        if league_ids:
+            count = int(registrations_per_player) + (rng.random() < registrations_per_player % 1)
+            for league_id in rng.sample(league_ids, min(count, len(league_ids))):
+                registrations.append({
+                    "id": uuid.uuid4(),
+                    "league_id": league_id,
+                    "player_id": row["id"],
+                    "registration_status": rng.choices(statuses, weights)[0],
+                    "created_by": DATASET_TAG,
+                    "is_active": True,
+                })
+        if len(batch) >= 5000:
+            flush()
+    flush()
+    db.commit()
+    db.execute(text("ANALYZE players"))
+    db.execute(text("ANALYZE league_players"))
+    db.commit()
+    return Dataset(player_ids=player_ids, league_ids=league_ids)
+
+
+def drop(db) -> None:
+    """Delete every row the dataset created. Commits."""
+    from app.models.league import League
+    from app.models.league_player import LeaguePlayer
+    from app.models.player import Player
+
+    db.query(LeaguePlayer).filter(LeaguePlayer.created_by == DATASET_TAG).delete(synchronize_session=False)
+    db.query(Player).filter(Player.created_by == DATASET_TAG).delete(synchronize_session=False)
+    db.query(League).filter(League.created_by == DATASET_TAG).delete(synchronize_session=False)
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--leagues", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--drop", action="store_true", help="remove a previously seeded dataset and exit")
+    args = parser.parse_args()
+
+    ensure_test_env()
+    from app.db.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        drop(db)
+        if not args.drop:
+            dataset = seed(db, args.players, args.leagues, seed=args.seed)
+            print(f"Seeded {len(dataset.player_ids)} players in {len(dataset.league_ids)} leagues")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
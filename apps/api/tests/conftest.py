@@ -13,12 +13,20 @@ os.environ.setdefault("CLERK_ISSUER", "https://test.clerk.dev/")
 os.environ.setdefault("CLERK_SECRET_KEY", "sk_test_placeholder")
 os.environ.setdefault("TESTING", "true")
 os.environ.setdefault("TEST_BYPASS_TOKEN", "test-secret-token-12345")
+# The query budget plugin (tests/query_budget.py) needs the per-request profiler
+os.environ.setdefault("QUERY_PROFILER_ENABLED", "true")
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 
-from app.db.db import Base, get_db
+from app.core.cache import public_cache
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.core.limiter import limiter
+from app.db.db import Base, get_db, get_async_db
 from app.main import app
 from app.utils.clerk_jwt import get_current_user, get_optional_user
 from app.api.admin.dependencies import get_admin_user
@@ -32,8 +40,22 @@ from app.models.admin_config import AdminConfig
 from app.models.game import Game
 from app.models.field import Field
 from app.models.field_availability import FieldAvailability
+from app.models.field_blackout import FieldBlackout
 from app.models.league_field import LeagueField
 from app.models.waiver import Waiver, WaiverSignature
+from app.services.league_service import recount_occupancy
+from tests.fake_resend import FakeResendServer
+from tests.fake_s3 import FakeS3Server
+
+pytest_plugins = ["tests.query_budget"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_http_client():
+    """Each test gets a fresh upstream pool (its own event loop) and closed breakers."""
+    http_client.reset()
+    yield
+    http_client.reset()
 
 
 @pytest.fixture(scope="session")
@@ -68,20 +90,111 @@ def db(engine):
         connection.close()
 
 
+class _SyncSessionRunner:
+    """Stand-in for AsyncSession that runs run_sync() callables on the test session.
+
+    Async routers only touch the DB through `await db.run_sync(fn, ...)`, so this
+    keeps them inside the same outer transaction as the sync `db` fixture. The
+    real AsyncSession path is covered by `async_client` (tests/integration/test_async_session.py).
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self._session, *args, **kwargs)
+
+
 @pytest.fixture(scope="function")
 def client(db):
     def override_get_db():
         yield db
 
+    async def override_get_async_db():
+        yield _SyncSessionRunner(db)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Cached public reads would otherwise leak between tests' rolled-back data
+    public_cache.clear()
+    # Every TestClient request comes from the same "testclient" host
+    limiter.reset()
     with TestClient(app, raise_server_exceptions=False) as c:
         yield c
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
     app.dependency_overrides.pop(get_current_user, None)
     app.dependency_overrides.pop(get_optional_user, None)
     app.dependency_overrides.pop(get_admin_user, None)
 
 
+@pytest.fixture(scope="function")
+def committed_db(engine):
+    """A session whose commits are real, for tests that read through another connection.
+
+    The `db` fixture's rows live in an uncommitted outer transaction that no
+    other connection can see. Everything is deleted again afterwards.
+    """
+    session = Session(bind=engine)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def async_client(committed_db, monkeypatch):
+    """TestClient whose async routers get a real AsyncSession (asyncpg) from get_async_db.
+
+    `client` swaps in _SyncSessionRunner; this one exercises the production
+    dependency against the test database, so seed data with `committed_db`.
+    NullPool because TestClient runs each client on its own event loop and
+    asyncpg connections cannot cross loops.
+    """
+    import app.db.db as db_module
+    async_engine = create_async_engine(db_module._async_url(TEST_DATABASE_URL), poolclass=NullPool)
+    monkeypatch.setattr(
+        db_module, "AsyncSessionLocal",
+        async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False),
+    )
+    public_cache.clear()
+    limiter.reset()
+    with TestClient(app, raise_server_exceptions=False) as c:
+        yield c
+    app.dependency_overrides.pop(get_optional_user, None)
+
+
+@pytest.fixture
+def fake_resend():
+    """Local fake Resend API (tests/fake_resend.py) with the resend SDK pointed at it."""
+    import resend
+    server = FakeResendServer().start()
+    saved = resend.api_url, resend.api_key
+    resend.api_url, resend.api_key = server.url, "re_test_fake"
+    yield server
+    resend.api_url, resend.api_key = saved
+    server.stop()
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    """Local S3 stand-in (tests/fake_s3.py) with the waiver bucket settings pointed at it."""
+    import app.services.s3_service as s3_service
+    server = FakeS3Server().start()
+    server.buckets.add("test-waivers")
+    monkeypatch.setattr(settings, "WAIVER_S3_BUCKET", "test-waivers")
+    monkeypatch.setattr(settings, "WAIVER_S3_ENDPOINT_URL", server.url)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    monkeypatch.setattr(s3_service, "_s3_client", None)
+    yield server
+    server.stop()
+
+
 def make_user_override(data: dict):
     async def _override():
         return data
@@ -188,6 +301,7 @@ def make_league_player(db, league_id, player_id, status="confirmed", **kwargs) -
     lp = LeaguePlayer(**defaults)
     db.add(lp)
     db.flush()
+    recount_occupancy(db, [league_id])
     return lp
 
 
@@ -210,6 +324,7 @@ def make_group_invitation(db, group_id, league_id, invited_by_id, email=None, st
     )
     db.add(inv)
     db.flush()
+    recount_occupancy(db, [league_id])
     return inv
 
 
@@ -306,6 +421,22 @@ def make_field_availability(db, field_id, **kwargs) -> FieldAvailability:
     return fa
 
 
+def make_field_blackout(db, field_id, starts_at, ends_at, **kwargs) -> FieldBlackout:
+    """Create and flush a FieldBlackout."""
+    defaults = dict(
+        field_id=field_id,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        created_by="system",
+        is_active=True,
+    )
+    defaults.update(kwargs)
+    blackout = FieldBlackout(**defaults)
+    db.add(blackout)
+    db.flush()
+    return blackout
+
+
 def make_league_field(db, league_id, field_id) -> LeagueField:
     """Create and flush a LeagueField association."""
     lf = LeagueField(league_id=league_id, field_id=field_id)
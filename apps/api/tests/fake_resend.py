@@ -0,0 +1,172 @@
+"""
+Local fake of the Resend HTTP API for exercising real email delivery code.
+
+Serves POST /emails and POST /emails/batch on 127.0.0.1 in a background
+thread. Point the SDK at it with resend.api_url = server.url (or set
+RESEND_API_URL) — see the fake_resend fixture in tests/conftest.py.
+
+Behaviour mirrors the parts of Resend the outbox relies on:
+- Idempotency-Key: a repeated key replays the first response without
+  delivering again
+- batch_validation=permissive: rejected recipients are reported in
+  "errors" by index and the rest are delivered
+- error bodies carry statusCode/name/message, which the SDK maps to
+  ResendError subclasses
+
+Scripting:
+- fail_next(status, count) — the next count requests fail with status
+- reject(address) — messages to address fail validation (422)
+
+Standalone, for local development (logs each delivered message):
+
+    python -m tests.fake_resend --port 8025
+    RESEND_API_URL=http://127.0.0.1:8025 RESEND_API_KEY=re_fake python -m app.handlers.email_outbox_handler
+"""
+
+import argparse
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+_ERROR_NAMES = {
+    400: "validation_error",
+    422: "validation_error",
+    429: "rate_limit_exceeded",
+    500: "application_error",
+}
+
+
+class FakeResendServer:
+    def __init__(self, port: int = 0):
+        self.port = port
+        self.sent: List[dict] = []  # delivered messages, in order
+        self.requests: List[Tuple[str, dict, object]] = []  # (path, headers, body)
+        self._failures: List[int] = []
+        self._rejected: set = set()
+        self._idempotent: Dict[str, Tuple[int, dict]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # -- scripting ---------------------------------------------------------
+
+    def fail_next(self, status: int = 500, count: int = 1) -> None:
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def reject(self, address: str) -> None:
+        with self._lock:
+            self._rejected.add(address.lower())
+
+    def reset(self) -> None:
+        with self._lock:
+            self.sent.clear()
+            self.requests.clear()
+            self._failures.clear()
+            self._rejected.clear()
+            self._idempotent.clear()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> "FakeResendServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"null")
+                status, payload = server._handle(self.path, dict(self.headers), body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    # -- request handling --------------------------------------------------
+
+    def _error(self, status: int, message: str) -> Tuple[int, dict]:
+        return status, {"statusCode": status, "name": _ERROR_NAMES.get(status, "application_error"), "message": message}
+
+    def _accept(self, message: dict) -> dict:
+        self.sent.append(message)
+        return {"id": f"fake-{next(self._ids)}"}
+
+    def _is_rejected(self, message: dict) -> bool:
+        to = message.get("to")
+        recipients = to if isinstance(to, list) else [to]
+        return any(str(r).lower() in self._rejected for r in recipients)
+
+    def _handle(self, path: str, headers: dict, body) -> Tuple[int, dict]:
+        with self._lock:
+            self.requests.append((path, headers, body))
+            key = headers.get("Idempotency-Key")
+            if key and key in self._idempotent:
+                return self._idempotent[key]
+
+            if self._failures:
+                response = self._error(self._failures.pop(0), "Scripted failure")
+            elif path == "/emails":
+                if self._is_rejected(body):
+                    response = self._error(422, f"Invalid `to` field: {body.get('to')}")
+                else:
+                    response = 200, self._accept(body)
+            elif path == "/emails/batch":
+                response = self._batch(headers, body)
+            else:
+                response = 404, {"statusCode": 404, "name": "not_found", "message": path}
+
+            if key and response[0] == 200:
+                self._idempotent[key] = response
+            return response
+
+    def _batch(self, headers: dict, messages: list) -> Tuple[int, dict]:
+        if any(m.get("attachments") for m in messages):
+            return self._error(422, "Attachments are not supported in batch sends")
+        rejected = [i for i, m in enumerate(messages) if self._is_rejected(m)]
+        if rejected and headers.get("x-batch-validation") != "permissive":
+            return self._error(422, f"Invalid `to` field in email {rejected[0]}")
+        data = [self._accept(m) for i, m in enumerate(messages) if i not in rejected]
+        errors = [{"index": i, "message": "Invalid `to` field"} for i in rejected]
+        return 200, {"data": data, "errors": errors}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local fake Resend API")
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+
+    class _LoggingServer(FakeResendServer):
+        def _accept(self, message: dict) -> dict:
+            accepted = super()._accept(message)
+            print(f"{accepted['id']}  to={message.get('to')}  subject={message.get('subject')!r}", flush=True)
+            return accepted
+
+    server = _LoggingServer(port=args.port).start()
+    print(f"Fake Resend listening on {server.url}", flush=True)
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,202 @@
+"""
+Local S3 stand-in (MinIO-style) for exercising real boto3 code paths.
+
+Serves path-style object requests — PUT/GET/HEAD/DELETE /<bucket>/<key>,
+including single-range GETs (Range: bytes=a-b), multipart uploads
+(POST ?uploads, PUT ?partNumber&uploadId, POST/DELETE ?uploadId), and
+PUT /<bucket> — from memory on 127.0.0.1 in a background thread. Point
+boto3 at it with endpoint_url=server.url (settings.WAIVER_S3_ENDPOINT_URL);
+see the fake_s3 fixture in tests/conftest.py. Authentication is not checked.
+
+Scripting:
+- fail_next(status, count) — the next count requests fail with an S3 error
+- objects — {(bucket, key): bytes}, inspect or seed directly
+- uploads — {upload_id: parts} for multipart uploads neither completed nor aborted
+- requests — (method, bucket, key) log
+
+Standalone, for local development:
+
+    python -m tests.fake_s3 --port 9000
+    WAIVER_S3_ENDPOINT_URL=http://127.0.0.1:9000 WAIVER_S3_BUCKET=waivers ...
+"""
+
+import argparse
+import hashlib
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from uuid import uuid4
+
+_RANGE = re.compile(r"bytes=(\d+)-(\d*)")
+
+_ERROR_CODES = {
+    403: "AccessDenied",
+    404: "NoSuchKey",
+    500: "InternalError",
+    503: "SlowDown",
+}
+
+
+class FakeS3Server:
+    def __init__(self, port: int = 0):
+        self.port = port
+        self.buckets: set = set()
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+        self.content_types: Dict[Tuple[str, str], str] = {}
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+        self._upload_targets: Dict[str, Tuple[str, str, str]] = {}  # upload_id -> (bucket, key, content type)
+        self.requests: List[Tuple[str, str, str]] = []
+        self._failures: List[int] = []
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def fail_next(self, status: int = 500, count: int = 1) -> None:
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> "FakeS3Server":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, headers, payload = server._handle(self.command, self.path, dict(self.headers), body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(payload)
+
+            do_GET = do_PUT = do_HEAD = do_DELETE = do_POST = _dispatch
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    # -- request handling --------------------------------------------------
+
+    def _error(self, status: int, code: str = None) -> Tuple[int, dict, bytes]:
+        code = code or _ERROR_CODES.get(status, "InternalError")
+        body = f"<?xml version=\"1.0\" encoding=\"UTF-8\"?><Error><Code>{code}</Code><Message>{code}</Message></Error>"
+        return status, {"Content-Type": "application/xml"}, body.encode()
+
+    def _multipart(self, method: str, bucket: str, key: str, query: dict, headers: dict, body: bytes):
+        """Multipart upload calls; None when the request is a plain object request."""
+        upload_id = query.get("uploadId", [None])[0]
+        if method == "POST" and "uploads" in query:
+            upload_id = uuid4().hex
+            self.uploads[upload_id] = {}
+            self._upload_targets[upload_id] = (bucket, key, headers.get("Content-Type", "binary/octet-stream"))
+            xml = (
+                "<InitiateMultipartUploadResult><Bucket>{}</Bucket><Key>{}</Key><UploadId>{}</UploadId>"
+                "</InitiateMultipartUploadResult>"
+            ).format(bucket, key, upload_id)
+            return 200, {"Content-Type": "application/xml"}, xml.encode()
+        if upload_id is None:
+            return None
+        if upload_id not in self.uploads:
+            return self._error(404, "NoSuchUpload")
+        if method == "PUT":
+            self.uploads[upload_id][int(query["partNumber"][0])] = body
+            return 200, {"ETag": f'"{hashlib.md5(body).hexdigest()}"'}, b""
+        if method == "DELETE":
+            self.uploads.pop(upload_id)
+            self._upload_targets.pop(upload_id)
+            return 204, {}, b""
+        if method == "POST":
+            parts = self.uploads.pop(upload_id)
+            target_bucket, target_key, content_type = self._upload_targets.pop(upload_id)
+            data = b"".join(parts[n] for n in sorted(parts))
+            self.objects[(target_bucket, target_key)] = data
+            self.content_types[(target_bucket, target_key)] = content_type
+            xml = (
+                "<CompleteMultipartUploadResult><Bucket>{}</Bucket><Key>{}</Key><ETag>\"{}-{}\"</ETag>"
+                "</CompleteMultipartUploadResult>"
+            ).format(target_bucket, target_key, hashlib.md5(data).hexdigest(), len(parts))
+            return 200, {"Content-Type": "application/xml"}, xml.encode()
+        return self._error(405, "MethodNotAllowed")
+
+    def _handle(self, method: str, path: str, headers: dict, body: bytes) -> Tuple[int, dict, bytes]:
+        url = urlsplit(path)
+        bucket, _, key = unquote(url.path).lstrip("/").partition("/")
+        with self._lock:
+            self.requests.append((method, bucket, key))
+            if self._failures:
+                return self._error(self._failures.pop(0))
+
+            if not key:
+                if method == "PUT":
+                    self.buckets.add(bucket)
+                    return 200, {}, b""
+                return self._error(405, "MethodNotAllowed")
+            if bucket not in self.buckets:
+                return self._error(404, "NoSuchBucket")
+            multipart = self._multipart(method, bucket, key, parse_qs(url.query, keep_blank_values=True), headers, body)
+            if multipart is not None:
+                return multipart
+
+            if method == "PUT":
+                self.objects[(bucket, key)] = body
+                self.content_types[(bucket, key)] = headers.get("Content-Type", "binary/octet-stream")
+                return 200, {"ETag": f'"{hashlib.md5(body).hexdigest()}"'}, b""
+            if method == "DELETE":
+                self.objects.pop((bucket, key), None)
+                return 204, {}, b""
+
+            data = self.objects.get((bucket, key))
+            if data is None:
+                return self._error(404)
+            response_headers = {
+                "Content-Type": self.content_types[(bucket, key)],
+                "ETag": f'"{hashlib.md5(data).hexdigest()}"',
+                "Accept-Ranges": "bytes",
+            }
+            match = _RANGE.fullmatch(headers.get("Range", ""))
+            if method == "GET" and match:
+                start = int(match.group(1))
+                end = min(int(match.group(2) or len(data) - 1), len(data) - 1)
+                if start >= len(data):
+                    return self._error(416, "InvalidRange")
+                response_headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+                return 206, response_headers, data[start:end + 1]
+            return 200, response_headers, data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local in-memory S3 stand-in")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--bucket", action="append", default=[], help="bucket to create (repeatable)")
+    args = parser.parse_args()
+
+    server = FakeS3Server(port=args.port).start()
+    server.buckets.update(args.bucket)
+    print(f"Fake S3 listening on {server.url} (buckets: {', '.join(sorted(server.buckets)) or 'none'})", flush=True)
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
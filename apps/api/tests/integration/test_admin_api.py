@@ -1,3 +1,7 @@
+import csv
+import io
+import json
+
 import pytest
 from datetime import date
 from uuid import uuid4
@@ -159,6 +163,29 @@ def test_get_all_leagues_pagination(client, db):
         _admin_teardown()
 
 
+# 2b. GET /admin/leagues keyset pagination via X-Next-Cursor
+def test_get_all_leagues_cursor_pagination(client, db):
+    _admin_setup(db)
+    try:
+        seeded = {str(make_league(db, name=f"Cursor League {i}").id) for i in range(5)}
+        db.commit()
+
+        resp = client.get("/admin/leagues", params={"limit": 2, "count": "exact"})
+        assert resp.status_code == 200
+        assert int(resp.headers["x-total-count"]) >= 5
+        seen = [l["id"] for l in resp.json()]
+        while "x-next-cursor" in resp.headers:
+            resp = client.get("/admin/leagues", params={"limit": 2, "cursor": resp.headers["x-next-cursor"]})
+            assert resp.status_code == 200
+            seen += [l["id"] for l in resp.json()]
+
+        assert len(seen) == len(set(seen))
+        assert seeded <= set(seen)
+        assert client.get("/admin/leagues", params={"cursor": "bogus"}).status_code == 400
+    finally:
+        _admin_teardown()
+
+
 # 3. GET /admin/leagues/{id} returns league detail with counts
 def test_get_league_details(client, db):
     _admin_setup(db)
@@ -245,6 +272,55 @@ def test_get_league_members(client, db):
         _admin_teardown()
 
 
+def test_export_league_members_csv(client, db):
+    _admin_setup(db)
+    try:
+        league = make_league(db, name="Fall League")
+        team = make_team(db, league.id, name="Sharks")
+        p1 = make_player(db, first_name="Zoe", last_name="Adams")
+        p2 = make_player(db, first_name="=HYPERLINK(1)", last_name="Brown")
+        make_league_player(db, league.id, p1.id, team_id=team.id)
+        make_league_player(db, league.id, p2.id)
+        db.commit()
+
+        resp = client.get(f"/admin/leagues/{league.id}/members/export")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+        assert 'filename="roster-fall-league-' in resp.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert [(r["last_name"], r["first_name"], r["team_name"]) for r in rows] == [
+            ("Adams", "Zoe", "Sharks"), ("Brown", "'=HYPERLINK(1)", ""),
+        ]
+    finally:
+        _admin_teardown()
+
+
+def test_export_league_members_ndjson(client, db):
+    _admin_setup(db)
+    try:
+        league = make_league(db)
+        player = make_player(db, first_name="Alice", last_name="A")
+        make_league_player(db, league.id, player.id)
+        db.commit()
+
+        resp = client.get(f"/admin/leagues/{league.id}/members/export?format=ndjson")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        [row] = [json.loads(line) for line in resp.text.splitlines()]
+        assert row["player_id"] == str(player.id)
+        assert row["registration_status"] == "confirmed"
+        assert row["team_name"] is None
+    finally:
+        _admin_teardown()
+
+
+def test_export_league_members_not_found(client, db):
+    _admin_setup(db)
+    resp = client.get(f"/admin/leagues/{uuid4()}/members/export")
+    _admin_teardown()
+    assert resp.status_code == 404
+
+
 # 7. POST /admin/fields creates a field
 def test_create_field_success(client, db):
     _admin_setup(db)
@@ -363,6 +439,86 @@ def test_get_users_paginated(client, db):
         _admin_teardown()
 
 
+# 12b. GET /admin/users walks every user once by cursor
+def test_get_users_cursor_pagination(client, db):
+    _admin_setup(db)
+    try:
+        # Same transaction, so every created_at ties and only id orders them
+        seeded = {make_player(db).clerk_user_id for _ in range(5)}
+        db.commit()
+
+        seen, cursor = [], None
+        while True:
+            params = {"page_size": 2} if cursor is None else {"page_size": 2, "cursor": cursor}
+            resp = client.get("/admin/users", params=params)
+            assert resp.status_code == 200
+            data = resp.json()
+            seen += [u["clerk_user_id"] for u in data["users"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+            assert data["page"] in (1, None)
+
+        assert len(seen) == len(set(seen))
+        assert seeded <= set(seen)
+    finally:
+        _admin_teardown()
+
+
+# 12d. GET /admin/users/search: prefix, phone, fuzzy, ranking and filters
+def test_search_users(client, db):
+    _admin_setup(db)
+    try:
+        league = make_league(db)
+        smith = make_player(db, first_name="Jonathan", last_name="Smithfield",
+                            email="jsmith@example.com", phone="(555) 867-5309")
+        make_player(db, first_name="Mary", last_name="Jonas", email="mary@example.com")
+        make_player(db, first_name="Fielding", last_name="Adams", email="fadams@example.com")
+        make_player(db, first_name="Old", last_name="Smithfield", is_active=False)
+        make_league_player(db, league.id, smith.id, status="confirmed")
+        db.commit()
+
+        def search(**params):
+            resp = client.get("/admin/users/search", params=params)
+            assert resp.status_code == 200, resp.text
+            return [u["email"] for u in resp.json()]
+
+        assert search(q="jon smi")[0] == "jsmith@example.com"
+        assert search(q="867-53") == ["jsmith@example.com"]
+        assert "jsmith@example.com" in search(q="smithfeld")  # typo
+        assert search(q="jsmith@example.com")[0] == "jsmith@example.com"
+        # A word-prefix match ranks above a mid-word one
+        assert search(q="field")[:2] == ["fadams@example.com", "jsmith@example.com"]
+        assert search(q="smithfield", league_id=str(league.id), registration_status="confirmed") == ["jsmith@example.com"]
+        assert search(q="mary", league_id=str(league.id)) == []
+
+        assert client.get("/admin/users/search", params={"q": "j"}).status_code == 422
+        assert client.get("/admin/users/search", params={"q": "%%"}).status_code == 200
+    finally:
+        _admin_teardown()
+
+
+# 12c. GET /admin/users total from planner statistics; bad cursors are 400
+def test_get_users_estimated_total_and_bad_cursor(client, db):
+    _admin_setup(db)
+    try:
+        make_player(db)
+        db.commit()
+
+        data = client.get("/admin/users", params={"count": "estimated"}).json()
+        assert data["total_is_estimate"] is True
+        assert data["total"] >= 0
+
+        data = client.get("/admin/users", params={"count": "none"}).json()
+        assert data["total"] is None
+        assert data["total_pages"] is None
+
+        assert client.get("/admin/users", params={"cursor": "bogus"}).status_code == 400
+        assert client.get("/admin/users", params={"cursor": "x", "page": 2}).status_code == 400
+    finally:
+        _admin_teardown()
+
+
 # 13. Multiple admin endpoints require admin auth (parametrized)
 @pytest.mark.parametrize(
     "method,path",
@@ -0,0 +1,64 @@
+"""Async routers against a real AsyncSession (asyncpg), not the _SyncSessionRunner stand-in."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from tests.conftest import make_game, make_league, make_team
+
+
+@pytest.fixture
+def drivers():
+    """DBAPI driver of every statement executed during the test."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(conn.dialect.driver)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(Engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def league(committed_db):
+    league = make_league(committed_db, name="Async League")
+    home = make_team(committed_db, league.id, name="Home")
+    away = make_team(committed_db, league.id, name="Away")
+    make_game(
+        committed_db, league.id, home.id, away.id,
+        status="completed", team1_score=21, team2_score=14, winner_id=home.id,
+        game_datetime=datetime(2026, 6, 1, 18, 0),
+    )
+    committed_db.commit()
+    return league
+
+
+def test_public_leagues(async_client, league, drivers):
+    resp = async_client.get("/league/public/leagues")
+    assert resp.status_code == 200
+    assert [row["name"] for row in resp.json()] == ["Async League"]
+    assert set(drivers) == {"asyncpg"}
+
+
+def test_single_league(async_client, league, drivers):
+    resp = async_client.get(f"/league/{league.id}")
+    assert resp.status_code == 200
+    assert resp.json()["id"] == str(league.id)
+    assert "asyncpg" in drivers
+
+    assert async_client.get(f"/league/{uuid4()}").status_code == 404
+
+
+def test_schedule_and_standings(async_client, league, drivers):
+    schedule = async_client.get(f"/league/{league.id}/schedule")
+    assert schedule.status_code == 200
+    assert schedule.json()["total_games"] == 1
+
+    standings = async_client.get(f"/league/{league.id}/standings")
+    assert standings.status_code == 200
+    assert isinstance(standings.json(), list)
+    assert set(drivers) == {"asyncpg"}
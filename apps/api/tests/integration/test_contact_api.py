@@ -6,6 +6,7 @@ from fastapi import HTTPException
 from pydantic import ValidationError
 
 from app.api.contact import ContactRequest
+from app.models.email_outbox import EmailOutbox
 from app.core.limiter import limiter
 
 
@@ -31,19 +32,21 @@ CONTACT_PAYLOAD = {
 # ---------------------------------------------------------------------------
 
 
-@patch("app.api.contact.send_contact_message")
 @patch("app.api.contact.verify_recaptcha", new_callable=AsyncMock, return_value=True)
 @patch("app.api.contact.settings.CONTACT_EMAIL", "admin@example.com", create=True)
 @patch("app.api.contact.settings.RECAPTCHA_SECRET_KEY", "test-secret", create=True)
-def test_contact_success(mock_recaptcha, mock_send, client):
-    """Successful contact form submission returns 200."""
+def test_contact_success(mock_recaptcha, client, db):
+    """Successful contact form submission returns 200 and queues the email."""
     resp = client.post("/contact", json=CONTACT_PAYLOAD)
     assert resp.status_code == 200
     data = resp.json()
     assert data["success"] is True
     assert "sent" in data["message"].lower()
     mock_recaptcha.assert_awaited_once_with(CONTACT_PAYLOAD["recaptcha_token"])
-    mock_send.assert_called_once()
+    queued = db.query(EmailOutbox).filter(EmailOutbox.kind == "contact_message").all()
+    assert len(queued) == 1
+    assert queued[0].status == "pending"
+    assert queued[0].message["subject"] == "[Contact] Hello"
 
 
 @patch("app.api.contact.settings.RECAPTCHA_SECRET_KEY", "", create=True)
@@ -54,7 +57,7 @@ def test_contact_missing_recaptcha_key(client):
     assert "unavailable" in resp.json()["detail"].lower()
 
 
-@patch("app.api.contact.send_contact_message")
+@patch("app.api.contact.enqueue_email")
 @patch("app.api.contact.verify_recaptcha", new_callable=AsyncMock, return_value=False)
 @patch("app.api.contact.settings.RECAPTCHA_SECRET_KEY", "test-secret", create=True)
 def test_contact_recaptcha_fails(mock_recaptcha, mock_send, client):
@@ -88,14 +91,14 @@ def test_contact_missing_contact_email(mock_recaptcha, client):
 
 
 @patch(
-    "app.api.contact.send_contact_message",
-    side_effect=Exception("SMTP error"),
+    "app.api.contact.enqueue_email",
+    side_effect=Exception("DB error"),
 )
 @patch("app.api.contact.verify_recaptcha", new_callable=AsyncMock, return_value=True)
 @patch("app.api.contact.settings.CONTACT_EMAIL", "admin@example.com", create=True)
 @patch("app.api.contact.settings.RECAPTCHA_SECRET_KEY", "test-secret", create=True)
 def test_contact_email_send_failure(mock_recaptcha, mock_send, client):
-    """Returns 500 when send_contact_message raises."""
+    """Returns 500 when the email cannot be queued."""
     resp = client.post("/contact", json=CONTACT_PAYLOAD)
     assert resp.status_code == 500
     assert "failed" in resp.json()["detail"].lower()
@@ -202,16 +205,14 @@ async def test_verify_recaptcha_success():
     from app.api.contact import verify_recaptcha
 
     mock_response = MagicMock()
+    mock_response.status_code = 200
     mock_response.json.return_value = {"success": True, "score": 0.9}
     mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.post.return_value = mock_response
 
-    with patch("app.api.contact.httpx.AsyncClient") as MockClient:
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         result = await verify_recaptcha("test-token")
         assert result is True
 
@@ -223,16 +224,14 @@ async def test_verify_recaptcha_low_score():
     from app.api.contact import verify_recaptcha
 
     mock_response = MagicMock()
+    mock_response.status_code = 200
     mock_response.json.return_value = {"success": True, "score": 0.2}
     mock_response.raise_for_status = MagicMock()
 
     mock_client = AsyncMock()
     mock_client.post.return_value = mock_response
 
-    with patch("app.api.contact.httpx.AsyncClient") as MockClient:
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         result = await verify_recaptcha("test-token")
         assert result is False
 
@@ -246,10 +245,7 @@ async def test_verify_recaptcha_timeout_direct():
     mock_client = AsyncMock()
     mock_client.post.side_effect = httpx.TimeoutException("timed out")
 
-    with patch("app.api.contact.httpx.AsyncClient") as MockClient:
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         with pytest.raises(HTTPException) as exc_info:
             await verify_recaptcha("test-token")
         assert exc_info.value.status_code == 503
@@ -263,10 +259,7 @@ async def test_verify_recaptcha_other_error():
     mock_client = AsyncMock()
     mock_client.post.side_effect = RuntimeError("network error")
 
-    with patch("app.api.contact.httpx.AsyncClient") as MockClient:
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         with pytest.raises(HTTPException) as exc_info:
             await verify_recaptcha("test-token")
         assert exc_info.value.status_code == 400
@@ -1,11 +1,13 @@
 """Integration tests for field management endpoints (field_management.py)."""
+from datetime import datetime
 from uuid import uuid4
 
 from app.main import app
 from app.utils.clerk_jwt import get_current_user
 from app.api.admin.dependencies import get_admin_user
 from tests.conftest import (
-    make_field, make_field_availability, make_league, make_league_field, make_user_override,
+    make_field, make_field_availability, make_game, make_league, make_league_field, make_team,
+    make_user_override,
 )
 
 ADMIN = {"id": "admin_clerk", "email": "admin@example.com"}
@@ -337,6 +339,30 @@ def test_get_league_field_availability(client, db):
     assert len(resp.json()) >= 1
 
 
+def test_field_availability_listings_load_in_one_query(client, db, query_budget):
+    league = make_league(db)
+    fields = [make_field(db, name=f"Field {i}") for i in range(3)]
+    for field in fields:
+        make_league_field(db, league.id, field.id)
+        for day in range(4):
+            make_field_availability(db, field.id, day_of_week=day)
+    _admin_setup()
+    with query_budget(1):
+        all_resp = client.get("/admin/field-availability", params={"limit": 500})
+    # League existence check + the listing
+    with query_budget(2):
+        league_resp = client.get(f"/admin/leagues/{league.id}/field-availability")
+    _admin_teardown()
+    assert all_resp.status_code == 200
+    assert league_resp.status_code == 200
+    names = {str(f.id): f.name for f in fields}
+    listed = [a for a in all_resp.json() if a["field_id"] in names]
+    assert len(listed) == 12
+    assert all(a["field_name"] == names[a["field_id"]] for a in listed)
+    assert len(league_resp.json()) == 12
+    assert all(a["field_name"] == names[a["field_id"]] for a in league_resp.json())
+
+
 def test_get_league_field_availability_not_found(client, db):
     _admin_setup()
     resp = client.get(f"/admin/leagues/{uuid4()}/field-availability")
@@ -575,3 +601,99 @@ def test_create_field_for_league_league_not_found_check(client, db):
     resp = client.post(f"/admin/leagues/{uuid4()}/fields", json=FIELD_DATA)
     _admin_teardown()
     assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Field blackouts
+# ---------------------------------------------------------------------------
+
+def test_field_blackout_lifecycle(client, db):
+    field = make_field(db)
+    _admin_setup()
+    resp = client.post(f"/admin/fields/{field.id}/blackouts", json={
+        "starts_at": "2099-07-04T00:00:00",
+        "ends_at": "2099-07-05T00:00:00",
+        "reason": "Holiday",
+    })
+    assert resp.status_code == 200
+    blackout = resp.json()
+    assert blackout["field_id"] == str(field.id)
+    assert blackout["reason"] == "Holiday"
+
+    listed = client.get(f"/admin/fields/{field.id}/blackouts").json()
+    assert [b["id"] for b in listed] == [blackout["id"]]
+
+    resp = client.delete(f"/admin/fields/{field.id}/blackouts/{blackout['id']}")
+    assert resp.status_code == 200
+    assert client.get(f"/admin/fields/{field.id}/blackouts").json() == []
+    _admin_teardown()
+
+
+def test_field_blackout_rejects_inverted_range(client, db):
+    field = make_field(db)
+    _admin_setup()
+    resp = client.post(f"/admin/fields/{field.id}/blackouts", json={
+        "starts_at": "2099-07-05T00:00:00",
+        "ends_at": "2099-07-04T00:00:00",
+    })
+    _admin_teardown()
+    assert resp.status_code == 422
+
+
+def test_field_blackout_field_not_found(client, db):
+    _admin_setup()
+    resp = client.post(f"/admin/fields/{uuid4()}/blackouts", json={
+        "starts_at": "2099-07-04T00:00:00",
+        "ends_at": "2099-07-05T00:00:00",
+    })
+    _admin_teardown()
+    assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Field utilization analytics
+# ---------------------------------------------------------------------------
+
+def test_field_utilization_counts_all_leagues(client, db):
+    field = make_field(db, name="Shared Field")
+    make_field_availability(db, field.id)  # Mondays 18:00-21:00
+    league_a = make_league(db)
+    league_b = make_league(db)
+    make_league_field(db, league_a.id, field.id)
+    t1, t2 = make_team(db, league_b.id, name="A"), make_team(db, league_b.id, name="B")
+    make_game(db, league_b.id, t1.id, t2.id, field_id=field.id)  # Monday 2026-06-01 18:00
+    make_game(db, league_b.id, t1.id, t2.id, field_id=field.id,
+              game_time="18:30", game_datetime=datetime(2026, 6, 1, 18, 30))
+    _admin_setup()
+    resp = client.get("/admin/field-utilization", params={
+        "start_date": "2026-06-01", "end_date": "2026-06-07", "league_id": str(league_a.id),
+    })
+    _admin_teardown()
+
+    assert resp.status_code == 200
+    [row] = resp.json()["fields"]
+    assert row["field_name"] == "Shared Field"
+    assert row["available_minutes"] == 180
+    assert row["booked_minutes"] == 90
+    assert row["double_booked_minutes"] == 30
+    assert row["hourly_booked_minutes"][0][18] == 60
+    assert row["daily_booked_minutes"] == [90, 0, 0, 0, 0, 0, 0]
+    assert row["risks"] == [
+        {"date": "2026-06-01", "start_time": "18:30:00", "end_time": "19:00:00", "kind": "double_booked"},
+    ]
+
+
+def test_field_utilization_rejects_inverted_range(client, db):
+    _admin_setup()
+    resp = client.get("/admin/field-utilization", params={"start_date": "2026-06-07", "end_date": "2026-06-01"})
+    _admin_teardown()
+    assert resp.status_code == 400
+
+
+def test_field_utilization_league_not_found(client, db):
+    _admin_setup()
+    resp = client.get("/admin/field-utilization", params={
+        "start_date": "2026-06-01", "end_date": "2026-06-07", "league_id": str(uuid4()),
+    })
+    _admin_teardown()
+    assert resp.status_code == 404
@@ -41,6 +41,18 @@ def test_solo_register_success(client, db):
     assert data["registration"]["registration_status"] == "confirmed"
 
 
+def test_solo_register_queues_waiver_prompt(client, db):
+    from app.models.email_outbox import EmailOutbox
+    league = make_league(db, format="7v7", max_teams=4)
+    payload = {**VALID_PAYLOAD, "league_id": str(league.id)}
+    resp = client.post("/registration/player", json=payload)
+    assert resp.status_code == 200
+    queued = db.query(EmailOutbox).filter(EmailOutbox.kind == "waiver_prompt").all()
+    assert [q.to_email for q in queued] == ["alice@example.com"]
+    assert queued[0].status == "pending"
+    assert f"/waiver/{league.id}" in queued[0].message["html"]
+
+
 def test_solo_register_email_stored_lowercase(client, db):
     from app.models.player import Player
     league = make_league(db, format="7v7", max_teams=4)
@@ -165,6 +177,17 @@ def test_group_register_success(client, db):
         GroupInvitation.status == "pending",
     ).count()
     assert invites == 2
+    db.refresh(league)
+    assert league.confirmed_players_count == 1
+    assert league.pending_invites_count == 2
+    # Invitations and the organizer's waiver prompt were queued in the same commit
+    from app.models.email_outbox import EmailOutbox
+    queued = db.query(EmailOutbox).all()
+    assert sorted((q.kind, q.to_email) for q in queued) == [
+        ("group_invitation", "bob@example.com"),
+        ("group_invitation", "carol@example.com"),
+        ("waiver_prompt", "alice@example.com"),
+    ]
 
 
 def test_group_register_too_many_invitees(client, db):
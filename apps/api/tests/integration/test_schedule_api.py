@@ -1,17 +1,23 @@
 """Integration tests for schedule management endpoints."""
-from datetime import date, time
+import csv
+import io
+import json
+from datetime import date, datetime, time, timedelta
 from uuid import uuid4
 
 from app.main import app
 from app.utils.clerk_jwt import get_current_user
 from app.api.admin.dependencies import get_admin_user
+from app.models.game import Game
 from app.services.schedule_service import (
     calculate_team_standings,
     get_available_time_slots_for_date,
+    get_available_time_slots_for_range,
     generate_time_slots_from_availability,
 )
+from app.services.standings_service import get_team_standings
 from tests.conftest import (
-    make_field, make_field_availability, make_game, make_league,
+    make_field, make_field_availability, make_field_blackout, make_game, make_league,
     make_league_field, make_team, make_user_override,
 )
 
@@ -193,17 +199,143 @@ def test_generate_schedule_odd_teams_bye(client, db):
     assert resp.json()["games_created"] == 1
 
 
-def test_generate_schedule_swiss_returns_501(client, db):
-    """Swiss tournament scheduling is not yet implemented — should return 501."""
-    league = make_league(db, num_weeks=1, tournament_format="swiss")
+def test_generate_schedule_reports_objective_and_overflow(client, db):
+    league = make_league(db, num_weeks=2)
+    for i in range(4):
+        make_team(db, league.id, name=f"T{i}")
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
+        "time_slots": ["18:00"],
+        "engine": "greedy",
+    })
+    _admin_teardown()
+    assert resp.status_code == 200
+    data = resp.json()
+    # 2 games per week needed, 1 slot per week: week 1's overflow can't fit either
+    assert data["games_created"] == 2
+    assert data["unscheduled_games"] == 2
+    assert data["engine"] == "greedy"
+    assert data["objective_score"] is not None
+
+
+def test_generate_schedule_games_per_week_parallel_fields(client, db):
+    from datetime import time as t
+    league = make_league(db, num_weeks=2, start_date=date(2026, 6, 1))
+    teams = [make_team(db, league.id, name=f"T{i}") for i in range(4)]
+    for name in ("F1", "F2"):
+        field = make_field(db, name=name)
+        make_league_field(db, league.id, field.id)
+        make_field_availability(db, field.id, day_of_week=0, start_time=t(18, 0), end_time=t(20, 0),
+                               recurrence_start_date=date(2026, 1, 1))
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
+        "games_per_week": 2,
+        "time_budget_ms": 200,
+    })
+    _admin_teardown()
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["games_created"] == 8
+    assert data["unscheduled_games"] == 0
+    seen = set()
+    for d in data["schedule_details"]:
+        for team_id in (d["team1_id"], d["team2_id"]):
+            key = (team_id, d["week"], d["time"])
+            assert key not in seen
+            seen.add(key)
+
+
+def test_generate_schedule_rejects_unknown_engine(client, db):
+    league = make_league(db)
+    make_team(db, league.id, name="T1")
+    make_team(db, league.id, name="T2")
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
+        "time_slots": ["18:00"],
+        "engine": "annealing",
+    })
+    _admin_teardown()
+    assert resp.status_code == 422
+
+
+def test_generate_schedule_swiss_first_round(client, db):
+    league = make_league(db, num_weeks=3, tournament_format="swiss", swiss_rounds=3)
+    teams = [make_team(db, league.id, name=f"T{i}") for i in range(4)]
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
+        "time_slots": ["18:00", "19:00"],
+    })
+    _admin_teardown()
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["games_created"] == 2
+    assert data["weeks_scheduled"] == 1
+    assert {d["week"] for d in data["schedule_details"]} == {1}
+    paired = {d["team1_id"] for d in data["schedule_details"]} | {d["team2_id"] for d in data["schedule_details"]}
+    assert paired == {str(t.id) for t in teams}
+
+
+def test_generate_schedule_swiss_next_round_avoids_rematches(client, db):
+    league = make_league(db, num_weeks=3, tournament_format="swiss", swiss_rounds=3)
+    t1, t2, t3, t4 = [make_team(db, league.id, name=f"T{i}") for i in range(4)]
+    make_game(db, league.id, t1.id, t2.id, week=1, status="completed",
+              team1_score=21, team2_score=7, winner_id=t1.id)
+    make_game(db, league.id, t3.id, t4.id, week=1, status="completed",
+              team1_score=14, team2_score=10, winner_id=t3.id)
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
+        "time_slots": ["18:00", "19:00"],
+    })
+    _admin_teardown()
+    assert resp.status_code == 200
+    details = resp.json()["schedule_details"]
+    assert {d["week"] for d in details} == {2}
+    pairs = {frozenset((d["team1_id"], d["team2_id"])) for d in details}
+    # Winners meet, losers meet
+    assert pairs == {frozenset((str(t1.id), str(t3.id))), frozenset((str(t2.id), str(t4.id)))}
+
+
+def test_generate_schedule_swiss_round_in_progress(client, db):
+    league = make_league(db, num_weeks=3, tournament_format="swiss", swiss_rounds=3)
+    t1, t2, t3, t4 = [make_team(db, league.id, name=f"T{i}") for i in range(4)]
+    make_game(db, league.id, t1.id, t2.id, week=1, status="completed",
+              team1_score=21, team2_score=7, winner_id=t1.id)
+    make_game(db, league.id, t3.id, t4.id, week=1, status="scheduled")
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
+        "time_slots": ["18:00", "19:00"],
+    })
+    _admin_teardown()
+    assert resp.status_code == 409
+
+
+def test_generate_schedule_swiss_more_pairings_than_slots(client, db):
+    league = make_league(db, num_weeks=3, tournament_format="swiss", swiss_rounds=3)
+    for i in range(6):
+        make_team(db, league.id, name=f"T{i}")
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
+        "time_slots": ["18:00", "19:00"],
+    })
+    _admin_teardown()
+    assert resp.status_code == 400
+    assert "needs 3 time slots" in resp.json()["detail"]
+    db.expire_all()
+    assert db.query(Game).filter(Game.league_id == league.id, Game.is_active == True).count() == 0
+
+
+def test_generate_schedule_swiss_all_rounds_played(client, db):
+    league = make_league(db, num_weeks=1, tournament_format="swiss", swiss_rounds=1)
     t1 = make_team(db, league.id, name="T1")
     t2 = make_team(db, league.id, name="T2")
+    make_game(db, league.id, t1.id, t2.id, week=1, status="completed",
+              team1_score=21, team2_score=7, winner_id=t1.id)
     _admin_setup()
     resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={
         "time_slots": ["18:00"],
     })
     _admin_teardown()
-    assert resp.status_code == 501
+    assert resp.status_code == 400
 
 
 # ---------------------------------------------------------------------------
@@ -240,6 +372,37 @@ def test_get_admin_schedule_not_found(client, db):
     assert resp.status_code == 404
 
 
+def test_export_admin_schedule(client, db):
+    league = make_league(db, name="Spring League")
+    field = make_field(db, name="North")
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    make_game(db, league.id, t1.id, t2.id, week=2, game_date=date(2026, 6, 8),
+              game_datetime=datetime(2026, 6, 8, 18, 0))
+    make_game(db, league.id, t2.id, t1.id, week=1, field_id=field.id)
+    _admin_setup()
+    csv_resp = client.get(f"/admin/leagues/{league.id}/schedule/export")
+    ndjson_resp = client.get(f"/admin/leagues/{league.id}/schedule/export?format=ndjson")
+    _admin_teardown()
+
+    assert csv_resp.status_code == 200
+    assert 'filename="schedule-spring-league-' in csv_resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(csv_resp.text)))
+    assert [(r["week"], r["team1_name"], r["field_name"]) for r in rows] == [("1", "T2", "North"), ("2", "T1", "")]
+    games = [json.loads(line) for line in ndjson_resp.text.splitlines()]
+    assert [(g["week"], g["date"], g["datetime"]) for g in games] == [
+        (1, "2026-06-01", "2026-06-01T18:00:00"), (2, "2026-06-08", "2026-06-08T18:00:00"),
+    ]
+
+
+def test_export_admin_schedule_rejects_unknown_format(client, db):
+    league = make_league(db)
+    _admin_setup()
+    resp = client.get(f"/admin/leagues/{league.id}/schedule/export?format=xlsx")
+    _admin_teardown()
+    assert resp.status_code == 422
+
+
 # ---------------------------------------------------------------------------
 # PUT /admin/leagues/{id}/games/{game_id}
 # ---------------------------------------------------------------------------
@@ -344,6 +507,94 @@ def test_update_game_not_found(client, db):
     assert resp.status_code == 404
 
 
+# ---------------------------------------------------------------------------
+# Incremental standings (team_standings aggregate)
+# ---------------------------------------------------------------------------
+
+def _put_game(client, league_id, game_id, body):
+    _admin_setup()
+    resp = client.put(f"/admin/leagues/{league_id}/games/{game_id}", json=body)
+    _admin_teardown()
+    assert resp.status_code == 200
+    return resp
+
+
+def test_update_game_maintains_standings(client, db):
+    league = make_league(db)
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    game = make_game(db, league.id, t1.id, t2.id)
+    _put_game(client, league.id, game.id, {"team1_score": 21, "team2_score": 14})
+
+    standings = dict(get_team_standings(db, league.id))
+    assert standings[t1.id]["wins"] == 1
+    assert standings[t1.id]["points_for"] == 21
+    assert standings[t2.id]["losses"] == 1
+    assert standings[t2.id]["points_against"] == 21
+
+
+def test_score_correction_replaces_previous_result(client, db):
+    league = make_league(db)
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    game = make_game(db, league.id, t1.id, t2.id)
+    _put_game(client, league.id, game.id, {"team1_score": 21, "team2_score": 14})
+    _put_game(client, league.id, game.id, {"team1_score": 7, "team2_score": 10})
+
+    standings = dict(get_team_standings(db, league.id))
+    assert standings[t1.id]["wins"] == 0
+    assert standings[t1.id]["losses"] == 1
+    assert standings[t1.id]["points_for"] == 7
+    assert standings[t2.id]["wins"] == 1
+    assert standings[t2.id]["points_for"] == 10
+
+
+def test_cancelling_completed_game_removes_it_from_standings(client, db):
+    league = make_league(db)
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    game = make_game(db, league.id, t1.id, t2.id)
+    _put_game(client, league.id, game.id, {"team1_score": 21, "team2_score": 14})
+    _put_game(client, league.id, game.id, {"status": "cancelled"})
+
+    assert get_team_standings(db, league.id) == []
+
+
+def test_aggregate_matches_full_recalculation(client, db):
+    league = make_league(db)
+    teams = [make_team(db, league.id, name=f"T{i}") for i in range(4)]
+    scores = [(21, 14), (7, 28), (14, 13), (3, 6)]
+    for week, (s1, s2) in enumerate(scores, start=1):
+        game = make_game(db, league.id, teams[week % 4].id, teams[(week + 1) % 4].id, week=week)
+        _put_game(client, league.id, game.id, {"team1_score": s1, "team2_score": s2})
+
+    assert get_team_standings(db, league.id) == calculate_team_standings(league.id, db)
+
+
+def test_rebuild_standings_repairs_drift(client, db):
+    league = make_league(db)
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    # Written directly, bypassing update_game, so the aggregate is stale
+    make_game(db, league.id, t1.id, t2.id,
+              status="completed", team1_score=21, team2_score=14, winner_id=t1.id)
+    assert get_team_standings(db, league.id) == []
+
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/standings/rebuild")
+    _admin_teardown()
+    assert resp.status_code == 200
+    assert resp.json()["teams_ranked"] == 2
+    assert get_team_standings(db, league.id) == calculate_team_standings(league.id, db)
+
+
+def test_rebuild_standings_league_not_found(client, db):
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{uuid4()}/standings/rebuild")
+    _admin_teardown()
+    assert resp.status_code == 404
+
+
 # ---------------------------------------------------------------------------
 # get_available_time_slots_for_date (integration-style, uses real DB)
 # ---------------------------------------------------------------------------
@@ -425,3 +676,214 @@ def test_available_slots_with_field_filter(db):
     db.flush()
     result = get_available_time_slots_for_date(league.id, date(2026, 6, 1), db, field_id=f1.id)
     assert all(slot[0] == f1.id for slot in result)
+
+
+# ---------------------------------------------------------------------------
+# get_available_time_slots_for_range
+# ---------------------------------------------------------------------------
+
+def test_range_expands_recurring_by_weekday(db):
+    league = make_league(db)
+    field = make_field(db)
+    make_league_field(db, league.id, field.id)
+    make_field_availability(db, field.id, day_of_week=0,
+                           recurrence_start_date=date(2026, 1, 1))
+    result = get_available_time_slots_for_range(league.id, date(2026, 6, 1), date(2026, 6, 21), db)
+    # Mondays only: 6/1, 6/8, 6/15
+    assert sorted(result) == [date(2026, 6, 1), date(2026, 6, 8), date(2026, 6, 15)]
+    assert all(windows[0][0] == field.id for windows in result.values())
+
+
+def test_range_respects_recurrence_bounds_and_custom_dates(db):
+    from datetime import time as t
+    league = make_league(db)
+    field = make_field(db)
+    make_league_field(db, league.id, field.id)
+    make_field_availability(db, field.id, day_of_week=0,
+                           recurrence_start_date=date(2026, 6, 8),
+                           recurrence_end_date=date(2026, 6, 8))
+    make_field_availability(db, field.id, is_recurring=False, day_of_week=None,
+                           custom_date=date(2026, 6, 13),
+                           start_time=t(10, 0), end_time=t(14, 0))
+    result = get_available_time_slots_for_range(league.id, date(2026, 6, 1), date(2026, 6, 30), db)
+    assert sorted(result) == [date(2026, 6, 8), date(2026, 6, 13)]
+
+
+def test_range_matches_per_date_lookup(db):
+    from datetime import time as t
+    league = make_league(db)
+    f1 = make_field(db, name="F1")
+    f2 = make_field(db, name="F2")
+    make_league_field(db, league.id, f1.id)
+    make_league_field(db, league.id, f2.id)
+    make_field_availability(db, f1.id, day_of_week=0, recurrence_start_date=date(2026, 1, 1))
+    make_field_availability(db, f2.id, day_of_week=0, recurrence_start_date=date(2026, 1, 1),
+                           start_time=t(17, 0), end_time=t(18, 0))
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    make_game(db, league.id, t1.id, t2.id, field_id=f2.id,
+              game_date=date(2026, 6, 8), game_time="17:00",
+              game_datetime=datetime(2026, 6, 8, 17, 0))
+
+    start, end = date(2026, 6, 1), date(2026, 6, 28)
+    by_range = get_available_time_slots_for_range(league.id, start, end, db)
+    day = start
+    while day <= end:
+        assert by_range.get(day, []) == get_available_time_slots_for_date(league.id, day, db)
+        day += timedelta(days=1)
+
+
+def test_range_skips_blackouts(db):
+    league = make_league(db)
+    field = make_field(db)
+    make_league_field(db, league.id, field.id)
+    make_field_availability(db, field.id, day_of_week=0, recurrence_start_date=date(2026, 1, 1))
+    # Closed all of the 6/8 session and the first half of 6/15's
+    make_field_blackout(db, field.id, datetime(2026, 6, 8, 0, 0), datetime(2026, 6, 9, 0, 0))
+    make_field_blackout(db, field.id, datetime(2026, 6, 15, 17, 0), datetime(2026, 6, 15, 19, 30))
+    make_field_blackout(db, field.id, datetime(2026, 6, 22, 0, 0), datetime(2026, 6, 23, 0, 0), is_active=False)
+    result = get_available_time_slots_for_range(league.id, date(2026, 6, 1), date(2026, 6, 28), db)
+    assert sorted(result) == [date(2026, 6, 1), date(2026, 6, 15), date(2026, 6, 22)]
+    assert result[date(2026, 6, 15)] == [(field.id, time(19, 30), time(21, 0))]
+
+
+def test_range_offers_free_part_of_booked_window(db):
+    league = make_league(db)
+    field = make_field(db)
+    make_league_field(db, league.id, field.id)
+    make_field_availability(db, field.id, day_of_week=0, recurrence_start_date=date(2026, 1, 1))
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    make_game(db, league.id, t1.id, t2.id, field_id=field.id,
+              game_date=date(2026, 6, 1), game_time="18:00",
+              game_datetime=datetime(2026, 6, 1, 18, 0))
+    result = get_available_time_slots_for_date(league.id, date(2026, 6, 1), db)
+    assert result == [(field.id, time(19, 0), time(21, 0))]
+
+
+def test_generate_schedule_query_count_is_independent_of_weeks(client, db):
+    from sqlalchemy import event
+
+    league = make_league(db, num_weeks=20)
+    field = make_field(db)
+    make_league_field(db, league.id, field.id)
+    make_field_availability(db, field.id, day_of_week=0, recurrence_start_date=date(2026, 1, 1))
+    for i in range(4):
+        make_team(db, league.id, name=f"T{i}")
+
+    statements = []
+
+    def _count(conn, cursor, statement, params, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _count)
+    try:
+        _admin_setup()
+        resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={})
+        _admin_teardown()
+    finally:
+        event.remove(bind, "before_cursor_execute", _count)
+
+    assert resp.status_code == 200
+    assert resp.json()["games_created"] > 0
+    # league, teams, existing games, standings rebuild, fields, bookings, availability
+    assert len(statements) <= 10
+
+
+def test_regenerate_schedule_writes_games_in_bulk(client, db):
+    from sqlalchemy import event
+
+    league = make_league(db, num_weeks=12)
+    teams = [make_team(db, league.id, name=f"T{i}") for i in range(8)]
+    for week in range(1, 6):
+        make_game(db, league.id, teams[0].id, teams[1].id, week=week)
+
+    statements = []
+
+    def _record(conn, cursor, statement, params, context, executemany):
+        if "games" in statement and statement.lstrip().upper().startswith(("INSERT", "UPDATE")):
+            statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        _admin_setup()
+        resp = client.post(
+            f"/admin/leagues/{league.id}/generate-schedule",
+            json={"time_slots": ["18:00", "19:00", "20:00", "21:00"]},
+        )
+        _admin_teardown()
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+    assert resp.status_code == 200
+    assert resp.json()["games_created"] == 48
+    # One UPDATE deactivating the old games, one multi-row INSERT
+    assert len(statements) == 2
+    db.expire_all()
+    assert db.query(Game).filter(Game.league_id == league.id, Game.is_active == True).count() == 48
+
+
+# ---------------------------------------------------------------------------
+# Public read cache
+# ---------------------------------------------------------------------------
+
+def test_public_schedule_etag_and_304(client, db):
+    league = make_league(db)
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    make_game(db, league.id, t1.id, t2.id)
+
+    first = client.get(f"/league/{league.id}/schedule")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public, max-age=")
+
+    resp = client.get(f"/league/{league.id}/schedule", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+
+def test_update_game_invalidates_cached_standings_and_schedule(client, db):
+    league = make_league(db)
+    t1 = make_team(db, league.id, name="T1")
+    t2 = make_team(db, league.id, name="T2")
+    game = make_game(db, league.id, t1.id, t2.id)
+
+    standings = client.get(f"/league/{league.id}/standings")
+    schedule = client.get(f"/league/{league.id}/schedule")
+    assert standings.json() == []
+
+    _admin_setup()
+    resp = client.put(f"/admin/leagues/{league.id}/games/{game.id}", json={
+        "team1_score": 21,
+        "team2_score": 14,
+    })
+    _admin_teardown()
+    assert resp.status_code == 200
+
+    fresh = client.get(
+        f"/league/{league.id}/standings", headers={"If-None-Match": standings.headers["etag"]},
+    )
+    assert fresh.status_code == 200
+    assert fresh.json()[0]["team_id"] == str(t1.id)
+    week = client.get(f"/league/{league.id}/schedule").json()["schedule_by_week"]["1"]
+    assert week[0]["team1_score"] == 21
+    assert schedule.headers["etag"] != client.get(f"/league/{league.id}/schedule").headers["etag"]
+
+
+def test_generate_schedule_invalidates_cached_schedule(client, db):
+    league = make_league(db, num_weeks=2)
+    make_team(db, league.id, name="T1")
+    make_team(db, league.id, name="T2")
+
+    assert client.get(f"/league/{league.id}/schedule").json()["total_games"] == 0
+
+    _admin_setup()
+    resp = client.post(f"/admin/leagues/{league.id}/generate-schedule", json={"time_slots": ["18:00"]})
+    _admin_teardown()
+    assert resp.status_code == 200
+
+    assert client.get(f"/league/{league.id}/schedule").json()["total_games"] == 2
@@ -53,3 +53,19 @@ def test_unregister_not_registered(client, db):
     db.commit()
     resp = client.delete(f"/registration/leagues/{league.id}")
     assert resp.status_code == 404
+
+
+def test_unregister_decrements_occupancy_counter(client, db):
+    from app.models.league import League
+
+    league = make_league(db)
+    player = make_player(db, clerk_user_id=CLERK_ID, email="unreg@example.com")
+    make_league_player(db, league.id, player.id, status="confirmed")
+    db.commit()
+    assert league.confirmed_players_count == 1
+
+    resp = client.delete(f"/registration/leagues/{league.id}")
+    assert resp.status_code == 200
+
+    db.expire_all()
+    assert db.query(League).get(league.id).confirmed_players_count == 0
@@ -1,7 +1,13 @@
 """Integration tests for waiver API endpoints."""
 
+import csv
+import io
+import zipfile
 from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
+from app.models.email_outbox import EmailOutbox
+from app.models.waiver import WaiverSignature
 from tests.conftest import (
     make_league,
     make_league_player,
@@ -46,6 +52,12 @@ class TestSignWaiver:
         assert "signed_at" in data
         assert data["waiver_version"] == "2025-v1"
 
+        # PDF, S3 and the confirmation email are left to the document stage
+        sig = db.query(WaiverSignature).filter(WaiverSignature.player_id == player.id).one()
+        assert sig.processed_at is None
+        assert sig.pdf_path is None
+        assert db.query(EmailOutbox).filter(EmailOutbox.kind == "waiver_confirmation").count() == 0
+
     def test_sign_unauthenticated(self, client, db):
         waiver = make_waiver(db)
         league = make_league(db)
@@ -163,6 +175,88 @@ class TestAdminWaivers:
         resp = client.get(f"/admin/waivers?league_id={league.id}")
         assert resp.status_code == 403
 
+    def test_export_archive(self, client, db, override_admin, fake_s3):
+        waiver = make_waiver(db, content="Waiver text.")
+        league = make_league(db, name="Fall League")
+        alice = make_player(db, first_name="Alice", last_name="Smith")
+        bob = make_player(db, first_name="Bob", last_name="Jones")
+        stored = make_waiver_signature(db, waiver.id, alice.id, league.id, pdf_path="waivers/alice.pdf")
+        make_waiver_signature(db, waiver.id, bob.id, league.id)
+        fake_s3.objects[("test-waivers", stored.pdf_path)] = b"%PDF-stored"
+        fake_s3.content_types[("test-waivers", stored.pdf_path)] = "application/pdf"
+
+        # No export Lambda configured: the archive is built before the response
+        resp = client.post(f"/admin/waivers/export?league_id={league.id}")
+
+        assert resp.status_code == 202
+        data = resp.json()
+        assert data["status"] == "ready"
+        assert "waivers-fall-league-" in data["download_url"]
+        key = f"exports/waivers/{league.id}/{data['export_id']}.zip"
+        with zipfile.ZipFile(io.BytesIO(fake_s3.objects[("test-waivers", key)])) as zf:
+            names = zf.namelist()
+            manifest = list(csv.DictReader(io.StringIO(zf.read("manifest.csv").decode())))
+        assert len(names) == 3 and names[-1] == "manifest.csv"
+        assert [(r["player_name"], r["source"]) for r in manifest] == [
+            ("Bob Jones", "regenerated"), ("Alice Smith", "stored"),
+        ]
+
+        status = client.get(f"/admin/waivers/export/{data['export_id']}?league_id={league.id}")
+        assert status.status_code == 200
+        assert status.json()["status"] == "ready"
+
+    def test_export_archive_is_handed_to_the_export_lambda(self, client, db, override_admin, fake_s3, monkeypatch):
+        from app.core.config import settings
+        league = make_league(db)
+        invoked = []
+
+        class _Lambda:
+            def invoke(self, **kwargs):
+                invoked.append(kwargs)
+
+        monkeypatch.setattr(settings, "WAIVER_EXPORT_FUNCTION_NAME", "waiver-export")
+        monkeypatch.setattr("boto3.client", lambda service, **kwargs: _Lambda())
+
+        resp = client.post(f"/admin/waivers/export?league_id={league.id}")
+
+        assert resp.status_code == 202
+        assert resp.json()["status"] == "pending"
+        assert invoked[0]["FunctionName"] == "waiver-export"
+        assert invoked[0]["InvocationType"] == "Event"
+        assert resp.json()["export_id"] in invoked[0]["Payload"].decode()
+
+    def test_failed_export_reports_its_error(self, client, db, override_admin, fake_s3):
+        league = make_league(db)
+        export_id = uuid4()
+        key = f"exports/waivers/{league.id}/{export_id}.zip.failed"
+        fake_s3.objects[("test-waivers", key)] = b"ClientError: SlowDown"
+        fake_s3.content_types[("test-waivers", key)] = "text/plain"
+
+        resp = client.get(f"/admin/waivers/export/{export_id}?league_id={league.id}")
+
+        assert resp.json() == {
+            "export_id": str(export_id), "status": "failed", "download_url": None, "error": "ClientError: SlowDown",
+        }
+
+    def test_export_status_pending(self, client, db, override_admin, fake_s3):
+        league = make_league(db)
+        resp = client.get(f"/admin/waivers/export/{uuid4()}?league_id={league.id}")
+        assert resp.json()["status"] == "pending"
+
+    def test_export_archive_unknown_league(self, client, db, override_admin, fake_s3):
+        resp = client.post(f"/admin/waivers/export?league_id={uuid4()}")
+        assert resp.status_code == 404
+
+    def test_export_archive_without_storage(self, client, db, override_admin):
+        league = make_league(db)
+        resp = client.post(f"/admin/waivers/export?league_id={league.id}")
+        assert resp.status_code == 503
+
+    def test_export_archive_forbidden(self, client, db, override_auth):
+        league = make_league(db)
+        resp = client.post(f"/admin/waivers/export?league_id={league.id}")
+        assert resp.status_code == 403
+
     def test_create_waiver_version(self, client, db, override_admin):
         make_waiver(db, version="v1")
 
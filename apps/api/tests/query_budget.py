@@ -0,0 +1,81 @@
+"""
+Pytest plugin: fail a test when an endpoint runs more SQL than it declares.
+
+Every request served while a budget is active is profiled by
+app.core.query_profiler; one that exceeds the budget fails the test with its
+query count and the statements it repeated (the usual N+1 culprit).
+
+Per test, covering every request it makes:
+
+    @pytest.mark.query_budget(4)
+    def test_list_fields(client, override_admin): ...
+
+Or around specific requests, e.g. to keep setup calls out of the budget:
+
+    def test_list_fields(client, query_budget):
+        with query_budget(4):
+            client.get("/admin/fields")
+
+Queries the test itself runs (factories, assertions) are not counted.
+Registered from tests/conftest.py via pytest_plugins.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from app.core.query_profiler import QueryProfile, add_request_observer, remove_request_observer
+
+_SHOWN_STATEMENTS = 3
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "query_budget(n): fail if any request in the test runs more than n SQL queries",
+    )
+
+
+def _describe(method: str, path: str, profile: QueryProfile, budget: int) -> str:
+    lines = [f"{method} {path} ran {profile.count} queries (budget {budget})"]
+    for sql, n in profile.fingerprints.most_common(_SHOWN_STATEMENTS):
+        if n > 1:
+            lines.append(f"    {n}x {sql}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def _budget(limit: int) -> Iterator[List[Tuple[str, str, QueryProfile]]]:
+    if limit < 0:
+        raise ValueError("query budget must be >= 0")
+    seen: List[Tuple[str, str, QueryProfile]] = []
+
+    def observe(request, profile):
+        route = request.scope.get("route")
+        seen.append((request.method, getattr(route, "path", request.url.path), profile))
+
+    add_request_observer(observe)
+    try:
+        yield seen
+    finally:
+        remove_request_observer(observe)
+    over = [_describe(method, path, profile, limit) for method, path, profile in seen if profile.count > limit]
+    if over:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(over), pytrace=False)
+
+
+@pytest.fixture
+def query_budget():
+    """query_budget(n) — context manager failing the test if a request inside runs more than n queries."""
+    return _budget
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    # Wraps the test body only (not fixture setup/teardown), so an overrun is a
+    # test failure rather than a teardown error
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+    with _budget(*marker.args, **marker.kwargs):
+        return (yield)
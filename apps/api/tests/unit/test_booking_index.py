@@ -0,0 +1,76 @@
+"""Tests for the benchmarks' sorted-interval baseline (benchmarks/_booking_index.py)."""
+
+import random
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from benchmarks._booking_index import FieldBookingIndex
+
+
+def _dt(hour, minute=0, day=1):
+    return datetime(2026, 6, day, hour, minute)
+
+
+def _linear_overlaps(bookings, start, end):
+    return any(b_start < end and b_end > start for b_start, b_end in bookings)
+
+
+class TestFieldBookingIndex:
+    def test_empty_field_has_no_overlap(self):
+        index = FieldBookingIndex()
+        assert not index.overlaps(uuid4(), _dt(18), _dt(19))
+
+    def test_overlap_and_touching_boundaries(self):
+        field = uuid4()
+        index = FieldBookingIndex()
+        index.add(field, _dt(18), _dt(19))
+        assert index.overlaps(field, _dt(18, 30), _dt(19, 30))
+        assert index.overlaps(field, _dt(17), _dt(20))
+        # Half-open intervals: back-to-back games do not conflict
+        assert not index.overlaps(field, _dt(19), _dt(20))
+        assert not index.overlaps(field, _dt(17), _dt(18))
+
+    def test_fields_are_independent(self):
+        field_a, field_b = uuid4(), uuid4()
+        index = FieldBookingIndex()
+        index.add(field_a, _dt(18), _dt(19))
+        assert not index.overlaps(field_b, _dt(18), _dt(19))
+
+    def test_long_early_booking_is_found(self):
+        """A booking that starts early but ends late must not be hidden by later, shorter ones."""
+        field = uuid4()
+        index = FieldBookingIndex()
+        index.add(field, _dt(8), _dt(20))
+        index.add(field, _dt(9), _dt(10))
+        index.add(field, _dt(11), _dt(12))
+        assert index.overlaps(field, _dt(15), _dt(16))
+
+    def test_add_after_query_is_visible(self):
+        field = uuid4()
+        index = FieldBookingIndex()
+        index.add(field, _dt(18), _dt(19))
+        assert not index.overlaps(field, _dt(20), _dt(21))
+        index.add(field, _dt(20, 30), _dt(21, 30))
+        assert index.overlaps(field, _dt(20), _dt(21))
+
+    def test_spans_midnight(self):
+        field = uuid4()
+        index = FieldBookingIndex()
+        index.add(field, _dt(23, 30), _dt(0, 30, day=2))
+        assert index.overlaps(field, _dt(0, 0, day=2), _dt(1, 0, day=2))
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        field = uuid4()
+        base = _dt(0)
+        bookings = []
+        index = FieldBookingIndex()
+        for _ in range(300):
+            start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 14, 15))
+            end = start + timedelta(minutes=rng.choice([30, 60, 90, 240]))
+            bookings.append((start, end))
+            index.add(field, start, end)
+        for _ in range(500):
+            start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 14, 5))
+            end = start + timedelta(minutes=rng.choice([15, 60, 120]))
+            assert index.overlaps(field, start, end) == _linear_overlaps(bookings, start, end)
@@ -1,5 +1,6 @@
 """Unit tests for app.utils.clerk_jwt — JWKS caching, signing key extraction,
-email fetching, get_optional_user, get_current_user, and test bypass."""
+email fetching, get_optional_user, get_current_user, test bypass, the
+parsed-key / verified-token caches, and the tiered email lookup."""
 
 import asyncio
 import time
@@ -17,13 +18,21 @@ from app.utils.clerk_jwt import (
     JWKS_CACHE_TTL,
     _CLERK_ISSUER_NORMALIZED,
     _EMAIL_CACHE,
+    _EMAIL_INFLIGHT,
+    EmailLookupStats,
+    _SIGNING_KEYS,
+    _VERIFIED_TOKENS,
+    _build_shared_email_store,
     _fetch_clerk_email,
     _get_signing_key,
     _get_test_bypass_user,
     get_current_user,
     get_jwks,
+    email_lookup_stats,
     get_optional_user,
 )
+from app.core.cache import MemoryBackend, PostgresBackend
+from app.core.config import settings
 
 
 # ---------------------------------------------------------------------------
@@ -66,17 +75,23 @@ def _make_request(token: str | None = None) -> MagicMock:
 
 
 @pytest.fixture(autouse=True)
-def _reset_caches():
-    """Clear JWKS and email caches before each test."""
-    JWKS_CACHE["keys"] = None
-    JWKS_CACHE["fetched_at"] = 0
-    JWKS_CACHE["failed_at"] = 0
-    _EMAIL_CACHE.clear()
+def _reset_caches(monkeypatch):
+    """Clear JWKS, key, token and email caches before each test."""
+    monkeypatch.setattr("app.utils.clerk_jwt.EMAIL_LOOKUP_STATS", EmailLookupStats())
+    monkeypatch.setattr("app.utils.clerk_jwt._EMAIL_SHARED", None)
+
+    def reset():
+        JWKS_CACHE["keys"] = None
+        JWKS_CACHE["fetched_at"] = 0
+        JWKS_CACHE["failed_at"] = 0
+        _SIGNING_KEYS["source"] = None
+        _SIGNING_KEYS["keys"] = {}
+        _VERIFIED_TOKENS.clear()
+        _EMAIL_CACHE.clear()
+        _EMAIL_INFLIGHT.clear()
+    reset()
     yield
-    JWKS_CACHE["keys"] = None
-    JWKS_CACHE["fetched_at"] = 0
-    JWKS_CACHE["failed_at"] = 0
-    _EMAIL_CACHE.clear()
+    reset()
 
 
 # ===================================================================
@@ -87,6 +102,7 @@ def _reset_caches():
 async def test_get_jwks_cache_miss_fetches():
     """First call should fetch JWKS via HTTP."""
     mock_resp = MagicMock()
+    mock_resp.status_code = 200
     mock_resp.json.return_value = {"keys": [JWK_DICT]}
     mock_resp.raise_for_status = MagicMock()
 
@@ -95,7 +111,7 @@ async def test_get_jwks_cache_miss_fetches():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         result = await get_jwks()
 
     assert result == {"keys": [JWK_DICT]}
@@ -108,7 +124,7 @@ async def test_get_jwks_cache_hit_skips_fetch():
     JWKS_CACHE["keys"] = {"keys": [JWK_DICT]}
     JWKS_CACHE["fetched_at"] = int(time.time())
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient") as mock_cls:
+    with patch("app.core.http_client.httpx.AsyncClient") as mock_cls:
         result = await get_jwks()
 
     assert result == {"keys": [JWK_DICT]}
@@ -123,6 +139,7 @@ async def test_get_jwks_cache_expiry_refetches():
 
     new_jwks = {"keys": [JWK_DICT]}
     mock_resp = MagicMock()
+    mock_resp.status_code = 200
     mock_resp.json.return_value = new_jwks
     mock_resp.raise_for_status = MagicMock()
 
@@ -131,7 +148,7 @@ async def test_get_jwks_cache_expiry_refetches():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         result = await get_jwks()
 
     assert result == new_jwks
@@ -149,6 +166,7 @@ async def test_get_jwks_lock_dedup():
         fetch_count += 1
         await asyncio.sleep(0.05)  # simulate latency
         resp = MagicMock()
+        resp.status_code = 200
         resp.json.return_value = original_keys
         resp.raise_for_status = MagicMock()
         return resp
@@ -158,7 +176,7 @@ async def test_get_jwks_lock_dedup():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         results = await asyncio.gather(get_jwks(), get_jwks(), get_jwks())
 
     # All should get the same result
@@ -209,6 +227,7 @@ async def test_fetch_clerk_email_primary():
     }
 
     mock_resp = MagicMock()
+    mock_resp.status_code = 200
     mock_resp.json.return_value = api_response
     mock_resp.raise_for_status = MagicMock()
 
@@ -217,7 +236,7 @@ async def test_fetch_clerk_email_primary():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         email = await _fetch_clerk_email("user_abc")
 
     assert email == "primary@example.com"
@@ -234,6 +253,7 @@ async def test_fetch_clerk_email_fallback_first():
     }
 
     mock_resp = MagicMock()
+    mock_resp.status_code = 200
     mock_resp.json.return_value = api_response
     mock_resp.raise_for_status = MagicMock()
 
@@ -242,7 +262,7 @@ async def test_fetch_clerk_email_fallback_first():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         email = await _fetch_clerk_email("user_abc")
 
     assert email == "first@example.com"
@@ -254,6 +274,7 @@ async def test_fetch_clerk_email_no_emails():
     api_response = {"email_addresses": [], "primary_email_address_id": None}
 
     mock_resp = MagicMock()
+    mock_resp.status_code = 200
     mock_resp.json.return_value = api_response
     mock_resp.raise_for_status = MagicMock()
 
@@ -262,7 +283,7 @@ async def test_fetch_clerk_email_no_emails():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         with pytest.raises(HTTPException) as exc_info:
             await _fetch_clerk_email("user_abc")
     assert exc_info.value.status_code == 401
@@ -277,7 +298,7 @@ async def test_fetch_clerk_email_timeout():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         with pytest.raises(HTTPException) as exc_info:
             await _fetch_clerk_email("user_abc")
     assert exc_info.value.status_code == 503
@@ -296,7 +317,7 @@ async def test_fetch_clerk_email_http_error():
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
     mock_client.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.utils.clerk_jwt.httpx.AsyncClient", return_value=mock_client):
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
         with pytest.raises(HTTPException) as exc_info:
             await _fetch_clerk_email("user_abc")
     assert exc_info.value.status_code == 401
@@ -498,3 +519,224 @@ def test_bypass_empty_token_returns_none():
          patch("app.utils.clerk_jwt._TEST_BYPASS_TOKEN", ""):
         result = _get_test_bypass_user(request)
     assert result is None
+
+
+# ===================================================================
+# 7. Parsed-key and verified-token caches
+# ===================================================================
+
+def _load_jwks(jwks=None):
+    JWKS_CACHE["keys"] = jwks or {"keys": [JWK_DICT]}
+    JWKS_CACHE["fetched_at"] = int(time.time())
+    return JWKS_CACHE["keys"]
+
+
+def _valid_token(sub="user_abc", ttl=300):
+    return _make_token({
+        "sub": sub,
+        "iss": _CLERK_ISSUER_NORMALIZED,
+        "exp": int(time.time()) + ttl,
+        "email": f"{sub}@example.com",
+    })
+
+
+def test_signing_keys_parsed_once_per_jwks_document():
+    jwks = {"keys": [JWK_DICT]}
+    token = _make_token({"sub": "user_123"})
+    with patch.object(jwt_algorithms.RSAAlgorithm, "from_jwk", wraps=jwt_algorithms.RSAAlgorithm.from_jwk) as from_jwk:
+        first = _get_signing_key(jwks, token)
+        assert _get_signing_key(jwks, token) is first
+        assert from_jwk.call_count == 1
+
+        _get_signing_key({"keys": [JWK_DICT]}, token)  # refreshed document
+        assert from_jwk.call_count == 2
+
+
+def test_unusable_jwk_is_skipped():
+    jwks = {"keys": [{"kid": "bad", "kty": "RSA"}, JWK_DICT]}
+    token = _make_token({"sub": "user_123"})
+    assert _get_signing_key(jwks, token) is not None
+
+
+@pytest.mark.asyncio
+async def test_repeated_token_is_verified_once():
+    _load_jwks()
+    token = _valid_token()
+
+    with patch("app.utils.clerk_jwt._get_test_bypass_user", return_value=None), \
+         patch("app.utils.clerk_jwt.pyjwt.decode", wraps=pyjwt.decode) as decode:
+        first = await get_current_user(_make_request(token))
+        first["email"] = "mutated@example.com"
+        second = await get_current_user(_make_request(token))
+        optional = await get_optional_user(_make_request(token))
+
+    assert decode.call_count == 1
+    assert second["id"] == "user_abc"
+    assert second["email"] == "user_abc@example.com"
+    assert optional == {"id": "user_abc"}
+
+
+@pytest.mark.asyncio
+async def test_cached_token_is_not_served_after_exp():
+    _load_jwks()
+    token = _valid_token(ttl=60)
+
+    with patch("app.utils.clerk_jwt._get_test_bypass_user", return_value=None):
+        await get_current_user(_make_request(token))
+        with patch("app.utils.clerk_jwt.time.time", return_value=time.time() + 120), \
+             patch("app.utils.clerk_jwt.pyjwt.decode", side_effect=pyjwt.ExpiredSignatureError("expired")):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(_make_request(token))
+
+    assert exc_info.value.status_code == 401
+    assert len(_VERIFIED_TOKENS) == 0
+
+
+@pytest.mark.asyncio
+async def test_jwks_refresh_invalidates_verified_tokens():
+    _load_jwks()
+    token = _valid_token()
+    with patch("app.utils.clerk_jwt._get_test_bypass_user", return_value=None):
+        await get_current_user(_make_request(token))
+        assert len(_VERIFIED_TOKENS) == 1
+
+        # Key rotated out: the refreshed JWKS no longer has the token's kid
+        _, _, other_jwk = _generate_rsa_key_pair()
+        other_jwk["kid"] = "test-kid-2"
+        _load_jwks({"keys": [other_jwk]})
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(_make_request(token))
+
+    assert exc_info.value.status_code == 401
+    assert len(_VERIFIED_TOKENS) == 0
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_not_cached():
+    _load_jwks()
+    token = _make_token({"sub": "user_abc", "iss": "https://wrong.clerk.dev", "exp": int(time.time()) + 300})
+    with patch("app.utils.clerk_jwt._get_test_bypass_user", return_value=None):
+        assert await get_optional_user(_make_request(token)) is None
+    assert len(_VERIFIED_TOKENS) == 0
+
+
+@pytest.mark.asyncio
+async def test_verified_token_cache_is_bounded():
+    _load_jwks()
+    with patch("app.utils.clerk_jwt._VERIFIED_TOKENS_MAX", 2), \
+         patch("app.utils.clerk_jwt._get_test_bypass_user", return_value=None):
+        tokens = [_valid_token(sub=f"user_{i}") for i in range(3)]
+        for token in tokens:
+            await get_optional_user(_make_request(token))
+    assert len(_VERIFIED_TOKENS) == 2
+
+
+# ===================================================================
+# 8. Tiered email lookup
+# ===================================================================
+
+def _clerk_client(email="primary@example.com", delay=0.0, side_effect=None):
+    """Mock httpx.AsyncClient whose GET returns a single primary email after `delay`."""
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.json.return_value = {
+        "email_addresses": [{"id": "email_primary", "email_address": email}],
+        "primary_email_address_id": "email_primary",
+    }
+    mock_resp.raise_for_status = MagicMock()
+
+    async def get(*args, **kwargs):
+        await asyncio.sleep(delay)
+        if side_effect:
+            raise side_effect
+        return mock_resp
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=get)
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=False)
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_upstream_call():
+    mock_client = _clerk_client(delay=0.05)
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
+        emails = await asyncio.gather(*(_fetch_clerk_email("user_abc") for _ in range(5)))
+
+    assert emails == ["primary@example.com"] * 5
+    assert mock_client.get.await_count == 1
+    assert not _EMAIL_INFLIGHT
+    stats = email_lookup_stats()
+    assert stats["upstream_calls"] == 1
+    assert stats["coalesced"] == 4
+    assert stats["hit_rate"] == 0.8
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_lookup():
+    mock_client = _clerk_client(delay=0.05)
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
+        first = asyncio.ensure_future(_fetch_clerk_email("user_abc"))
+        second = asyncio.ensure_future(_fetch_clerk_email("user_abc"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "primary@example.com"
+    assert mock_client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_hit_skips_upstream():
+    mock_client = _clerk_client()
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
+        await _fetch_clerk_email("user_abc")
+        await _fetch_clerk_email("user_abc")
+    assert mock_client.get.await_count == 1
+    assert email_lookup_stats()["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_store_is_read_and_written(monkeypatch):
+    shared = MemoryBackend()
+    monkeypatch.setattr("app.utils.clerk_jwt._EMAIL_SHARED", shared)
+    mock_client = _clerk_client()
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client):
+        await _fetch_clerk_email("user_abc")
+        assert shared.get("clerk-email:user_abc") == b"primary@example.com"
+
+        # Another instance: cold memory tier, warm shared tier
+        _EMAIL_CACHE.clear()
+        assert await _fetch_clerk_email("user_abc") == "primary@example.com"
+
+    assert mock_client.get.await_count == 1
+    assert email_lookup_stats()["shared_hits"] == 1
+
+
+def test_shared_store_defaults_to_postgres(monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_LOOKUP_SHARED_BACKEND", "postgres")
+    assert isinstance(_build_shared_email_store(), PostgresBackend)
+    monkeypatch.setattr(settings, "EMAIL_LOOKUP_SHARED_BACKEND", "none")
+    assert _build_shared_email_store() is None
+
+
+@pytest.mark.asyncio
+async def test_shared_store_errors_are_misses(monkeypatch):
+    broken = MagicMock()
+    broken.get.side_effect = ConnectionError("down")
+    broken.set.side_effect = ConnectionError("down")
+    monkeypatch.setattr("app.utils.clerk_jwt._EMAIL_SHARED", broken)
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=_clerk_client()):
+        assert await _fetch_clerk_email("user_abc") == "primary@example.com"
+
+
+@pytest.mark.asyncio
+async def test_clerk_outage_is_503_and_not_cached():
+    mock_client = _clerk_client(side_effect=httpx.TimeoutException("timed out"))
+    with patch("app.core.http_client.httpx.AsyncClient", return_value=mock_client), \
+         patch("app.utils.clerk_jwt.asyncio.sleep", AsyncMock()):
+        with pytest.raises(HTTPException) as exc_info:
+            await _fetch_clerk_email("user_abc")
+
+    assert exc_info.value.status_code == 503
+    assert email_lookup_stats()["upstream_errors"] == 1
+    assert _EMAIL_CACHE.get("user_abc") is None
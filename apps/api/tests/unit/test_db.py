@@ -0,0 +1,25 @@
+"""Unit tests for app.db.db — async URL rewriting and async dependency wiring."""
+
+from app.db.db import _async_url, get_async_db
+
+
+def test_async_url_rewrites_plain_postgres():
+    assert _async_url("postgresql://u:p@h:5432/db") == "postgresql+asyncpg://u:p@h:5432/db"
+
+
+def test_async_url_rewrites_psycopg2_driver():
+    assert _async_url("postgresql+psycopg2://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+
+def test_async_url_rewrites_postgres_alias():
+    assert _async_url("postgres://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+
+def test_async_url_leaves_explicit_async_driver():
+    url = "postgresql+asyncpg://u:p@h/db"
+    assert _async_url(url) == url
+
+
+def test_get_async_db_is_async_generator():
+    import inspect
+    assert inspect.isasyncgenfunction(get_async_db)
@@ -0,0 +1,253 @@
+"""Tests for the email outbox — delivery against the local fake Resend server, drain state via the test DB."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.handlers.email_outbox_handler import handler
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox_service import (
+    RESEND_BATCH_LIMIT,
+    _backoff_seconds,
+    _deliver,
+    drain_outbox,
+    enqueue_email,
+    purge_sent,
+)
+
+
+def _message(to="player@example.com", attachment=False) -> dict:
+    message = {"from": "noreply@example.com", "to": to, "subject": "Hello", "html": "<p>Hi</p>"}
+    if attachment:
+        message["attachments"] = [{"filename": "signed-waiver.pdf", "content": "JVBERi0="}]
+    return message
+
+
+# ---------------------------------------------------------------------------
+# Delivery (no DB)
+# ---------------------------------------------------------------------------
+
+class TestDeliver:
+    def test_batches_plain_messages_and_sends_attachments_singly(self, fake_resend):
+        items = [(uuid4(), _message(f"p{i}@example.com")) for i in range(3)]
+        items.append((uuid4(), _message("att@example.com", attachment=True)))
+
+        outcomes = _deliver(items)
+
+        assert [path for path, _, _ in fake_resend.requests] == ["/emails/batch", "/emails"]
+        assert len(fake_resend.sent) == 4
+        assert all(o.error is None and o.provider_id for o in outcomes.values())
+
+    def test_splits_batches_at_resend_limit(self, fake_resend):
+        items = [(uuid4(), _message(f"p{i}@example.com")) for i in range(RESEND_BATCH_LIMIT + 1)]
+        _deliver(items)
+        batch_sizes = [len(body) for path, _, body in fake_resend.requests if path == "/emails/batch"]
+        assert batch_sizes == [RESEND_BATCH_LIMIT, 1]
+
+    def test_permissive_batch_rejects_only_bad_recipient(self, fake_resend):
+        fake_resend.reject("bad@example.com")
+        good, bad, good2 = uuid4(), uuid4(), uuid4()
+
+        outcomes = _deliver([
+            (good, _message("a@example.com")),
+            (bad, _message("bad@example.com")),
+            (good2, _message("b@example.com")),
+        ])
+
+        assert outcomes[good].error is None and outcomes[good2].error is None
+        assert outcomes[good].provider_id != outcomes[good2].provider_id
+        assert outcomes[bad].error and not outcomes[bad].retryable
+        assert [m["to"] for m in fake_resend.sent] == ["a@example.com", "b@example.com"]
+
+    def test_server_error_is_retryable(self, fake_resend):
+        fake_resend.fail_next(500)
+        outbox_id = uuid4()
+        outcome = _deliver([(outbox_id, _message())])[outbox_id]
+        assert outcome.error and outcome.retryable
+
+    def test_rate_limit_is_retryable(self, fake_resend):
+        fake_resend.fail_next(429)
+        outbox_id = uuid4()
+        outcome = _deliver([(outbox_id, _message(attachment=True))])[outbox_id]
+        assert outcome.retryable
+
+    def test_validation_error_is_permanent(self, fake_resend):
+        fake_resend.reject("bad@example.com")
+        outbox_id = uuid4()
+        outcome = _deliver([(outbox_id, _message("bad@example.com", attachment=True))])[outbox_id]
+        assert outcome.error and not outcome.retryable
+
+    def test_unreachable_server_is_retryable(self, fake_resend):
+        fake_resend.stop()
+        outbox_id = uuid4()
+        outcome = _deliver([(outbox_id, _message())])[outbox_id]
+        assert outcome.retryable
+
+    def test_resend_of_same_claim_is_deduplicated(self, fake_resend):
+        items = [(uuid4(), _message("a@example.com")), (uuid4(), _message("b@example.com"))]
+        first = _deliver(items)
+        second = _deliver(items)
+        assert len(fake_resend.sent) == 2
+        assert {k: o.provider_id for k, o in first.items()} == {k: o.provider_id for k, o in second.items()}
+
+
+class TestBackoff:
+    def test_grows_exponentially_and_caps(self):
+        rng = random.Random(0)
+        base = settings.EMAIL_OUTBOX_BACKOFF_BASE_SECONDS
+        for attempts in range(1, 20):
+            delay = _backoff_seconds(attempts, rng)
+            step = min(base * 2 ** (attempts - 1), settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS)
+            assert step / 2 <= delay <= step
+
+
+# ---------------------------------------------------------------------------
+# Drain (test DB)
+# ---------------------------------------------------------------------------
+
+def _rows(db):
+    db.expire_all()
+    return {row.to_email: row for row in db.query(EmailOutbox).all()}
+
+
+class TestDrainOutbox:
+    def test_enqueue_does_not_send(self, db, fake_resend):
+        enqueue_email(db, "waiver_prompt", _message())
+        db.flush()
+        assert fake_resend.requests == []
+        assert _rows(db)["player@example.com"].status == "pending"
+
+    def test_delivers_and_records_provider_id(self, db, fake_resend):
+        enqueue_email(db, "waiver_prompt", _message("a@example.com"))
+        enqueue_email(db, "waiver_confirmation", _message("b@example.com", attachment=True))
+        db.commit()
+
+        result = drain_outbox(db)
+
+        assert (result.claimed, result.sent, result.retried, result.dead) == (2, 2, 0, 0)
+        rows = _rows(db)
+        for row in rows.values():
+            assert row.status == "sent"
+            assert row.attempts == 1
+            assert row.provider_message_id.startswith("fake-")
+            assert row.sent_at is not None
+
+    def test_retryable_failure_is_rescheduled_with_backoff(self, db, fake_resend):
+        enqueue_email(db, "waiver_prompt", _message())
+        db.commit()
+        fake_resend.fail_next(503)
+
+        result = drain_outbox(db, seed=1)
+
+        assert result.retried == 1
+        row = _rows(db)["player@example.com"]
+        assert row.status == "pending"
+        assert row.attempts == 1
+        assert "Scripted failure" in row.last_error
+        assert row.next_attempt_at > datetime.now(timezone.utc)
+
+        # Not due yet: a second drain leaves it alone
+        assert drain_outbox(db).claimed == 0
+
+        row.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db.commit()
+        assert drain_outbox(db).sent == 1
+        row = _rows(db)["player@example.com"]
+        assert row.status == "sent"
+        assert row.attempts == 2
+        assert row.last_error is None
+
+    def test_dead_letters_after_max_attempts(self, db, fake_resend, monkeypatch):
+        monkeypatch.setattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 2)
+        enqueue_email(db, "waiver_prompt", _message())
+        db.commit()
+
+        for _ in range(2):
+            fake_resend.fail_next(500)
+            _rows(db)["player@example.com"].next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            db.commit()
+            result = drain_outbox(db)
+
+        assert result.dead == 1
+        row = _rows(db)["player@example.com"]
+        assert row.status == "dead"
+        assert row.attempts == 2
+
+    def test_permanent_failure_dead_letters_immediately(self, db, fake_resend):
+        fake_resend.reject("bad@example.com")
+        enqueue_email(db, "group_invitation", _message("bad@example.com"))
+        enqueue_email(db, "group_invitation", _message("good@example.com"))
+        db.commit()
+
+        result = drain_outbox(db)
+
+        assert (result.sent, result.dead) == (1, 1)
+        rows = _rows(db)
+        assert rows["bad@example.com"].status == "dead"
+        assert rows["good@example.com"].status == "sent"
+
+    def test_batches_by_claim_size(self, db, fake_resend):
+        for i in range(5):
+            enqueue_email(db, "group_invitation", _message(f"p{i}@example.com"))
+        db.commit()
+
+        result = drain_outbox(db, batch_size=2)
+
+        assert result.sent == 5
+        assert [len(body) for _, _, body in fake_resend.requests] == [2, 2, 1]
+
+    def test_max_batches_limits_work(self, db, fake_resend):
+        for i in range(4):
+            enqueue_email(db, "group_invitation", _message(f"p{i}@example.com"))
+        db.commit()
+
+        result = drain_outbox(db, batch_size=2, max_batches=1)
+
+        assert result.sent == 2
+        assert sum(1 for r in _rows(db).values() if r.status == "pending") == 2
+
+    def test_without_api_key_leaves_rows_pending(self, db, fake_resend, monkeypatch):
+        import resend
+        monkeypatch.setattr(resend, "api_key", None)
+        enqueue_email(db, "waiver_prompt", _message())
+        db.commit()
+
+        assert drain_outbox(db).claimed == 0
+        assert fake_resend.requests == []
+
+    def test_purge_sent_keeps_pending_and_dead(self, db, fake_resend):
+        fake_resend.reject("bad@example.com")
+        enqueue_email(db, "waiver_prompt", _message("sent@example.com"))
+        enqueue_email(db, "waiver_prompt", _message("bad@example.com"))
+        db.commit()
+        drain_outbox(db)
+        enqueue_email(db, "waiver_prompt", _message("pending@example.com"))
+        db.commit()
+
+        purged = purge_sent(db, datetime.now(timezone.utc) + timedelta(days=1))
+        db.commit()
+
+        assert purged == 1
+        assert set(_rows(db)) == {"bad@example.com", "pending@example.com"}
+
+
+# ---------------------------------------------------------------------------
+# Handler
+# ---------------------------------------------------------------------------
+
+def test_handler_rejects_wrong_source():
+    assert handler({"source": "manual"}, None)["statusCode"] == 403
+
+
+def test_handler_drains_with_time_budget(mocker):
+    mock_drain = mocker.patch("app.handlers.email_outbox_handler._drain_once", return_value={"claimed": 0})
+    context = mocker.MagicMock()
+    context.get_remaining_time_in_millis.return_value = 60_000
+
+    result = handler({"source": "aws.events"}, context)
+
+    assert result["statusCode"] == 200
+    assert mock_drain.call_args.args[0] == pytest.approx(55.0)
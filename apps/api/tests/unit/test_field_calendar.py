@@ -0,0 +1,163 @@
+from datetime import date, datetime, timedelta, time as t
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services.field_calendar import (
+    SLOTS_PER_DAY,
+    FieldCalendar,
+    mask_runs,
+    window_mask,
+)
+
+MONDAY = date(2026, 6, 1)
+
+
+def _avail(field_id, **kwargs):
+    defaults = dict(
+        id=uuid4(), field_id=field_id, is_recurring=True, day_of_week=0,
+        recurrence_start_date=None, recurrence_end_date=None, custom_date=None,
+        start_time=t(18, 0), end_time=t(21, 0), is_active=True,
+    )
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+def _calendar(field_id, start=MONDAY, end=date(2026, 6, 28)):
+    return FieldCalendar([field_id], start, end)
+
+
+class TestMasks:
+    def test_window_mask_rounds_inward(self):
+        assert mask_runs(window_mask(t(18, 0), t(19, 0))) == [(216, 228)]
+        assert mask_runs(window_mask(t(18, 2), t(18, 58))) == [(217, 227)]
+        assert window_mask(t(18, 2), t(18, 4)) == 0
+
+    def test_mask_runs(self):
+        mask = window_mask(t(0, 0), t(0, 10)) | window_mask(t(1, 0), t(1, 5))
+        assert mask_runs(mask) == [(0, 2), (12, 13)]
+        assert mask_runs(0) == []
+        assert mask_runs((1 << SLOTS_PER_DAY) - 1) == [(0, SLOTS_PER_DAY)]
+
+
+class TestExpansion:
+    def test_recurring_rule_expands_by_weekday_within_bounds(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field, recurrence_start_date=date(2026, 6, 8),
+                                    recurrence_end_date=date(2026, 6, 15)))
+        windows = cal.windows_by_date(60)
+        assert sorted(windows) == [date(2026, 6, 8), date(2026, 6, 15)]
+        assert windows[date(2026, 6, 8)] == [(field, t(18, 0), t(21, 0))]
+
+    def test_custom_date_and_overlapping_windows_merge(self):
+        field = uuid4()
+        cal = _calendar(field)
+        day = date(2026, 6, 13)
+        cal.add_availability(_avail(field, is_recurring=False, day_of_week=None, custom_date=day,
+                                    start_time=t(10, 0), end_time=t(12, 0)))
+        cal.add_availability(_avail(field, is_recurring=False, day_of_week=None, custom_date=day,
+                                    start_time=t(11, 0), end_time=t(14, 0)))
+        assert cal.free_windows(field, day) == [(t(10, 0), t(14, 0))]
+
+    def test_inactive_and_empty_rules_are_ignored(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field, is_active=False))
+        cal.add_availability(_avail(field, start_time=t(18, 2), end_time=t(18, 4)))
+        cal.add_availability(_avail(field, is_recurring=False, day_of_week=None))
+        assert cal.windows_by_date() == {}
+
+
+class TestBusy:
+    def test_booking_leaves_free_remainder(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field))
+        cal.book(field, datetime(2026, 6, 1, 18), datetime(2026, 6, 1, 19))
+        assert cal.free_windows(field, MONDAY, 60) == [(t(19, 0), t(21, 0))]
+        assert not cal.is_free(field, datetime(2026, 6, 1, 18, 30), datetime(2026, 6, 1, 19, 30))
+        assert cal.is_free(field, datetime(2026, 6, 1, 19), datetime(2026, 6, 1, 20))
+
+    def test_booking_rounds_outward(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field))
+        cal.book(field, datetime(2026, 6, 1, 18, 2), datetime(2026, 6, 1, 18, 58))
+        assert cal.free_windows(field, MONDAY) == [(t(19, 0), t(21, 0))]
+
+    def test_blackout_spanning_days(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field))
+        cal.add_blackout(field, datetime(2026, 6, 1, 20), datetime(2026, 6, 8, 19))
+        assert cal.free_windows(field, MONDAY) == [(t(18, 0), t(20, 0))]
+        assert cal.free_windows(field, date(2026, 6, 8)) == [(t(19, 0), t(21, 0))]
+
+    def test_game_crossing_midnight(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field, day_of_week=1, start_time=t(0, 0), end_time=t(2, 0)))
+        cal.book_games([(field, datetime(2026, 6, 1, 23, 30), 60)])
+        assert cal.free_windows(field, date(2026, 6, 2)) == [(t(0, 30), t(2, 0))]
+
+
+class TestQueries:
+    def test_start_times_pack_games(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field))
+        cal.book(field, datetime(2026, 6, 1, 18, 50), datetime(2026, 6, 1, 19, 10))
+        assert cal.start_times(field, MONDAY, 50) == [t(18, 0), t(19, 10), t(20, 0)]
+        assert cal.start_times(field, MONDAY, 50, step_minutes=60) == [t(18, 0), t(19, 10), t(20, 10)]
+
+    def test_unknown_field_and_out_of_range_are_closed(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field))
+        assert cal.free_mask(uuid4(), MONDAY) == 0
+        assert cal.free_mask(field, date(2026, 7, 6)) == 0
+        assert not cal.is_free(field, datetime(2026, 5, 25, 18), datetime(2026, 5, 25, 19))
+
+    def test_window_until_midnight(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field, start_time=t(22, 0), end_time=t(23, 59, 59)))
+        assert cal.free_windows(field, MONDAY) == [(t(22, 0), t(23, 55))]
+
+    def test_windows_by_date_filters_and_orders_fields(self):
+        f1, f2 = sorted([uuid4(), uuid4()])
+        cal = FieldCalendar([f2, f1], MONDAY, MONDAY)
+        cal.add_availability(_avail(f2, start_time=t(9, 0), end_time=t(10, 0)))
+        cal.add_availability(_avail(f1, start_time=t(18, 0), end_time=t(18, 30)))
+        assert cal.windows_by_date(5) == {MONDAY: [(f1, t(18, 0), t(18, 30)), (f2, t(9, 0), t(10, 0))]}
+        assert cal.windows_by_date(60) == {MONDAY: [(f2, t(9, 0), t(10, 0))]}
+        assert cal.windows_by_date(5, field_ids=[f2]) == {MONDAY: [(f2, t(9, 0), t(10, 0))]}
+
+    def test_book_games_matches_book(self):
+        field = uuid4()
+        rows = [
+            (field, datetime(2026, 6, 1, 18, 2), 50),
+            (field, datetime(2026, 6, 7, 23, 30), 60),  # crosses midnight
+            (field, datetime(2026, 6, 28, 23, 0), 120),  # runs past the range
+            (uuid4(), datetime(2026, 6, 2, 9, 0), 60),  # field not in the calendar yet
+        ]
+        bulk, single = _calendar(field), _calendar(field)
+        bulk.book_games(rows)
+        for field_id, start, minutes in rows:
+            single.book(field_id, start, start + timedelta(minutes=minutes))
+        for field_id, start, _ in rows:
+            for day in (start.date(), start.date() + timedelta(days=1)):
+                assert bulk.masks(field_id, day) == single.masks(field_id, day)
+        assert bulk.masks(field, date(2026, 6, 8))[2] == window_mask(t(0, 0), t(0, 30))
+
+    def test_overlap_mask_and_day_masks(self):
+        field = uuid4()
+        cal = _calendar(field)
+        cal.add_availability(_avail(field))
+        cal.book(field, datetime(2026, 6, 1, 18), datetime(2026, 6, 1, 19))
+        cal.book(field, datetime(2026, 6, 1, 18, 30), datetime(2026, 6, 1, 19, 30))
+        assert cal.overlap_mask(field, MONDAY) == window_mask(t(18, 30), t(19, 0))
+        days = list(cal.day_masks(field))
+        assert [i for i, *_ in days] == [0, 7, 14, 21]
+        assert days[0][4] == window_mask(t(18, 30), t(19, 0))
+        assert days[1][3:] == (0, 0)
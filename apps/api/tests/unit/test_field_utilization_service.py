@@ -0,0 +1,120 @@
+from datetime import date, datetime, timedelta, time as t
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services.exceptions import ServiceError
+from app.services.field_calendar import FieldCalendar
+from app.services.field_utilization_service import (
+    MAX_RANGE_DAYS,
+    MAX_RISK_WINDOWS,
+    RISK_DOUBLE_BOOKED,
+    RISK_UNAVAILABLE,
+    RiskWindow,
+    summarize_calendar,
+)
+
+MONDAY = date(2026, 6, 1)
+
+
+def _avail(field_id, **kwargs):
+    defaults = dict(
+        id=uuid4(), field_id=field_id, is_recurring=True, day_of_week=0,
+        recurrence_start_date=None, recurrence_end_date=None, custom_date=None,
+        start_time=t(18, 0), end_time=t(21, 0), is_active=True,
+    )
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+def _summary(calendar, field_id):
+    [result] = summarize_calendar(calendar, [(field_id, "Field")])
+    return result
+
+
+def test_totals_and_hourly_grid():
+    field = uuid4()
+    cal = FieldCalendar([field], MONDAY, date(2026, 6, 14))
+    cal.add_availability(_avail(field))
+    cal.book(field, datetime(2026, 6, 1, 18, 30), datetime(2026, 6, 1, 19, 30))
+    result = _summary(cal, field)
+
+    assert result.available_minutes == 2 * 180
+    assert result.booked_minutes == 60
+    assert result.idle_minutes == 300
+    assert result.utilization == pytest.approx(60 / 360)
+    assert result.hourly_available_minutes[0][17:22] == [0, 120, 120, 120, 0]
+    assert result.hourly_booked_minutes[0][17:22] == [0, 30, 30, 0, 0]
+    assert result.hourly_utilization[0][18] == pytest.approx(0.25)
+    assert result.hourly_utilization[0][17] is None
+    assert all(sum(row) == 0 for row in result.hourly_available_minutes[1:])
+    assert result.daily_available_minutes == [180, 0, 0, 0, 0, 0, 0, 180, 0, 0, 0, 0, 0, 0]
+    assert result.daily_booked_minutes[0] == 60
+    assert result.risks == []
+
+
+def test_grid_aligns_with_weekday_when_range_starts_midweek():
+    field = uuid4()
+    cal = FieldCalendar([field], date(2026, 6, 3), date(2026, 6, 9))
+    cal.add_availability(_avail(field, day_of_week=4, start_time=t(9, 0), end_time=t(10, 0)))
+    result = _summary(cal, field)
+    assert result.hourly_available_minutes[4][9] == 60
+    assert result.daily_available_minutes == [0, 0, 60, 0, 0, 0, 0]
+
+
+def test_blackout_removes_availability():
+    field = uuid4()
+    cal = FieldCalendar([field], MONDAY, MONDAY)
+    cal.add_availability(_avail(field))
+    cal.add_blackout(field, datetime(2026, 6, 1, 20), datetime(2026, 6, 2))
+    result = _summary(cal, field)
+    assert result.available_minutes == 120
+    assert result.blocked_minutes == 60
+
+
+def test_double_booking_and_game_outside_availability_are_risks():
+    field = uuid4()
+    cal = FieldCalendar([field], MONDAY, MONDAY)
+    cal.add_availability(_avail(field))
+    cal.book(field, datetime(2026, 6, 1, 18), datetime(2026, 6, 1, 19))
+    cal.book(field, datetime(2026, 6, 1, 18, 30), datetime(2026, 6, 1, 19, 30))
+    cal.book(field, datetime(2026, 6, 1, 20, 30), datetime(2026, 6, 1, 21, 30))
+    result = _summary(cal, field)
+
+    assert result.double_booked_minutes == 30
+    assert result.conflict_minutes == 30
+    assert result.booked_minutes == 120
+    assert result.risks == [
+        RiskWindow(MONDAY, t(18, 30), t(19, 0), RISK_DOUBLE_BOOKED),
+        RiskWindow(MONDAY, t(21, 0), t(21, 30), RISK_UNAVAILABLE),
+    ]
+
+
+def test_risk_windows_are_capped():
+    field = uuid4()
+    cal = FieldCalendar([field], MONDAY, date(2026, 12, 31))
+    day = MONDAY
+    while day <= date(2026, 12, 31):
+        cal.book(field, datetime.combine(day, t(8)), datetime.combine(day, t(9)))
+        day += timedelta(days=1)
+    result = _summary(cal, field)
+    assert len(result.risks) == MAX_RISK_WINDOWS
+    assert result.risks_truncated
+    assert result.conflict_minutes == 214 * 60
+
+
+def test_fields_keep_given_order_and_unknown_fields_are_empty():
+    f1, f2 = uuid4(), uuid4()
+    cal = FieldCalendar([f1], MONDAY, MONDAY)
+    cal.add_availability(_avail(f1))
+    results = summarize_calendar(cal, [(f2, "B"), (f1, "A")])
+    assert [r.field_name for r in results] == ["B", "A"]
+    assert results[0].available_minutes == 0
+    assert results[0].hourly_utilization[0][18] is None
+
+
+def test_range_limit():
+    cal = FieldCalendar([], MONDAY, MONDAY + timedelta(days=MAX_RANGE_DAYS))
+    with pytest.raises(ServiceError):
+        summarize_calendar(cal, [])
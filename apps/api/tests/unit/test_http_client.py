@@ -0,0 +1,187 @@
+"""Unit tests for app.core.http_client — pooling, per-host limits and the circuit breaker."""
+
+import asyncio
+import logging
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from app.core import http_client as http_client_module
+from app.core.http_client import CircuitBreaker, CircuitOpenError, SharedHTTPClient
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client(handler, **kwargs) -> SharedHTTPClient:
+    kwargs.setdefault("http2", False)
+    return SharedHTTPClient(transport=httpx.MockTransport(handler), **kwargs)
+
+
+def _status(code):
+    return lambda request: httpx.Response(code, json={})
+
+
+# ===================================================================
+# CircuitBreaker
+# ===================================================================
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30, clock=_Clock())
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=_Clock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_a_single_probe(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_seconds=30, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.now += 30
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now += 29
+        assert not breaker.allow()
+
+
+# ===================================================================
+# SharedHTTPClient
+# ===================================================================
+
+@pytest.mark.asyncio
+async def test_reuses_one_pooled_client():
+    client = _client(_status(200))
+    await client.get("https://api.example.com/a")
+    first = client._state.client
+    await client.post("https://api.example.com/b", data={"x": "1"})
+    assert client._state.client is first
+    await client.aclose()
+    assert client._state is None
+    assert first.is_closed
+
+
+def test_new_event_loop_gets_a_new_pool():
+    client = _client(_status(200))
+
+    async def fetch():
+        await client.get("https://api.example.com/")
+        return client._state.client
+
+    assert asyncio.run(fetch()) is not asyncio.run(fetch())
+
+
+@pytest.mark.asyncio
+async def test_server_errors_open_the_circuit_per_host():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        return httpx.Response(503 if request.url.host == "down.example.com" else 200)
+
+    client = _client(handler, breaker_failures=2, clock=_Clock())
+    for _ in range(2):
+        response = await client.get("https://down.example.com/")
+        assert response.status_code == 503  # returned to the caller, not raised
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://down.example.com/")
+    assert (await client.get("https://up.example.com/")).status_code == 200
+    assert calls == ["down.example.com", "down.example.com", "up.example.com"]
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip_the_breaker():
+    client = _client(_status(404), breaker_failures=1)
+    for _ in range(3):
+        assert (await client.get("https://api.example.com/")).status_code == 404
+    assert client.breaker("api.example.com").state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_count_and_propagate():
+    def handler(request):
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    client = _client(handler, breaker_failures=1)
+    with pytest.raises(httpx.TimeoutException):
+        await client.get("https://api.example.com/")
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://api.example.com/")
+
+
+@pytest.mark.asyncio
+async def test_circuit_closes_after_successful_probe():
+    clock = _Clock()
+    status = {"code": 500}
+    client = _client(lambda request: httpx.Response(status["code"]), breaker_failures=1,
+                     breaker_reset_seconds=10, clock=clock)
+    await client.get("https://api.example.com/")
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://api.example.com/")
+
+    clock.now += 10
+    status["code"] = 200
+    assert (await client.get("https://api.example.com/")).status_code == 200
+    assert client.breaker("api.example.com").state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_are_limited_per_host():
+    in_flight = {"slow.example.com": 0, "fast.example.com": 0}
+    peak = dict(in_flight)
+
+    async def handler(request):
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.02)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    client = _client(handler, max_per_host=2)
+    await asyncio.gather(
+        *(client.get("https://slow.example.com/") for _ in range(6)),
+        *(client.get("https://fast.example.com/") for _ in range(2)),
+    )
+    assert peak == {"slow.example.com": 2, "fast.example.com": 2}
+
+
+def test_http2_falls_back_without_h2(monkeypatch, caplog):
+    monkeypatch.setattr(http_client_module, "_http2_available", lambda: False)
+    factory = MagicMock()
+    monkeypatch.setattr(http_client_module.httpx, "AsyncClient", factory)
+    with caplog.at_level(logging.WARNING, logger="app.core.http_client"):
+        SharedHTTPClient(http2=True)._new_client()
+    assert "h2 package is not installed" in caplog.text
+    assert factory.call_args.kwargs["http2"] is False
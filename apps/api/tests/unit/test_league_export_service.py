@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.services.exceptions import ServiceError
+from app.services.league_export_service import (
+    ROSTER_COLUMNS,
+    LeagueExport,
+    iter_export,
+    load_roster_export,
+)
+
+
+class _Result:
+    def __init__(self, batches):
+        self.batches = batches
+        self.closed = False
+
+    def partitions(self):
+        yield from self.batches
+
+    def close(self):
+        self.closed = True
+
+
+class _Session:
+    """Records execute() and hands back canned batches."""
+
+    def __init__(self, batches):
+        self.result = _Result(batches)
+        self.executed = []
+
+    def execute(self, statement):
+        self.executed.append(statement)
+        return self.result
+
+
+class _Statement:
+    def __init__(self):
+        self.options = {}
+
+    def execution_options(self, **options):
+        self.options = options
+        return self
+
+
+def _row(first_name="Alice", team_name=None):
+    return (
+        uuid4(), uuid4(), first_name, "Smith", "alice@example.com", "+1 555 0100", None, team_name,
+        "confirmed", "paid", "signed", datetime(2026, 6, 1, 12, tzinfo=timezone.utc),
+    )
+
+
+def _export(fmt, batches):
+    statement = _Statement()
+    return LeagueExport(statement, ROSTER_COLUMNS, fmt, "roster.csv"), statement, _Session(batches)
+
+
+def test_csv_header_is_sent_before_the_query_runs():
+    export, statement, db = _export("csv", [[_row()]])
+    chunks = iter_export(db, export, batch_size=2)
+    header = next(chunks)
+    assert header.decode().strip() == ",".join(ROSTER_COLUMNS)
+    assert db.executed == []
+    list(chunks)
+    assert statement.options == {"yield_per": 2}
+    assert db.result.closed
+
+
+def test_one_chunk_per_batch():
+    export, _, db = _export("csv", [[_row(), _row()], [_row("Bob")]])
+    chunks = list(iter_export(db, export))
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [r["first_name"] for r in rows] == ["Alice", "Alice", "Bob"]
+    assert rows[0]["group_name"] == ""
+
+
+def test_csv_neutralizes_formulas():
+    export, _, db = _export("csv", [[_row("=cmd|' /C calc'!A0", team_name="@team")]])
+    [row] = csv.DictReader(io.StringIO(b"".join(iter_export(db, export)).decode()))
+    assert row["first_name"] == "'=cmd|' /C calc'!A0"
+    assert row["team_name"] == "'@team"
+    assert row["phone"] == "'+1 555 0100"
+
+
+def test_ndjson_lines():
+    row = _row()
+    export, _, db = _export("ndjson", [[row]])
+    chunks = list(iter_export(db, export))
+    assert len(chunks) == 1
+    [line] = [json.loads(text) for text in chunks[0].decode().splitlines()]
+    assert line["id"] == str(row[0])
+    assert line["group_name"] is None
+    assert line["registered_at"] == "2026-06-01T12:00:00+00:00"
+
+
+def test_result_closed_when_client_disconnects():
+    export, _, db = _export("ndjson", [[_row()], [_row()]])
+    chunks = iter_export(db, export)
+    next(chunks)
+    chunks.close()
+    assert db.result.closed
+
+
+def test_unknown_format_rejected():
+    with pytest.raises(ServiceError):
+        load_roster_export(_Session([]), uuid4(), "xlsx")
+
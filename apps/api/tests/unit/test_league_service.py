@@ -1,7 +1,15 @@
 import pytest
 
 # conftest sets env vars before import
-from app.services.league_service import get_player_cap, get_occupied_spots
+from app.models.league import League
+from app.services.league_service import (
+    adjust_occupancy,
+    get_occupied_spots,
+    get_player_cap,
+    reconcile_occupancy_counters,
+    recount_occupancy,
+    remaining_spots,
+)
 from tests.conftest import make_league, make_player, make_league_player, make_group_invitation, make_group
 
 
@@ -56,3 +64,53 @@ def test_occupied_spots_ignores_expired_invitations(db):
 def test_occupied_spots_zero_empty_league(db):
     league = make_league(db)
     assert get_occupied_spots(league.id, db) == 0
+
+
+def test_factories_keep_counters_in_sync(db):
+    league = make_league(db)
+    organizer = make_player(db)
+    make_league_player(db, league.id, organizer.id, status="confirmed")
+    group = make_group(db, league.id, organizer.id)
+    make_group_invitation(db, group.id, league.id, organizer.id)
+    assert (league.confirmed_players_count, league.pending_invites_count) == (1, 1)
+
+
+def test_adjust_occupancy_is_relative(db):
+    league = make_league(db)
+    adjust_occupancy(db, league.id, confirmed=3, pending_invites=2)
+    adjust_occupancy(db, league.id, confirmed=-1)
+    db.expire_all()
+    league = db.query(League).get(league.id)
+    assert (league.confirmed_players_count, league.pending_invites_count) == (2, 2)
+
+
+def test_remaining_spots_uses_counters(db):
+    league = make_league(db, format="7v7", max_teams=2)  # cap 14
+    adjust_occupancy(db, league.id, confirmed=4)
+    assert remaining_spots(league, db) == 10
+    assert remaining_spots(make_league(db, max_teams=None), db) is None
+
+
+def test_remaining_spots_recounts_when_counters_say_full(db):
+    league = make_league(db, format="7v7", max_teams=2)
+    organizer = make_player(db)
+    make_league_player(db, league.id, organizer.id, status="confirmed")
+    group = make_group(db, league.id, organizer.id)
+    # Past expires_at but still 'pending': counted by the counter, not by the exact check
+    for _ in range(13):
+        make_group_invitation(db, group.id, league.id, organizer.id, expires_future=False)
+    assert league.pending_invites_count == 13
+    assert remaining_spots(league, db) == 13
+
+
+def test_reconcile_repairs_drift(db):
+    league = make_league(db)
+    p = make_player(db)
+    make_league_player(db, league.id, p.id, status="confirmed")
+    adjust_occupancy(db, league.id, confirmed=5, pending_invites=1)
+
+    assert league.id in reconcile_occupancy_counters(db)
+    db.expire_all()
+    league = db.query(League).get(league.id)
+    assert (league.confirmed_players_count, league.pending_invites_count) == (1, 0)
+    assert recount_occupancy(db, [league.id]) == []
@@ -0,0 +1,23 @@
+"""Unit tests for the Alembic revision graph (no database needed)."""
+
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+API_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _scripts() -> ScriptDirectory:
+    config = Config(str(API_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(API_ROOT / "alembic"))
+    return ScriptDirectory.from_config(config)
+
+
+def test_single_head():
+    assert len(_scripts().get_heads()) == 1
+
+
+def test_revision_ids_are_unique():
+    revisions = [script.revision for script in _scripts().walk_revisions()]
+    assert len(revisions) == len(set(revisions))
@@ -0,0 +1,113 @@
+"""Unit tests for app.core.pagination — cursors, headers and the generated SQL."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.core.pagination import (
+    InvalidCursorError, KeysetPage, _Explain, decode_cursor, encode_cursor, keyset_page, page_headers,
+)
+from app.models.player import Player
+
+
+class TestCursor:
+    def test_round_trip_keeps_microseconds_and_timezone(self):
+        created_at = datetime(2026, 3, 1, 12, 30, 5, 123456, tzinfo=timezone(timedelta(hours=-5)))
+        row_id = uuid4()
+        cursor = encode_cursor(created_at, row_id)
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, row_id)
+
+    @pytest.mark.parametrize("cursor", [
+        "",
+        "not base64!",
+        encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4())[:-6],
+        "MjAyNi0wMS0wMXxub3QtYS11dWlk",  # "2026-01-01|not-a-uuid"
+    ])
+    def test_malformed_cursors_are_rejected(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_naive_timestamps_are_rejected(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor(datetime(2026, 1, 1), uuid4()))
+
+
+class _Query:
+    """Records the calls keyset_page makes and returns canned rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def filter(self, clause):
+        self.calls.append(("filter", str(clause.compile(dialect=postgresql.dialect()))))
+        return self
+
+    def order_by(self, *clauses):
+        self.calls.append(("order_by", [str(c) for c in clauses]))
+        return self
+
+    def offset(self, n):
+        self.calls.append(("offset", n))
+        return self
+
+    def limit(self, n):
+        self.calls.append(("limit", n))
+        return self
+
+    def all(self):
+        return self.rows
+
+
+def _player(created_at):
+    return Player(id=uuid4(), created_at=created_at)
+
+
+class TestKeysetPage:
+    def test_first_page_fetches_one_extra_row(self):
+        now = datetime.now(timezone.utc)
+        rows = [_player(now - timedelta(seconds=i)) for i in range(3)]
+        query = _Query(rows)
+        page = keyset_page(query, Player, None, 2)
+        assert page.items == rows[:2]
+        assert decode_cursor(page.next_cursor) == (rows[1].created_at, rows[1].id)
+        assert query.calls == [
+            ("order_by", ["players.created_at DESC", "players.id DESC"]),
+            ("limit", 3),
+        ]
+
+    def test_cursor_filters_on_the_row_value(self):
+        query = _Query([])
+        cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+        page = keyset_page(query, Player, cursor, 25)
+        assert page == KeysetPage(items=[], next_cursor=None)
+        assert query.calls[0][1].startswith("(players.created_at, players.id) < (")
+
+    def test_last_page_has_no_cursor(self):
+        rows = [_player(datetime.now(timezone.utc))]
+        assert keyset_page(_Query(rows), Player, None, 1).next_cursor is None
+
+    def test_legacy_offset(self):
+        query = _Query([])
+        keyset_page(query, Player, None, 10, offset=20)
+        assert ("offset", 20) in query.calls
+
+
+def test_explain_keeps_bind_parameters():
+    query = Session().query(Player).filter(Player.is_active == True, Player.email == "a@example.com")
+    compiled = _Explain(query.statement).compile(dialect=postgresql.dialect())
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "a@example.com" in compiled.params.values()
+
+
+def test_page_headers():
+    page = KeysetPage(items=[], next_cursor="abc")
+    assert page_headers(page, None, "none") == {"X-Next-Cursor": "abc"}
+    assert page_headers(KeysetPage([], None), 40, "exact") == {"X-Total-Count": "40"}
+    assert page_headers(page, 40, "estimated") == {
+        "X-Next-Cursor": "abc", "X-Total-Count": "40", "X-Total-Count-Estimated": "true",
+    }
@@ -1,8 +1,21 @@
 """Unit tests for pdf_service.py — no DB required."""
 
+import os
+import re
 from datetime import datetime, timezone
+from uuid import uuid4
 
-from app.services.pdf_service import generate_waiver_pdf
+import pytest
+
+from app.core.config import settings
+from app.services import pdf_service
+from app.services.pdf_service import (
+    build_waiver_template,
+    clear_waiver_templates,
+    generate_waiver_pdf,
+    get_waiver_template,
+    render_signed_waiver,
+)
 
 
 class TestGenerateWaiverPdf:
@@ -30,3 +43,100 @@ class TestGenerateWaiverPdf:
         assert isinstance(pdf, bytes)
         assert pdf[:5] == b"%PDF-"
         assert len(pdf) > 1000
+
+    def test_renders_unicode_without_replacement(self):
+        pdf = generate_waiver_pdf(
+            waiver_content="Players assume all risks — including “incidental” contact…",
+            waiver_version="v1",
+            league_name="Liga Señor",
+            player_name="Zoë Дмитрий",
+            signed_at=datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc),
+        )
+        assert pdf[:5] == b"%PDF-"
+        if not _fonts_installed():
+            return
+        assert b"DejaVuSans" in pdf
+
+
+def _fonts_installed() -> bool:
+    return not pdf_service._load_font_sets()[1].is_core
+
+
+def _page_count(pdf: bytes) -> int:
+    return len(re.findall(rb"/Type /Page\b", pdf))
+
+
+@pytest.fixture(autouse=True)
+def _clear_templates():
+    clear_waiver_templates()
+    yield
+    clear_waiver_templates()
+
+
+class TestWaiverTemplates:
+    def test_template_is_cached_per_waiver_and_league(self):
+        waiver_id = uuid4()
+        first = get_waiver_template(waiver_id, "Fall League", "Body", "v1")
+        assert get_waiver_template(waiver_id, "Fall League", "ignored", "v1") is first
+        assert get_waiver_template(waiver_id, "Spring League", "Body", "v1") is not first
+        assert get_waiver_template(uuid4(), "Fall League", "Body", "v1") is not first
+
+    def test_least_recently_used_template_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(pdf_service, "_templates", pdf_service._TemplateCache(2))
+        a = get_waiver_template("a", "L", "A", "v1")
+        get_waiver_template("b", "L", "B", "v1")
+        get_waiver_template("a", "L", "A", "v1")  # touch a
+        get_waiver_template("c", "L", "C", "v1")  # evicts b
+
+        assert len(pdf_service._templates) == 2
+        assert get_waiver_template("a", "L", "A", "v1") is a
+        assert get_waiver_template("b", "L", "B2", "v1").body_lines == ("B2",)
+
+    def test_stamped_render_matches_one_off_layout(self):
+        content = "This is a line of waiver text that is long enough to wrap across the page width. " * 120
+        template = get_waiver_template(uuid4(), "Salem League", content, "v1")
+        signed_at = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+
+        stamped = [render_signed_waiver(template, name, signed_at) for name in ("Alex", "Sam")]
+        one_off = generate_waiver_pdf(content, "v1", "Salem League", "Alex", signed_at)
+
+        assert len(template.body_lines) > 60
+        assert all(p[:5] == b"%PDF-" for p in stamped)
+        assert _page_count(stamped[0]) == _page_count(stamped[1]) == _page_count(one_off) > 1
+
+    def test_text_outside_compact_ranges_uses_full_fonts(self):
+        compact, full = pdf_service._load_font_sets()
+        assert pdf_service._fonts_for(pdf_service._code_points("Jane Doe")) is compact
+        if _fonts_installed():
+            assert pdf_service._fonts_for(pdf_service._code_points("Jane ✓")) is full
+        template = build_waiver_template("League", "Checked ✓", "v1")
+        pdf = render_signed_waiver(template, "Jane", datetime(2026, 3, 1, tzinfo=timezone.utc))
+        assert pdf[:5] == b"%PDF-"
+
+    def test_font_subset_dir_is_removed_at_exit(self, monkeypatch):
+        if not _fonts_installed():
+            pytest.skip("DejaVu fonts not installed")
+        registered = []
+        monkeypatch.setattr(pdf_service.atexit, "register", lambda fn, *args, **kwargs: registered.append((fn, args)))
+        paths = {
+            style: os.path.join(settings.WAIVER_PDF_FONT_DIR, name) for style, name in pdf_service._FONT_FILES.items()
+        }
+        compact = pdf_service._subset_fonts(paths)
+
+        [(fn, (out_dir,))] = registered
+        assert all(os.path.dirname(path) == out_dir for path in compact.files.values())
+        fn(out_dir, ignore_errors=True)
+        assert not os.path.exists(out_dir)
+
+    def test_falls_back_to_helvetica_without_fonts(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "WAIVER_PDF_FONT_DIR", str(tmp_path))
+        monkeypatch.setattr(pdf_service, "_font_sets", None)
+
+        pdf = generate_waiver_pdf(
+            "Risks — assumed", "v1", "Liga Señor", "Дмитрий",
+            datetime(2026, 3, 1, tzinfo=timezone.utc),
+        )
+
+        assert pdf[:5] == b"%PDF-"
+        assert b"Helvetica" in pdf
+        assert b"DejaVuSans" not in pdf
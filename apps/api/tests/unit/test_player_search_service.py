@@ -0,0 +1,66 @@
+"""Unit tests for the query handling in app.services.player_search_service (no DB)."""
+
+import re
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.services.exceptions import ServiceError
+from app.services.player_search_service import (
+    MAX_CANDIDATES,
+    _candidate_ids,
+    _like_escape,
+    _regex_escape,
+    _tokens,
+    search_players,
+)
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("John SMITH", ["john", "smith"]),
+    ("(555) 123-4567", ["555", "1234567"]),
+    ("+1.555.0100", ["15550100"]),
+    ("jo.smith@example.com", ["jo.smith@example.com"]),
+    ("a b c d e f g", ["a", "b", "c", "d", "e"]),
+    ("  ", []),
+    ("!!! smith ---", ["smith"]),
+])
+def test_tokens(query, expected):
+    assert _tokens(query) == expected
+
+
+def test_like_wildcards_are_escaped():
+    assert _like_escape("50%_off\\") == "50\\%\\_off\\\\"
+
+
+def test_regex_escape_keeps_word_characters_literal():
+    token = "o'neil+ü_1"
+    escaped = _regex_escape(token)
+    assert escaped == "o\\'neil\\+ü_1"
+    assert re.search(escaped, "pat o'neil+ü_1 x")
+
+
+@pytest.mark.parametrize("query", ["   ", "!!!", "--- ..."])
+def test_query_without_tokens_is_rejected(query):
+    with pytest.raises(ServiceError):
+        search_players(None, query)
+
+
+
+def _candidate_sql(query: str) -> str:
+    subquery = _candidate_ids(Session(), _tokens(query), None, None)
+    return str(subquery.element.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_trigram_queries_rank_every_match():
+    sql = _candidate_sql("gmail")
+    assert "LIMIT" not in sql
+    assert "<%" in sql
+
+
+def test_short_queries_keep_the_best_prefix_matches():
+    sql = _candidate_sql("sm")
+    assert f"LIMIT {MAX_CANDIDATES}" in sql
+    assert "DESC, players.last_name, players.first_name, players.id" in sql
+    assert "<%" not in sql
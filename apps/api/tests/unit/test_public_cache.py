@@ -0,0 +1,219 @@
+import asyncio
+import sys
+
+import pytest
+from starlette.requests import Request
+
+from app.core.cache import (
+    MemoryBackend,
+    PostgresBackend,
+    RedisBackend,
+    ResponseCache,
+    WithHeaders,
+    cached_json_response,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _RedisStandIn:
+    """Minimal Redis-compatible client: get / set(px=) / delete / scan_iter."""
+
+    def __init__(self, clock):
+        self._clock = clock
+        self._data = {}
+
+    def get(self, key):
+        value, expires_at = self._data.get(key, (None, None))
+        if expires_at is not None and expires_at <= self._clock():
+            self._data.pop(key)
+            return None
+        return value
+
+    def set(self, key, value, px=None):
+        self._data[key] = (value, self._clock() + px / 1000 if px else None)
+
+    def delete(self, *keys):
+        for key in keys:
+            self._data.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [k for k in self._data if k.startswith(prefix)]
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _respond(cache, key, payload, calls, if_none_match=None, shared=True):
+    async def build():
+        calls.append(1)
+        return payload
+
+    return asyncio.run(cached_json_response(_request(if_none_match), cache, key, build, shared=shared))
+
+
+class TestMemoryBackend:
+    def test_lru_eviction(self):
+        backend = MemoryBackend(max_entries=2)
+        backend.set("a", b"1")
+        backend.set("b", b"2")
+        backend.get("a")
+        backend.set("c", b"3")
+        assert backend.get("a") == b"1"
+        assert backend.get("b") is None
+        assert len(backend) == 2
+
+    def test_ttl_expiry(self):
+        clock = _Clock()
+        backend = MemoryBackend(clock=clock)
+        backend.set("a", b"1", ttl_seconds=30)
+        clock.now = 29.9
+        assert backend.get("a") == b"1"
+        clock.now = 30
+        assert backend.get("a") is None
+
+
+class TestResponseCache:
+    def test_bump_changes_version(self):
+        cache = ResponseCache(MemoryBackend())
+        v1 = cache.version("league-1")
+        assert cache.version("league-1") == v1
+        cache.bump("league-1")
+        assert cache.version("league-1") != v1
+
+    def test_backend_errors_are_misses(self):
+        class Broken:
+            def get(self, key):
+                raise ConnectionError
+
+            def set(self, key, value, ttl_seconds=None):
+                raise ConnectionError
+
+        cache = ResponseCache(Broken())
+        assert cache.get("k") is None
+        cache.put("k", '"e"', b"{}")
+        assert cache.version("x")
+
+    def test_redis_backend(self):
+        clock = _Clock()
+        client = _RedisStandIn(clock)
+        cache = ResponseCache(RedisBackend(client), ttl_seconds=10)
+        cache.put("k", '"etag"', b'{"a":1}')
+        assert cache.get("k") == ('"etag"', b'{"a":1}')
+        clock.now = 10
+        assert cache.get("k") is None
+        cache.put("k2", '"e"', b"{}")
+        cache.clear()
+        assert client._data == {}
+
+
+def test_redis_backend_names_the_calling_setting_without_the_package(monkeypatch):
+    monkeypatch.setitem(sys.modules, "redis", None)
+    with pytest.raises(RuntimeError, match="^PUBLIC_CACHE_BACKEND=redis"):
+        RedisBackend.from_url("redis://localhost:6379/0")
+    with pytest.raises(RuntimeError, match="^EMAIL_LOOKUP_SHARED_BACKEND=redis"):
+        RedisBackend.from_url("redis://localhost:6379/0", setting="EMAIL_LOOKUP_SHARED_BACKEND")
+
+
+class TestCachedJsonResponse:
+    def test_hit_skips_build_and_sets_headers(self):
+        cache = ResponseCache(MemoryBackend(), ttl_seconds=30)
+        calls = []
+        first = _respond(cache, "k", {"b": [1, 2]}, calls)
+        second = _respond(cache, "k", {"b": [1, 2]}, calls)
+        assert len(calls) == 1
+        assert first.body == second.body == b'{"b":[1,2]}'
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=30"
+
+    def test_conditional_get_returns_304(self):
+        cache = ResponseCache(MemoryBackend())
+        calls = []
+        etag = _respond(cache, "k", {"a": 1}, calls).headers["etag"]
+        resp = _respond(cache, "k", {"a": 1}, calls, if_none_match=f'W/"nope", {etag}')
+        assert resp.status_code == 304
+        assert resp.body == b""
+        assert resp.headers["etag"] == etag
+        assert _respond(cache, "k", {"a": 1}, calls, if_none_match='"other"').status_code == 200
+
+    def test_not_found_is_not_cached(self):
+        cache = ResponseCache(MemoryBackend())
+        calls = []
+        assert _respond(cache, "k", None, calls) is None
+        assert _respond(cache, "k", None, calls) is None
+        assert len(calls) == 2
+
+    def test_uncached_private_response(self):
+        cache = ResponseCache(MemoryBackend())
+        calls = []
+        resp = _respond(cache, None, {"a": 1}, calls, shared=False)
+        _respond(cache, None, {"a": 1}, calls, shared=False)
+        assert len(calls) == 2
+        assert resp.headers["cache-control"] == "private, no-cache"
+
+    def test_disabled_cache_still_emits_etag(self):
+        cache = ResponseCache(None)
+        calls = []
+        resp = _respond(cache, None, {"a": 1}, calls)
+        assert resp.headers["etag"]
+        assert not cache.enabled
+
+    def test_extra_headers_are_cached_with_the_body(self):
+        cache = ResponseCache(MemoryBackend())
+        calls = []
+        payload = WithHeaders([1, 2], {"X-Next-Cursor": "abc"})
+        first = _respond(cache, "k", payload, calls)
+        second = _respond(cache, "k", payload, calls)
+        assert len(calls) == 1
+        assert first.body == second.body == b"[1,2]"
+        assert second.headers["x-next-cursor"] == "abc"
+        assert cache.get("k") == (first.headers["etag"], b"[1,2]")
+
+    def test_entries_without_headers_still_read(self):
+        backend = MemoryBackend()
+        backend.set("k", b'"etag"\n{"a":1}')
+        assert ResponseCache(backend).get_entry("k") == ('"etag"', b'{"a":1}', {})
+
+
+class TestPostgresBackend:
+    """Against the test database's cache_entries table."""
+
+    @pytest.fixture
+    def backend(self, engine):
+        backend = PostgresBackend(engine=engine, prefix="test:")
+        backend.clear()
+        yield backend
+        backend.clear()
+
+    def test_set_get_and_overwrite(self, backend):
+        assert backend.get("k") is None
+        backend.set("k", b"one", ttl_seconds=60)
+        backend.set("k", b"two", ttl_seconds=60)
+        assert backend.get("k") == b"two"
+
+    def test_expired_entries_are_misses(self, backend):
+        backend.set("k", b"v", ttl_seconds=-1)
+        assert backend.get("k") is None
+
+    def test_instances_share_entries(self, backend, engine):
+        backend.set("k", b"v", ttl_seconds=60)
+        assert PostgresBackend(engine=engine, prefix="test:").get("k") == b"v"
+        assert PostgresBackend(engine=engine, prefix="other:").get("k") is None
+
+    def test_clear_only_touches_its_prefix(self, backend, engine):
+        other = PostgresBackend(engine=engine, prefix="other:")
+        other.set("k", b"kept", ttl_seconds=60)
+        backend.set("k", b"v", ttl_seconds=60)
+        backend.clear()
+        assert backend.get("k") is None
+        assert other.get("k") == b"kept"
+        other.clear()
@@ -0,0 +1,156 @@
+"""
+Unit tests for app.core.query_profiler and the tests' query budget plugin.
+
+Uses an in-memory SQLite engine and a throwaway FastAPI app, so no Postgres
+is needed; the cursor-execute listeners are engine-wide.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.middleware import CorrelationIDMiddleware
+from app.core.query_profiler import QueryProfilerMiddleware, fingerprint, profile_queries
+
+
+@pytest.fixture
+def sqlite_engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def profiled_client(sqlite_engine):
+    app = FastAPI()
+
+    @app.get("/items/{n}")
+    def items(n: int):
+        with sqlite_engine.connect() as conn:
+            return [conn.execute(text("SELECT :i"), {"i": i}).scalar() for i in range(n)]
+
+    app.add_middleware(QueryProfilerMiddleware)
+    app.add_middleware(CorrelationIDMiddleware)
+    return TestClient(app)
+
+
+class TestFingerprint:
+    def test_literals_and_params_are_normalized(self):
+        a = fingerprint("SELECT * FROM fields WHERE id = 'abc' AND  n > 10")
+        b = fingerprint("SELECT *\n FROM fields WHERE id = 'x''y' AND n > 7")
+        assert a == b == "SELECT * FROM fields WHERE id = ? AND n > ?"
+
+    def test_bind_styles_and_in_lists_collapse(self):
+        assert fingerprint("SELECT 1 WHERE id IN (%(id_1)s, %(id_2)s, %(id_3)s)") == "SELECT ? WHERE id IN (...)"
+        assert fingerprint("SELECT 1 WHERE id IN ($1, $2)") == "SELECT ? WHERE id IN (...)"
+        assert fingerprint("SELECT 1 WHERE id = ?") == "SELECT ? WHERE id = ?"
+
+    def test_identifiers_with_digits_kept(self):
+        assert fingerprint("SELECT anon_1.id FROM anon_1") == "SELECT anon_1.id FROM anon_1"
+
+
+def test_profile_queries_counts_and_groups(sqlite_engine):
+    with profile_queries() as profile:
+        with sqlite_engine.connect() as conn:
+            for i in range(4):
+                conn.execute(text("SELECT :i"), {"i": i})
+            conn.execute(text("SELECT 'other'"))
+    assert profile.count == 5
+    assert profile.total_ms >= 0
+    assert profile.repeated(4) == [("SELECT ?", 5)]
+    assert profile.repeated(6) == []
+
+
+def test_failed_statement_leaves_no_state_on_connection(sqlite_engine):
+    with profile_queries() as profile:
+        with sqlite_engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+            assert not any("profiler" in str(key) for key in conn.info)
+    assert profile.count == 1
+
+
+def test_no_profile_outside_block(sqlite_engine):
+    with profile_queries() as profile:
+        pass
+    with sqlite_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert profile.count == 0
+
+
+def test_middleware_sets_server_timing(profiled_client, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_PROFILER_SERVER_TIMING", True)
+    response = profiled_client.get("/items/3")
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="3 queries"' in timing
+    assert ", app;dur=" in timing
+
+
+def test_server_timing_off_by_default(profiled_client, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_PROFILER_SERVER_TIMING", False)
+    with caplog.at_level(logging.INFO, logger="app.core.query_profiler"):
+        response = profiled_client.get("/items/2")
+    assert "Server-Timing" not in response.headers
+    assert [r for r in caplog.records if getattr(r, "event", None) == "request_queries"]
+
+
+def test_middleware_logs_summary_and_n_plus_one(profiled_client, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_PROFILER_REPEAT_THRESHOLD", 5)
+    with caplog.at_level(logging.INFO, logger="app.core.query_profiler"):
+        profiled_client.get("/items/6", headers={"X-Correlation-ID": "abc-123"})
+
+    summary = next(r for r in caplog.records if getattr(r, "event", None) == "request_queries")
+    assert summary.db["queries"] == 6
+    assert summary.db["path"] == "/items/{n}"
+    assert summary.db["status"] == 200
+    assert summary.db["top"] == [{"count": 6, "sql": "SELECT ?"}]
+
+    warnings = [r for r in caplog.records if getattr(r, "event", None) == "n_plus_one"]
+    assert len(warnings) == 1
+    assert warnings[0].levelno == logging.WARNING
+    assert warnings[0].db["count"] == 6
+
+
+def test_middleware_quiet_below_threshold(profiled_client, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_PROFILER_REPEAT_THRESHOLD", 5)
+    with caplog.at_level(logging.INFO, logger="app.core.query_profiler"):
+        profiled_client.get("/items/4")
+    assert not [r for r in caplog.records if getattr(r, "event", None) == "n_plus_one"]
+
+
+def test_middleware_disabled(profiled_client, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_PROFILER_ENABLED", False)
+    monkeypatch.setattr(settings, "QUERY_PROFILER_SERVER_TIMING", True)
+    with caplog.at_level(logging.INFO, logger="app.core.query_profiler"):
+        response = profiled_client.get("/items/2")
+    assert "Server-Timing" not in response.headers
+    assert not [r for r in caplog.records if getattr(r, "event", None) == "request_queries"]
+
+
+class TestQueryBudget:
+    def test_within_budget(self, profiled_client, query_budget):
+        with query_budget(3):
+            profiled_client.get("/items/3")
+
+    def test_over_budget_fails_with_repeated_statement(self, profiled_client, query_budget):
+        with pytest.raises(pytest.fail.Exception) as exc:
+            with query_budget(3):
+                profiled_client.get("/items/1")
+                profiled_client.get("/items/7")
+        message = str(exc.value)
+        assert "/items/{n} ran 7 queries (budget 3)" in message
+        assert "7x SELECT ?" in message
+        assert "ran 1 queries" not in message
+
+    @pytest.mark.query_budget(2)
+    def test_marker_within_budget(self, profiled_client):
+        profiled_client.get("/items/2")
@@ -0,0 +1,228 @@
+"""Unit tests for app.core.rate_limit — the local fast path over a shared store.
+
+limits' MemoryStorage stands in for the shared store (Postgres/Redis); two
+LocalFastPathStorage instances over the same MemoryStorage behave like two
+Lambda instances. The Postgres storage tests need the test database.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from limits import parse
+from limits.errors import ConfigurationError
+from limits.storage import MemoryStorage
+from limits.strategies import FixedWindowRateLimiter
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+
+from app.core.rate_limit import STRATEGY, LocalFastPathStorage, PostgresSlidingWindowStorage
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_020.0  # 20s into a 60s window
+
+    def __call__(self):
+        return self.now
+
+
+def _storage(shared, share=0.1, clock=None):
+    return LocalFastPathStorage(shared=shared, local_share=share, clock=clock or _Clock())
+
+
+def _store_down(*args, **kwargs):
+    raise ConnectionError("down")
+
+
+def _shared_usage(shared, key="k", expiry=60):
+    previous_count, previous_ttl, current_count, _ = shared.get_sliding_window(key, expiry)
+    return previous_count * previous_ttl / expiry + current_count
+
+
+class TestLocalFastPath:
+    def test_small_limits_always_use_the_shared_store(self):
+        shared = MemoryStorage()
+        a, b = _storage(shared), _storage(shared)
+        results = [s.acquire_sliding_window_entry("k", 5, 60) for s in (a, b, a, b, a, b, a)]
+        assert results == [True] * 5 + [False] * 2
+        assert a.local_hits == b.local_hits == 0
+
+    def test_admits_up_to_budget_locally_then_flushes(self):
+        shared = MemoryStorage()
+        storage = _storage(shared)  # 30/window, share 0.1 -> 3 local hits per sync
+
+        assert storage.acquire_sliding_window_entry("k", 30, 60)
+        for _ in range(3):
+            assert storage.acquire_sliding_window_entry("k", 30, 60)
+        assert (storage.shared_calls, storage.local_hits) == (1, 3)
+        assert _shared_usage(shared) == 1
+
+        assert storage.acquire_sliding_window_entry("k", 30, 60)
+        assert storage.shared_calls == 2
+        assert _shared_usage(shared) == 5
+
+    def test_pending_hits_are_reported_in_window_stats(self):
+        shared = MemoryStorage()
+        storage = _storage(shared)
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        assert storage.get_sliding_window("k", 60)[2] == 2
+
+    def test_no_local_admits_past_half_the_limit(self):
+        shared = MemoryStorage()
+        other = _storage(shared)
+        for _ in range(16):
+            assert other.acquire_sliding_window_entry("k", 30, 60)
+
+        storage = _storage(shared)
+        for _ in range(3):
+            storage.acquire_sliding_window_entry("k", 30, 60)
+        assert storage.local_hits == 0
+
+    def test_stale_sync_goes_to_the_shared_store(self):
+        clock = _Clock()
+        storage = _storage(MemoryStorage(), clock=clock)
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        clock.now += 7  # > 60s * 0.1
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        assert storage.local_hits == 0
+
+    def test_instances_together_never_exceed_limit_plus_budgets(self):
+        shared = MemoryStorage()
+        instances = [_storage(shared) for _ in range(4)]
+        admitted = sum(
+            instances[i % 4].acquire_sliding_window_entry("k", 30, 60) for i in range(200)
+        )
+        assert 30 <= admitted <= 30 + 4 * 3
+
+    def test_overshoot_after_another_instance_fills_the_window_is_bounded(self):
+        shared = MemoryStorage()
+        storage = _storage(shared)
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        storage.acquire_sliding_window_entry("k", 30, 60)  # local
+        other = _storage(shared, share=0)
+        while other.acquire_sliding_window_entry("k", 30, 60):
+            pass
+
+        extra = 0
+        while storage.acquire_sliding_window_entry("k", 30, 60):
+            extra += 1
+        assert extra <= 2  # the rest of this sync's budget of 3
+        assert not storage.acquire_sliding_window_entry("k", 30, 60)
+
+    def test_shared_store_errors_keep_pending_hits(self):
+        shared = MemoryStorage()
+        storage = _storage(shared)
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        storage.acquire_sliding_window_entry("k", 30, 60)  # local, pending=1
+
+        shared.acquire_sliding_window_entry = _store_down
+        with pytest.raises(ConnectionError):
+            storage.acquire_sliding_window_entry("k", 30, 60, amount=3)
+        assert storage._keys["k"].pending == 1
+
+    def test_reset_clears_local_and_shared_state(self):
+        shared = MemoryStorage()
+        storage = _storage(shared)
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        storage.acquire_sliding_window_entry("k", 30, 60)
+        storage.reset()
+        assert not storage._keys
+        assert _shared_usage(shared) == 0
+
+
+def _app(shared) -> FastAPI:
+    """A one-route app whose limiter keeps its counters in `shared` (one 'instance')."""
+    limiter = Limiter(
+        key_func=lambda request: "client",
+        strategy=STRATEGY,
+        storage_uri="ratelimit+local://",
+        storage_options={"shared": shared, "local_share": 0.1},
+        in_memory_fallback_enabled=True,
+    )
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+    @app.post("/sign")
+    @limiter.limit("5/minute")
+    async def sign(request: Request):
+        return {"ok": True}
+
+    return app
+
+
+def test_limit_is_shared_across_instances():
+    shared = MemoryStorage()
+    first, second = TestClient(_app(shared)), TestClient(_app(shared))
+    statuses = [(first if i % 2 else second).post("/sign").status_code for i in range(8)]
+    assert statuses.count(200) == 5
+    assert statuses[5:] == [429, 429, 429]
+
+
+def test_falls_back_to_instance_memory_when_shared_store_fails():
+    shared = MemoryStorage()
+    shared.acquire_sliding_window_entry = _store_down
+    shared.check = lambda: False
+    client = TestClient(_app(shared))
+    statuses = [client.post("/sign").status_code for _ in range(6)]
+    assert statuses == [200] * 5 + [429]
+
+
+def test_postgres_storage_rejects_fixed_window_strategy():
+    limiter = FixedWindowRateLimiter(PostgresSlidingWindowStorage(engine=object()))
+    with pytest.raises(ConfigurationError, match=STRATEGY):
+        limiter.hit(parse("5/minute"), "client")
+
+
+class TestPostgresSlidingWindowStorage:
+    """Against the test database's rate_limit_counters table."""
+
+    @pytest.fixture
+    def storage(self, engine):
+        clock = _Clock()
+        storage = PostgresSlidingWindowStorage(engine=engine, clock=clock)
+        storage.reset()
+        storage.clock = clock
+        yield storage
+        storage.reset()
+
+    def test_enforces_limit_within_window(self, storage):
+        results = [storage.acquire_sliding_window_entry("k", 5, 60) for _ in range(7)]
+        assert results == [True] * 5 + [False] * 2
+
+    def test_previous_window_is_weighted(self, storage):
+        for _ in range(10):
+            storage.acquire_sliding_window_entry("k", 10, 60)
+        storage.clock.now += 60  # same offset in the next window: 2/3 of the previous window overlaps
+        admitted = sum(storage.acquire_sliding_window_entry("k", 10, 60) for _ in range(10))
+        assert admitted == 10 - 6  # floor(10 * 40/60) = 6 still counted
+        assert storage.get_sliding_window("k", 60)[:3:2] == (10, 4)
+
+    def test_old_windows_are_forgotten(self, storage):
+        for _ in range(5):
+            storage.acquire_sliding_window_entry("k", 5, 60)
+        storage.clock.now += 120
+        assert storage.acquire_sliding_window_entry("k", 5, 60)
+
+    def test_reports_usage_for_the_fast_path(self, storage):
+        storage.acquire_with_usage("k", 30, 60, amount=4)
+        assert storage.acquire_with_usage("k", 30, 60) == (True, 5)
+        assert storage.acquire_with_usage("k", 30, 60, amount=26) == (False, 30)
+
+    def test_concurrent_instances_share_one_count(self, storage, engine):
+        others = [PostgresSlidingWindowStorage(engine=engine, clock=storage.clock) for _ in range(3)]
+
+        def hit(i):
+            return others[i % 3].acquire_sliding_window_entry("k", 20, 60)
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            assert sum(pool.map(hit, range(60))) == 20
+
+    def test_check_and_clear(self, storage):
+        assert storage.check()
+        storage.acquire_sliding_window_entry("k", 1, 60)
+        storage.clear_sliding_window("k", 60)
+        assert storage.acquire_sliding_window_entry("k", 1, 60)
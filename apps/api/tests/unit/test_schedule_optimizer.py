@@ -0,0 +1,127 @@
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.services.schedule_optimizer import (
+    ScheduleProblem,
+    Slot,
+    optimize_schedule,
+    round_robin_matchups,
+)
+
+START = date(2026, 6, 1)
+
+
+def _slots(weeks, times, fields=(None,), skip=()):
+    return {
+        w: [Slot(w, START + timedelta(weeks=w - 1), t, f) for t in times for f in fields]
+        for w in range(1, weeks + 1) if w not in skip
+    }
+
+
+def _assert_feasible(result, duration=60):
+    used = Counter((g.slot.week, g.slot.time, g.slot.field_id) for g in result.games)
+    assert max(used.values(), default=1) == 1, "slot double-booked"
+    busy = defaultdict(list)
+    for g in result.games:
+        assert g.slot.week >= g.matchup.week, "game played before its target week"
+        for team in (g.matchup.team1_id, g.matchup.team2_id):
+            busy[(team, g.slot.week)].append(g.slot.start_minutes)
+    for starts in busy.values():
+        starts.sort()
+        assert all(b - a >= duration for a, b in zip(starts, starts[1:])), "team double-booked"
+
+
+class TestRoundRobinMatchups:
+    def test_each_pair_once_per_cycle(self):
+        teams = [uuid4() for _ in range(6)]
+        matchups = round_robin_matchups(teams, num_weeks=5)
+        pairs = {frozenset((m.team1_id, m.team2_id)) for m in matchups}
+        assert len(matchups) == len(pairs) == 15
+
+    def test_games_per_week_packs_rounds_into_weeks(self):
+        teams = [uuid4() for _ in range(4)]
+        matchups = round_robin_matchups(teams, num_weeks=2, games_per_week=2)
+        assert Counter(m.week for m in matchups) == {1: 4, 2: 4}
+
+    def test_odd_team_count_gets_byes(self):
+        teams = [uuid4() for _ in range(5)]
+        matchups = round_robin_matchups(teams, num_weeks=1)
+        assert len(matchups) == 2
+
+
+class TestOptimizeSchedule:
+    @pytest.mark.parametrize("engine", ["greedy", "optimized"])
+    def test_parallel_fields_without_team_conflicts(self, engine):
+        teams = [uuid4() for _ in range(8)]
+        fields = [uuid4(), uuid4()]
+        problem = ScheduleProblem(
+            matchups=round_robin_matchups(teams, num_weeks=4, games_per_week=2),
+            slots_by_week=_slots(4, ["18:00", "19:00", "20:00", "21:00"], fields),
+            num_weeks=4,
+            games_per_week=2,
+        )
+        result = optimize_schedule(problem, engine=engine, time_budget_ms=200)
+        assert result.unscheduled == []
+        assert len(result.games) == 32
+        _assert_feasible(result)
+
+    def test_overflow_is_carried_into_later_weeks(self):
+        teams = [uuid4() for _ in range(4)]
+        # Week 2 has no availability; weeks 3-4 have spare capacity
+        problem = ScheduleProblem(
+            matchups=round_robin_matchups(teams, num_weeks=4),
+            slots_by_week=_slots(4, ["18:00", "19:00", "20:00"], skip=(2,)),
+            num_weeks=4,
+        )
+        result = optimize_schedule(problem, time_budget_ms=200)
+        assert result.unscheduled == []
+        assert len(result.games) == 8
+        assert result.breakdown["delay_weeks"] > 0
+        _assert_feasible(result)
+
+    def test_reports_games_that_cannot_fit(self):
+        teams = [uuid4() for _ in range(4)]
+        problem = ScheduleProblem(
+            matchups=round_robin_matchups(teams, num_weeks=2),
+            slots_by_week=_slots(2, ["18:00"]),
+            num_weeks=2,
+        )
+        result = optimize_schedule(problem, time_budget_ms=100)
+        assert len(result.games) == 2
+        assert len(result.unscheduled) == 2
+        assert result.objective >= 2000
+
+    def test_balances_early_and_late_slots(self):
+        teams = [uuid4() for _ in range(4)]
+        problem = ScheduleProblem(
+            matchups=round_robin_matchups(teams, num_weeks=6),
+            slots_by_week=_slots(6, ["18:00", "19:00"]),
+            num_weeks=6,
+        )
+        result = optimize_schedule(problem, time_budget_ms=300)
+        early = Counter()
+        for g in result.games:
+            if g.slot.time == "18:00":
+                early[g.matchup.team1_id] += 1
+                early[g.matchup.team2_id] += 1
+        # 6 games each; a balanced schedule gives every team 3 early games
+        assert all(early[t] == 3 for t in teams)
+
+    def test_deterministic_for_seed(self):
+        teams = [uuid4() for _ in range(6)]
+        problem = ScheduleProblem(
+            matchups=round_robin_matchups(teams, num_weeks=5),
+            slots_by_week=_slots(5, ["18:00", "19:00", "20:00"]),
+            num_weeks=5,
+        )
+        a = optimize_schedule(problem, engine="greedy", seed=1)
+        b = optimize_schedule(problem, engine="greedy", seed=1)
+        assert [(g.matchup, g.slot) for g in a.games] == [(g.matchup, g.slot) for g in b.games]
+
+    def test_unknown_engine_rejected(self):
+        problem = ScheduleProblem(matchups=[], slots_by_week={}, num_weeks=1)
+        with pytest.raises(ValueError):
+            optimize_schedule(problem, engine="annealing")
@@ -0,0 +1,138 @@
+import random
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services.swiss_service import (
+    compute_swiss_records,
+    pair_swiss_round,
+    rank_swiss,
+)
+
+
+def _game(team1, team2, week, winner=None, score=(1, 0), status="completed"):
+    return SimpleNamespace(
+        team1_id=team1, team2_id=team2, week=week, status=status,
+        team1_score=score[0], team2_score=score[1], winner_id=winner,
+    )
+
+
+def _play_rounds(n_teams, n_rounds, seed=0):
+    rng = random.Random(seed)
+    teams = [uuid4() for _ in range(n_teams)]
+    games = []
+    pairings = []
+    for week in range(1, n_rounds + 1):
+        pairing = pair_swiss_round(compute_swiss_records(teams, games))
+        pairings.append(pairing)
+        for a, b in pairing.pairings:
+            games.append(_game(a, b, week, winner=a if rng.random() < 0.5 else b))
+    return teams, games, pairings
+
+
+class TestComputeSwissRecords:
+    def test_points_ties_and_tiebreaks(self):
+        a, b, c, d = (uuid4() for _ in range(4))
+        games = [
+            _game(a, b, 1, winner=a),
+            _game(c, d, 1, score=(7, 7)),  # tie
+            _game(a, c, 2, winner=a),
+            _game(b, d, 2, winner=d),
+        ]
+        records = compute_swiss_records([a, b, c, d], games)
+        assert records[a].points == 2
+        assert records[c].points == 0.5
+        assert records[d].points == 1.5
+        assert records[b].points == 0
+        # Buchholz: sum of opponents' points
+        assert records[a].buchholz == records[b].points + records[c].points
+        # Sonneborn-Berger: beaten opponents' points + half of drawn opponents'
+        assert records[d].sonneborn_berger == records[b].points * 1 + records[c].points * 0.5
+
+    def test_cancelled_games_are_not_meetings(self):
+        a, b = uuid4(), uuid4()
+        records = compute_swiss_records([a, b], [_game(a, b, 1, winner=a, status="cancelled")])
+        assert records[a].opponents == set()
+        assert records[a].points == 0
+
+    def test_scheduled_games_count_as_meetings_without_points(self):
+        a, b = uuid4(), uuid4()
+        records = compute_swiss_records([a, b], [_game(a, b, 1, status="scheduled")])
+        assert records[a].opponents == {b}
+        assert records[a].points == 0
+
+    def test_missing_from_a_week_is_a_bye(self):
+        a, b, c = uuid4(), uuid4(), uuid4()
+        records = compute_swiss_records([a, b, c], [_game(a, b, 1, winner=a)])
+        assert records[c].byes == 1
+        assert records[a].byes == 0
+
+    def test_bye_scores_as_a_win_and_counts_in_opponents_buchholz(self):
+        a, b, c = uuid4(), uuid4(), uuid4()
+        games = [_game(a, b, 1, winner=a), _game(a, c, 2, winner=c), _game(b, c, 3, winner=b)]
+        records = compute_swiss_records([a, b, c], games)
+        assert [records[t].points for t in (a, b, c)] == [2.0, 2.0, 2.0]
+        assert [records[t].byes for t in (a, b, c)] == [1, 1, 1]
+        assert records[a].buchholz == 4.0  # b and c, byes included
+        assert records[a].sonneborn_berger == 2.0  # beat b only
+
+    def test_bye_points_are_configurable(self):
+        a, b, c = uuid4(), uuid4(), uuid4()
+        records = compute_swiss_records([a, b, c], [_game(a, b, 1, winner=a)], bye_points=0.5)
+        assert records[c].points == 0.5
+
+
+class TestRankSwiss:
+    def test_tiebreak_changes_order(self):
+        a, b, c, d, e, f = (uuid4() for _ in range(6))
+        games = [
+            _game(a, c, 1, winner=a),
+            _game(b, d, 1, winner=b),
+            _game(e, f, 1, score=(3, 3)),
+            _game(a, e, 2, score=(3, 3)),
+            _game(b, f, 2, score=(3, 3)),
+            _game(c, d, 2, winner=c),
+        ]
+        records = compute_swiss_records([a, b, c, d, e, f], games)
+        # a and b both have 1.5 points
+        assert records[a].points == records[b].points == 1.5
+        assert records[a].buchholz > records[b].buchholz
+        assert rank_swiss(records, "buchholz")[0] == a
+
+
+class TestPairSwissRound:
+    def test_first_round_pairs_top_half_against_bottom_half(self):
+        teams = [uuid4() for _ in range(8)]
+        pairing = pair_swiss_round(compute_swiss_records(teams, []))
+        assert pairing.pairings[0] == (teams[0], teams[4])
+        assert pairing.bye_team_id is None
+
+    def test_every_team_plays_once_per_round(self):
+        teams, _, pairings = _play_rounds(64, 6)
+        for pairing in pairings:
+            paired = [t for pair in pairing.pairings for t in pair]
+            assert len(paired) == len(set(paired)) == 64
+
+    def test_no_rematches_in_full_round_robin_length(self):
+        # 8 teams can play 7 rounds without ever meeting twice
+        _, games, pairings = _play_rounds(8, 7, seed=3)
+        meetings = [frozenset((g.team1_id, g.team2_id)) for g in games]
+        assert len(meetings) == len(set(meetings))
+        assert all(p.rematches == 0 for p in pairings)
+
+    def test_odd_team_count_rotates_byes(self):
+        teams, _, pairings = _play_rounds(7, 7, seed=5)
+        byes = [p.bye_team_id for p in pairings]
+        assert None not in byes
+        assert len(set(byes)) == 7
+
+    def test_falls_back_to_rematch_when_unavoidable(self):
+        a, b = uuid4(), uuid4()
+        pairing = pair_swiss_round(compute_swiss_records([a, b], [_game(a, b, 1, winner=a)]))
+        assert pairing.pairings == [(a, b)]
+        assert pairing.rematches == 1
+
+    def test_unknown_tiebreak_rejected(self):
+        with pytest.raises(ValueError):
+            pair_swiss_round(compute_swiss_records([uuid4(), uuid4()], []), tiebreak="median")
@@ -0,0 +1,90 @@
+from collections import Counter
+
+from app.services.team_balancer import balance_teams
+
+
+def _players(prefix, n, gender=None):
+    return [{"id": f"{prefix}{i}", "gender": gender} for i in range(n)]
+
+
+def _ids(result):
+    return [[p["id"] for p in team] for team in result.teams]
+
+
+def _team_of(result):
+    return {p["id"]: t for t, team in enumerate(result.teams) for p in team}
+
+
+class TestBalanceTeams:
+    def test_sizes_within_one(self):
+        result = balance_teams({}, _players("p", 23), teams_count=4, capacity=6)
+        sizes = sorted(len(team) for team in result.teams)
+        assert sizes == [5, 6, 6, 6]
+        assert sum(sizes) == 23
+
+    def test_groups_kept_together(self):
+        groups = {
+            "g1": _players("a", 4),
+            "g2": _players("b", 3),
+            "g3": _players("c", 3),
+            "g4": _players("d", 2),
+        }
+        result = balance_teams(groups, _players("s", 12), teams_count=4, capacity=6)
+        team_of = _team_of(result)
+        for members in groups.values():
+            assert len({team_of[p["id"]] for p in members}) == 1
+        assert result.groups_kept_together == 4
+        assert result.groups_split == 0
+        assert max(len(t) for t in result.teams) - min(len(t) for t in result.teams) <= 1
+
+    def test_oversized_group_split_into_fewest_chunks(self):
+        groups = {"big": _players("b", 10)}
+        result = balance_teams(groups, _players("s", 8), teams_count=3, capacity=6)
+        team_of = _team_of(result)
+        assert len({team_of[p["id"]] for p in groups["big"]}) == 2
+        assert result.groups_split == 1
+        assert result.groups_kept_together == 0
+        assert all(len(team) == 6 for team in result.teams)
+
+    def test_capacity_respected(self):
+        groups = {f"g{i}": _players(f"g{i}-", 3) for i in range(5)}
+        result = balance_teams(groups, _players("s", 5), teams_count=4, capacity=5)
+        assert all(len(team) <= 5 for team in result.teams)
+        assert sum(len(team) for team in result.teams) == 20
+
+    def test_balances_attribute_across_groups(self):
+        women = _players("f", 8, "female")
+        men = _players("m", 16, "male")
+        # Eight pairs: size-only packing puts any two pairs on a team
+        groups = {f"f{i}": women[2 * i:2 * i + 2] for i in range(4)}
+        groups.update({f"m{i}": men[2 * i:2 * i + 2] for i in range(4)})
+        for seed in range(5):
+            result = balance_teams(
+                groups, men[8:], teams_count=4, capacity=6,
+                balance_key=lambda p: p["gender"], seed=seed,
+            )
+            per_team = [Counter(p["gender"] for p in team) for team in result.teams]
+            assert all(c == {"male": 4, "female": 2} for c in per_team)
+            assert result.groups_kept_together == 8
+            assert result.attribute_counts == [dict(c) for c in per_team]
+
+    def test_ungrouped_attribute_spread_evenly(self):
+        players = _players("m", 12, "male") + _players("f", 12, "female") + _players("u", 2)
+        result = balance_teams({}, players, teams_count=4, capacity=7, balance_key=lambda p: p["gender"])
+        for team in result.teams:
+            counts = Counter(p["gender"] for p in team)
+            assert counts["male"] == 3
+            assert counts["female"] == 3
+
+    def test_deterministic_for_seed(self):
+        groups = {f"g{i}": _players(f"g{i}-", 2 + i % 3) for i in range(6)}
+        solo = _players("s", 30)
+        first = balance_teams(groups, solo, teams_count=5, capacity=10, seed=7)
+        second = balance_teams(groups, solo, teams_count=5, capacity=10, seed=7)
+        assert _ids(first) == _ids(second)
+
+    def test_single_team(self):
+        result = balance_teams({"g": _players("g", 3)}, _players("s", 2), teams_count=1, capacity=5)
+        assert len(result.teams) == 1
+        assert len(result.teams[0]) == 5
+        assert result.iterations == 0
@@ -1,5 +1,5 @@
 from datetime import date, timedelta
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from tests.conftest import (
     make_league, make_player, make_league_player, make_group
@@ -9,6 +9,7 @@ from app.services.team_generation_service import (
 )
 from app.models.team import Team
 from app.models.league_player import LeaguePlayer
+from app.models.player import Player
 
 
 def _fill_league(db, league, count):
@@ -158,6 +159,25 @@ def test_run_imbalanced_flag_present(db):
     assert result["imbalanced"] is False
 
 
+def test_run_balance_by_gender(db):
+    league = make_league(db, format="7v7", max_teams=2)
+    for gender in ["male"] * 8 + ["female"] * 6:
+        p = make_player(db, gender=gender)
+        make_league_player(db, league.id, p.id, status="confirmed", waiver_status="signed")
+
+    result = generate_teams(league, db, teams_count=2, balance_by="gender", seed=3)
+    assert result["team_sizes"] == [7, 7]
+
+    db.expire_all()
+    for team in result["team_details"]:
+        genders = [
+            db.query(Player).filter(Player.id == UUID(p["player_id"])).one().gender
+            for p in team["players"]
+        ]
+        assert genders.count("male") == 4
+        assert genders.count("female") == 3
+
+
 def test_run_balanced_detection(db):
     league = make_league(db, format="7v7", max_teams=2)
     _fill_league(db, league, 14)
@@ -0,0 +1,202 @@
+"""Tests for the streamed waiver ZIP export — S3 via the local stand-in, no DB."""
+
+import csv
+import hashlib
+import io
+import threading
+import zipfile
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+import app.services.waiver_archive_service as archive_service
+from app.services.s3_service import upload_waiver_archive
+from app.services.waiver_archive_service import (
+    MANIFEST_NAME,
+    ArchiveEntry,
+    WaiverArchive,
+    archive_filename,
+    iter_waiver_archive,
+)
+
+
+def _archive(*entries, waivers=None):
+    return WaiverArchive(
+        league_id=uuid4(),
+        league_name="Fall League",
+        entries=list(entries),
+        waivers=waivers if waivers is not None else {},
+    )
+
+
+def _entry(name, waiver_id, pdf_path=None):
+    signature_id = uuid4()
+    return ArchiveEntry(
+        signature_id=signature_id,
+        waiver_id=waiver_id,
+        player_name=name,
+        player_email=f"{name.split()[0].lower()}@example.com",
+        full_name_typed=name,
+        waiver_version="2026-v1",
+        signed_at=datetime(2026, 9, 1, 18, 30, tzinfo=timezone.utc),
+        pdf_path=pdf_path,
+        filename=f"{name.replace(' ', '_')}_{signature_id.hex[:8]}.pdf",
+    )
+
+
+def _store(fake_s3, key, data):
+    fake_s3.objects[("test-waivers", key)] = data
+    fake_s3.content_types[("test-waivers", key)] = "application/pdf"
+
+
+def _open(chunks):
+    zf = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    manifest = list(csv.DictReader(io.StringIO(zf.read(MANIFEST_NAME).decode())))
+    return zf, manifest
+
+
+class TestIterWaiverArchive:
+    def test_streams_stored_pdfs_and_manifest(self, fake_s3):
+        waiver_id = uuid4()
+        pdfs = {"waivers/a.pdf": b"%PDF-a" * 50, "waivers/b.pdf": b"%PDF-b" * 3}
+        for key, data in pdfs.items():
+            _store(fake_s3, key, data)
+        a = _entry("Alice Smith", waiver_id, "waivers/a.pdf")
+        b = _entry("Bob Jones", waiver_id, "waivers/b.pdf")
+
+        chunks = list(iter_waiver_archive(_archive(a, b), concurrency=2, chunk_size=64))
+
+        zf, manifest = _open(chunks)
+        assert zf.namelist() == [a.filename, b.filename, MANIFEST_NAME]
+        assert zf.read(a.filename) == pdfs["waivers/a.pdf"]
+        assert zf.read(b.filename) == pdfs["waivers/b.pdf"]
+        assert zf.getinfo(a.filename).compress_type == zipfile.ZIP_STORED
+        assert [r["source"] for r in manifest] == ["stored", "stored"]
+        assert manifest[0]["sha256"] == hashlib.sha256(pdfs["waivers/a.pdf"]).hexdigest()
+        assert manifest[0]["bytes"] == str(len(pdfs["waivers/a.pdf"]))
+        # 300 bytes in 64-byte ranges
+        assert sum(1 for m, _, key in fake_s3.requests if key == "waivers/a.pdf") == 5
+        assert max(len(c) for c in chunks) < 1024
+
+    def test_regenerates_missing_pdfs(self, fake_s3):
+        waiver_id = uuid4()
+        waivers = {waiver_id: ("Play at your own risk.", "2026-v1")}
+        gone = _entry("Alice Smith", waiver_id, "waivers/gone.pdf")
+        unprocessed = _entry("Bob Jones", waiver_id)
+
+        zf, manifest = _open(iter_waiver_archive(_archive(gone, unprocessed, waivers=waivers)))
+
+        assert [r["source"] for r in manifest] == ["regenerated", "regenerated"]
+        assert zf.read(gone.filename)[:5] == b"%PDF-"
+        assert zf.read(unprocessed.filename)[:5] == b"%PDF-"
+        assert not any(method == "PUT" for method, _, _ in fake_s3.requests)
+
+    def test_s3_error_falls_back_to_regeneration(self, fake_s3):
+        waiver_id = uuid4()
+        _store(fake_s3, "waivers/a.pdf", b"%PDF-a")
+        fake_s3.fail_next(403)
+        entry = _entry("Alice Smith", waiver_id, "waivers/a.pdf")
+
+        zf, manifest = _open(iter_waiver_archive(
+            _archive(entry, waivers={waiver_id: ("Text", "2026-v1")}), concurrency=1,
+        ))
+
+        assert manifest[0]["source"] == "regenerated"
+        assert zf.read(entry.filename)[:5] == b"%PDF-"
+
+    def test_unrenderable_signature_is_reported_not_archived(self, fake_s3):
+        entry = _entry("Alice Smith", uuid4())  # no PDF and no waiver text
+
+        zf, manifest = _open(iter_waiver_archive(_archive(entry)))
+
+        assert zf.namelist() == [MANIFEST_NAME]
+        assert manifest[0]["source"] == "failed"
+        assert manifest[0]["error"].startswith("KeyError")
+
+    def test_read_failure_mid_member_is_reported_and_export_continues(self, fake_s3, monkeypatch):
+        waiver_id = uuid4()
+        _store(fake_s3, "waivers/a.pdf", b"%PDF-a" * 50)
+        _store(fake_s3, "waivers/b.pdf", b"%PDF-b" * 3)
+        a = _entry("Alice Smith", waiver_id, "waivers/a.pdf")
+        b = _entry("Bob Jones", waiver_id, "waivers/b.pdf")
+        real_range = archive_service.get_waiver_pdf_range
+
+        def flaky_range(key, start, length):
+            if key == "waivers/a.pdf" and start > 0:
+                raise IOError("connection reset")
+            return real_range(key, start, length)
+
+        monkeypatch.setattr(archive_service, "get_waiver_pdf_range", flaky_range)
+
+        zf, manifest = _open(iter_waiver_archive(_archive(a, b), concurrency=1, chunk_size=64))
+
+        assert zf.testzip() is None
+        assert zf.read(a.filename) == (b"%PDF-a" * 50)[:64]
+        assert zf.read(b.filename) == b"%PDF-b" * 3
+        assert manifest[0]["file"] == a.filename
+        assert manifest[0]["source"] == "failed"
+        assert manifest[0]["bytes"] == "64"
+        assert manifest[0]["error"].startswith("OSError: connection reset (file truncated at 64 of 300 bytes)")
+        assert manifest[1]["source"] == "stored"
+
+    def test_prefetch_is_bounded_by_concurrency(self, fake_s3):
+        waiver_id = uuid4()
+        entries = []
+        for i in range(10):
+            _store(fake_s3, f"waivers/{i}.pdf", b"%PDF-" + bytes(100))
+            entries.append(_entry(f"Player {i}", waiver_id, f"waivers/{i}.pdf"))
+
+        stream = iter_waiver_archive(_archive(*entries), concurrency=2)
+        next(stream)
+        stream.close()
+        # Closing doesn't wait for in-flight prefetches; let them finish before fake_s3 stops
+        for thread in threading.enumerate():
+            if thread.name.startswith("waiver-export"):
+                thread.join(timeout=5)
+
+        assert len(fake_s3.requests) <= 3
+
+    def test_empty_league_has_only_manifest(self):
+        zf, manifest = _open(iter_waiver_archive(_archive()))
+        assert zf.namelist() == [MANIFEST_NAME]
+        assert manifest == []
+
+
+def test_archive_filename_is_ascii():
+    archive = WaiverArchive(league_id=uuid4(), league_name="Liga Señor 2026!", entries=[])
+    name = archive_filename(archive)
+    assert name.startswith("waivers-liga-se-or-2026-") and name.endswith(".zip")
+    assert name.isascii()
+
+
+class TestUploadWaiverArchive:
+    def test_streams_chunks_into_a_multipart_upload(self, fake_s3):
+        chunks = [bytes([i]) * 3000 for i in range(5)]
+
+        key = upload_waiver_archive(iter(chunks), "exports/waivers/x.zip", part_size=4096)
+
+        assert key == "exports/waivers/x.zip"
+        assert fake_s3.objects[("test-waivers", key)] == b"".join(chunks)
+        assert fake_s3.content_types[("test-waivers", key)] == "application/zip"
+        assert sum(1 for method, _, _ in fake_s3.requests if method == "PUT") == 3  # parts of 6000, 6000 and 3000 bytes
+        assert fake_s3.uploads == {}
+
+    def test_empty_stream_still_creates_the_object(self, fake_s3):
+        upload_waiver_archive(iter([]), "exports/waivers/empty.zip")
+        assert fake_s3.objects[("test-waivers", "exports/waivers/empty.zip")] == b""
+
+    def test_failure_aborts_the_upload(self, fake_s3):
+        def chunks():
+            yield b"x" * 5000
+            raise IOError("archive build failed")
+
+        with pytest.raises(IOError):
+            upload_waiver_archive(chunks(), "exports/waivers/x.zip", part_size=4096)
+
+        assert ("test-waivers", "exports/waivers/x.zip") not in fake_s3.objects
+        assert fake_s3.uploads == {}
+
+    def test_without_bucket_is_a_no_op(self, monkeypatch):
+        monkeypatch.setattr(archive_service.settings, "WAIVER_S3_BUCKET", "")
+        assert upload_waiver_archive(iter([b"x"]), "exports/waivers/x.zip") is None
@@ -0,0 +1,195 @@
+"""Tests for the post-signing waiver document stage — S3 via the local stand-in, state via the test DB."""
+
+import base64
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.core.config import settings
+from app.handlers.waiver_document_handler import handler
+from app.models.email_outbox import EmailOutbox
+from app.services.s3_service import download_waiver_pdf, upload_waiver_pdf, waiver_pdf_key
+from app.services.waiver_document_service import (
+    MAX_ATTEMPTS,
+    process_pending_signatures,
+    process_signature,
+)
+from tests.conftest import make_league, make_player, make_waiver, make_waiver_signature
+
+
+def _puts(fake_s3):
+    return [r for r in fake_s3.requests if r[0] == "PUT"]
+
+
+# ---------------------------------------------------------------------------
+# S3 helpers (no DB)
+# ---------------------------------------------------------------------------
+
+class TestS3Helpers:
+    def test_upload_and_download_round_trip(self, fake_s3):
+        league_id, player_id, signature_id = uuid4(), uuid4(), uuid4()
+        key = upload_waiver_pdf(b"%PDF-test", league_id, player_id, signature_id)
+        assert key == waiver_pdf_key(league_id, player_id, signature_id)
+        assert fake_s3.content_types[("test-waivers", key)] == "application/pdf"
+        assert download_waiver_pdf(key) == b"%PDF-test"
+
+    def test_download_missing_object_returns_none(self, fake_s3):
+        assert download_waiver_pdf("waivers/missing.pdf") is None
+
+    def test_upload_error_raises(self, fake_s3):
+        fake_s3.fail_next(403)
+        with pytest.raises(ClientError):
+            upload_waiver_pdf(b"%PDF-test", uuid4(), uuid4(), uuid4())
+
+    def test_no_bucket_skips_upload(self, fake_s3, monkeypatch):
+        monkeypatch.setattr(settings, "WAIVER_S3_BUCKET", "")
+        assert upload_waiver_pdf(b"%PDF-test", uuid4(), uuid4(), uuid4()) is None
+        assert fake_s3.requests == []
+
+
+# ---------------------------------------------------------------------------
+# Processing (test DB)
+# ---------------------------------------------------------------------------
+
+def _signed(db, **kwargs):
+    waiver = make_waiver(db, version="2026-v1", content="Play at your own risk.")
+    league = make_league(db, name="Fall League")
+    player = make_player(db, first_name="Jane", last_name="Doe", email="jane@example.com")
+    sig = make_waiver_signature(db, waiver.id, player.id, league.id, full_name_typed="Jane Doe", **kwargs)
+    db.commit()
+    return sig
+
+
+def _outbox(db):
+    return db.query(EmailOutbox).filter(EmailOutbox.kind == "waiver_confirmation").all()
+
+
+class TestProcessSignature:
+    def test_renders_uploads_and_queues_confirmation(self, db, fake_s3):
+        sig = _signed(db)
+
+        assert process_signature(db, sig.id) is True
+
+        db.refresh(sig)
+        assert sig.pdf_path == waiver_pdf_key(sig.league_id, sig.player_id, sig.id)
+        assert fake_s3.objects[("test-waivers", sig.pdf_path)][:5] == b"%PDF-"
+        assert sig.email_sent_at is not None
+        assert sig.processed_at is not None
+        queued = _outbox(db)
+        assert [q.to_email for q in queued] == ["jane@example.com"]
+        assert queued[0].message["attachments"][0]["filename"] == "signed-waiver.pdf"
+
+    def test_is_idempotent(self, db, fake_s3):
+        sig = _signed(db)
+        process_signature(db, sig.id)
+        puts = len(_puts(fake_s3))
+
+        assert process_signature(db, sig.id) is False
+        assert len(_puts(fake_s3)) == puts
+        assert len(_outbox(db)) == 1
+
+    def test_reuses_stored_pdf_when_only_email_is_pending(self, db, fake_s3):
+        sig = _signed(db)
+        key = waiver_pdf_key(sig.league_id, sig.player_id, sig.id)
+        fake_s3.objects[("test-waivers", key)] = b"%PDF-stored"
+        fake_s3.content_types[("test-waivers", key)] = "application/pdf"
+        sig.pdf_path = key
+        db.commit()
+
+        assert process_signature(db, sig.id) is True
+
+        assert _puts(fake_s3) == []
+        attachment = _outbox(db)[0].message["attachments"][0]["content"]
+        assert base64.b64decode(attachment) == b"%PDF-stored"
+
+    def test_regenerates_missing_stored_pdf(self, db, fake_s3):
+        sig = _signed(db, pdf_path="waivers/gone.pdf")
+
+        assert process_signature(db, sig.id) is True
+
+        db.refresh(sig)
+        assert len(_puts(fake_s3)) == 1
+        assert ("test-waivers", sig.pdf_path) in fake_s3.objects
+
+    def test_email_already_sent_is_not_queued_again(self, db, fake_s3):
+        sig = _signed(db, email_sent_at=datetime.now(timezone.utc))
+        assert process_signature(db, sig.id) is True
+        assert _outbox(db) == []
+        db.refresh(sig)
+        assert sig.pdf_path is not None
+
+    def test_without_bucket_still_queues_email(self, db, fake_s3, monkeypatch):
+        monkeypatch.setattr(settings, "WAIVER_S3_BUCKET", "")
+        sig = _signed(db)
+        assert process_signature(db, sig.id) is True
+        db.refresh(sig)
+        assert sig.pdf_path is None
+        assert len(_outbox(db)) == 1
+
+
+class TestProcessPendingSignatures:
+    def test_processes_due_signatures(self, db, fake_s3):
+        sig = _signed(db)
+        result = process_pending_signatures(db)
+        assert (result.claimed, result.processed, result.failed) == (1, 1, 0)
+        db.refresh(sig)
+        assert sig.processing_attempts == 1
+        assert sig.processed_at is not None
+
+    def test_s3_failure_is_retried_with_backoff(self, db, fake_s3):
+        sig = _signed(db)
+        fake_s3.fail_next(403)
+
+        result = process_pending_signatures(db, seed=0)
+
+        assert result.failed_ids == [sig.id]
+        db.expire_all()
+        assert sig.processed_at is None
+        assert sig.processing_attempts == 1
+        assert "AccessDenied" in sig.processing_error
+        assert sig.next_processing_at > datetime.now(timezone.utc)
+        assert _outbox(db) == []
+
+        # Not due yet
+        assert process_pending_signatures(db).claimed == 0
+
+        sig.next_processing_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db.commit()
+        assert process_pending_signatures(db).processed == 1
+        db.expire_all()
+        assert sig.processing_error is None
+        assert len(_outbox(db)) == 1
+
+    def test_gives_up_after_max_attempts(self, db, fake_s3):
+        sig = _signed(db, processing_attempts=MAX_ATTEMPTS)
+        assert process_pending_signatures(db).claimed == 0
+        db.refresh(sig)
+        assert sig.processed_at is None
+
+    def test_skips_processed_signatures(self, db, fake_s3):
+        _signed(db, processed_at=datetime.now(timezone.utc))
+        assert process_pending_signatures(db).claimed == 0
+
+
+# ---------------------------------------------------------------------------
+# Handler
+# ---------------------------------------------------------------------------
+
+def test_handler_rejects_wrong_source():
+    assert handler({"source": "manual"}, None)["statusCode"] == 403
+
+
+def test_handler_reserves_time_for_outbox(mocker):
+    mock_run = mocker.patch(
+        "app.handlers.waiver_document_handler._run_once",
+        return_value={"claimed": 0, "processed": 0, "failed": 0, "emails_sent": 0},
+    )
+    context = mocker.MagicMock()
+    context.get_remaining_time_in_millis.return_value = 60_000
+
+    result = handler({"source": "aws.events"}, context)
+
+    assert result["statusCode"] == 200
+    assert mock_run.call_args.args[0] == pytest.approx(45.0)
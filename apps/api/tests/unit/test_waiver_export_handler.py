@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+import pytest
+
+import app.handlers.waiver_export_handler as export_handler
+from app.handlers.waiver_export_handler import handler
+
+
+@pytest.mark.parametrize("event", [{}, {"league_id": str(uuid4())}, {"league_id": "nope", "export_id": str(uuid4())}])
+def test_rejects_malformed_event(event):
+    assert handler(event, None)["statusCode"] == 400
+
+
+def test_runs_the_export(monkeypatch):
+    league_id, export_id = uuid4(), uuid4()
+    calls = []
+    monkeypatch.setattr(export_handler, "_run", lambda *args: calls.append(args) or "exports/waivers/x.zip")
+
+    result = handler({"league_id": str(league_id), "export_id": str(export_id)}, None)
+
+    assert result == {"statusCode": 200, "key": "exports/waivers/x.zip"}
+    assert calls == [(league_id, export_id)]
+
+
+def test_failure_is_returned_not_raised(monkeypatch):
+    def fail(*args):
+        raise RuntimeError("S3 down")
+
+    monkeypatch.setattr(export_handler, "_run", fail)
+    result = handler({"league_id": str(uuid4()), "export_id": str(uuid4())}, None)
+    assert result["statusCode"] == 500
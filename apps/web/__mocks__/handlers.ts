@@ -170,7 +170,7 @@ export const handlers = [
 
   // Admin users
   rest.get(`${API_BASE}/admin/users`, (_req, res, ctx) => {
-    return res(ctx.json({ users: [], total: 0, page: 1, page_size: 25, total_pages: 0 }));
+    return res(ctx.json({ users: [], total: 0, total_is_estimate: true, page: 1, page_size: 25, total_pages: 0, next_cursor: null }));
   }),
 
   // Admin fields
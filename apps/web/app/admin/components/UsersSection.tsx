@@ -1,7 +1,7 @@
 'use client';
 
 import React, { useState, useEffect } from 'react';
-import { PaginatedUserResponse } from '@/services';
+import { PaginatedUserResponse, PlayerSearchResult } from '@/services';
 
 interface UsersSectionProps {
   authenticatedRequest: <T>(url: string, options?: RequestInit) => Promise<T>;
@@ -12,6 +12,8 @@ export default function UsersSection({ authenticatedRequest }: UsersSectionProps
   const [isLoadingUsers, setIsLoadingUsers] = useState(false);
   const [usersPage, setUsersPage] = useState(1);
   const [usersPageSize] = useState(25);
+  // cursors[i] starts page i + 1; the API pages by cursor so deep pages stay fast
+  const [cursors, setCursors] = useState<(string | null)[]>([null]);
 
   useEffect(() => {
     loadUsers(1);
@@ -19,21 +21,58 @@ export default function UsersSection({ authenticatedRequest }: UsersSectionProps
   }, []);
 
   const loadUsers = async (page: number) => {
+    const cursor = cursors[page - 1] ?? null;
     setIsLoadingUsers(true);
     try {
-      const data = await authenticatedRequest<PaginatedUserResponse>(`/admin/users?page=${page}&page_size=${usersPageSize}`);
+      const query = cursor
+        ? `cursor=${encodeURIComponent(cursor)}&page_size=${usersPageSize}&count=estimated`
+        : `page_size=${usersPageSize}&count=estimated`;
+      const data = await authenticatedRequest<PaginatedUserResponse>(`/admin/users?${query}`);
       setUsersData(data);
       setUsersPage(page);
+      setCursors((prev) => [...prev.slice(0, page), data.next_cursor]);
     } catch { /* silent */ } finally { setIsLoadingUsers(false); }
   };
 
+  const [search, setSearch] = useState('');
+  const [searchResults, setSearchResults] = useState<PlayerSearchResult[] | null>(null);
+
+  useEffect(() => {
+    const q = search.trim();
+    if (q.length < 2) {
+      setSearchResults(null);
+      return;
+    }
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const results = await authenticatedRequest<PlayerSearchResult[]>(`/admin/users/search?q=${encodeURIComponent(q)}`);
+        if (!cancelled) setSearchResults(results);
+      } catch { /* silent */ }
+    }, 200);
+    return () => { cancelled = true; clearTimeout(timer); };
+  // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [search]);
+
+  const rows = searchResults ?? usersData?.users ?? [];
+  const hasNextPage = Boolean(usersData?.next_cursor);
+  const approx = usersData?.total_is_estimate ? '~' : '';
+
   return (
     <section id="users">
       <div className="flex items-center justify-between mb-4">
         <div>
           <h2 className="text-base font-semibold text-white">Users</h2>
-          <p className="text-xs text-[#6B6B6B] mt-0.5">{usersData?.total ?? 0} registered</p>
+          <p className="text-xs text-[#6B6B6B] mt-0.5">{approx}{usersData?.total ?? 0} registered</p>
         </div>
+        <input
+          type="search"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+          placeholder="Search name, email or phone"
+          aria-label="Search users"
+          className="ml-auto mr-2 w-64 bg-white/5 border border-white/10 rounded px-3 py-1.5 text-sm text-white placeholder-[#6B6B6B] focus:outline-none focus:border-white/30"
+        />
         <button
           onClick={() => loadUsers(usersPage)}
           className="text-[#6B6B6B] hover:text-white transition-colors p-1.5 rounded hover:bg-white/5"
@@ -46,7 +85,7 @@ export default function UsersSection({ authenticatedRequest }: UsersSectionProps
       <div className="admin-surface overflow-hidden">
         {isLoadingUsers ? (
           <div className="py-12 text-center text-sm text-[#6B6B6B]">Loading users&#8230;</div>
-        ) : usersData && usersData.users.length > 0 ? (
+        ) : rows.length > 0 ? (
           <>
             <div className="overflow-x-auto">
               <table className="w-full">
@@ -58,7 +97,7 @@ export default function UsersSection({ authenticatedRequest }: UsersSectionProps
                   </tr>
                 </thead>
                 <tbody>
-                  {usersData.users.map((u) => (
+                  {rows.map((u) => (
                     <tr key={u.clerk_user_id} className="admin-row">
                       <td className="py-2.5 px-3 text-sm text-white">{u.first_name} {u.last_name}</td>
                       <td className="py-2.5 px-3 text-sm text-[#A0A0A0]">{u.email}</td>
@@ -74,10 +113,10 @@ export default function UsersSection({ authenticatedRequest }: UsersSectionProps
               </table>
             </div>
 
-            {usersData.total_pages > 1 && (
+            {searchResults === null && usersData && (usersPage > 1 || hasNextPage) && (
               <div className="px-4 py-3 border-t border-white/5 flex items-center justify-between">
                 <span className="text-xs text-[#6B6B6B]">
-                  {(usersPage - 1) * usersPageSize + 1}&#8211;{Math.min(usersPage * usersPageSize, usersData.total)} of {usersData.total}
+                  {(usersPage - 1) * usersPageSize + 1}&#8211;{(usersPage - 1) * usersPageSize + usersData.users.length} of {approx}{usersData.total ?? 0}
                 </span>
                 <div className="flex items-center gap-3">
                   <button
@@ -87,10 +126,10 @@ export default function UsersSection({ authenticatedRequest }: UsersSectionProps
                   >
                     Previous
                   </button>
-                  <span className="text-xs text-[#6B6B6B]">Page {usersPage} of {usersData.total_pages}</span>
+                  <span className="text-xs text-[#6B6B6B]">Page {usersPage} of {approx}{Math.max(usersData.total_pages ?? 0, usersPage)}</span>
                   <button
                     onClick={() => loadUsers(usersPage + 1)}
-                    disabled={usersPage === usersData.total_pages}
+                    disabled={!hasNextPage}
                     className="text-xs text-[#A0A0A0] hover:text-white px-3 py-1 rounded hover:bg-white/5 transition-colors disabled:opacity-30"
                   >
                     Next
@@ -100,7 +139,7 @@ export default function UsersSection({ authenticatedRequest }: UsersSectionProps
             )}
           </>
         ) : (
-          <div className="py-12 text-center text-sm text-[#6B6B6B]">No users found.</div>
+          <div className="py-12 text-center text-sm text-[#6B6B6B]">{searchResults ? 'No matching users.' : 'No users found.'}</div>
         )}
       </div>
     </section>
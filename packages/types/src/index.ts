@@ -147,12 +147,18 @@ export interface User {
   leagues_count: number;
 }
 
+export interface PlayerSearchResult extends User {
+  score: number;
+}
+
 export interface PaginatedUserResponse {
   users: User[];
-  total: number;
-  page: number;
+  total: number | null;
+  total_is_estimate: boolean;
+  page: number | null;
   page_size: number;
-  total_pages: number;
+  total_pages: number | null;
+  next_cursor: string | null;
 }
 
 export interface LeagueMember {
@@ -361,6 +367,57 @@ export interface FieldAvailabilityCreateRequest {
   notes?: string;
 }
 
+export interface FieldBlackout {
+  id: string;
+  field_id: string;
+  starts_at: string;
+  ends_at: string;
+  reason?: string;
+  is_active: boolean;
+  created_at: string;
+  updated_at: string;
+}
+
+export interface FieldBlackoutCreateRequest {
+  starts_at: string;
+  ends_at: string;
+  reason?: string;
+}
+
+export interface FieldRiskWindow {
+  date: string;
+  start_time: string;
+  end_time: string;
+  kind: "double_booked" | "outside_availability";
+}
+
+// Minutes; hourly_* grids are [weekday][hour] (Monday first), daily_* arrays start at start_date
+export interface FieldUtilization {
+  field_id: string;
+  field_name: string;
+  available_minutes: number;
+  booked_minutes: number;
+  idle_minutes: number;
+  blocked_minutes: number;
+  conflict_minutes: number;
+  double_booked_minutes: number;
+  utilization: number;
+  hourly_available_minutes: number[][];
+  hourly_booked_minutes: number[][];
+  hourly_utilization: (number | null)[][];
+  daily_available_minutes: number[];
+  daily_booked_minutes: number[];
+  risks: FieldRiskWindow[];
+  risks_truncated: boolean;
+}
+
+export interface FieldUtilizationReport {
+  start_date: string;
+  end_date: string;
+  slot_minutes: number;
+  fields: FieldUtilization[];
+}
+
 export interface GroupMemberDetail {
   invitation_id?: string;
   player_id?: string;